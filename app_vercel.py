@@ -5,35 +5,46 @@ Aplicação Flask para Vercel - Conversor PDF para XLSM
 Versão simplificada para debug
 """
 
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, make_response, Response, send_file
+from werkzeug.utils import secure_filename
 import os
+import json
 import logging
+import tempfile
+import time
 import io
-import threading
 import uuid
-import time
 
 # Importação condicional para evitar erros no Vercel
+# O módulo do conversor não importa pdfplumber/pandas/openpyxl: a verificação das
+# dependências é feita sem carregá-las e elas só são importadas na primeira conversão
 try:
-    from pdf_to_xlsm_converter import PDFToXLSMConverter
+    from pdf_to_xlsm_converter import PDFToXLSMConverter, CONVERTER_VERSION, missing_dependencies
+    if missing_dependencies():
+        raise ImportError(f"dependências ausentes: {', '.join(missing_dependencies())}")
 except ImportError as e:
     logging.error(f"Erro ao importar PDFToXLSMConverter: {e}")
     PDFToXLSMConverter = None
+    CONVERTER_VERSION = 'basico'
 
-# Importações básicas para conversão simples
+# Seleção de páginas e limite de linhas (sem dependências; valem também para a conversão básica)
 try:
-    import PyPDF2
-    import openpyxl
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment
-    import io
-    import re
-    import tempfile
-    import os
+    from pdf_to_xlsm_converter import parse_page_ranges, select_pages, validate_max_rows
+except ImportError:
+    parse_page_ranges = select_pages = validate_max_rows = None
+
+try:
+    from batch_conversion import BATCH_OUTPUTS, collect_batch_pdfs, convert_batch, remove_batch_pdfs
 except ImportError as e:
-    logging.error(f"Erro ao importar dependências básicas: {e}")
-    PyPDF2 = None
-    openpyxl = None
+    logging.error(f"Erro ao importar conversão em lote: {e}")
+    BATCH_OUTPUTS, collect_batch_pdfs, convert_batch, remove_batch_pdfs = (), None, None, None
+
+from conversion_cache import ConversionCache, make_cache_key
+from job_queue import ConversionQueue, QueueFullError
+from result_store import create_result_store, result_source
+from metrics import ConversionMetrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from row_formats import OUTPUT_FORMATS, STREAMING_FORMATS, check_output_format
+from upload_storage import store_upload, remove_stale_uploads
 
 # Configurar Flask
 app = Flask(__name__)
@@ -51,39 +62,365 @@ def after_request(response):
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Dicionário para armazenar status das conversões
-conversion_status = {}
-conversion_data = {}
+# Processos usados para extrair as páginas de cada PDF (1 = sequencial)
+CONVERTER_WORKERS = int(os.environ.get('CONVERTER_WORKERS', '1'))
+
+# Motor de escrita do XLSM: 'openpyxl' ou 'xml' (escritor direto, mais rápido)
+CONVERTER_ENGINE = os.environ.get('CONVERTER_ENGINE', 'openpyxl')
+
+# Tamanho máximo de cada PDF enviado (uploads maiores recebem 413)
+MAX_FILE_SIZE = int(os.environ.get('MAX_FILE_SIZE', 50 * 1024 * 1024))
+
+# Conversão em lote: processos por lote (1 = sequencial, sem multiprocessing no serverless),
+# quantidade máxima de PDFs e total de bytes dos PDFs
+BATCH_WORKERS = int(os.environ.get('BATCH_WORKERS', '1'))
+BATCH_MAX_FILES = int(os.environ.get('BATCH_MAX_FILES', '100'))
+BATCH_MAX_BYTES = int(os.environ.get('BATCH_MAX_BYTES', 50 * 1024 * 1024))
+
+# Streams de status (SSE) e long-poll: intervalo do keep-alive, espera máxima de uma
+# requisição long-poll e reconsulta da posição enquanto a tarefa aguarda na fila
+STATUS_STREAM_HEARTBEAT = int(os.environ.get('STATUS_STREAM_HEARTBEAT', 15))
+STATUS_MAX_WAIT = int(os.environ.get('STATUS_MAX_WAIT', 30))
+QUEUED_POLL_INTERVAL = 1
 
-def process_conversion(task_id, file_data, filename):
-    """Processa conversão em background"""
+# Métricas exportadas em /metrics (formato Prometheus, por processo)
+conversion_metrics = ConversionMetrics()
+conversion_metrics.gauge('conversion_queue_depth', 'Tarefas aguardando na fila',
+                         lambda: conversion_queue.stats()['queued'])
+conversion_metrics.gauge('conversion_active_jobs', 'Conversões em execução',
+                         lambda: conversion_queue.stats()['active'] + conversion_queue.stats()['direct'])
+conversion_metrics.gauge('result_store_bytes', 'Bytes em memória do armazenamento de resultados',
+                         lambda: [({'store': 'status'}, conversion_status.stats()['bytes']),
+                                  ({'store': 'data'}, conversion_data.stats()['bytes'])])
+conversion_metrics.gauge('result_store_spilled_bytes', 'Bytes de resultados gravados em disco',
+                         lambda: conversion_data.stats()['spilled_bytes'])
+conversion_metrics.gauge('result_store_entries', 'Entradas do armazenamento de resultados',
+                         lambda: [({'store': 'status'}, conversion_status.stats()['entries']),
+                                  ({'store': 'data'}, conversion_data.stats()['entries'])])
+conversion_metrics.gauge('conversion_cache_bytes', 'Bytes em memória do cache de resultados',
+                         lambda: conversion_cache.stats()['memory_bytes'])
+
+# Pool fixo de workers com fila FIFO limitada (uploads excedentes recebem 429)
+conversion_queue = ConversionQueue(
+    workers=int(os.environ.get('QUEUE_WORKERS', '2')),
+    max_queue=int(os.environ.get('QUEUE_MAX_SIZE', '20'))
+)
+
+# Status e dados binários das conversões, com expiração (TTL), limite de memória
+# e limpeza periódica em segundo plano. Backend 'memory' (padrão) fica no processo;
+# com vários workers do gunicorn use 'sqlite' (RESULT_DB compartilhado no host) para
+# que status e download funcionem em qualquer worker
+RESULT_TTL = int(os.environ.get('RESULT_TTL', 3600))
+RESULT_BACKEND = os.environ.get('RESULT_BACKEND', 'memory')
+RESULT_DB = os.environ.get('RESULT_DB') or os.path.join(tempfile.gettempdir(), 'conversor_resultados.sqlite3')
+conversion_status = create_result_store(RESULT_BACKEND, 'status', RESULT_DB, ttl=RESULT_TTL)
+conversion_data = create_result_store(
+    RESULT_BACKEND, 'data', RESULT_DB,
+    ttl=RESULT_TTL,
+    max_bytes=int(os.environ.get('RESULT_MAX_BYTES', 500 * 1024 * 1024)),
+    evict_after_download=os.environ.get('RESULT_EVICT_AFTER_DOWNLOAD', '0') == '1',
+    sweep_interval=int(os.environ.get('RESULT_SWEEP_INTERVAL', 60)),
+    # Resultados grandes vão para disco e são enviados em blocos no download
+    spill_dir=os.environ.get('RESULT_DIR') or os.path.join(tempfile.gettempdir(), 'conversor_resultados'),
+    spill_threshold=int(os.environ.get('RESULT_SPILL_BYTES', 5 * 1024 * 1024))
+)
+
+# Cache de resultados: LRU em memória + diretório opcional em disco. Resultados que o
+# armazenamento grava em disco ficam só no nível em disco (sem uma cópia na memória)
+conversion_cache = ConversionCache(
+    max_bytes=int(os.environ.get('CACHE_MAX_BYTES', 100 * 1024 * 1024)),
+    disk_dir=os.environ.get('CACHE_DIR') or None,
+    disk_max_bytes=int(os.environ.get('CACHE_DISK_MAX_BYTES', 1024 * 1024 * 1024)),
+    max_entry_bytes=conversion_data.spill_threshold
+)
+
+# Uploads gravados em disco até o fim da conversão (o conversor lê o PDF pelo caminho);
+# sobras de tarefas interrompidas (ex.: instância encerrada) são removidas na inicialização
+UPLOAD_DIR = os.environ.get('UPLOAD_DIR') or os.path.join(tempfile.gettempdir(), 'conversor_uploads')
+remove_stale_uploads(UPLOAD_DIR, max_age=RESULT_TTL)
+
+@app.route('/api/convert', methods=['POST'])
+def convert_direct():
+    """
+    Conversão síncrona, sem fila: o resultado vem na própria resposta.
+    Campo 'format': csv e jsonl são enviados em blocos enquanto as páginas são extraídas;
+    xlsm (padrão) e parquet são enviados ao final. Aceita também 'pages' e 'max_rows'.
+    Respeita o limite da fila (429 se estiver cheia ou sem vaga para conversão síncrona).
+    """
+    if PDFToXLSMConverter is None:
+        return jsonify({'error': 'Conversão direta indisponível neste servidor'}), 503
+    
+    # Recusar antes de ler o corpo. A vaga é liberada com a resposta pronta; na conversão
+    # enviada em blocos, só quando o envio termina (ou o cliente desconecta)
     try:
-        logger.info(f"Iniciando process_conversion para task_id: {task_id}")
+        conversion_queue.acquire_direct()
+    except QueueFullError as e:
+        return queue_full_response(e)
+    
+    try:
+        response = make_response(direct_conversion())
+    except BaseException:
+        conversion_queue.release_direct()
+        raise
+    
+    # Arquivos de send_file (direct_passthrough) não passam pelos callbacks de close
+    if response.is_streamed and not response.direct_passthrough:
+        response.call_on_close(conversion_queue.release_direct)
+    else:
+        conversion_queue.release_direct()
+    return response
+
+def direct_conversion():
+    """Converte o PDF de /api/convert (com a vaga de conversão síncrona já reservada)"""
+    file = request.files.get('file')
+    if file is None or file.filename == '':
+        return jsonify({'error': 'Nenhum arquivo selecionado'}), 400
+    
+    if not file.filename.lower().endswith('.pdf'):
+        return jsonify({'error': 'Apenas arquivos PDF são aceitos'}), 400
+    
+    try:
+        pages, max_rows = conversion_options(request.form)
+        output_format = output_format_option(request.form)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        upload = store_upload(file, UPLOAD_DIR, max_bytes=MAX_FILE_SIZE)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 413
+    
+    converter = PDFToXLSMConverter(workers=CONVERTER_WORKERS, engine=CONVERTER_ENGINE)
+    started = time.perf_counter()
+    chunks = None
+    
+    # Mesmo PDF já convertido com a mesma versão/motor/opções (aqui ou em /upload)
+    cache_key = conversion_cache_key(upload.digest, pages, max_rows, output_format)
+    data = conversion_cache.get(cache_key)
+    
+    if data is not None:
+        upload.remove()
+        conversion_metrics.conversions.inc(status='cached')
+    else:
+        # Erros até o primeiro bloco (PDF inválido ou sem dados) ainda viram uma resposta JSON
+        try:
+            if output_format in STREAMING_FORMATS:
+                chunks = converter.stream_pdf_conversion(upload.path, output_format, pages, max_rows)
+            else:
+                data = converter.convert_pdf_in_memory(upload.path, output_format, pages, max_rows)
+                conversion_metrics.observe_conversion(converter.conversion_stats(), time.perf_counter() - started)
+                upload.remove()
+                # Só os resultados completos vão para o cache: os blocos de csv/jsonl são
+                # enviados durante a extração, sem juntar o arquivo inteiro em memória
+                conversion_cache.put(cache_key, data)
+        except Exception as e:
+            upload.remove()
+            logger.error(f"Erro na conversão direta: {str(e)}")
+            conversion_metrics.observe_conversion(converter.conversion_stats(), time.perf_counter() - started,
+                                                  status='error')
+            return jsonify({'error': str(e)}), 400 if isinstance(e, ValueError) else 500
+    
+    if chunks is not None:
+        finished = []
         
-        conversion_status[task_id] = {'progress': 0, 'status': 'processing', 'error': None, 'filename': filename}
+        def stream():
+            yield from chunks
+            finished.append(True)
+        
+        def close():
+            # Também quando o cliente desconecta: a extração das páginas restantes é
+            # encerrada antes de remover o upload
+            chunks.close()
+            upload.remove()
+            conversion_metrics.observe_conversion(converter.conversion_stats(), time.perf_counter() - started,
+                                                  status='completed' if finished else 'error')
+        
+        response = Response(stream(), mimetype=OUTPUT_FORMATS[output_format][1])
+        response.call_on_close(close)
+    else:
+        # Resultados grandes do cache em disco são enviados a partir do arquivo
+        response = send_file(result_source(data), mimetype=OUTPUT_FORMATS[output_format][1])
+    
+    response.headers.set('Content-Disposition', 'attachment',
+                         filename=converted_filename(secure_filename(file.filename), output_format))
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/upload/batch', methods=['POST'])
+def upload_batch():
+    """
+    Processa o upload de vários PDFs (ou ZIPs de PDFs) em uma única tarefa.
+    Campo 'output': 'zip' (um XLSM por PDF, padrão) ou 'sheets' (um XLSM com uma planilha por PDF)
+    """
+    if convert_batch is None or PDFToXLSMConverter is None:
+        return jsonify({'error': 'Conversão em lote indisponível neste servidor'}), 503
+    
+    try:
+        # Fila cheia: recusar antes de ler o corpo (sem gravar nem calcular o hash do upload)
+        try:
+            conversion_queue.check_capacity()
+        except QueueFullError as e:
+            return queue_full_response(e)
+        
+        uploads = [file for file in request.files.getlist('files') + request.files.getlist('file')
+                   if file.filename]
+        if not uploads:
+            return jsonify({'error': 'Nenhum arquivo selecionado'}), 400
+        
+        output = request.form.get('output', 'zip')
+        if output not in BATCH_OUTPUTS:
+            return jsonify({'error': f"Formato de saída inválido. Use um de: {', '.join(BATCH_OUTPUTS)}"}), 400
+        
+        try:
+            # PDFs (e membros dos ZIPs) gravados em disco; a tarefa remove os arquivos
+            pdfs = collect_batch_pdfs(
+                [(file.filename, file.stream) for file in uploads],
+                upload_dir=UPLOAD_DIR,
+                max_files=BATCH_MAX_FILES,
+                max_bytes=BATCH_MAX_BYTES
+            )
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        task_id = str(uuid.uuid4())
+        download_name = 'lote_convertido.zip' if output == 'zip' else 'lote_convertido.xlsm'
+        
+        conversion_status[task_id] = {
+            'progress': 0,
+            'status': 'queued',
+            'error': None,
+            'filename': f"Lote com {len(pdfs)} arquivos",
+            'download_name': download_name,
+            'files': [{'filename': name, 'status': 'queued', 'rows': None, 'error': None} for name, _ in pdfs]
+        }
+        
+        try:
+            queue_position = conversion_queue.submit(task_id, process_batch_conversion, pdfs, output)
+        except QueueFullError as e:
+            conversion_status.pop(task_id, None)
+            remove_batch_pdfs(pdfs)
+            return queue_full_response(e)
+        
+        return jsonify({
+            'task_id': task_id,
+            'message': f"Conversão de {len(pdfs)} arquivos iniciada",
+            'files': len(pdfs),
+            'queue_position': queue_position
+        })
+        
+    except Exception as e:
+        logger.error(f"Erro no upload em lote: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def update_batch_progress(task_id, event):
+    """Atualiza o status do lote com o resultado de um arquivo"""
+    status = conversion_status.get(task_id)
+    if status is None:
+        return
+    
+    files = list(status['files'])
+    files[event['index']] = {key: event[key] for key in ('filename', 'status', 'rows', 'error')}
+    
+    conversion_status[task_id] = dict(
+        status,
+        files=files,
+        files_done=event['files_done'],
+        files_total=event['files_total'],
+        # Arquivos convertidos ocupam de 5% a 90%
+        progress=5 + int(85 * event['files_done'] / event['files_total'])
+    )
+
+def process_batch_conversion(task_id, pdfs, output):
+    """Converte os PDFs do lote em background, com progresso por arquivo"""
+    try:
+        logger.info(f"Iniciando lote {task_id} com {len(pdfs)} arquivos")
+        
+        status = conversion_status.get(task_id, {})
+        conversion_status[task_id] = dict(status, status='processing', progress=5,
+                                          files_done=0, files_total=len(pdfs))
+        
+        result, files = convert_batch(
+            pdfs,
+            output=output,
+            workers=BATCH_WORKERS,
+            engine=CONVERTER_ENGINE,
+            progress_callback=lambda event: update_batch_progress(task_id, event)
+        )
+        
+        for item in files:
+            conversion_metrics.conversions.inc(status=item['status'])
+            conversion_metrics.rows_valid.inc(item['rows'] or 0)
         
-        conversion_status[task_id]['progress'] = 10
-        time.sleep(0.5)
+        conversion_data[task_id] = result
+        conversion_status[task_id] = dict(
+            conversion_status.get(task_id, status),
+            progress=100,
+            status='completed',
+            files=files,
+            rows=sum(item['rows'] or 0 for item in files)
+        )
         
-        conversion_status[task_id]['progress'] = 30
+    except Exception as e:
+        logger.error(f"Erro no lote {task_id}: {str(e)}")
+        conversion_status[task_id] = dict(
+            conversion_status.get(task_id, {}),
+            progress=0,
+            status='error',
+            error=str(e)
+        )
+    finally:
+        remove_batch_pdfs(pdfs)
+
+def update_progress(task_id, event):
+    """Converte os eventos de progresso do conversor no percentual exibido em /api/status"""
+    status = conversion_status.get(task_id)
+    if status is None:
+        return
+    
+    progress = status.get('progress', 0)
+    if event['stage'] == 'open':
+        progress = 5
+    elif event['stage'] == 'extract' and event.get('pages_total'):
+        # Extração (páginas processadas) ocupa de 5% a 90%
+        progress = 5 + int(85 * event['pages_done'] / event['pages_total'])
+    elif event['stage'] == 'write':
+        progress = 95
+    
+    # Nova atribuição (e não update in-place) para acordar os streams de status
+    conversion_status[task_id] = dict(status, **event, progress=progress)
+
+def process_conversion(task_id, upload, filename, cache_key=None, pages=None, max_rows=None, output_format='xlsm'):
+    """
+    Processa conversão em background (páginas selecionadas, limite de linhas e formato
+    de saída opcionais; a conversão básica gera apenas xlsm). O upload gravado em disco
+    é removido ao final.
+    """
+    converter = None
+    started = time.perf_counter()
+    try:
+        logger.info(f"Iniciando process_conversion para task_id: {task_id}")
+        
+        conversion_status[task_id] = {'progress': 0, 'status': 'processing', 'error': None, 'filename': filename}
         
         if PDFToXLSMConverter is not None:
-            # Usar conversor completo se disponível
-            converter = PDFToXLSMConverter()
-            time.sleep(0.5)
-            
-            conversion_status[task_id]['progress'] = 60
-            
-            logger.info(f"Criando BytesIO com {len(file_data)} bytes")
-            file_buffer = io.BytesIO(file_data)
-            file_buffer.name = filename
-            logger.info(f"BytesIO criado com sucesso")
+            # Usar conversor completo se disponível, com progresso real por página
+            converter = PDFToXLSMConverter(
+                workers=CONVERTER_WORKERS,
+                engine=CONVERTER_ENGINE,
+                progress_callback=lambda event: update_progress(task_id, event)
+            )
             
-            xlsm_data = converter.convert_pdf_to_xlsm_in_memory(file_buffer)
+            # O conversor lê o PDF pelo caminho, sob demanda, sem carregar o arquivo na memória
+            xlsm_data = converter.convert_pdf_in_memory(upload.path, output_format, pages, max_rows)
+            rows = converter.rows_valid
+            pages_processed = converter.pages_processed
+            row_limit_reached = converter.row_limit_reached
         else:
             # Conversão básica usando apenas PyPDF2 e openpyxl
             logger.info("Usando conversão básica (sem pandas)")
-            conversion_status[task_id]['progress'] = 60
+            import PyPDF2
+            from openpyxl import Workbook
+            from openpyxl.styles import Font, PatternFill, Alignment
             
             # Criar arquivo XLSM básico
             wb = Workbook()
@@ -105,12 +442,17 @@ def process_conversion(task_id, file_data, filename):
                 cell.fill = header_fill
                 cell.alignment = header_alignment
             
-            # Extrair texto do PDF
-            file_buffer = io.BytesIO(file_data)
-            pdf_reader = PyPDF2.PdfReader(file_buffer)
+            # Extrair texto do PDF (lido do arquivo gravado no upload)
+            pdf_reader = PyPDF2.PdfReader(upload.path)
+            page_count = len(pdf_reader.pages)
+            page_numbers = select_pages(pages, page_count) if pages else range(1, page_count + 1)
+            pages_total = len(page_numbers)
             
             row = 2
-            for page_num, page in enumerate(pdf_reader.pages):
+            pages_processed = 0
+            row_limit_reached = False
+            for page_number in page_numbers:
+                page = pdf_reader.pages[page_number - 1]
                 text = page.extract_text()
                 lines = text.split('\n')
                 
@@ -119,36 +461,90 @@ def process_conversion(task_id, file_data, filename):
                         # Tentar extrair dados básicos
                         parts = line.split()
                         if len(parts) >= 2:
+                            # Limite já preenchido e ainda há linha: o resultado foi cortado
+                            if max_rows is not None and row - 2 >= max_rows:
+                                row_limit_reached = True
+                                break
                             ws[f'A{row}'] = parts[0] if parts[0] else ""
                             ws[f'B{row}'] = " ".join(parts[1:-1]) if len(parts) > 2 else parts[1] if len(parts) > 1 else ""
                             ws[f'C{row}'] = parts[-1] if parts else ""
                             row += 1
+                
+                pages_processed += 1
+                update_progress(task_id, {
+                    'stage': 'extract',
+                    'pages_done': pages_processed,
+                    'pages_total': pages_total,
+                    'rows': row - 2
+                })
+                
+                # Limite de linhas atingido: as páginas restantes não são lidas
+                if row_limit_reached:
+                    break
+            
+            update_progress(task_id, {'stage': 'write', 'rows': row - 2})
+            rows = row - 2
             
             # Salvar em memória
             output = io.BytesIO()
             wb.save(output)
             xlsm_data = output.getvalue()
             output.close()
-        time.sleep(0.5)
         
-        conversion_status[task_id]['progress'] = 80
-        time.sleep(0.5)
+        # Dados disponíveis antes de marcar como concluído
+        conversion_data[task_id] = xlsm_data
         
         conversion_status[task_id] = {
             'progress': 100, 
             'status': 'completed', 
             'error': None,
-            'filename': filename
+            'filename': filename,
+            'format': output_format,
+            'rows': rows,
+            'pages': pages_processed,
+            'row_limit_reached': row_limit_reached
         }
-        conversion_data[task_id] = xlsm_data
+        conversion_metrics.observe_conversion(converter.conversion_stats() if converter else None,
+                                              time.perf_counter() - started)
+        
+        if cache_key:
+            conversion_cache.put(cache_key, xlsm_data)
         
     except Exception as e:
         logger.error(f"Erro na conversão {task_id}: {str(e)}")
+        conversion_metrics.observe_conversion(converter.conversion_stats() if converter else None,
+                                              time.perf_counter() - started, status='error')
         conversion_status[task_id] = {
             'progress': 0, 
             'status': 'error', 
             'error': str(e)
         }
+    finally:
+        upload.remove()
+
+def conversion_options(form):
+    """
+    Opções enviadas com o upload: seleção de páginas ('pages', ex.: '1-3,8' ou 'r3-z')
+    e limite de linhas ('max_rows'). Lança ValueError se forem inválidas.
+    """
+    pages, max_rows = form.get('pages') or None, form.get('max_rows') or None
+    if parse_page_ranges is None:
+        if pages or max_rows:
+            raise ValueError("Seleção de páginas e limite de linhas indisponíveis neste servidor")
+        return None, None
+    return parse_page_ranges(pages), validate_max_rows(max_rows)
+
+def output_format_option(form):
+    """Formato de saída enviado com o upload (campo 'format', padrão xlsm)"""
+    output_format = check_output_format(form.get('format') or 'xlsm')
+    if output_format != 'xlsm' and PDFToXLSMConverter is None:
+        raise ValueError(f"Formato {output_format} indisponível na conversão básica")
+    return output_format
+
+def converted_filename(filename, output_format='xlsm'):
+    """Nome do arquivo convertido: <nome do PDF>_convertido.<extensão do formato>"""
+    base_name = os.path.splitext(filename)[0]
+    return f"{base_name}_convertido{OUTPUT_FORMATS[output_format][0]}"
 
 @app.route('/')
 def index():
@@ -177,6 +573,12 @@ def test():
 def upload_file():
     """Upload e conversão de arquivo"""
     try:
+        # Fila cheia: recusar antes de ler o corpo (sem gravar nem calcular o hash do upload)
+        try:
+            conversion_queue.check_capacity()
+        except QueueFullError as e:
+            return queue_full_response(e)
+        
         if 'file' not in request.files:
             return jsonify({'error': 'Nenhum arquivo enviado'}), 400
         
@@ -188,48 +590,186 @@ def upload_file():
         if not file.filename.lower().endswith('.pdf'):
             return jsonify({'error': 'Apenas arquivos PDF são aceitos'}), 400
         
-        # Ler dados do arquivo
-        file_data = file.read()
+        try:
+            pages, max_rows = conversion_options(request.form)
+            output_format = output_format_option(request.form)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Gravar o upload em disco em blocos, calculando o hash no caminho (sem ler o
+        # arquivo inteiro para a memória); a tarefa recebe só o caminho
+        try:
+            upload = store_upload(file, UPLOAD_DIR, max_bytes=MAX_FILE_SIZE)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 413
+        filename = secure_filename(file.filename)
         
         # Gerar ID único para a tarefa
         task_id = str(uuid.uuid4())
         
-        # Inicializar status
+        try:
+            return enqueue_upload(task_id, upload, filename, pages, max_rows, output_format)
+        except BaseException:
+            upload.remove()
+            raise
+        
+    except Exception as e:
+        logger.error(f"Erro no upload: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def queue_full_response(error):
+    """Resposta 429 com Retry-After para a fila de conversões cheia"""
+    response = jsonify({'error': 'Servidor ocupado: fila de conversões cheia. Tente novamente em instantes.'})
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 429
+
+def conversion_cache_key(digest, pages, max_rows, output_format):
+    """Chave do cache: hash do PDF, versão do conversor, motor, opções e formato de saída"""
+    cache_variant = [CONVERTER_ENGINE if PDFToXLSMConverter is not None else 'basico']
+    cache_variant += [pages, max_rows] if pages or max_rows else []
+    cache_variant += [output_format] if output_format != 'xlsm' else []
+    return make_cache_key(digest, CONVERTER_VERSION, *cache_variant)
+
+def enqueue_upload(task_id, upload, filename, pages, max_rows, output_format):
+    """
+    Conclui pelo cache ou enfileira a conversão do upload gravado em disco.
+    O arquivo passa a pertencer à tarefa ao ser enfileirado; nos demais casos é removido.
+    """
+    # Mesmo PDF já convertido com a mesma versão/motor/opções: concluir sem converter
+    cache_key = conversion_cache_key(upload.digest, pages, max_rows, output_format)
+    cached_data = conversion_cache.get(cache_key)
+    
+    if cached_data is not None:
+        upload.remove()
+        logger.info(f"Resultado em cache para task_id: {task_id}")
+        # Dados antes do status: quem vê 'completed' já encontra o arquivo
+        conversion_data[task_id] = cached_data
         conversion_status[task_id] = {
-            'progress': 0,
-            'status': 'queued',
-            'filename': file.filename
+            'progress': 100,
+            'status': 'completed',
+            'error': None,
+            'filename': filename,
+            'format': output_format,
+            'cached': True
         }
-        
-        # Iniciar conversão em background
-        thread = threading.Thread(
-            target=process_conversion,
-            args=(task_id, file_data, file.filename)
-        )
-        thread.daemon = True
-        thread.start()
+        conversion_metrics.conversions.inc(status='cached')
         
         return jsonify({
             'task_id': task_id,
-            'message': 'Conversão iniciada'
+            'message': 'Conversão concluída (cache)'
         })
-        
-    except Exception as e:
-        logger.error(f"Erro no upload: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+    
+    # Inicializar status
+    conversion_status[task_id] = {
+        'progress': 0,
+        'status': 'queued',
+        'filename': filename
+    }
+    
+    # Enfileirar a conversão no pool de workers
+    try:
+        queue_position = conversion_queue.submit(task_id, process_conversion, upload, filename, cache_key,
+                                                 pages, max_rows, output_format)
+    except QueueFullError as e:
+        conversion_status.pop(task_id, None)
+        upload.remove()
+        return queue_full_response(e)
+    
+    return jsonify({
+        'task_id': task_id,
+        'message': 'Conversão iniciada',
+        'queue_position': queue_position
+    })
+
+def status_payload(task_id, status, version):
+    """Status serializável em JSON com a versão e a posição na fila"""
+    payload = {key: value for key, value in status.items() if key != 'xlsm_data'}
+    payload['version'] = version
+    if payload.get('status') == 'queued':
+        # Só o processo que recebeu o upload conhece a fila: nos demais workers (backend
+        # sqlite) o campo fica de fora em vez de vir nulo
+        queue_position = conversion_queue.position(task_id)
+        if queue_position is not None:
+            payload['queue_position'] = queue_position
+    return payload
+
+def wait_status(task_id, since=0, timeout=0):
+    """
+    Aguarda o status passar da versão `since` (até `timeout` segundos).
+    Na fila a posição muda sem escrita no status, por isso a espera é curta.
+    Retorna (versão, payload) ou (versão, None) se a tarefa não existir.
+    """
+    current = conversion_status.get(task_id)
+    if current is not None and current.get('status') == 'queued':
+        timeout = min(timeout, QUEUED_POLL_INTERVAL)
+    
+    version, status = conversion_status.wait(task_id, since=since, timeout=timeout)
+    if status is None:
+        return version, None
+    return version, status_payload(task_id, status, version)
 
 @app.route('/api/status/<task_id>')
 def get_status(task_id):
-    """Obter status da conversão"""
+    """
+    API para verificar status da conversão
+    Long-poll: ?wait=<segundos>&since=<versão> responde assim que o status mudar
+    """
+    wait = min(max(request.args.get('wait', 0, type=float), 0), STATUS_MAX_WAIT)
+    since = request.args.get('since', 0, type=int)
+    
+    _, payload = wait_status(task_id, since=since, timeout=wait)
+    if payload is None:
+        return jsonify({'error': 'Tarefa não encontrada'}), 404
+    
+    return jsonify(payload)
+
+@app.route('/api/status/<task_id>/stream')
+def stream_status(task_id):
+    """Server-Sent Events com o progresso da conversão; encerra ao concluir ou falhar"""
     if task_id not in conversion_status:
         return jsonify({'error': 'Tarefa não encontrada'}), 404
     
-    status = conversion_status[task_id].copy()
-    # Remover dados binários para serialização JSON
-    if 'xlsm_data' in status:
-        del status['xlsm_data']
+    def events():
+        version, sent, sent_at = 0, None, time.monotonic()
+        while True:
+            version, payload = wait_status(task_id, since=version, timeout=STATUS_STREAM_HEARTBEAT)
+            if payload is None:
+                yield f"data: {json.dumps({'error': 'Tarefa não encontrada'})}\n\n"
+                return
+            
+            if payload != sent:
+                yield f"id: {version}\ndata: {json.dumps(payload)}\n\n"
+                sent, sent_at = payload, time.monotonic()
+            elif time.monotonic() - sent_at >= STATUS_STREAM_HEARTBEAT:
+                # Comentário SSE mantém a conexão aberta em proxies
+                yield ": keep-alive\n\n"
+                sent_at = time.monotonic()
+            
+            if payload.get('status') in ('completed', 'error'):
+                return
     
-    return jsonify(status)
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@app.route('/metrics')
+def metrics():
+    """Métricas no formato de texto do Prometheus"""
+    return Response(conversion_metrics.render(), content_type=METRICS_CONTENT_TYPE)
+
+@app.route('/api/cache/stats')
+def cache_stats():
+    """Contadores do cache de resultados"""
+    return jsonify(conversion_cache.stats())
+
+@app.route('/api/results/stats')
+def results_stats():
+    """Entradas e bytes mantidos pelo armazenamento de resultados"""
+    return jsonify({
+        'status': conversion_status.stats(),
+        'data': conversion_data.stats()
+    })
 
 @app.route('/download/<task_id>')
 def download_file(task_id):
@@ -237,26 +777,42 @@ def download_file(task_id):
     if task_id not in conversion_status:
         return jsonify({'error': 'Tarefa não encontrada'}), 404
     
-    if task_id not in conversion_data:
+    result = conversion_data.get(task_id)
+    if result is None:
         return jsonify({'error': 'Arquivo não disponível'}), 404
     
     status = conversion_status[task_id]
     if status['status'] != 'completed':
         return jsonify({'error': 'Conversão não concluída'}), 400
     
-    # Preparar nome do arquivo
-    original_name = status['filename']
-    base_name = os.path.splitext(original_name)[0]
-    download_filename = f"{base_name}_convertido.xlsm"
-    
-    # Retornar arquivo
-    return Response(
-        conversion_data[task_id],
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        headers={
-            'Content-Disposition': f'attachment; filename="{download_filename}"'
-        }
+    # Preparar nome do arquivo pelo formato (lotes já definem o nome do resultado)
+    output_format = status.get('format', 'xlsm')
+    download_filename = status.get('download_name')
+    if download_filename is None:
+        download_filename = converted_filename(status['filename'], output_format)
+    
+    if download_filename.endswith('.zip'):
+        mimetype = 'application/zip'
+    else:
+        mimetype = OUTPUT_FORMATS[output_format][1]
+    
+    # Resultado em memória ou em disco: send_file envia em blocos, com Content-Length,
+    # ETag e suporte a Range para retomar downloads interrompidos
+    response = send_file(
+        result_source(result),
+        mimetype=mimetype,
+        as_attachment=True,
+        download_name=download_filename,
+        conditional=True,
+        etag=task_id,
+        max_age=0
     )
+    
+    # Remove o resultado após um download completo se RESULT_EVICT_AFTER_DOWNLOAD=1
+    if conversion_data.evict_after_download and request.method == 'GET' and response.status_code == 200:
+        conversion_data.pop(task_id)
+    
+    return response
 
 # Para Vercel
 app = app
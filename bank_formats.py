@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Formatos de extrato em texto (MercadoPago, Asaas, ...)
+Cada formato declara seus cabeçalhos, padrões de linha e regras de linhas quebradas.
+Os padrões são compilados uma única vez em um matcher combinado por formato, que
+testa todas as regras em uma só passada pela linha; linhas que não começam com um
+dígito só são comparadas com as regras que não exigem data no início.
+
+Para suportar outro banco basta registrar um formato:
+
+    register_format(BankFormat(
+        'meubanco', 'Meu Banco', detect_date=r'\\d{2}\\.\\d{2}\\.\\d{4}',
+        headers=['Data Histórico Valor'],
+        rules=[LineRule('linha completa', ROW, rf'(?P<date>...)\\s+(?P<description>.+?)\\s+R\\$\\s*(?P<value>{VALUE})')],
+    ))
+"""
+
+import re
+
+# Valor monetário no formato brasileiro (sem o prefixo R$)
+VALUE = r'[+-]?\d{1,3}(?:\.\d{3})*(?:,\d{2})?'
+
+# Tipos de regra (onde ficam data, descrição e valor da transação)
+ROW = 'row'                                    # data, descrição e valor na mesma linha
+PREVIOUS_DESCRIPTION = 'previous_description'  # data e valor; descrição na linha anterior
+NEXT_VALUE = 'next_value'                      # data e descrição; valor na próxima linha
+NEXT_DATE_VALUE = 'next_date_value'            # descrição; data e valor na próxima linha
+RULE_KINDS = (ROW, PREVIOUS_DESCRIPTION, NEXT_VALUE, NEXT_DATE_VALUE)
+
+# Grupos nomeados usados nos padrões das regras
+RULE_GROUPS = ('date', 'description', 'value')
+
+GROUP_NAME = re.compile(r'\(\?P<(\w+)>')
+
+
+class LineRule:
+    """
+    Regra de uma linha de transação.
+    - pattern: padrão da linha atual, com os grupos nomeados date, description e value
+    - next_pattern: padrão da próxima linha (NEXT_VALUE e NEXT_DATE_VALUE), que é
+      consumida quando a transação é aceita
+    """
+
+    def __init__(self, name, kind, pattern, next_pattern=None):
+        if kind not in RULE_KINDS:
+            raise ValueError(f"Tipo de regra inválido: {kind}. Use um de: {', '.join(RULE_KINDS)}")
+        if (next_pattern is None) != (kind in (ROW, PREVIOUS_DESCRIPTION)):
+            raise ValueError(f"Regra {name}: next_pattern é obrigatório apenas para regras de linha quebrada")
+
+        self.name = name
+        self.kind = kind
+        self.source = pattern
+        self.pattern = re.compile(pattern)
+        self.next_pattern = re.compile(next_pattern) if next_pattern else None
+
+        # Filtros baratos antes das expressões: onde a data precisa estar
+        self.dated = kind != NEXT_DATE_VALUE
+        self.next_dated = kind == NEXT_DATE_VALUE
+
+    def complete(self, date, description, value, previous, next_line):
+        """
+        Completa a transação da linha atual com a linha anterior ou a próxima.
+        Retorna (data, descrição, valor) ou None quando a regra não se aplica.
+        """
+        kind = self.kind
+        if kind == ROW:
+            return date, description, value
+
+        if kind == PREVIOUS_DESCRIPTION:
+            return None if previous is None else (date, previous, value)
+
+        if next_line is None or (self.next_dated and not next_line[:1].isdigit()):
+            return None
+        next_match = self.next_pattern.fullmatch(next_line)
+        if next_match is None:
+            return None
+
+        if kind == NEXT_VALUE:
+            return date, description, next_match.group('value')
+        return next_match.group('date'), description, next_match.group('value')
+
+    def match(self, line, previous, next_line):
+        """Aplica só esta regra à linha: (data, descrição, valor) ou None"""
+        match = self.pattern.fullmatch(line)
+        if match is None:
+            return None
+        fields = match.groupdict()
+        return self.complete(fields.get('date'), fields.get('description'), fields.get('value'),
+                             previous, next_line)
+
+
+class CombinedMatcher:
+    """Padrões de várias regras em uma única alternância, testada na ordem das regras"""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        alternatives = []
+        for index, rule in enumerate(self.rules):
+            prefixed = GROUP_NAME.sub(lambda found: f'(?P<r{index}_{found.group(1)}>', rule.source)
+            alternatives.append(f'(?P<r{index}>{prefixed})')
+        self.pattern = re.compile('|'.join(alternatives)) if alternatives else None
+
+        # Número do grupo externo de cada alternativa -> (índice da regra, grupos de
+        # data, descrição e valor); grupos ausentes apontam para o grupo externo
+        self.alternatives = {}
+        if self.pattern is not None:
+            groupindex = self.pattern.groupindex
+            for index in range(len(self.rules)):
+                outer = groupindex[f'r{index}']
+                fields = tuple(groupindex.get(f'r{index}_{name}', outer) for name in RULE_GROUPS)
+                self.alternatives[outer] = (index, fields)
+
+    def match(self, line, previous, next_line):
+        """
+        Retorna (regra, data, descrição, valor) da primeira regra que se aplica à linha,
+        ou None
+        """
+        if self.pattern is None:
+            return None
+        match = self.pattern.fullmatch(line)
+        if match is None:
+            return None
+
+        # O grupo externo da alternativa que casou é o último a fechar
+        index, fields = self.alternatives[match.lastindex]
+        rule = self.rules[index]
+        date, description, value = match.group(*fields)
+        if rule.kind == ROW:
+            return rule, date, description, value
+
+        transaction = rule.complete(date, description, value, previous, next_line)
+        if transaction is not None:
+            return (rule,) + transaction
+
+        # A linha atual casou, mas a anterior/próxima não completa a transação:
+        # as regras seguintes são testadas uma a uma (caso raro)
+        for rule in self.rules[index + 1:]:
+            transaction = rule.match(line, previous, next_line)
+            if transaction is not None:
+                return (rule,) + transaction
+        return None
+
+
+class BankFormat:
+    """
+    Formato de extrato em texto.
+    - name: identificador do formato (ex.: 'asaas')
+    - label: nome exibido nos logs
+    - detect_date: padrão de data que identifica o formato no texto do documento
+    - headers: linhas de cabeçalho ignoradas
+    - rules: LineRule na ordem de prioridade
+    """
+
+    def __init__(self, name, label, detect_date, headers, rules):
+        self.name = name
+        self.label = label
+        self.detect_date = re.compile(detect_date)
+        self.headers = frozenset(headers)
+        self.rules = list(rules)
+
+        for rule in self.rules:
+            unknown = set(GROUP_NAME.findall(rule.source)) - set(RULE_GROUPS)
+            if unknown:
+                raise ValueError(f"Regra {rule.name}: grupos desconhecidos {sorted(unknown)}")
+
+        # Linhas que começam com dígito testam todas as regras; as demais, só as
+        # regras sem data no início da linha
+        self.matcher = CombinedMatcher(self.rules)
+        self.undated_matcher = CombinedMatcher(rule for rule in self.rules if not rule.dated)
+        # Sem regras para essas linhas (ou só regras com data na próxima linha) a linha é
+        # descartada quando a próxima não começa com dígito
+        self.undated_need_dated_next = all(rule.next_dated for rule in self.undated_matcher.rules)
+
+    def count_dates(self, text):
+        """Quantidade de datas do formato no texto (usada na detecção)"""
+        return len(self.detect_date.findall(text))
+
+    def parse_lines(self, lines, accept):
+        """
+        Gera (regra, data, descrição, valor) das transações das linhas de uma página.
+        accept(data, valor) decide se a transação é aceita; linhas de continuação só são
+        consumidas quando a transação é aceita.
+        """
+        lines = [line.strip() for line in lines]
+        count = len(lines)
+        i = 0
+        while i < count:
+            line = lines[i]
+            if not line or line in self.headers:
+                i += 1
+                continue
+
+            # Filtro pelo prefixo de data antes de qualquer expressão regular
+            next_line = lines[i + 1] if i + 1 < count else None
+            if line[0].isdigit():
+                matcher = self.matcher
+            elif self.undated_need_dated_next and not (next_line and next_line[0].isdigit()):
+                matcher = None
+            else:
+                matcher = self.undated_matcher
+
+            found = matcher.match(line, lines[i - 1] if i else None, next_line) if matcher else None
+            if found is not None:
+                rule, date, description, value = found
+                if description and accept(date, value):
+                    yield rule, date, description, value
+                    if rule.next_pattern is not None:
+                        i += 1  # Pular a linha de continuação
+            i += 1
+
+
+# Formatos registrados, na ordem de registro (empates na detecção ficam com o primeiro)
+BANK_FORMATS = {}
+
+# Formato com as regras de todos os registrados, usado quando a amostra do documento
+# não decide o formato (montado sob demanda e refeito a cada registro)
+COMBINED_FORMAT = 'combinado'
+_combined_format = None
+
+
+def register_format(bank_format):
+    """Registra (ou substitui) um formato de extrato"""
+    global _combined_format
+    BANK_FORMATS[bank_format.name] = bank_format
+    _combined_format = None
+    return bank_format
+
+
+def combined_format():
+    """Formato com as regras e cabeçalhos de todos os formatos registrados, na ordem de registro"""
+    global _combined_format
+    if _combined_format is None:
+        formats = list(BANK_FORMATS.values())
+        _combined_format = BankFormat(
+            COMBINED_FORMAT, 'Todos os formatos',
+            detect_date='|'.join(f'(?:{bank_format.detect_date.pattern})' for bank_format in formats),
+            headers=[header for bank_format in formats for header in bank_format.headers],
+            rules=[rule for bank_format in formats for rule in bank_format.rules],
+        )
+    return _combined_format
+
+
+def text_format(name):
+    """Formato registrado ou combinado com esse nome; None se não houver (formato decidido por página)"""
+    if name == COMBINED_FORMAT:
+        return combined_format()
+    return BANK_FORMATS.get(name)
+
+
+def get_format(name):
+    try:
+        return BANK_FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Formato de extrato desconhecido: {name}. Use um de: {', '.join(BANK_FORMATS)}")
+
+
+def has_format_dates(text):
+    """O texto tem alguma data de um formato registrado?"""
+    return any(bank_format.detect_date.search(text) for bank_format in BANK_FORMATS.values())
+
+
+def detect_format(text):
+    """Formato com mais datas no texto"""
+    return max(BANK_FORMATS.values(), key=lambda bank_format: bank_format.count_dates(text))
+
+
+def sample_format(text):
+    """
+    Formato de um documento pelo texto de uma amostra de páginas: o formato com mais
+    datas, se tiver mais que todos os outros juntos. Senão a amostra é inconclusiva
+    (ex.: capa ou resumo com datas de vários formatos) e retorna o formato combinado.
+    """
+    counts = [(bank_format.count_dates(text), bank_format) for bank_format in BANK_FORMATS.values()]
+    best_count, best = max(counts, key=lambda item: item[0])
+    if best_count > sum(count for count, _ in counts) - best_count:
+        return best
+    return combined_format()
+
+
+# Asaas: DD/MM/AAAA, valor na mesma linha ou linhas quebradas
+ASAAS_DATE = r'\d{1,2}/\d{1,2}/\d{4}'
+
+register_format(BankFormat(
+    'asaas', 'Asaas',
+    detect_date=r'\d{2}/\d{2}/\d{4}',
+    headers=['Data Movimentações Valor', 'Data', 'Movimentações', 'Valor'],
+    rules=[
+        LineRule('linha completa', ROW,
+                 rf'(?P<date>{ASAAS_DATE})\s+(?P<description>.+?)\s+R\$\s*(?P<value>{VALUE})'),
+        LineRule('data e descrição, valor na próxima linha', NEXT_VALUE,
+                 rf'(?P<date>{ASAAS_DATE})\s+(?P<description>.+)',
+                 next_pattern=rf'R\$\s*(?P<value>{VALUE})'),
+        LineRule('descrição, data e valor na próxima linha', NEXT_DATE_VALUE,
+                 rf'(?!{ASAAS_DATE})(?P<description>.+)',
+                 next_pattern=rf'(?P<date>{ASAAS_DATE})\s+R\$\s*(?P<value>{VALUE})'),
+    ],
+))
+
+# MercadoPago: DD-MM-AAAA, ID da operação e saldo após o valor
+MERCADOPAGO_DATE = r'\d{2}-\d{2}-\d{4}'
+
+register_format(BankFormat(
+    'mercadopago', 'MercadoPago',
+    detect_date=MERCADOPAGO_DATE,
+    headers=['Data Descrição ID da operação Valor Saldo', 'Data', 'Descrição', 'Valor'],
+    rules=[
+        LineRule('linha completa', ROW,
+                 rf'(?P<date>{MERCADOPAGO_DATE})\s+(?P<description>.+?)\s+\d+'
+                 rf'\s+R\$\s*(?P<value>{VALUE})\s+R\$\s*{VALUE}'),
+        LineRule('descrição na linha anterior', PREVIOUS_DESCRIPTION,
+                 rf'(?P<date>{MERCADOPAGO_DATE})\s+\d+\s+R\$\s*(?P<value>{VALUE})\s+R\$\s*{VALUE}'),
+    ],
+))
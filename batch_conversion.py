@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Conversão em lote
+Vários PDFs (ou um ZIP de PDFs) convertidos em paralelo em um único resultado:
+um ZIP com um XLSM por arquivo ou um XLSM com uma planilha por arquivo
+"""
+
+import io
+import logging
+import os
+import re
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from werkzeug.utils import secure_filename
+
+from log_config import configure_file_logging
+from pdf_to_xlsm_converter import PDFToXLSMConverter
+from upload_storage import store_upload
+
+logger = logging.getLogger(__name__)
+
+# Formatos do resultado: 'zip' (um XLSM por PDF) ou 'sheets' (uma planilha por PDF)
+BATCH_OUTPUTS = ('zip', 'sheets')
+
+# Caracteres não permitidos em nomes de planilha do Excel
+INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+MAX_SHEET_TITLE = 31
+
+# Erros de leitura de um ZIP corrompido, truncado ou com membros não suportados
+# (RuntimeError: membro criptografado)
+ZIP_ERRORS = (zipfile.BadZipFile, zlib.error, EOFError, NotImplementedError, RuntimeError)
+
+
+def collect_batch_pdfs(uploads, upload_dir=None, max_files=100, max_bytes=200 * 1024 * 1024):
+    """
+    Grava os PDFs do lote em upload_dir, em blocos, e retorna a lista [(nome, StoredUpload)].
+    uploads: pares (nome, bytes ou objeto com read()); arquivos .zip são expandidos membro
+    a membro, sem ler o ZIP inteiro. Os nomes passam por secure_filename.
+    Lança ValueError para arquivos de outro tipo, ZIP inválido ou lote acima dos limites
+    (os arquivos já gravados são removidos). Quem recebe a lista chama remove_batch_pdfs.
+    """
+    pdfs = []
+
+    try:
+        for filename, source in uploads:
+            stream = io.BytesIO(source) if isinstance(source, bytes) else source
+            extension = os.path.splitext(filename)[1].lower()
+
+            if extension == '.pdf':
+                store_batch_pdf(pdfs, filename, stream, upload_dir, max_files, max_bytes)
+            elif extension == '.zip':
+                try:
+                    with zipfile.ZipFile(stream) as archive:
+                        for info in zip_pdf_members(archive, max_bytes - batch_bytes(pdfs), max_bytes):
+                            with archive.open(info) as member:
+                                store_batch_pdf(pdfs, info.filename, member, upload_dir, max_files, max_bytes)
+                except ZIP_ERRORS as e:
+                    raise ValueError(f"Arquivo ZIP inválido: {secure_filename(filename) or filename}") from e
+            else:
+                raise ValueError(f"Apenas arquivos PDF ou ZIP são permitidos: {filename}")
+
+        if not pdfs:
+            raise ValueError("Nenhum PDF encontrado no lote")
+    except BaseException:
+        remove_batch_pdfs(pdfs)
+        raise
+
+    return pdfs
+
+
+def store_batch_pdf(pdfs, filename, stream, upload_dir, max_files, max_bytes):
+    """Grava um PDF do lote e o acrescenta a pdfs, respeitando os limites do lote"""
+    if len(pdfs) >= max_files:
+        raise ValueError(f"Lote com mais de {max_files} PDFs")
+
+    try:
+        upload = store_upload(stream, upload_dir, max_bytes=max_bytes - batch_bytes(pdfs))
+    except ValueError:
+        raise ValueError(f"Lote maior que {max_bytes // (1024 * 1024)}MB") from None
+
+    pdfs.append((secure_filename(os.path.basename(filename)) or 'arquivo.pdf', upload))
+
+
+def batch_bytes(pdfs):
+    """Total de bytes dos PDFs já gravados do lote"""
+    return sum(upload.size for _, upload in pdfs)
+
+
+def remove_batch_pdfs(pdfs):
+    """Remove os arquivos gravados por collect_batch_pdfs"""
+    for _, upload in pdfs:
+        upload.remove()
+
+
+def zip_pdf_members(archive, available_bytes, max_bytes):
+    """PDFs de um ZIP, ignorando pastas e metadados do macOS"""
+    members = [info for info in archive.infolist()
+               if not info.is_dir()
+               and not info.filename.startswith('__MACOSX/')
+               and info.filename.lower().endswith('.pdf')]
+
+    # Tamanho declarado no cabeçalho: recusa antes de extrair (a gravação confere de novo)
+    if sum(info.file_size for info in members) > available_bytes:
+        raise ValueError(f"Lote maior que {max_bytes // (1024 * 1024)}MB")
+    return members
+
+
+def sheet_title(filename, used_titles):
+    """Nome de planilha válido e único (até 31 caracteres) a partir do nome do arquivo"""
+    base = os.path.splitext(filename)[0]
+    base = INVALID_SHEET_CHARS.sub('_', base).strip("' ") or 'Planilha'
+    title = base[:MAX_SHEET_TITLE]
+
+    suffix = 2
+    while title.lower() in used_titles:
+        tag = f" ({suffix})"
+        title = base[:MAX_SHEET_TITLE - len(tag)] + tag
+        suffix += 1
+
+    used_titles.add(title.lower())
+    return title
+
+
+def output_filename(filename, used_names):
+    """Nome único do XLSM de cada PDF dentro do ZIP de resultado"""
+    base = os.path.splitext(filename)[0] or 'arquivo'
+    name = f"{base}_convertido.xlsm"
+
+    suffix = 2
+    while name.lower() in used_names:
+        name = f"{base}_convertido ({suffix}).xlsm"
+        suffix += 1
+
+    used_names.add(name.lower())
+    return name
+
+
+def convert_batch_item(converter, pdf_data, output):
+    """
+    Converte um PDF do lote.
+    Retorna (bytes do XLSM, linhas) para output='zip' ou (linhas no layout XLSM, linhas)
+    para output='sheets'.
+    """
+    rows = converter.stream_conversion_rows(pdf_data)
+    if output == 'sheets':
+        rows = list(rows)
+        return rows, len(rows)
+    return converter.create_xlsm_in_memory(rows), converter.rows_valid
+
+
+# Conversor usado pelos processos do pool do lote
+_batch_converter = None
+
+
+def _init_batch_worker(engine):
+    """Inicializa o conversor de cada processo do pool do lote"""
+    global _batch_converter
+    # Processos do pool encerram sem atexit: gravação direta no arquivo, sem fila
+    configure_file_logging('pdf_to_xlsm_converter', asynchronous=False)
+    _batch_converter = PDFToXLSMConverter(engine=engine)
+
+
+def _convert_batch_item(pdf_data, output):
+    """Converte um PDF do lote (executado em processo separado)"""
+    return convert_batch_item(_batch_converter, pdf_data, output)
+
+
+def convert_batch(pdfs, output='zip', workers=1, engine='openpyxl', progress_callback=None):
+    """
+    Converte os PDFs do lote em paralelo e monta o resultado único.
+    - pdfs: lista [(nome, PDF)] como retornada por collect_batch_pdfs (StoredUpload),
+      ou com caminhos/bytes
+    - output: 'zip' ou 'sheets'
+    - workers: processos usados (1 = sequencial, no próprio processo)
+    - progress_callback: recebe {'stage': 'file', 'index', 'filename', 'status', 'rows', 'error',
+      'files_done', 'files_total'} a cada arquivo concluído
+    Retorna (bytes do resultado, lista com o resultado de cada arquivo).
+    Arquivos com erro ficam fora do resultado; lança ValueError se todos falharem.
+    """
+    if output not in BATCH_OUTPUTS:
+        raise ValueError(f"Formato de lote inválido: {output}. Use um de: {', '.join(BATCH_OUTPUTS)}")
+
+    converter = PDFToXLSMConverter(engine=engine)
+    # Os processos recebem o caminho do arquivo gravado, não o conteúdo
+    sources = [getattr(pdf, 'path', pdf) for _, pdf in pdfs]
+    files = [{'filename': name, 'status': 'queued', 'rows': None, 'error': None} for name, _ in pdfs]
+    results = [None] * len(pdfs)
+
+    def finish(index, converted=None, error=None):
+        if error is None:
+            results[index], row_count = converted
+            files[index].update(status='completed', rows=row_count)
+        else:
+            logger.error(f"Erro no arquivo do lote {files[index]['filename']}: {error}")
+            files[index].update(status='error', error=error)
+
+        if progress_callback is not None:
+            files_done = sum(1 for item in files if item['status'] != 'queued')
+            progress_callback(dict(files[index], stage='file', index=index,
+                                   files_done=files_done, files_total=len(files)))
+
+    workers = max(1, min(int(workers or 1), len(pdfs)))
+    logger.info(f"Lote com {len(pdfs)} PDFs em {workers} processos (saída: {output})")
+
+    if workers == 1:
+        for index, pdf_data in enumerate(sources):
+            try:
+                finish(index, convert_batch_item(converter, pdf_data, output))
+            except Exception as e:
+                finish(index, error=str(e))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(engine,)) as executor:
+            futures = {executor.submit(_convert_batch_item, pdf_data, output): index
+                       for index, pdf_data in enumerate(sources)}
+            for future in as_completed(futures):
+                try:
+                    finish(futures[future], future.result())
+                except Exception as e:
+                    finish(futures[future], error=str(e))
+
+    if not any(item['status'] == 'completed' for item in files):
+        raise ValueError("Nenhum PDF do lote pôde ser convertido")
+
+    converted = [(name, result) for (name, _), result in zip(pdfs, results) if result is not None]
+    buffer = io.BytesIO()
+
+    if output == 'sheets':
+        used_titles = set()
+        converter.write_xlsm_sheets(((sheet_title(name, used_titles), rows) for name, rows in converted),
+                                    buffer)
+    else:
+        # Os XLSM já são compactados: armazenar sem nova compressão
+        used_names = set()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+            for name, xlsm_data in converted:
+                archive.writestr(output_filename(name, used_names), xlsm_data)
+
+    return buffer.getvalue(), files
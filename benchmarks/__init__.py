@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks do conversor PDF para XLSM
+- synthetic_pdf: gerador de extratos sintéticos MercadoPago/Asaas (tabela ou texto)
+- run_benchmarks: mede cada etapa da conversão e grava os resultados em JSON
+- import_time: mede o tempo de importação dos módulos do servidor (cold start)
+- logging_cost: mede o custo do logging na conversão (nível, diagnóstico por linha, fila)
+- engine_equivalence: confere que os motores openpyxl e xml geram o mesmo XLSM, célula a célula
+"""
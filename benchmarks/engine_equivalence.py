@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Equivalência dos motores de escrita do XLSM (openpyxl e xml)
+Escreve as mesmas linhas com os dois motores, reabre cada arquivo com o openpyxl e
+compara célula a célula: valores, estilos (estilo nomeado, fonte, alinhamento, bordas,
+preenchimento e formato numérico), larguras das colunas, altura do cabeçalho e o layout
+de referência (4 linhas vazias, cabeçalho na linha 5, dados a partir da 6).
+A comparação byte a byte não se aplica (o XML gerado é diferente, o conteúdo não).
+As linhas vêm de extratos sintéticos convertidos pelo pipeline e de casos de borda
+(acentos, caracteres especiais de XML, vazios, números e textos longos), uma planilha
+por caso, como no lote com saída 'sheets'. Termina com código 1 se houver diferença.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.engine_equivalence
+    python -m benchmarks.engine_equivalence --pages 20 --max-differences 50
+"""
+
+import argparse
+import io
+import logging
+import sys
+
+from benchmarks.synthetic_pdf import FORMATS, LAYOUTS, generate_statement
+
+# Linhas no layout de 10 colunas com valores que exercitam a serialização
+EDGE_ROWS = [
+    ['01/02/2024', '', '', '1.234,56', '', 'Pagamento & transferência <PIX> "João" d\'Ávila', '', '', '', ''],
+    ['31/12/2023', '', '', '-0,01', '', '  espaços nas pontas  ', '', '', '', ''],
+    ['15/06/2024', '', '', '999.999,99', '', 'ç ã õ é ü ñ € ✓ 日本', '', '', '', ''],
+    ['01/01/2024', 123, 45.5, 0, None, 'x' * 500, '', '', '', ''],
+    ['', '', '', '', '', '', '', '', '', ''],
+]
+
+
+def pipeline_rows(fmt, layout, pages):
+    """Linhas no layout XLSM produzidas pelo conversor a partir de um extrato sintético"""
+    from pdf_to_xlsm_converter import PDFToXLSMConverter
+
+    pdf_data = generate_statement(fmt, layout, pages)
+    return [list(row) for row in PDFToXLSMConverter().stream_conversion_rows(pdf_data)]
+
+
+def write_workbook(engine, sheets):
+    """Escreve as planilhas com o motor informado e retorna o workbook reaberto pelo openpyxl"""
+    from openpyxl import load_workbook
+    from pdf_to_xlsm_converter import PDFToXLSMConverter
+
+    output = io.BytesIO()
+    PDFToXLSMConverter(engine=engine).write_xlsm_sheets(sheets, output)
+    output.seek(0)
+    return load_workbook(output)
+
+
+def cell_signature(cell):
+    """Valor e formatação de uma célula, na forma comparada entre os motores"""
+    font, alignment, border, fill = cell.font, cell.alignment, cell.border, cell.fill
+    return {
+        'value': cell.value,
+        'style': cell.style,
+        'font': (font.name, font.sz, bool(font.b)),
+        'alignment': (alignment.horizontal, alignment.vertical),
+        'border': tuple(getattr(border, side).style for side in ('left', 'right', 'top', 'bottom')),
+        'fill': fill.fill_type,
+        'number_format': cell.number_format,
+    }
+
+
+def check_layout(name, worksheet, rows):
+    """Diferenças do layout de referência em uma planilha"""
+    from pdf_to_xlsm_converter import XLSM_COLUMNS
+
+    problems = []
+    for row_idx in range(1, 5):
+        values = [cell.value for cell in worksheet[row_idx] if cell.value not in (None, '')]
+        if values:
+            problems.append(f"{name}: linha {row_idx} deveria estar vazia: {values}")
+
+    header = [worksheet.cell(row=5, column=col).value for col in range(1, len(XLSM_COLUMNS) + 1)]
+    if header != XLSM_COLUMNS:
+        problems.append(f"{name}: cabeçalho da linha 5 diferente: {header}")
+
+    if worksheet.max_row != 5 + len(rows):
+        problems.append(f"{name}: {worksheet.max_row - 5} linhas de dados, esperado {len(rows)}")
+    return problems
+
+
+def compare(sheets, max_differences=20):
+    """Compara os arquivos dos dois motores. Retorna a lista de diferenças."""
+    from pdf_to_xlsm_converter import REFERENCE_COLUMN_WIDTHS
+
+    expected = write_workbook('openpyxl', sheets)
+    actual = write_workbook('xml', sheets)
+
+    if expected.sheetnames != actual.sheetnames:
+        return [f"Planilhas diferentes: {expected.sheetnames} x {actual.sheetnames}"]
+
+    differences = []
+    for title, rows in sheets:
+        reference, candidate = expected[title], actual[title]
+        for engine, worksheet in (('openpyxl', reference), ('xml', candidate)):
+            differences += check_layout(f"{title} ({engine})", worksheet, rows)
+
+        for letter in REFERENCE_COLUMN_WIDTHS:
+            widths = (reference.column_dimensions[letter].width, candidate.column_dimensions[letter].width)
+            if widths[0] != widths[1]:
+                differences.append(f"{title}: largura da coluna {letter}: {widths[0]} x {widths[1]}")
+
+        heights = (reference.row_dimensions[5].height, candidate.row_dimensions[5].height)
+        if heights[0] != heights[1]:
+            differences.append(f"{title}: altura do cabeçalho: {heights[0]} x {heights[1]}")
+
+        max_row = max(reference.max_row, candidate.max_row)
+        max_column = max(reference.max_column, candidate.max_column)
+        for row_idx in range(1, max_row + 1):
+            for col_idx in range(1, max_column + 1):
+                expected_cell = cell_signature(reference.cell(row=row_idx, column=col_idx))
+                actual_cell = cell_signature(candidate.cell(row=row_idx, column=col_idx))
+                for key, value in expected_cell.items():
+                    if actual_cell[key] != value:
+                        ref = reference.cell(row=row_idx, column=col_idx).coordinate
+                        differences.append(f"{title}!{ref} {key}: {value!r} x {actual_cell[key]!r}")
+
+        if len(differences) >= max_differences:
+            break
+
+    return differences[:max_differences]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara os motores de escrita do XLSM célula a célula")
+    parser.add_argument("--pages", type=int, default=3, help="Páginas de cada extrato sintético (padrão: 3)")
+    parser.add_argument("--max-differences", type=int, default=20, help="Diferenças exibidas (padrão: 20)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    # Uma planilha por formato e layout e uma com os casos de borda
+    sheets = [(f"{fmt}-{layout}", pipeline_rows(fmt, layout, args.pages)) for fmt in FORMATS for layout in LAYOUTS]
+    sheets.append(('Casos de borda', EDGE_ROWS))
+
+    differences = compare(sheets, args.max_differences)
+    row_count = sum(len(rows) for _, rows in sheets)
+    if differences:
+        print(f"{len(differences)} diferenças entre openpyxl e xml:", file=sys.stderr)
+        for difference in differences:
+            print(f"  {difference}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"openpyxl e xml equivalentes: {len(sheets)} planilhas, {row_count} linhas de dados", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do tempo de importação (cold start)
+Importa cada módulo em um interpretador novo e mede o tempo e as dependências
+pesadas carregadas. O modo 'eager' importa antes pandas, pdfplumber e tkinter,
+como o conversor fazia no topo do módulo, para comparar com o carregamento sob demanda.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --modules app_vercel --repeat 10 --output importacao.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks.run_benchmarks import git_revision, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ('pdf_to_xlsm_converter', 'app_vercel', 'app')
+MODES = ('lazy', 'eager')
+
+# Importados no topo de pdf_to_xlsm_converter.py antes do carregamento sob demanda
+EAGER_IMPORTS = ('pandas', 'pdfplumber', 'tkinter')
+
+# Dependências pesadas verificadas em sys.modules depois da importação
+HEAVY_MODULES = ('pandas', 'numpy', 'pdfplumber', 'openpyxl', 'PyPDF2', 'tkinter')
+
+PROBE = """
+import json, logging, sys, time
+logging.disable(logging.CRITICAL)
+started = time.perf_counter()
+for name in {preload!r}:
+    try:
+        __import__(name)
+    except ImportError:
+        pass
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module, mode):
+    """Importa o módulo em um interpretador novo e retorna (segundos, módulos pesados carregados)"""
+    preload = EAGER_IMPORTS if mode == 'eager' else ()
+    code = PROBE.format(module=module, preload=preload, heavy=HEAVY_MODULES)
+    completed = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                               text=True, check=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result['seconds'], result['loaded']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o tempo de importação dos módulos do servidor")
+    parser.add_argument("--modules", nargs='+', default=list(DEFAULT_MODULES))
+    parser.add_argument("--modes", nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument("--repeat", type=int, default=5, help="Interpretadores por caso (padrão: 5)")
+    parser.add_argument("--output", help="Arquivo JSON de saída (opcional)")
+    args = parser.parse_args()
+
+    results = []
+    for module in args.modules:
+        for mode in args.modes:
+            samples = []
+            loaded = []
+            for _ in range(args.repeat):
+                seconds, loaded = measure(module, mode)
+                samples.append(seconds)
+            result = dict(module=module, mode=mode, loaded=loaded, seconds=summarize(samples))
+            results.append(result)
+            print(f"{module:22} {mode:5} {statistics.median(samples) * 1000:8.1f} ms  "
+                  f"carregados: {', '.join(loaded) or '-'}", file=sys.stderr)
+
+    if args.output:
+        report = {
+            'meta': dict(git_revision(), python=sys.version.split()[0], repeat=args.repeat),
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(report, output, ensure_ascii=False, indent=2)
+        print(f"Resultados gravados em {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
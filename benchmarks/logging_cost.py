@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark do custo de logging na conversão
+Cada caso roda em um interpretador novo (o log é configurado uma vez por processo)
+e converte o mesmo extrato sintético, gravando o log em um diretório temporário:
+- warning: apenas avisos e erros
+- info / info-sync: nível padrão, com gravação pela fila (QueueHandler) ou direta
+- debug-rows / debug-rows-sync: DEBUG com o diagnóstico de todas as linhas extraídas
+Também confere que instanciar vários conversores não duplica os handlers.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.logging_cost
+    python -m benchmarks.logging_cost --pages 50 --repeat 5 --output logging.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.run_benchmarks import git_revision, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Caso -> (nível do logger, diagnóstico a cada N linhas, gravação pela fila)
+CASES = {
+    'warning': ('WARNING', 0, True),
+    'info': ('INFO', 0, True),
+    'info-sync': ('INFO', 0, False),
+    'debug-rows': ('DEBUG', 1, True),
+    'debug-rows-sync': ('DEBUG', 1, False),
+}
+
+PROBE = """
+import json, logging, sys, time
+from benchmarks.synthetic_pdf import generate_statement
+from log_config import configure_file_logging
+import pdf_to_xlsm_converter
+from pdf_to_xlsm_converter import PDFToXLSMConverter
+
+level, row_log_every, asynchronous = {level!r}, {row_log_every!r}, {asynchronous!r}
+pdf_to_xlsm_converter.logger.setLevel(level)
+configure_file_logging('pdf_to_xlsm_converter', asynchronous=asynchronous)
+
+pdf_data = generate_statement({fmt!r}, 'text', {pages!r})
+samples = []
+for _ in range({repeat!r}):
+    converter = PDFToXLSMConverter(row_log_every=row_log_every)
+    started = time.perf_counter()
+    converter.convert_pdf_to_xlsm_in_memory(pdf_data)
+    samples.append(time.perf_counter() - started)
+
+print(json.dumps({{'samples': samples, 'rows': converter.rows_valid,
+                  'handlers': len(pdf_to_xlsm_converter.logger.handlers)}}))
+"""
+
+
+def run_case(name, fmt, pages, repeat):
+    """Executa um caso em um interpretador novo e retorna o resultado"""
+    level, row_log_every, asynchronous = CASES[name]
+    code = PROBE.format(level=level, row_log_every=row_log_every, asynchronous=asynchronous,
+                        fmt=fmt, pages=pages, repeat=repeat)
+    with tempfile.TemporaryDirectory() as log_dir:
+        env = dict(os.environ, CONVERTER_LOG_DIR=log_dir)
+        completed = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, check=True,
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        with open(os.path.join(log_dir, 'converter.log'), encoding='utf-8') as log_file:
+            log_lines = sum(1 for _ in log_file)
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {
+        'case': name,
+        'format': fmt,
+        'pages': pages,
+        'rows': result['rows'],
+        'handlers': result['handlers'],
+        'log_lines': log_lines,
+        'seconds': summarize(result['samples']),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o custo do logging na conversão")
+    parser.add_argument("--cases", nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument("--format", dest='fmt', choices=('mercadopago', 'asaas'), default='asaas')
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3, help="Conversões por caso (padrão: 3)")
+    parser.add_argument("--output", help="Arquivo JSON de saída (opcional)")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.cases:
+        result = run_case(name, args.fmt, args.pages, args.repeat)
+        results.append(result)
+        print(f"{name:16} {result['seconds']['median']:.3f}s  {result['log_lines']:6} linhas de log  "
+              f"handlers: {result['handlers']}", file=sys.stderr)
+
+    if args.output:
+        report = {
+            'meta': dict(git_revision(), python=sys.version.split()[0], repeat=args.repeat),
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(report, output, ensure_ascii=False, indent=2)
+        print(f"Resultados gravados em {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks das etapas da conversão
+Gera extratos sintéticos (formato x layout x páginas) e mede separadamente:
+extract_tables_from_pdf, clean_and_validate_data, convert_to_xlsm_format e
+create_xlsm_in_memory. Os resultados são gravados em JSON para comparar branches.
+
+Uso (na raiz do repositório):
+    python -m benchmarks.run_benchmarks --pages 1 10 100 --output resultados.json
+    python -m benchmarks.run_benchmarks --full --engine openpyxl xml
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks.synthetic_pdf import FORMATS, LAYOUTS, generate_statement
+
+DEFAULT_PAGES = (1, 10, 100)
+FULL_PAGES = (1, 10, 100, 500, 1000, 2000)
+
+STAGES = ('extract_tables_from_pdf', 'clean_and_validate_data', 'convert_to_xlsm_format',
+          'create_xlsm_in_memory')
+
+
+def git_revision():
+    """Commit e branch atuais (None fora de um repositório git)"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        branch = subprocess.run(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], cwd=root,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        return {'commit': commit, 'branch': branch}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'branch': None}
+
+
+def timed(func, *args):
+    """Executa a função e retorna (resultado, segundos)"""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def run_once(converter, pdf_data, as_dataframe=False):
+    """Executa as quatro etapas uma vez e retorna (tempos por etapa, contadores)"""
+    timings = {}
+    tables, timings['extract_tables_from_pdf'] = timed(converter.extract_tables_from_pdf, io.BytesIO(pdf_data))
+    cleaned, timings['clean_and_validate_data'] = timed(converter.clean_and_validate_data, tables)
+    df, timings['convert_to_xlsm_format'] = timed(converter.convert_to_xlsm_format, cleaned, as_dataframe)
+    xlsm_data, timings['create_xlsm_in_memory'] = timed(converter.create_xlsm_in_memory, df)
+
+    counts = {
+        'rows_extracted': len(tables),
+        'rows_valid': len(cleaned),
+        'output_bytes': len(xlsm_data),
+    }
+    return timings, counts
+
+
+def summarize(samples):
+    """Estatísticas de uma lista de tempos em segundos"""
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'max': max(samples),
+        'samples': samples,
+    }
+
+
+def run_case(converter, fmt, layout, pages, repeat, rows_per_page, as_dataframe=False):
+    """Mede um caso (formato, layout, páginas) com `repeat` repetições"""
+    pdf_data = generate_statement(fmt, layout, pages, rows_per_page)
+
+    samples = {stage: [] for stage in STAGES}
+    totals = []
+    counts = None
+    for _ in range(repeat):
+        timings, counts = run_once(converter, pdf_data, as_dataframe)
+        for stage in STAGES:
+            samples[stage].append(timings[stage])
+        totals.append(sum(timings.values()))
+
+    total = summarize(totals)
+    return dict(
+        counts,
+        format=fmt,
+        layout=layout,
+        pages=pages,
+        engine=converter.engine,
+        dataframe=as_dataframe,
+        pdf_bytes=len(pdf_data),
+        stages={stage: summarize(samples[stage]) for stage in STAGES},
+        total=total,
+        pages_per_second=pages / total['median'] if total['median'] else None,
+        rows_per_second=counts['rows_valid'] / total['median'] if total['median'] else None,
+    )
+
+
+def main():
+    # Importado aqui para o gerador de PDFs não depender do conversor
+    from pdf_to_xlsm_converter import CONVERTER_VERSION, OUTPUT_ENGINES, PDFToXLSMConverter
+
+    parser = argparse.ArgumentParser(description="Mede as etapas do conversor com extratos sintéticos")
+    parser.add_argument("--pages", type=int, nargs='+', default=list(DEFAULT_PAGES),
+                        help=f"Tamanhos em páginas (padrão: {' '.join(map(str, DEFAULT_PAGES))})")
+    parser.add_argument("--full", action="store_true",
+                        help=f"Usar os tamanhos {' '.join(map(str, FULL_PAGES))}")
+    parser.add_argument("--formats", nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--layouts", nargs='+', choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument("--engine", nargs='+', choices=OUTPUT_ENGINES, default=['openpyxl'])
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por caso (padrão: 3)")
+    parser.add_argument("--rows-per-page", type=int, default=40)
+    parser.add_argument("--dataframe", action="store_true",
+                        help="Montar um DataFrame do pandas em convert_to_xlsm_format (requer pandas)")
+    parser.add_argument("--log-level", default='WARNING',
+                        help="Nível de log do conversor durante as medições (padrão: WARNING)")
+    parser.add_argument("--output", default='benchmark_results.json',
+                        help="Arquivo JSON de saída (padrão: benchmark_results.json)")
+    args = parser.parse_args()
+
+    logging.getLogger('pdf_to_xlsm_converter').setLevel(args.log_level.upper())
+    page_sizes = FULL_PAGES if args.full else args.pages
+
+    results = []
+    for engine in args.engine:
+        converter = PDFToXLSMConverter(engine=engine)
+        for fmt in args.formats:
+            for layout in args.layouts:
+                for pages in page_sizes:
+                    result = run_case(converter, fmt, layout, pages, args.repeat, args.rows_per_page,
+                                      args.dataframe)
+                    results.append(result)
+                    print(f"{engine:8} {fmt:11} {layout:5} {pages:5} páginas: "
+                          f"{result['total']['median']:.3f}s "
+                          f"({result['pages_per_second']:.1f} páginas/s, "
+                          f"{result['rows_per_second']:.1f} linhas/s)", file=sys.stderr)
+
+    report = {
+        'meta': dict(
+            git_revision(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            converter_version=CONVERTER_VERSION,
+            python=platform.python_version(),
+            platform=platform.platform(),
+            cpu_count=os.cpu_count(),
+            repeat=args.repeat,
+            rows_per_page=args.rows_per_page,
+            log_level=args.log_level.upper(),
+        ),
+        'results': results,
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as output:
+        json.dump(report, output, ensure_ascii=False, indent=2)
+    print(f"Resultados gravados em {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gerador de extratos sintéticos para os benchmarks
+Produz PDFs no formato MercadoPago (DD-MM-AAAA) ou Asaas (DD/MM/AAAA), com as
+transações em tabela (linhas e colunas desenhadas) ou em texto corrido com
+linhas quebradas, sem dependências além da biblioteca padrão.
+
+Uso:
+    python -m benchmarks.synthetic_pdf asaas text 100 extrato.pdf
+"""
+
+import argparse
+import random
+
+FORMATS = ('mercadopago', 'asaas')
+LAYOUTS = ('table', 'text')
+
+# Página A4 em pontos e geometria das linhas
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+TOP = 800
+LINE_HEIGHT = 14
+FONT_SIZE = 9
+
+# Colunas da tabela: início do texto de cada coluna e bordas verticais
+TABLE_TEXT_X = (40, 120, 480)
+TABLE_BORDERS_X = (35, 115, 475, 560)
+
+DESCRIPTIONS = (
+    'Pix recebido', 'Pagamento de boleto', 'Transferência enviada', 'Venda no cartão',
+    'Cobrança recebida', 'Tarifa bancária', 'Rendimentos', 'Estorno de venda',
+)
+
+HEADERS = {
+    'mercadopago': 'Data Descrição ID da operação Valor Saldo',
+    'asaas': 'Data Movimentações Valor',
+}
+
+
+def pdf_escape(text):
+    """Escapa o texto para uma string literal do PDF"""
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def text_op(x, y, text):
+    return f"BT /F1 {FONT_SIZE} Tf {x} {y} Td ({pdf_escape(text)}) Tj ET"
+
+
+def page_content(lines):
+    """
+    Conteúdo de uma página: strings viram linhas de texto, tuplas viram linhas
+    de tabela com bordas
+    """
+    ops = []
+    y = TOP
+    for line in lines:
+        if isinstance(line, tuple):
+            ops.extend(text_op(x, y, cell) for x, cell in zip(TABLE_TEXT_X, line))
+            left, right = TABLE_BORDERS_X[0], TABLE_BORDERS_X[-1]
+            ops.append(f"{left} {y - 4} m {right} {y - 4} l S {left} {y + 10} m {right} {y + 10} l S")
+            ops.extend(f"{x} {y - 4} m {x} {y + 10} l S" for x in TABLE_BORDERS_X)
+        else:
+            ops.append(text_op(TABLE_TEXT_X[0], y, line))
+        y -= LINE_HEIGHT
+    return '\n'.join(ops).encode('cp1252')
+
+
+def build_pdf(pages):
+    """Monta o PDF (objetos, xref e trailer) a partir das linhas de cada página"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # árvore de páginas, preenchida depois das páginas
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+
+    kids = []
+    for lines in pages:
+        content = page_content(lines)
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        objects.append((
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        ).encode('ascii'))
+        kids.append(len(objects))
+
+    objects[1] = (f"<< /Type /Pages /Kids [{' '.join(f'{kid} 0 R' for kid in kids)}] "
+                  f"/Count {len(kids)} >>").encode('ascii')
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+
+    return bytes(output)
+
+
+def random_date(rng, fmt):
+    day, month = rng.randint(1, 28), rng.randint(1, 12)
+    separator = '-' if fmt == 'mercadopago' else '/'
+    return f"{day:02d}{separator}{month:02d}{separator}2024"
+
+
+def random_value(rng):
+    """Valor no formato brasileiro, com separador de milhar em parte dos casos"""
+    sign = '-' if rng.random() < 0.3 else ''
+    reais = rng.randint(1, 999) if rng.random() < 0.8 else rng.randint(1000, 99999)
+    integer = f"{reais:,}".replace(',', '.')
+    return f"{sign}{integer},{rng.randint(0, 99):02d}"
+
+
+def random_description(rng):
+    return f"{rng.choice(DESCRIPTIONS)} {rng.randint(1, 9999)}"
+
+
+def text_transactions(rng, fmt):
+    """Linhas de texto de uma transação; parte delas quebrada em duas linhas"""
+    date, value, description = random_date(rng, fmt), random_value(rng), random_description(rng)
+    wrapped = rng.random() < 0.3
+
+    if fmt == 'mercadopago':
+        operation_id = rng.randint(10 ** 9, 10 ** 10)
+        balance = random_value(rng).lstrip('-')
+        if wrapped:
+            # Descrição na linha anterior à data
+            return [description, f"{date} {operation_id} R$ {value} R$ {balance}"]
+        return [f"{date} {description} {operation_id} R$ {value} R$ {balance}"]
+
+    if wrapped and rng.random() < 0.5:
+        # Data e descrição em uma linha, valor na seguinte
+        return [f"{date} {description}", f"R$ {value}"]
+    if wrapped:
+        # Descrição em uma linha, data e valor na seguinte
+        return [description, f"{date} R$ {value}"]
+    return [f"{date} {description} R$ {value}"]
+
+
+def generate_pages(fmt='asaas', layout='text', pages=1, rows_per_page=40, seed=0):
+    """Gera as linhas de cada página do extrato"""
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato inválido: {fmt}. Use um de: {', '.join(FORMATS)}")
+    if layout not in LAYOUTS:
+        raise ValueError(f"Layout inválido: {layout}. Use um de: {', '.join(LAYOUTS)}")
+
+    rng = random.Random(seed)
+    result = []
+    for _ in range(pages):
+        if layout == 'table':
+            lines = [('Data', 'Movimentações', 'Valor')]
+            lines.extend((random_date(rng, fmt), random_description(rng), random_value(rng))
+                         for _ in range(rows_per_page - 1))
+        else:
+            lines = [HEADERS[fmt]]
+            while True:
+                # Transações quebradas não são divididas entre páginas
+                transaction = text_transactions(rng, fmt)
+                if len(lines) + len(transaction) > rows_per_page:
+                    break
+                lines.extend(transaction)
+        result.append(lines)
+    return result
+
+
+def generate_statement(fmt='asaas', layout='text', pages=1, rows_per_page=40, seed=0):
+    """
+    Gera um extrato sintético e retorna os bytes do PDF.
+    - fmt: 'mercadopago' ou 'asaas'
+    - layout: 'table' (tabela com bordas) ou 'text' (texto com linhas quebradas)
+    - pages: número de páginas (ex.: 1 a 2000)
+    """
+    return build_pdf(generate_pages(fmt, layout, pages, rows_per_page, seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera um extrato sintético em PDF para benchmarks")
+    parser.add_argument("format", choices=FORMATS)
+    parser.add_argument("layout", choices=LAYOUTS)
+    parser.add_argument("pages", type=int)
+    parser.add_argument("output", metavar="arquivo_saida.pdf")
+    parser.add_argument("--rows-per-page", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = generate_statement(args.format, args.layout, args.pages, args.rows_per_page, args.seed)
+    with open(args.output, 'wb') as output:
+        output.write(data)
+    print(f"{args.output}: {args.pages} páginas, {len(data)} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de resultados de conversão
+Endereçado pelo conteúdo do PDF: a chave é o hash dos bytes do arquivo combinado
+com a versão do conversor e as opções que alteram a saída
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from result_store import SpilledResult
+
+logger = logging.getLogger(__name__)
+
+
+def pdf_hasher():
+    """Hash incremental do PDF (o mesmo de pdf_digest), para calcular em blocos"""
+    return hashlib.sha256()
+
+
+def pdf_digest(pdf_data):
+    """Calcula o hash SHA-256 dos bytes do PDF"""
+    hasher = pdf_hasher()
+    hasher.update(pdf_data)
+    return hasher.hexdigest()
+
+
+def make_cache_key(digest, *variant):
+    """
+    Monta a chave do cache a partir do hash do PDF e das partes que alteram o resultado
+    (versão do conversor, motor de escrita, opções...)
+    """
+    material = '|'.join([digest] + [str(part) for part in variant])
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class ConversionCache:
+    """
+    Cache em dois níveis para os arquivos convertidos:
+    - memória: LRU limitado por um orçamento total de bytes; resultados maiores que
+      max_entry_bytes ficam só no disco (None = qualquer tamanho que caiba no orçamento)
+    - disco (opcional): diretório com despejo dos arquivos mais antigos por tamanho
+    """
+
+    def __init__(self, max_bytes=100 * 1024 * 1024, disk_dir=None, disk_max_bytes=1024 * 1024 * 1024,
+                 max_entry_bytes=None):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(path.stat().st_size for path in self.disk_dir.glob('*.bin'))
+
+    def get(self, key):
+        """
+        Retorna os bytes convertidos da chave ou None. Resultados do disco maiores que
+        max_entry_bytes não são lidos: retorna um SpilledResult com o arquivo do cache
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return data
+
+        data = self._read_disk(key)
+
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.disk_hits += 1
+            if not isinstance(data, SpilledResult):
+                self._store_memory(key, data)
+            return data
+
+    def put(self, key, data):
+        """Armazena o resultado nos dois níveis (só no disco acima de max_entry_bytes)"""
+        with self._lock:
+            self._store_memory(key, data)
+
+        self._write_disk(key, data)
+
+    def stats(self):
+        """Contadores de acertos/falhas e ocupação de cada nível"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'memory_entries': len(self._entries),
+                'memory_bytes': self._memory_bytes,
+                'memory_max_bytes': self.max_bytes,
+                'disk_enabled': self.disk_dir is not None,
+                'disk_bytes': self._disk_bytes,
+                'disk_max_bytes': self.disk_max_bytes if self.disk_dir else 0,
+            }
+
+    def _store_memory(self, key, data):
+        """Insere no LRU em memória e despeja as entradas mais antigas (chamar com o lock)"""
+        size = len(data)
+        if not self._fits_memory(size):
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+
+        self._entries[key] = data
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _fits_memory(self, size):
+        return size <= self.max_bytes and (self.max_entry_bytes is None or size <= self.max_entry_bytes)
+
+    def _disk_path(self, key):
+        return self.disk_dir / f"{key}.bin"
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            size = path.stat().st_size
+            # Atualiza o horário de acesso usado no despejo
+            os.utime(path)
+            if not self._fits_memory(size):
+                return SpilledResult(str(path), size)
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Erro ao ler cache em disco {path}: {str(e)}")
+            return None
+
+    def _write_disk(self, key, data):
+        if not self.disk_dir or len(data) > self.disk_max_bytes:
+            return
+
+        path = self._disk_path(key)
+        if path.exists():
+            return
+
+        # Escrita atômica: grava em arquivo temporário e renomeia
+        temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Erro ao gravar cache em disco {path}: {str(e)}")
+            temp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._disk_bytes += len(data)
+            if self._disk_bytes <= self.disk_max_bytes:
+                return
+
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """Remove os arquivos menos usados até caber no orçamento do disco"""
+        files = []
+        for path in self.disk_dir.glob('*.bin'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+        with self._lock:
+            self._disk_bytes = total
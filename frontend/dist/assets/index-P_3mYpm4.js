@@ -37,4 +37,4 @@
 `+l[o].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}while(1<=o&&0<=i);break}}}finally{El=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Sn(e):""}function Tc(e){switch(e.tag){case 5:return Sn(e.type);case 16:return Sn("Lazy");case 13:return Sn("Suspense");case 19:return Sn("SuspenseList");case 0:case 2:case 15:return e=Cl(e.type,!1),e;case 11:return e=Cl(e.type.render,!1),e;case 1:return e=Cl(e.type,!0),e;default:return""}}function ql(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case It:return"Fragment";case Mt:return"Portal";case Gl:return"Profiler";case Xu:return"StrictMode";case Zl:return"Suspense";case Jl:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case os:return(e.displayName||"Context")+".Consumer";case us:return(e._context.displayName||"Context")+".Provider";case Yu:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Gu:return t=e.displayName||null,t!==null?t:ql(e.type)||"Memo";case et:t=e._payload,e=e._init;try{return ql(e(t))}catch{}}return null}function Rc(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return ql(t);case 8:return t===Xu?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function mt(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function ss(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Dc(e){var t=ss(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var l=n.get,u=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return l.call(this)},set:function(o){r=""+o,u.call(this,o)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(o){r=""+o},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function ur(e){e._valueTracker||(e._valueTracker=Dc(e))}function as(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ss(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function Rr(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function bl(e,t){var n=t.checked;return H({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function Vo(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=mt(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function cs(e,t){t=t.checked,t!=null&&Ku(e,"checked",t,!1)}function eu(e,t){cs(e,t);var n=mt(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?tu(e,t.type,n):t.hasOwnProperty("defaultValue")&&tu(e,t.type,mt(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function Bo(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function tu(e,t,n){(t!=="number"||Rr(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var kn=Array.isArray;function Yt(e,t,n,r){if(e=e.options,t){t={};for(var l=0;l<n.length;l++)t["$"+n[l]]=!0;for(n=0;n<e.length;n++)l=t.hasOwnProperty("$"+e[n].value),e[n].selected!==l&&(e[n].selected=l),l&&r&&(e[n].defaultSelected=!0)}else{for(n=""+mt(n),t=null,l=0;l<e.length;l++){if(e[l].value===n){e[l].selected=!0,r&&(e[l].defaultSelected=!0);return}t!==null||e[l].disabled||(t=e[l])}t!==null&&(t.selected=!0)}}function nu(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(g(91));return H({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Ho(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(g(92));if(kn(n)){if(1<n.length)throw Error(g(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:mt(n)}}function fs(e,t){var n=mt(t.value),r=mt(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function Wo(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function ds(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ru(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?ds(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var or,ps=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,l){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,l)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(or=or||document.createElement("div"),or.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=or.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function On(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Cn={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},Oc=["Webkit","ms","Moz","O"];Object.keys(Cn).forEach(function(e){Oc.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Cn[t]=Cn[e]})});function ms(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Cn.hasOwnProperty(e)&&Cn[e]?(""+t).trim():t+"px"}function hs(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,l=ms(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,l):e[n]=l}}var Fc=H({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function lu(e,t){if(t){if(Fc[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(g(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(g(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(g(61))}if(t.style!=null&&typeof t.style!="object")throw Error(g(62))}}function uu(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var ou=null;function Zu(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var iu=null,Gt=null,Zt=null;function Qo(e){if(e=bn(e)){if(typeof iu!="function")throw Error(g(280));var t=e.stateNode;t&&(t=il(t),iu(e.stateNode,e.type,t))}}function vs(e){Gt?Zt?Zt.push(e):Zt=[e]:Gt=e}function ys(){if(Gt){var e=Gt,t=Zt;if(Zt=Gt=null,Qo(e),t)for(e=0;e<t.length;e++)Qo(t[e])}}function gs(e,t){return e(t)}function ws(){}var Nl=!1;function Ss(e,t,n){if(Nl)return e(t,n);Nl=!0;try{return gs(e,t,n)}finally{Nl=!1,(Gt!==null||Zt!==null)&&(ws(),ys())}}function Fn(e,t){var n=e.stateNode;if(n===null)return null;var r=il(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(g(231,t,typeof n));return n}var su=!1;if(Ye)try{var pn={};Object.defineProperty(pn,"passive",{get:function(){su=!0}}),window.addEventListener("test",pn,pn),window.removeEventListener("test",pn,pn)}catch{su=!1}function Mc(e,t,n,r,l,u,o,i,s){var f=Array.prototype.slice.call(arguments,3);try{t.apply(n,f)}catch(h){this.onError(h)}}var Nn=!1,Dr=null,Or=!1,au=null,Ic={onError:function(e){Nn=!0,Dr=e}};function Uc(e,t,n,r,l,u,o,i,s){Nn=!1,Dr=null,Mc.apply(Ic,arguments)}function $c(e,t,n,r,l,u,o,i,s){if(Uc.apply(this,arguments),Nn){if(Nn){var f=Dr;Nn=!1,Dr=null}else throw Error(g(198));Or||(Or=!0,au=f)}}function Ot(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function ks(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function Ko(e){if(Ot(e)!==e)throw Error(g(188))}function Ac(e){var t=e.alternate;if(!t){if(t=Ot(e),t===null)throw Error(g(188));return t!==e?null:e}for(var n=e,r=t;;){var l=n.return;if(l===null)break;var u=l.alternate;if(u===null){if(r=l.return,r!==null){n=r;continue}break}if(l.child===u.child){for(u=l.child;u;){if(u===n)return Ko(l),e;if(u===r)return Ko(l),t;u=u.sibling}throw Error(g(188))}if(n.return!==r.return)n=l,r=u;else{for(var o=!1,i=l.child;i;){if(i===n){o=!0,n=l,r=u;break}if(i===r){o=!0,r=l,n=u;break}i=i.sibling}if(!o){for(i=u.child;i;){if(i===n){o=!0,n=u,r=l;break}if(i===r){o=!0,r=u,n=l;break}i=i.sibling}if(!o)throw Error(g(189))}}if(n.alternate!==r)throw Error(g(190))}if(n.tag!==3)throw Error(g(188));return n.stateNode.current===n?e:t}function xs(e){return e=Ac(e),e!==null?Es(e):null}function Es(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Es(e);if(t!==null)return t;e=e.sibling}return null}var Cs=ke.unstable_scheduleCallback,Xo=ke.unstable_cancelCallback,Vc=ke.unstable_shouldYield,Bc=ke.unstable_requestPaint,K=ke.unstable_now,Hc=ke.unstable_getCurrentPriorityLevel,Ju=ke.unstable_ImmediatePriority,Ns=ke.unstable_UserBlockingPriority,Fr=ke.unstable_NormalPriority,Wc=ke.unstable_LowPriority,_s=ke.unstable_IdlePriority,rl=null,Ve=null;function Qc(e){if(Ve&&typeof Ve.onCommitFiberRoot=="function")try{Ve.onCommitFiberRoot(rl,e,void 0,(e.current.flags&128)===128)}catch{}}var Oe=Math.clz32?Math.clz32:Yc,Kc=Math.log,Xc=Math.LN2;function Yc(e){return e>>>=0,e===0?32:31-(Kc(e)/Xc|0)|0}var ir=64,sr=4194304;function xn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function Mr(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,l=e.suspendedLanes,u=e.pingedLanes,o=n&268435455;if(o!==0){var i=o&~l;i!==0?r=xn(i):(u&=o,u!==0&&(r=xn(u)))}else o=n&~l,o!==0?r=xn(o):u!==0&&(r=xn(u));if(r===0)return 0;if(t!==0&&t!==r&&!(t&l)&&(l=r&-r,u=t&-t,l>=u||l===16&&(u&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-Oe(t),l=1<<n,r|=e[n],t&=~l;return r}function Gc(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Zc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,u=e.pendingLanes;0<u;){var o=31-Oe(u),i=1<<o,s=l[o];s===-1?(!(i&n)||i&r)&&(l[o]=Gc(i,t)):s<=t&&(e.expiredLanes|=i),u&=~i}}function cu(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function Ps(){var e=ir;return ir<<=1,!(ir&4194240)&&(ir=64),e}function _l(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Jn(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-Oe(t),e[t]=n}function Jc(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var l=31-Oe(n),u=1<<l;t[l]=0,r[l]=-1,e[l]=-1,n&=~u}}function qu(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-Oe(n),l=1<<r;l&t|e[r]&t&&(e[r]|=t),n&=~l}}var O=0;function zs(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var js,bu,Ls,Ts,Rs,fu=!1,ar=[],ot=null,it=null,st=null,Mn=new Map,In=new Map,nt=[],qc="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Yo(e,t){switch(e){case"focusin":case"focusout":ot=null;break;case"dragenter":case"dragleave":it=null;break;case"mouseover":case"mouseout":st=null;break;case"pointerover":case"pointerout":Mn.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":In.delete(t.pointerId)}}function mn(e,t,n,r,l,u){return e===null||e.nativeEvent!==u?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:u,targetContainers:[l]},t!==null&&(t=bn(t),t!==null&&bu(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,l!==null&&t.indexOf(l)===-1&&t.push(l),e)}function bc(e,t,n,r,l){switch(t){case"focusin":return ot=mn(ot,e,t,n,r,l),!0;case"dragenter":return it=mn(it,e,t,n,r,l),!0;case"mouseover":return st=mn(st,e,t,n,r,l),!0;case"pointerover":var u=l.pointerId;return Mn.set(u,mn(Mn.get(u)||null,e,t,n,r,l)),!0;case"gotpointercapture":return u=l.pointerId,In.set(u,mn(In.get(u)||null,e,t,n,r,l)),!0}return!1}function Ds(e){var t=Et(e.target);if(t!==null){var n=Ot(t);if(n!==null){if(t=n.tag,t===13){if(t=ks(n),t!==null){e.blockedOn=t,Rs(e.priority,function(){Ls(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function xr(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=du(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);ou=r,n.target.dispatchEvent(r),ou=null}else return t=bn(n),t!==null&&bu(t),e.blockedOn=n,!1;t.shift()}return!0}function Go(e,t,n){xr(e)&&n.delete(t)}function ef(){fu=!1,ot!==null&&xr(ot)&&(ot=null),it!==null&&xr(it)&&(it=null),st!==null&&xr(st)&&(st=null),Mn.forEach(Go),In.forEach(Go)}function hn(e,t){e.blockedOn===t&&(e.blockedOn=null,fu||(fu=!0,ke.unstable_scheduleCallback(ke.unstable_NormalPriority,ef)))}function Un(e){function t(l){return hn(l,e)}if(0<ar.length){hn(ar[0],e);for(var n=1;n<ar.length;n++){var r=ar[n];r.blockedOn===e&&(r.blockedOn=null)}}for(ot!==null&&hn(ot,e),it!==null&&hn(it,e),st!==null&&hn(st,e),Mn.forEach(t),In.forEach(t),n=0;n<nt.length;n++)r=nt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<nt.length&&(n=nt[0],n.blockedOn===null);)Ds(n),n.blockedOn===null&&nt.shift()}var Jt=qe.ReactCurrentBatchConfig,Ir=!0;function tf(e,t,n,r){var l=O,u=Jt.transition;Jt.transition=null;try{O=1,eo(e,t,n,r)}finally{O=l,Jt.transition=u}}function nf(e,t,n,r){var l=O,u=Jt.transition;Jt.transition=null;try{O=4,eo(e,t,n,r)}finally{O=l,Jt.transition=u}}function eo(e,t,n,r){if(Ir){var l=du(e,t,n,r);if(l===null)Ml(e,t,r,Ur,n),Yo(e,r);else if(bc(l,e,t,n,r))r.stopPropagation();else if(Yo(e,r),t&4&&-1<qc.indexOf(e)){for(;l!==null;){var u=bn(l);if(u!==null&&js(u),u=du(e,t,n,r),u===null&&Ml(e,t,r,Ur,n),u===l)break;l=u}l!==null&&r.stopPropagation()}else Ml(e,t,r,null,n)}}var Ur=null;function du(e,t,n,r){if(Ur=null,e=Zu(r),e=Et(e),e!==null)if(t=Ot(e),t===null)e=null;else if(n=t.tag,n===13){if(e=ks(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return Ur=e,null}function Os(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Hc()){case Ju:return 1;case Ns:return 4;case Fr:case Wc:return 16;case _s:return 536870912;default:return 16}default:return 16}}var lt=null,to=null,Er=null;function Fs(){if(Er)return Er;var e,t=to,n=t.length,r,l="value"in lt?lt.value:lt.textContent,u=l.length;for(e=0;e<n&&t[e]===l[e];e++);var o=n-e;for(r=1;r<=o&&t[n-r]===l[u-r];r++);return Er=l.slice(e,1<r?1-r:void 0)}function Cr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function cr(){return!0}function Zo(){return!1}function Ee(e){function t(n,r,l,u,o){this._reactName=n,this._targetInst=l,this.type=r,this.nativeEvent=u,this.target=o,this.currentTarget=null;for(var i in e)e.hasOwnProperty(i)&&(n=e[i],this[i]=n?n(u):u[i]);return this.isDefaultPrevented=(u.defaultPrevented!=null?u.defaultPrevented:u.returnValue===!1)?cr:Zo,this.isPropagationStopped=Zo,this}return H(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=cr)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=cr)},persist:function(){},isPersistent:cr}),t}var an={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},no=Ee(an),qn=H({},an,{view:0,detail:0}),rf=Ee(qn),Pl,zl,vn,ll=H({},qn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ro,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==vn&&(vn&&e.type==="mousemove"?(Pl=e.screenX-vn.screenX,zl=e.screenY-vn.screenY):zl=Pl=0,vn=e),Pl)},movementY:function(e){return"movementY"in e?e.movementY:zl}}),Jo=Ee(ll),lf=H({},ll,{dataTransfer:0}),uf=Ee(lf),of=H({},qn,{relatedTarget:0}),jl=Ee(of),sf=H({},an,{animationName:0,elapsedTime:0,pseudoElement:0}),af=Ee(sf),cf=H({},an,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),ff=Ee(cf),df=H({},an,{data:0}),qo=Ee(df),pf={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},mf={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},hf={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function vf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=hf[e])?!!t[e]:!1}function ro(){return vf}var yf=H({},qn,{key:function(e){if(e.key){var t=pf[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Cr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?mf[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ro,charCode:function(e){return e.type==="keypress"?Cr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Cr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),gf=Ee(yf),wf=H({},ll,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),bo=Ee(wf),Sf=H({},qn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ro}),kf=Ee(Sf),xf=H({},an,{propertyName:0,elapsedTime:0,pseudoElement:0}),Ef=Ee(xf),Cf=H({},ll,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Nf=Ee(Cf),_f=[9,13,27,32],lo=Ye&&"CompositionEvent"in window,_n=null;Ye&&"documentMode"in document&&(_n=document.documentMode);var Pf=Ye&&"TextEvent"in window&&!_n,Ms=Ye&&(!lo||_n&&8<_n&&11>=_n),ei=" ",ti=!1;function Is(e,t){switch(e){case"keyup":return _f.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Us(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Ut=!1;function zf(e,t){switch(e){case"compositionend":return Us(t);case"keypress":return t.which!==32?null:(ti=!0,ei);case"textInput":return e=t.data,e===ei&&ti?null:e;default:return null}}function jf(e,t){if(Ut)return e==="compositionend"||!lo&&Is(e,t)?(e=Fs(),Er=to=lt=null,Ut=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Ms&&t.locale!=="ko"?null:t.data;default:return null}}var Lf={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function ni(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Lf[e.type]:t==="textarea"}function $s(e,t,n,r){vs(r),t=$r(t,"onChange"),0<t.length&&(n=new no("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Pn=null,$n=null;function Tf(e){Zs(e,0)}function ul(e){var t=Vt(e);if(as(t))return e}function Rf(e,t){if(e==="change")return t}var As=!1;if(Ye){var Ll;if(Ye){var Tl="oninput"in document;if(!Tl){var ri=document.createElement("div");ri.setAttribute("oninput","return;"),Tl=typeof ri.oninput=="function"}Ll=Tl}else Ll=!1;As=Ll&&(!document.documentMode||9<document.documentMode)}function li(){Pn&&(Pn.detachEvent("onpropertychange",Vs),$n=Pn=null)}function Vs(e){if(e.propertyName==="value"&&ul($n)){var t=[];$s(t,$n,e,Zu(e)),Ss(Tf,t)}}function Df(e,t,n){e==="focusin"?(li(),Pn=t,$n=n,Pn.attachEvent("onpropertychange",Vs)):e==="focusout"&&li()}function Of(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return ul($n)}function Ff(e,t){if(e==="click")return ul(t)}function Mf(e,t){if(e==="input"||e==="change")return ul(t)}function If(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var Me=typeof Object.is=="function"?Object.is:If;function An(e,t){if(Me(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var l=n[r];if(!Yl.call(t,l)||!Me(e[l],t[l]))return!1}return!0}function ui(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function oi(e,t){var n=ui(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=ui(n)}}function Bs(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Bs(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Hs(){for(var e=window,t=Rr();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=Rr(e.document)}return t}function uo(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Uf(e){var t=Hs(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&Bs(n.ownerDocument.documentElement,n)){if(r!==null&&uo(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var l=n.textContent.length,u=Math.min(r.start,l);r=r.end===void 0?u:Math.min(r.end,l),!e.extend&&u>r&&(l=r,r=u,u=l),l=oi(n,u);var o=oi(n,r);l&&o&&(e.rangeCount!==1||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&(t=t.createRange(),t.setStart(l.node,l.offset),e.removeAllRanges(),u>r?(e.addRange(t),e.extend(o.node,o.offset)):(t.setEnd(o.node,o.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var $f=Ye&&"documentMode"in document&&11>=document.documentMode,$t=null,pu=null,zn=null,mu=!1;function ii(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;mu||$t==null||$t!==Rr(r)||(r=$t,"selectionStart"in r&&uo(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),zn&&An(zn,r)||(zn=r,r=$r(pu,"onSelect"),0<r.length&&(t=new no("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=$t)))}function fr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var At={animationend:fr("Animation","AnimationEnd"),animationiteration:fr("Animation","AnimationIteration"),animationstart:fr("Animation","AnimationStart"),transitionend:fr("Transition","TransitionEnd")},Rl={},Ws={};Ye&&(Ws=document.createElement("div").style,"AnimationEvent"in window||(delete At.animationend.animation,delete At.animationiteration.animation,delete At.animationstart.animation),"TransitionEvent"in window||delete At.transitionend.transition);function ol(e){if(Rl[e])return Rl[e];if(!At[e])return e;var t=At[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Ws)return Rl[e]=t[n];return e}var Qs=ol("animationend"),Ks=ol("animationiteration"),Xs=ol("animationstart"),Ys=ol("transitionend"),Gs=new Map,si="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function vt(e,t){Gs.set(e,t),Dt(t,[e])}for(var Dl=0;Dl<si.length;Dl++){var Ol=si[Dl],Af=Ol.toLowerCase(),Vf=Ol[0].toUpperCase()+Ol.slice(1);vt(Af,"on"+Vf)}vt(Qs,"onAnimationEnd");vt(Ks,"onAnimationIteration");vt(Xs,"onAnimationStart");vt("dblclick","onDoubleClick");vt("focusin","onFocus");vt("focusout","onBlur");vt(Ys,"onTransitionEnd");en("onMouseEnter",["mouseout","mouseover"]);en("onMouseLeave",["mouseout","mouseover"]);en("onPointerEnter",["pointerout","pointerover"]);en("onPointerLeave",["pointerout","pointerover"]);Dt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Dt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Dt("onBeforeInput",["compositionend","keypress","textInput","paste"]);Dt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Dt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Dt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var En="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Bf=new Set("cancel close invalid load scroll toggle".split(" ").concat(En));function ai(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,$c(r,t,void 0,e),e.currentTarget=null}function Zs(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],l=r.event;r=r.listeners;e:{var u=void 0;if(t)for(var o=r.length-1;0<=o;o--){var i=r[o],s=i.instance,f=i.currentTarget;if(i=i.listener,s!==u&&l.isPropagationStopped())break e;ai(l,i,f),u=s}else for(o=0;o<r.length;o++){if(i=r[o],s=i.instance,f=i.currentTarget,i=i.listener,s!==u&&l.isPropagationStopped())break e;ai(l,i,f),u=s}}}if(Or)throw e=au,Or=!1,au=null,e}function I(e,t){var n=t[wu];n===void 0&&(n=t[wu]=new Set);var r=e+"__bubble";n.has(r)||(Js(t,e,2,!1),n.add(r))}function Fl(e,t,n){var r=0;t&&(r|=4),Js(n,e,r,t)}var dr="_reactListening"+Math.random().toString(36).slice(2);function Vn(e){if(!e[dr]){e[dr]=!0,ls.forEach(function(n){n!=="selectionchange"&&(Bf.has(n)||Fl(n,!1,e),Fl(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[dr]||(t[dr]=!0,Fl("selectionchange",!1,t))}}function Js(e,t,n,r){switch(Os(t)){case 1:var l=tf;break;case 4:l=nf;break;default:l=eo}n=l.bind(null,t,n,e),l=void 0,!su||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(l=!0),r?l!==void 0?e.addEventListener(t,n,{capture:!0,passive:l}):e.addEventListener(t,n,!0):l!==void 0?e.addEventListener(t,n,{passive:l}):e.addEventListener(t,n,!1)}function Ml(e,t,n,r,l){var u=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var o=r.tag;if(o===3||o===4){var i=r.stateNode.containerInfo;if(i===l||i.nodeType===8&&i.parentNode===l)break;if(o===4)for(o=r.return;o!==null;){var s=o.tag;if((s===3||s===4)&&(s=o.stateNode.containerInfo,s===l||s.nodeType===8&&s.parentNode===l))return;o=o.return}for(;i!==null;){if(o=Et(i),o===null)return;if(s=o.tag,s===5||s===6){r=u=o;continue e}i=i.parentNode}}r=r.return}Ss(function(){var f=u,h=Zu(n),m=[];e:{var p=Gs.get(e);if(p!==void 0){var w=no,S=e;switch(e){case"keypress":if(Cr(n)===0)break e;case"keydown":case"keyup":w=gf;break;case"focusin":S="focus",w=jl;break;case"focusout":S="blur",w=jl;break;case"beforeblur":case"afterblur":w=jl;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":w=Jo;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":w=uf;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":w=kf;break;case Qs:case Ks:case Xs:w=af;break;case Ys:w=Ef;break;case"scroll":w=rf;break;case"wheel":w=Nf;break;case"copy":case"cut":case"paste":w=ff;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":w=bo}var k=(t&4)!==0,M=!k&&e==="scroll",c=k?p!==null?p+"Capture":null:p;k=[];for(var a=f,d;a!==null;){d=a;var v=d.stateNode;if(d.tag===5&&v!==null&&(d=v,c!==null&&(v=Fn(a,c),v!=null&&k.push(Bn(a,v,d)))),M)break;a=a.return}0<k.length&&(p=new w(p,S,null,n,h),m.push({event:p,listeners:k}))}}if(!(t&7)){e:{if(p=e==="mouseover"||e==="pointerover",w=e==="mouseout"||e==="pointerout",p&&n!==ou&&(S=n.relatedTarget||n.fromElement)&&(Et(S)||S[Ge]))break e;if((w||p)&&(p=h.window===h?h:(p=h.ownerDocument)?p.defaultView||p.parentWindow:window,w?(S=n.relatedTarget||n.toElement,w=f,S=S?Et(S):null,S!==null&&(M=Ot(S),S!==M||S.tag!==5&&S.tag!==6)&&(S=null)):(w=null,S=f),w!==S)){if(k=Jo,v="onMouseLeave",c="onMouseEnter",a="mouse",(e==="pointerout"||e==="pointerover")&&(k=bo,v="onPointerLeave",c="onPointerEnter",a="pointer"),M=w==null?p:Vt(w),d=S==null?p:Vt(S),p=new k(v,a+"leave",w,n,h),p.target=M,p.relatedTarget=d,v=null,Et(h)===f&&(k=new k(c,a+"enter",S,n,h),k.target=d,k.relatedTarget=M,v=k),M=v,w&&S)t:{for(k=w,c=S,a=0,d=k;d;d=Ft(d))a++;for(d=0,v=c;v;v=Ft(v))d++;for(;0<a-d;)k=Ft(k),a--;for(;0<d-a;)c=Ft(c),d--;for(;a--;){if(k===c||c!==null&&k===c.alternate)break t;k=Ft(k),c=Ft(c)}k=null}else k=null;w!==null&&ci(m,p,w,k,!1),S!==null&&M!==null&&ci(m,M,S,k,!0)}}e:{if(p=f?Vt(f):window,w=p.nodeName&&p.nodeName.toLowerCase(),w==="select"||w==="input"&&p.type==="file")var x=Rf;else if(ni(p))if(As)x=Mf;else{x=Of;var N=Df}else(w=p.nodeName)&&w.toLowerCase()==="input"&&(p.type==="checkbox"||p.type==="radio")&&(x=Ff);if(x&&(x=x(e,f))){$s(m,x,n,h);break e}N&&N(e,p,f),e==="focusout"&&(N=p._wrapperState)&&N.controlled&&p.type==="number"&&tu(p,"number",p.value)}switch(N=f?Vt(f):window,e){case"focusin":(ni(N)||N.contentEditable==="true")&&($t=N,pu=f,zn=null);break;case"focusout":zn=pu=$t=null;break;case"mousedown":mu=!0;break;case"contextmenu":case"mouseup":case"dragend":mu=!1,ii(m,n,h);break;case"selectionchange":if($f)break;case"keydown":case"keyup":ii(m,n,h)}var _;if(lo)e:{switch(e){case"compositionstart":var P="onCompositionStart";break e;case"compositionend":P="onCompositionEnd";break e;case"compositionupdate":P="onCompositionUpdate";break e}P=void 0}else Ut?Is(e,n)&&(P="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(P="onCompositionStart");P&&(Ms&&n.locale!=="ko"&&(Ut||P!=="onCompositionStart"?P==="onCompositionEnd"&&Ut&&(_=Fs()):(lt=h,to="value"in lt?lt.value:lt.textContent,Ut=!0)),N=$r(f,P),0<N.length&&(P=new qo(P,e,null,n,h),m.push({event:P,listeners:N}),_?P.data=_:(_=Us(n),_!==null&&(P.data=_)))),(_=Pf?zf(e,n):jf(e,n))&&(f=$r(f,"onBeforeInput"),0<f.length&&(h=new qo("onBeforeInput","beforeinput",null,n,h),m.push({event:h,listeners:f}),h.data=_))}Zs(m,t)})}function Bn(e,t,n){return{instance:e,listener:t,currentTarget:n}}function $r(e,t){for(var n=t+"Capture",r=[];e!==null;){var l=e,u=l.stateNode;l.tag===5&&u!==null&&(l=u,u=Fn(e,n),u!=null&&r.unshift(Bn(e,u,l)),u=Fn(e,t),u!=null&&r.push(Bn(e,u,l))),e=e.return}return r}function Ft(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function ci(e,t,n,r,l){for(var u=t._reactName,o=[];n!==null&&n!==r;){var i=n,s=i.alternate,f=i.stateNode;if(s!==null&&s===r)break;i.tag===5&&f!==null&&(i=f,l?(s=Fn(n,u),s!=null&&o.unshift(Bn(n,s,i))):l||(s=Fn(n,u),s!=null&&o.push(Bn(n,s,i)))),n=n.return}o.length!==0&&e.push({event:t,listeners:o})}var Hf=/\r\n?/g,Wf=/\u0000|\uFFFD/g;function fi(e){return(typeof e=="string"?e:""+e).replace(Hf,`
 `).replace(Wf,"")}function pr(e,t,n){if(t=fi(t),fi(e)!==t&&n)throw Error(g(425))}function Ar(){}var hu=null,vu=null;function yu(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var gu=typeof setTimeout=="function"?setTimeout:void 0,Qf=typeof clearTimeout=="function"?clearTimeout:void 0,di=typeof Promise=="function"?Promise:void 0,Kf=typeof queueMicrotask=="function"?queueMicrotask:typeof di<"u"?function(e){return di.resolve(null).then(e).catch(Xf)}:gu;function Xf(e){setTimeout(function(){throw e})}function Il(e,t){var n=t,r=0;do{var l=n.nextSibling;if(e.removeChild(n),l&&l.nodeType===8)if(n=l.data,n==="/$"){if(r===0){e.removeChild(l),Un(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=l}while(n);Un(t)}function at(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function pi(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var cn=Math.random().toString(36).slice(2),Ae="__reactFiber$"+cn,Hn="__reactProps$"+cn,Ge="__reactContainer$"+cn,wu="__reactEvents$"+cn,Yf="__reactListeners$"+cn,Gf="__reactHandles$"+cn;function Et(e){var t=e[Ae];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Ge]||n[Ae]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=pi(e);e!==null;){if(n=e[Ae])return n;e=pi(e)}return t}e=n,n=e.parentNode}return null}function bn(e){return e=e[Ae]||e[Ge],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Vt(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(g(33))}function il(e){return e[Hn]||null}var Su=[],Bt=-1;function yt(e){return{current:e}}function U(e){0>Bt||(e.current=Su[Bt],Su[Bt]=null,Bt--)}function F(e,t){Bt++,Su[Bt]=e.current,e.current=t}var ht={},oe=yt(ht),he=yt(!1),zt=ht;function tn(e,t){var n=e.type.contextTypes;if(!n)return ht;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var l={},u;for(u in n)l[u]=t[u];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=l),l}function ve(e){return e=e.childContextTypes,e!=null}function Vr(){U(he),U(oe)}function mi(e,t,n){if(oe.current!==ht)throw Error(g(168));F(oe,t),F(he,n)}function qs(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var l in r)if(!(l in t))throw Error(g(108,Rc(e)||"Unknown",l));return H({},n,r)}function Br(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||ht,zt=oe.current,F(oe,e),F(he,he.current),!0}function hi(e,t,n){var r=e.stateNode;if(!r)throw Error(g(169));n?(e=qs(e,t,zt),r.__reactInternalMemoizedMergedChildContext=e,U(he),U(oe),F(oe,e)):U(he),F(he,n)}var We=null,sl=!1,Ul=!1;function bs(e){We===null?We=[e]:We.push(e)}function Zf(e){sl=!0,bs(e)}function gt(){if(!Ul&&We!==null){Ul=!0;var e=0,t=O;try{var n=We;for(O=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}We=null,sl=!1}catch(l){throw We!==null&&(We=We.slice(e+1)),Cs(Ju,gt),l}finally{O=t,Ul=!1}}return null}var Ht=[],Wt=0,Hr=null,Wr=0,Ce=[],Ne=0,jt=null,Qe=1,Ke="";function kt(e,t){Ht[Wt++]=Wr,Ht[Wt++]=Hr,Hr=e,Wr=t}function ea(e,t,n){Ce[Ne++]=Qe,Ce[Ne++]=Ke,Ce[Ne++]=jt,jt=e;var r=Qe;e=Ke;var l=32-Oe(r)-1;r&=~(1<<l),n+=1;var u=32-Oe(t)+l;if(30<u){var o=l-l%5;u=(r&(1<<o)-1).toString(32),r>>=o,l-=o,Qe=1<<32-Oe(t)+l|n<<l|r,Ke=u+e}else Qe=1<<u|n<<l|r,Ke=e}function oo(e){e.return!==null&&(kt(e,1),ea(e,1,0))}function io(e){for(;e===Hr;)Hr=Ht[--Wt],Ht[Wt]=null,Wr=Ht[--Wt],Ht[Wt]=null;for(;e===jt;)jt=Ce[--Ne],Ce[Ne]=null,Ke=Ce[--Ne],Ce[Ne]=null,Qe=Ce[--Ne],Ce[Ne]=null}var Se=null,we=null,$=!1,De=null;function ta(e,t){var n=_e(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function vi(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,Se=e,we=at(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,Se=e,we=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=jt!==null?{id:Qe,overflow:Ke}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=_e(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,Se=e,we=null,!0):!1;default:return!1}}function ku(e){return(e.mode&1)!==0&&(e.flags&128)===0}function xu(e){if($){var t=we;if(t){var n=t;if(!vi(e,t)){if(ku(e))throw Error(g(418));t=at(n.nextSibling);var r=Se;t&&vi(e,t)?ta(r,n):(e.flags=e.flags&-4097|2,$=!1,Se=e)}}else{if(ku(e))throw Error(g(418));e.flags=e.flags&-4097|2,$=!1,Se=e}}}function yi(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;Se=e}function mr(e){if(e!==Se)return!1;if(!$)return yi(e),$=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!yu(e.type,e.memoizedProps)),t&&(t=we)){if(ku(e))throw na(),Error(g(418));for(;t;)ta(e,t),t=at(t.nextSibling)}if(yi(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(g(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){we=at(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}we=null}}else we=Se?at(e.stateNode.nextSibling):null;return!0}function na(){for(var e=we;e;)e=at(e.nextSibling)}function nn(){we=Se=null,$=!1}function so(e){De===null?De=[e]:De.push(e)}var Jf=qe.ReactCurrentBatchConfig;function yn(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(g(309));var r=n.stateNode}if(!r)throw Error(g(147,e));var l=r,u=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===u?t.ref:(t=function(o){var i=l.refs;o===null?delete i[u]:i[u]=o},t._stringRef=u,t)}if(typeof e!="string")throw Error(g(284));if(!n._owner)throw Error(g(290,e))}return e}function hr(e,t){throw e=Object.prototype.toString.call(t),Error(g(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function gi(e){var t=e._init;return t(e._payload)}function ra(e){function t(c,a){if(e){var d=c.deletions;d===null?(c.deletions=[a],c.flags|=16):d.push(a)}}function n(c,a){if(!e)return null;for(;a!==null;)t(c,a),a=a.sibling;return null}function r(c,a){for(c=new Map;a!==null;)a.key!==null?c.set(a.key,a):c.set(a.index,a),a=a.sibling;return c}function l(c,a){return c=pt(c,a),c.index=0,c.sibling=null,c}function u(c,a,d){return c.index=d,e?(d=c.alternate,d!==null?(d=d.index,d<a?(c.flags|=2,a):d):(c.flags|=2,a)):(c.flags|=1048576,a)}function o(c){return e&&c.alternate===null&&(c.flags|=2),c}function i(c,a,d,v){return a===null||a.tag!==6?(a=Ql(d,c.mode,v),a.return=c,a):(a=l(a,d),a.return=c,a)}function s(c,a,d,v){var x=d.type;return x===It?h(c,a,d.props.children,v,d.key):a!==null&&(a.elementType===x||typeof x=="object"&&x!==null&&x.$$typeof===et&&gi(x)===a.type)?(v=l(a,d.props),v.ref=yn(c,a,d),v.return=c,v):(v=Tr(d.type,d.key,d.props,null,c.mode,v),v.ref=yn(c,a,d),v.return=c,v)}function f(c,a,d,v){return a===null||a.tag!==4||a.stateNode.containerInfo!==d.containerInfo||a.stateNode.implementation!==d.implementation?(a=Kl(d,c.mode,v),a.return=c,a):(a=l(a,d.children||[]),a.return=c,a)}function h(c,a,d,v,x){return a===null||a.tag!==7?(a=Pt(d,c.mode,v,x),a.return=c,a):(a=l(a,d),a.return=c,a)}function m(c,a,d){if(typeof a=="string"&&a!==""||typeof a=="number")return a=Ql(""+a,c.mode,d),a.return=c,a;if(typeof a=="object"&&a!==null){switch(a.$$typeof){case lr:return d=Tr(a.type,a.key,a.props,null,c.mode,d),d.ref=yn(c,null,a),d.return=c,d;case Mt:return a=Kl(a,c.mode,d),a.return=c,a;case et:var v=a._init;return m(c,v(a._payload),d)}if(kn(a)||dn(a))return a=Pt(a,c.mode,d,null),a.return=c,a;hr(c,a)}return null}function p(c,a,d,v){var x=a!==null?a.key:null;if(typeof d=="string"&&d!==""||typeof d=="number")return x!==null?null:i(c,a,""+d,v);if(typeof d=="object"&&d!==null){switch(d.$$typeof){case lr:return d.key===x?s(c,a,d,v):null;case Mt:return d.key===x?f(c,a,d,v):null;case et:return x=d._init,p(c,a,x(d._payload),v)}if(kn(d)||dn(d))return x!==null?null:h(c,a,d,v,null);hr(c,d)}return null}function w(c,a,d,v,x){if(typeof v=="string"&&v!==""||typeof v=="number")return c=c.get(d)||null,i(a,c,""+v,x);if(typeof v=="object"&&v!==null){switch(v.$$typeof){case lr:return c=c.get(v.key===null?d:v.key)||null,s(a,c,v,x);case Mt:return c=c.get(v.key===null?d:v.key)||null,f(a,c,v,x);case et:var N=v._init;return w(c,a,d,N(v._payload),x)}if(kn(v)||dn(v))return c=c.get(d)||null,h(a,c,v,x,null);hr(a,v)}return null}function S(c,a,d,v){for(var x=null,N=null,_=a,P=a=0,A=null;_!==null&&P<d.length;P++){_.index>P?(A=_,_=null):A=_.sibling;var T=p(c,_,d[P],v);if(T===null){_===null&&(_=A);break}e&&_&&T.alternate===null&&t(c,_),a=u(T,a,P),N===null?x=T:N.sibling=T,N=T,_=A}if(P===d.length)return n(c,_),$&&kt(c,P),x;if(_===null){for(;P<d.length;P++)_=m(c,d[P],v),_!==null&&(a=u(_,a,P),N===null?x=_:N.sibling=_,N=_);return $&&kt(c,P),x}for(_=r(c,_);P<d.length;P++)A=w(_,c,P,d[P],v),A!==null&&(e&&A.alternate!==null&&_.delete(A.key===null?P:A.key),a=u(A,a,P),N===null?x=A:N.sibling=A,N=A);return e&&_.forEach(function(z){return t(c,z)}),$&&kt(c,P),x}function k(c,a,d,v){var x=dn(d);if(typeof x!="function")throw Error(g(150));if(d=x.call(d),d==null)throw Error(g(151));for(var N=x=null,_=a,P=a=0,A=null,T=d.next();_!==null&&!T.done;P++,T=d.next()){_.index>P?(A=_,_=null):A=_.sibling;var z=p(c,_,T.value,v);if(z===null){_===null&&(_=A);break}e&&_&&z.alternate===null&&t(c,_),a=u(z,a,P),N===null?x=z:N.sibling=z,N=z,_=A}if(T.done)return n(c,_),$&&kt(c,P),x;if(_===null){for(;!T.done;P++,T=d.next())T=m(c,T.value,v),T!==null&&(a=u(T,a,P),N===null?x=T:N.sibling=T,N=T);return $&&kt(c,P),x}for(_=r(c,_);!T.done;P++,T=d.next())T=w(_,c,P,T.value,v),T!==null&&(e&&T.alternate!==null&&_.delete(T.key===null?P:T.key),a=u(T,a,P),N===null?x=T:N.sibling=T,N=T);return e&&_.forEach(function(b){return t(c,b)}),$&&kt(c,P),x}function M(c,a,d,v){if(typeof d=="object"&&d!==null&&d.type===It&&d.key===null&&(d=d.props.children),typeof d=="object"&&d!==null){switch(d.$$typeof){case lr:e:{for(var x=d.key,N=a;N!==null;){if(N.key===x){if(x=d.type,x===It){if(N.tag===7){n(c,N.sibling),a=l(N,d.props.children),a.return=c,c=a;break e}}else if(N.elementType===x||typeof x=="object"&&x!==null&&x.$$typeof===et&&gi(x)===N.type){n(c,N.sibling),a=l(N,d.props),a.ref=yn(c,N,d),a.return=c,c=a;break e}n(c,N);break}else t(c,N);N=N.sibling}d.type===It?(a=Pt(d.props.children,c.mode,v,d.key),a.return=c,c=a):(v=Tr(d.type,d.key,d.props,null,c.mode,v),v.ref=yn(c,a,d),v.return=c,c=v)}return o(c);case Mt:e:{for(N=d.key;a!==null;){if(a.key===N)if(a.tag===4&&a.stateNode.containerInfo===d.containerInfo&&a.stateNode.implementation===d.implementation){n(c,a.sibling),a=l(a,d.children||[]),a.return=c,c=a;break e}else{n(c,a);break}else t(c,a);a=a.sibling}a=Kl(d,c.mode,v),a.return=c,c=a}return o(c);case et:return N=d._init,M(c,a,N(d._payload),v)}if(kn(d))return S(c,a,d,v);if(dn(d))return k(c,a,d,v);hr(c,d)}return typeof d=="string"&&d!==""||typeof d=="number"?(d=""+d,a!==null&&a.tag===6?(n(c,a.sibling),a=l(a,d),a.return=c,c=a):(n(c,a),a=Ql(d,c.mode,v),a.return=c,c=a),o(c)):n(c,a)}return M}var rn=ra(!0),la=ra(!1),Qr=yt(null),Kr=null,Qt=null,ao=null;function co(){ao=Qt=Kr=null}function fo(e){var t=Qr.current;U(Qr),e._currentValue=t}function Eu(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function qt(e,t){Kr=e,ao=Qt=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(me=!0),e.firstContext=null)}function ze(e){var t=e._currentValue;if(ao!==e)if(e={context:e,memoizedValue:t,next:null},Qt===null){if(Kr===null)throw Error(g(308));Qt=e,Kr.dependencies={lanes:0,firstContext:e}}else Qt=Qt.next=e;return t}var Ct=null;function po(e){Ct===null?Ct=[e]:Ct.push(e)}function ua(e,t,n,r){var l=t.interleaved;return l===null?(n.next=n,po(t)):(n.next=l.next,l.next=n),t.interleaved=n,Ze(e,r)}function Ze(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var tt=!1;function mo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function oa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Xe(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function ct(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,D&2){var l=r.pending;return l===null?t.next=t:(t.next=l.next,l.next=t),r.pending=t,Ze(e,n)}return l=r.interleaved,l===null?(t.next=t,po(r)):(t.next=l.next,l.next=t),r.interleaved=t,Ze(e,n)}function Nr(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,qu(e,n)}}function wi(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var l=null,u=null;if(n=n.firstBaseUpdate,n!==null){do{var o={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};u===null?l=u=o:u=u.next=o,n=n.next}while(n!==null);u===null?l=u=t:u=u.next=t}else l=u=t;n={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:u,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Xr(e,t,n,r){var l=e.updateQueue;tt=!1;var u=l.firstBaseUpdate,o=l.lastBaseUpdate,i=l.shared.pending;if(i!==null){l.shared.pending=null;var s=i,f=s.next;s.next=null,o===null?u=f:o.next=f,o=s;var h=e.alternate;h!==null&&(h=h.updateQueue,i=h.lastBaseUpdate,i!==o&&(i===null?h.firstBaseUpdate=f:i.next=f,h.lastBaseUpdate=s))}if(u!==null){var m=l.baseState;o=0,h=f=s=null,i=u;do{var p=i.lane,w=i.eventTime;if((r&p)===p){h!==null&&(h=h.next={eventTime:w,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var S=e,k=i;switch(p=t,w=n,k.tag){case 1:if(S=k.payload,typeof S=="function"){m=S.call(w,m,p);break e}m=S;break e;case 3:S.flags=S.flags&-65537|128;case 0:if(S=k.payload,p=typeof S=="function"?S.call(w,m,p):S,p==null)break e;m=H({},m,p);break e;case 2:tt=!0}}i.callback!==null&&i.lane!==0&&(e.flags|=64,p=l.effects,p===null?l.effects=[i]:p.push(i))}else w={eventTime:w,lane:p,tag:i.tag,payload:i.payload,callback:i.callback,next:null},h===null?(f=h=w,s=m):h=h.next=w,o|=p;if(i=i.next,i===null){if(i=l.shared.pending,i===null)break;p=i,i=p.next,p.next=null,l.lastBaseUpdate=p,l.shared.pending=null}}while(!0);if(h===null&&(s=m),l.baseState=s,l.firstBaseUpdate=f,l.lastBaseUpdate=h,t=l.shared.interleaved,t!==null){l=t;do o|=l.lane,l=l.next;while(l!==t)}else u===null&&(l.shared.lanes=0);Tt|=o,e.lanes=o,e.memoizedState=m}}function Si(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],l=r.callback;if(l!==null){if(r.callback=null,r=n,typeof l!="function")throw Error(g(191,l));l.call(r)}}}var er={},Be=yt(er),Wn=yt(er),Qn=yt(er);function Nt(e){if(e===er)throw Error(g(174));return e}function ho(e,t){switch(F(Qn,t),F(Wn,e),F(Be,er),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ru(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=ru(t,e)}U(Be),F(Be,t)}function ln(){U(Be),U(Wn),U(Qn)}function ia(e){Nt(Qn.current);var t=Nt(Be.current),n=ru(t,e.type);t!==n&&(F(Wn,e),F(Be,n))}function vo(e){Wn.current===e&&(U(Be),U(Wn))}var V=yt(0);function Yr(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var $l=[];function yo(){for(var e=0;e<$l.length;e++)$l[e]._workInProgressVersionPrimary=null;$l.length=0}var _r=qe.ReactCurrentDispatcher,Al=qe.ReactCurrentBatchConfig,Lt=0,B=null,Y=null,J=null,Gr=!1,jn=!1,Kn=0,qf=0;function re(){throw Error(g(321))}function go(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Me(e[n],t[n]))return!1;return!0}function wo(e,t,n,r,l,u){if(Lt=u,B=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,_r.current=e===null||e.memoizedState===null?nd:rd,e=n(r,l),jn){u=0;do{if(jn=!1,Kn=0,25<=u)throw Error(g(301));u+=1,J=Y=null,t.updateQueue=null,_r.current=ld,e=n(r,l)}while(jn)}if(_r.current=Zr,t=Y!==null&&Y.next!==null,Lt=0,J=Y=B=null,Gr=!1,t)throw Error(g(300));return e}function So(){var e=Kn!==0;return Kn=0,e}function $e(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return J===null?B.memoizedState=J=e:J=J.next=e,J}function je(){if(Y===null){var e=B.alternate;e=e!==null?e.memoizedState:null}else e=Y.next;var t=J===null?B.memoizedState:J.next;if(t!==null)J=t,Y=e;else{if(e===null)throw Error(g(310));Y=e,e={memoizedState:Y.memoizedState,baseState:Y.baseState,baseQueue:Y.baseQueue,queue:Y.queue,next:null},J===null?B.memoizedState=J=e:J=J.next=e}return J}function Xn(e,t){return typeof t=="function"?t(e):t}function Vl(e){var t=je(),n=t.queue;if(n===null)throw Error(g(311));n.lastRenderedReducer=e;var r=Y,l=r.baseQueue,u=n.pending;if(u!==null){if(l!==null){var o=l.next;l.next=u.next,u.next=o}r.baseQueue=l=u,n.pending=null}if(l!==null){u=l.next,r=r.baseState;var i=o=null,s=null,f=u;do{var h=f.lane;if((Lt&h)===h)s!==null&&(s=s.next={lane:0,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null}),r=f.hasEagerState?f.eagerState:e(r,f.action);else{var m={lane:h,action:f.action,hasEagerState:f.hasEagerState,eagerState:f.eagerState,next:null};s===null?(i=s=m,o=r):s=s.next=m,B.lanes|=h,Tt|=h}f=f.next}while(f!==null&&f!==u);s===null?o=r:s.next=i,Me(r,t.memoizedState)||(me=!0),t.memoizedState=r,t.baseState=o,t.baseQueue=s,n.lastRenderedState=r}if(e=n.interleaved,e!==null){l=e;do u=l.lane,B.lanes|=u,Tt|=u,l=l.next;while(l!==e)}else l===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Bl(e){var t=je(),n=t.queue;if(n===null)throw Error(g(311));n.lastRenderedReducer=e;var r=n.dispatch,l=n.pending,u=t.memoizedState;if(l!==null){n.pending=null;var o=l=l.next;do u=e(u,o.action),o=o.next;while(o!==l);Me(u,t.memoizedState)||(me=!0),t.memoizedState=u,t.baseQueue===null&&(t.baseState=u),n.lastRenderedState=u}return[u,r]}function sa(){}function aa(e,t){var n=B,r=je(),l=t(),u=!Me(r.memoizedState,l);if(u&&(r.memoizedState=l,me=!0),r=r.queue,ko(da.bind(null,n,r,e),[e]),r.getSnapshot!==t||u||J!==null&&J.memoizedState.tag&1){if(n.flags|=2048,Yn(9,fa.bind(null,n,r,l,t),void 0,null),q===null)throw Error(g(349));Lt&30||ca(n,t,l)}return l}function ca(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=B.updateQueue,t===null?(t={lastEffect:null,stores:null},B.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function fa(e,t,n,r){t.value=n,t.getSnapshot=r,pa(t)&&ma(e)}function da(e,t,n){return n(function(){pa(t)&&ma(e)})}function pa(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Me(e,n)}catch{return!0}}function ma(e){var t=Ze(e,1);t!==null&&Fe(t,e,1,-1)}function ki(e){var t=$e();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Xn,lastRenderedState:e},t.queue=e,e=e.dispatch=td.bind(null,B,e),[t.memoizedState,e]}function Yn(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=B.updateQueue,t===null?(t={lastEffect:null,stores:null},B.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function ha(){return je().memoizedState}function Pr(e,t,n,r){var l=$e();B.flags|=e,l.memoizedState=Yn(1|t,n,void 0,r===void 0?null:r)}function al(e,t,n,r){var l=je();r=r===void 0?null:r;var u=void 0;if(Y!==null){var o=Y.memoizedState;if(u=o.destroy,r!==null&&go(r,o.deps)){l.memoizedState=Yn(t,n,u,r);return}}B.flags|=e,l.memoizedState=Yn(1|t,n,u,r)}function xi(e,t){return Pr(8390656,8,e,t)}function ko(e,t){return al(2048,8,e,t)}function va(e,t){return al(4,2,e,t)}function ya(e,t){return al(4,4,e,t)}function ga(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function wa(e,t,n){return n=n!=null?n.concat([e]):null,al(4,4,ga.bind(null,t,e),n)}function xo(){}function Sa(e,t){var n=je();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&go(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function ka(e,t){var n=je();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&go(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function xa(e,t,n){return Lt&21?(Me(n,t)||(n=Ps(),B.lanes|=n,Tt|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,me=!0),e.memoizedState=n)}function bf(e,t){var n=O;O=n!==0&&4>n?n:4,e(!0);var r=Al.transition;Al.transition={};try{e(!1),t()}finally{O=n,Al.transition=r}}function Ea(){return je().memoizedState}function ed(e,t,n){var r=dt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Ca(e))Na(t,n);else if(n=ua(e,t,n,r),n!==null){var l=se();Fe(n,e,r,l),_a(n,t,r)}}function td(e,t,n){var r=dt(e),l={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Ca(e))Na(t,l);else{var u=e.alternate;if(e.lanes===0&&(u===null||u.lanes===0)&&(u=t.lastRenderedReducer,u!==null))try{var o=t.lastRenderedState,i=u(o,n);if(l.hasEagerState=!0,l.eagerState=i,Me(i,o)){var s=t.interleaved;s===null?(l.next=l,po(t)):(l.next=s.next,s.next=l),t.interleaved=l;return}}catch{}finally{}n=ua(e,t,l,r),n!==null&&(l=se(),Fe(n,e,r,l),_a(n,t,r))}}function Ca(e){var t=e.alternate;return e===B||t!==null&&t===B}function Na(e,t){jn=Gr=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function _a(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,qu(e,n)}}var Zr={readContext:ze,useCallback:re,useContext:re,useEffect:re,useImperativeHandle:re,useInsertionEffect:re,useLayoutEffect:re,useMemo:re,useReducer:re,useRef:re,useState:re,useDebugValue:re,useDeferredValue:re,useTransition:re,useMutableSource:re,useSyncExternalStore:re,useId:re,unstable_isNewReconciler:!1},nd={readContext:ze,useCallback:function(e,t){return $e().memoizedState=[e,t===void 0?null:t],e},useContext:ze,useEffect:xi,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Pr(4194308,4,ga.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Pr(4194308,4,e,t)},useInsertionEffect:function(e,t){return Pr(4,2,e,t)},useMemo:function(e,t){var n=$e();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=$e();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=ed.bind(null,B,e),[r.memoizedState,e]},useRef:function(e){var t=$e();return e={current:e},t.memoizedState=e},useState:ki,useDebugValue:xo,useDeferredValue:function(e){return $e().memoizedState=e},useTransition:function(){var e=ki(!1),t=e[0];return e=bf.bind(null,e[1]),$e().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=B,l=$e();if($){if(n===void 0)throw Error(g(407));n=n()}else{if(n=t(),q===null)throw Error(g(349));Lt&30||ca(r,t,n)}l.memoizedState=n;var u={value:n,getSnapshot:t};return l.queue=u,xi(da.bind(null,r,u,e),[e]),r.flags|=2048,Yn(9,fa.bind(null,r,u,n,t),void 0,null),n},useId:function(){var e=$e(),t=q.identifierPrefix;if($){var n=Ke,r=Qe;n=(r&~(1<<32-Oe(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=Kn++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=qf++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},rd={readContext:ze,useCallback:Sa,useContext:ze,useEffect:ko,useImperativeHandle:wa,useInsertionEffect:va,useLayoutEffect:ya,useMemo:ka,useReducer:Vl,useRef:ha,useState:function(){return Vl(Xn)},useDebugValue:xo,useDeferredValue:function(e){var t=je();return xa(t,Y.memoizedState,e)},useTransition:function(){var e=Vl(Xn)[0],t=je().memoizedState;return[e,t]},useMutableSource:sa,useSyncExternalStore:aa,useId:Ea,unstable_isNewReconciler:!1},ld={readContext:ze,useCallback:Sa,useContext:ze,useEffect:ko,useImperativeHandle:wa,useInsertionEffect:va,useLayoutEffect:ya,useMemo:ka,useReducer:Bl,useRef:ha,useState:function(){return Bl(Xn)},useDebugValue:xo,useDeferredValue:function(e){var t=je();return Y===null?t.memoizedState=e:xa(t,Y.memoizedState,e)},useTransition:function(){var e=Bl(Xn)[0],t=je().memoizedState;return[e,t]},useMutableSource:sa,useSyncExternalStore:aa,useId:Ea,unstable_isNewReconciler:!1};function Te(e,t){if(e&&e.defaultProps){t=H({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Cu(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:H({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var cl={isMounted:function(e){return(e=e._reactInternals)?Ot(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=se(),l=dt(e),u=Xe(r,l);u.payload=t,n!=null&&(u.callback=n),t=ct(e,u,l),t!==null&&(Fe(t,e,l,r),Nr(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=se(),l=dt(e),u=Xe(r,l);u.tag=1,u.payload=t,n!=null&&(u.callback=n),t=ct(e,u,l),t!==null&&(Fe(t,e,l,r),Nr(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=se(),r=dt(e),l=Xe(n,r);l.tag=2,t!=null&&(l.callback=t),t=ct(e,l,r),t!==null&&(Fe(t,e,r,n),Nr(t,e,r))}};function Ei(e,t,n,r,l,u,o){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,u,o):t.prototype&&t.prototype.isPureReactComponent?!An(n,r)||!An(l,u):!0}function Pa(e,t,n){var r=!1,l=ht,u=t.contextType;return typeof u=="object"&&u!==null?u=ze(u):(l=ve(t)?zt:oe.current,r=t.contextTypes,u=(r=r!=null)?tn(e,l):ht),t=new t(n,u),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=cl,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=u),t}function Ci(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&cl.enqueueReplaceState(t,t.state,null)}function Nu(e,t,n,r){var l=e.stateNode;l.props=n,l.state=e.memoizedState,l.refs={},mo(e);var u=t.contextType;typeof u=="object"&&u!==null?l.context=ze(u):(u=ve(t)?zt:oe.current,l.context=tn(e,u)),l.state=e.memoizedState,u=t.getDerivedStateFromProps,typeof u=="function"&&(Cu(e,t,u,n),l.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof l.getSnapshotBeforeUpdate=="function"||typeof l.UNSAFE_componentWillMount!="function"&&typeof l.componentWillMount!="function"||(t=l.state,typeof l.componentWillMount=="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount=="function"&&l.UNSAFE_componentWillMount(),t!==l.state&&cl.enqueueReplaceState(l,l.state,null),Xr(e,n,l,r),l.state=e.memoizedState),typeof l.componentDidMount=="function"&&(e.flags|=4194308)}function un(e,t){try{var n="",r=t;do n+=Tc(r),r=r.return;while(r);var l=n}catch(u){l=`
 Error generating stack: `+u.message+`
-`+u.stack}return{value:e,source:t,stack:l,digest:null}}function Hl(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function _u(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var ud=typeof WeakMap=="function"?WeakMap:Map;function za(e,t,n){n=Xe(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){qr||(qr=!0,Mu=r),_u(e,t)},n}function ja(e,t,n){n=Xe(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){_u(e,t)}}var u=e.stateNode;return u!==null&&typeof u.componentDidCatch=="function"&&(n.callback=function(){_u(e,t),typeof r!="function"&&(ft===null?ft=new Set([this]):ft.add(this));var o=t.stack;this.componentDidCatch(t.value,{componentStack:o!==null?o:""})}),n}function Ni(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new ud;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=wd.bind(null,e,t,n),t.then(e,e))}function _i(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Pi(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=Xe(-1,1),t.tag=2,ct(n,t,1))),n.lanes|=1),e)}var od=qe.ReactCurrentOwner,me=!1;function ie(e,t,n,r){t.child=e===null?la(t,null,n,r):rn(t,e.child,n,r)}function zi(e,t,n,r,l){n=n.render;var u=t.ref;return qt(t,l),r=wo(e,t,n,r,u,l),n=So(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Je(e,t,l)):($&&n&&oo(t),t.flags|=1,ie(e,t,r,l),t.child)}function ji(e,t,n,r,l){if(e===null){var u=n.type;return typeof u=="function"&&!Lo(u)&&u.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=u,La(e,t,u,r,l)):(e=Tr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(u=e.child,!(e.lanes&l)){var o=u.memoizedProps;if(n=n.compare,n=n!==null?n:An,n(o,r)&&e.ref===t.ref)return Je(e,t,l)}return t.flags|=1,e=pt(u,r),e.ref=t.ref,e.return=t,t.child=e}function La(e,t,n,r,l){if(e!==null){var u=e.memoizedProps;if(An(u,r)&&e.ref===t.ref)if(me=!1,t.pendingProps=r=u,(e.lanes&l)!==0)e.flags&131072&&(me=!0);else return t.lanes=e.lanes,Je(e,t,l)}return Pu(e,t,n,r,l)}function Ta(e,t,n){var r=t.pendingProps,l=r.children,u=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},F(Xt,ge),ge|=n;else{if(!(n&1073741824))return e=u!==null?u.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,F(Xt,ge),ge|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=u!==null?u.baseLanes:n,F(Xt,ge),ge|=r}else u!==null?(r=u.baseLanes|n,t.memoizedState=null):r=n,F(Xt,ge),ge|=r;return ie(e,t,l,n),t.child}function Ra(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Pu(e,t,n,r,l){var u=ve(n)?zt:oe.current;return u=tn(t,u),qt(t,l),n=wo(e,t,n,r,u,l),r=So(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Je(e,t,l)):($&&r&&oo(t),t.flags|=1,ie(e,t,n,l),t.child)}function Li(e,t,n,r,l){if(ve(n)){var u=!0;Br(t)}else u=!1;if(qt(t,l),t.stateNode===null)zr(e,t),Pa(t,n,r),Nu(t,n,r,l),r=!0;else if(e===null){var o=t.stateNode,i=t.memoizedProps;o.props=i;var s=o.context,f=n.contextType;typeof f=="object"&&f!==null?f=ze(f):(f=ve(n)?zt:oe.current,f=tn(t,f));var h=n.getDerivedStateFromProps,m=typeof h=="function"||typeof o.getSnapshotBeforeUpdate=="function";m||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(i!==r||s!==f)&&Ci(t,o,r,f),tt=!1;var p=t.memoizedState;o.state=p,Xr(t,r,o,l),s=t.memoizedState,i!==r||p!==s||he.current||tt?(typeof h=="function"&&(Cu(t,n,h,r),s=t.memoizedState),(i=tt||Ei(t,n,i,r,p,s,f))?(m||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(t.flags|=4194308)):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),o.props=r,o.state=s,o.context=f,r=i):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,oa(e,t),i=t.memoizedProps,f=t.type===t.elementType?i:Te(t.type,i),o.props=f,m=t.pendingProps,p=o.context,s=n.contextType,typeof s=="object"&&s!==null?s=ze(s):(s=ve(n)?zt:oe.current,s=tn(t,s));var w=n.getDerivedStateFromProps;(h=typeof w=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(i!==m||p!==s)&&Ci(t,o,r,s),tt=!1,p=t.memoizedState,o.state=p,Xr(t,r,o,l);var S=t.memoizedState;i!==m||p!==S||he.current||tt?(typeof w=="function"&&(Cu(t,n,w,r),S=t.memoizedState),(f=tt||Ei(t,n,f,r,p,S,s)||!1)?(h||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(r,S,s),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(r,S,s)),typeof o.componentDidUpdate=="function"&&(t.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof o.componentDidUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),o.props=r,o.state=S,o.context=s,r=f):(typeof o.componentDidUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),r=!1)}return zu(e,t,n,r,u,l)}function zu(e,t,n,r,l,u){Ra(e,t);var o=(t.flags&128)!==0;if(!r&&!o)return l&&hi(t,n,!1),Je(e,t,u);r=t.stateNode,od.current=t;var i=o&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&o?(t.child=rn(t,e.child,null,u),t.child=rn(t,null,i,u)):ie(e,t,i,u),t.memoizedState=r.state,l&&hi(t,n,!0),t.child}function Da(e){var t=e.stateNode;t.pendingContext?mi(e,t.pendingContext,t.pendingContext!==t.context):t.context&&mi(e,t.context,!1),ho(e,t.containerInfo)}function Ti(e,t,n,r,l){return nn(),so(l),t.flags|=256,ie(e,t,n,r),t.child}var ju={dehydrated:null,treeContext:null,retryLane:0};function Lu(e){return{baseLanes:e,cachePool:null,transitions:null}}function Oa(e,t,n){var r=t.pendingProps,l=V.current,u=!1,o=(t.flags&128)!==0,i;if((i=o)||(i=e!==null&&e.memoizedState===null?!1:(l&2)!==0),i?(u=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),F(V,l&1),e===null)return xu(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(o=r.children,e=r.fallback,u?(r=t.mode,u=t.child,o={mode:"hidden",children:o},!(r&1)&&u!==null?(u.childLanes=0,u.pendingProps=o):u=pl(o,r,0,null),e=Pt(e,r,n,null),u.return=t,e.return=t,u.sibling=e,t.child=u,t.child.memoizedState=Lu(n),t.memoizedState=ju,e):Eo(t,o));if(l=e.memoizedState,l!==null&&(i=l.dehydrated,i!==null))return id(e,t,o,r,i,l,n);if(u){u=r.fallback,o=t.mode,l=e.child,i=l.sibling;var s={mode:"hidden",children:r.children};return!(o&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=pt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),i!==null?u=pt(i,u):(u=Pt(u,o,n,null),u.flags|=2),u.return=t,r.return=t,r.sibling=u,t.child=r,r=u,u=t.child,o=e.child.memoizedState,o=o===null?Lu(n):{baseLanes:o.baseLanes|n,cachePool:null,transitions:o.transitions},u.memoizedState=o,u.childLanes=e.childLanes&~n,t.memoizedState=ju,r}return u=e.child,e=u.sibling,r=pt(u,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Eo(e,t){return t=pl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function vr(e,t,n,r){return r!==null&&so(r),rn(t,e.child,null,n),e=Eo(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function id(e,t,n,r,l,u,o){if(n)return t.flags&256?(t.flags&=-257,r=Hl(Error(g(422))),vr(e,t,o,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(u=r.fallback,l=t.mode,r=pl({mode:"visible",children:r.children},l,0,null),u=Pt(u,l,o,null),u.flags|=2,r.return=t,u.return=t,r.sibling=u,t.child=r,t.mode&1&&rn(t,e.child,null,o),t.child.memoizedState=Lu(o),t.memoizedState=ju,u);if(!(t.mode&1))return vr(e,t,o,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var i=r.dgst;return r=i,u=Error(g(419)),r=Hl(u,r,void 0),vr(e,t,o,r)}if(i=(o&e.childLanes)!==0,me||i){if(r=q,r!==null){switch(o&-o){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|o)?0:l,l!==0&&l!==u.retryLane&&(u.retryLane=l,Ze(e,l),Fe(r,e,l,-1))}return jo(),r=Hl(Error(g(421))),vr(e,t,o,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=Sd.bind(null,e),l._reactRetry=t,null):(e=u.treeContext,we=at(l.nextSibling),Se=t,$=!0,De=null,e!==null&&(Ce[Ne++]=Qe,Ce[Ne++]=Ke,Ce[Ne++]=jt,Qe=e.id,Ke=e.overflow,jt=t),t=Eo(t,r.children),t.flags|=4096,t)}function Ri(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Eu(e.return,t,n)}function Wl(e,t,n,r,l){var u=e.memoizedState;u===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(u.isBackwards=t,u.rendering=null,u.renderingStartTime=0,u.last=r,u.tail=n,u.tailMode=l)}function Fa(e,t,n){var r=t.pendingProps,l=r.revealOrder,u=r.tail;if(ie(e,t,r.children,n),r=V.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Ri(e,n,t);else if(e.tag===19)Ri(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(F(V,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&Yr(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),Wl(t,!1,l,n,u);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&Yr(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}Wl(t,!0,n,null,u);break;case"together":Wl(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function zr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Je(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Tt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(g(153));if(t.child!==null){for(e=t.child,n=pt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=pt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function sd(e,t,n){switch(t.tag){case 3:Da(t),nn();break;case 5:ia(t);break;case 1:ve(t.type)&&Br(t);break;case 4:ho(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;F(Qr,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(F(V,V.current&1),t.flags|=128,null):n&t.child.childLanes?Oa(e,t,n):(F(V,V.current&1),e=Je(e,t,n),e!==null?e.sibling:null);F(V,V.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Fa(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),F(V,V.current),r)break;return null;case 22:case 23:return t.lanes=0,Ta(e,t,n)}return Je(e,t,n)}var Ma,Tu,Ia,Ua;Ma=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Tu=function(){};Ia=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Nt(Be.current);var u=null;switch(n){case"input":l=bl(e,l),r=bl(e,r),u=[];break;case"select":l=H({},l,{value:void 0}),r=H({},r,{value:void 0}),u=[];break;case"textarea":l=nu(e,l),r=nu(e,r),u=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Ar)}lu(n,r);var o;n=null;for(f in l)if(!r.hasOwnProperty(f)&&l.hasOwnProperty(f)&&l[f]!=null)if(f==="style"){var i=l[f];for(o in i)i.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else f!=="dangerouslySetInnerHTML"&&f!=="children"&&f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(Dn.hasOwnProperty(f)?u||(u=[]):(u=u||[]).push(f,null));for(f in r){var s=r[f];if(i=l!=null?l[f]:void 0,r.hasOwnProperty(f)&&s!==i&&(s!=null||i!=null))if(f==="style")if(i){for(o in i)!i.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in s)s.hasOwnProperty(o)&&i[o]!==s[o]&&(n||(n={}),n[o]=s[o])}else n||(u||(u=[]),u.push(f,n)),n=s;else f==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,i=i?i.__html:void 0,s!=null&&i!==s&&(u=u||[]).push(f,s)):f==="children"?typeof s!="string"&&typeof s!="number"||(u=u||[]).push(f,""+s):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&(Dn.hasOwnProperty(f)?(s!=null&&f==="onScroll"&&I("scroll",e),u||i===s||(u=[])):(u=u||[]).push(f,s))}n&&(u=u||[]).push("style",n);var f=u;(t.updateQueue=f)&&(t.flags|=4)}};Ua=function(e,t,n,r){n!==r&&(t.flags|=4)};function gn(e,t){if(!$)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function le(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function ad(e,t,n){var r=t.pendingProps;switch(io(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return le(t),null;case 1:return ve(t.type)&&Vr(),le(t),null;case 3:return r=t.stateNode,ln(),U(he),U(oe),yo(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(mr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,De!==null&&($u(De),De=null))),Tu(e,t),le(t),null;case 5:vo(t);var l=Nt(Qn.current);if(n=t.type,e!==null&&t.stateNode!=null)Ia(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(g(166));return le(t),null}if(e=Nt(Be.current),mr(t)){r=t.stateNode,n=t.type;var u=t.memoizedProps;switch(r[Ae]=t,r[Hn]=u,e=(t.mode&1)!==0,n){case"dialog":I("cancel",r),I("close",r);break;case"iframe":case"object":case"embed":I("load",r);break;case"video":case"audio":for(l=0;l<En.length;l++)I(En[l],r);break;case"source":I("error",r);break;case"img":case"image":case"link":I("error",r),I("load",r);break;case"details":I("toggle",r);break;case"input":Vo(r,u),I("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!u.multiple},I("invalid",r);break;case"textarea":Ho(r,u),I("invalid",r)}lu(n,u),l=null;for(var o in u)if(u.hasOwnProperty(o)){var i=u[o];o==="children"?typeof i=="string"?r.textContent!==i&&(u.suppressHydrationWarning!==!0&&pr(r.textContent,i,e),l=["children",i]):typeof i=="number"&&r.textContent!==""+i&&(u.suppressHydrationWarning!==!0&&pr(r.textContent,i,e),l=["children",""+i]):Dn.hasOwnProperty(o)&&i!=null&&o==="onScroll"&&I("scroll",r)}switch(n){case"input":ur(r),Bo(r,u,!0);break;case"textarea":ur(r),Wo(r);break;case"select":case"option":break;default:typeof u.onClick=="function"&&(r.onclick=Ar)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{o=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=ds(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=o.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=o.createElement(n,{is:r.is}):(e=o.createElement(n),n==="select"&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,n),e[Ae]=t,e[Hn]=r,Ma(e,t,!1,!1),t.stateNode=e;e:{switch(o=uu(n,r),n){case"dialog":I("cancel",e),I("close",e),l=r;break;case"iframe":case"object":case"embed":I("load",e),l=r;break;case"video":case"audio":for(l=0;l<En.length;l++)I(En[l],e);l=r;break;case"source":I("error",e),l=r;break;case"img":case"image":case"link":I("error",e),I("load",e),l=r;break;case"details":I("toggle",e),l=r;break;case"input":Vo(e,r),l=bl(e,r),I("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=H({},r,{value:void 0}),I("invalid",e);break;case"textarea":Ho(e,r),l=nu(e,r),I("invalid",e);break;default:l=r}lu(n,l),i=l;for(u in i)if(i.hasOwnProperty(u)){var s=i[u];u==="style"?hs(e,s):u==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&ps(e,s)):u==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&On(e,s):typeof s=="number"&&On(e,""+s):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(Dn.hasOwnProperty(u)?s!=null&&u==="onScroll"&&I("scroll",e):s!=null&&Ku(e,u,s,o))}switch(n){case"input":ur(e),Bo(e,r,!1);break;case"textarea":ur(e),Wo(e);break;case"option":r.value!=null&&e.setAttribute("value",""+mt(r.value));break;case"select":e.multiple=!!r.multiple,u=r.value,u!=null?Yt(e,!!r.multiple,u,!1):r.defaultValue!=null&&Yt(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Ar)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return le(t),null;case 6:if(e&&t.stateNode!=null)Ua(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(g(166));if(n=Nt(Qn.current),Nt(Be.current),mr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Ae]=t,(u=r.nodeValue!==n)&&(e=Se,e!==null))switch(e.tag){case 3:pr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&pr(r.nodeValue,n,(e.mode&1)!==0)}u&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Ae]=t,t.stateNode=r}return le(t),null;case 13:if(U(V),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if($&&we!==null&&t.mode&1&&!(t.flags&128))na(),nn(),t.flags|=98560,u=!1;else if(u=mr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!u)throw Error(g(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(g(317));u[Ae]=t}else nn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;le(t),u=!1}else De!==null&&($u(De),De=null),u=!0;if(!u)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||V.current&1?G===0&&(G=3):jo())),t.updateQueue!==null&&(t.flags|=4),le(t),null);case 4:return ln(),Tu(e,t),e===null&&Vn(t.stateNode.containerInfo),le(t),null;case 10:return fo(t.type._context),le(t),null;case 17:return ve(t.type)&&Vr(),le(t),null;case 19:if(U(V),u=t.memoizedState,u===null)return le(t),null;if(r=(t.flags&128)!==0,o=u.rendering,o===null)if(r)gn(u,!1);else{if(G!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(o=Yr(e),o!==null){for(t.flags|=128,gn(u,!1),r=o.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)u=n,e=r,u.flags&=14680066,o=u.alternate,o===null?(u.childLanes=0,u.lanes=e,u.child=null,u.subtreeFlags=0,u.memoizedProps=null,u.memoizedState=null,u.updateQueue=null,u.dependencies=null,u.stateNode=null):(u.childLanes=o.childLanes,u.lanes=o.lanes,u.child=o.child,u.subtreeFlags=0,u.deletions=null,u.memoizedProps=o.memoizedProps,u.memoizedState=o.memoizedState,u.updateQueue=o.updateQueue,u.type=o.type,e=o.dependencies,u.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return F(V,V.current&1|2),t.child}e=e.sibling}u.tail!==null&&K()>on&&(t.flags|=128,r=!0,gn(u,!1),t.lanes=4194304)}else{if(!r)if(e=Yr(o),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),gn(u,!0),u.tail===null&&u.tailMode==="hidden"&&!o.alternate&&!$)return le(t),null}else 2*K()-u.renderingStartTime>on&&n!==1073741824&&(t.flags|=128,r=!0,gn(u,!1),t.lanes=4194304);u.isBackwards?(o.sibling=t.child,t.child=o):(n=u.last,n!==null?n.sibling=o:t.child=o,u.last=o)}return u.tail!==null?(t=u.tail,u.rendering=t,u.tail=t.sibling,u.renderingStartTime=K(),t.sibling=null,n=V.current,F(V,r?n&1|2:n&1),t):(le(t),null);case 22:case 23:return zo(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ge&1073741824&&(le(t),t.subtreeFlags&6&&(t.flags|=8192)):le(t),null;case 24:return null;case 25:return null}throw Error(g(156,t.tag))}function cd(e,t){switch(io(t),t.tag){case 1:return ve(t.type)&&Vr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return ln(),U(he),U(oe),yo(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return vo(t),null;case 13:if(U(V),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(g(340));nn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return U(V),null;case 4:return ln(),null;case 10:return fo(t.type._context),null;case 22:case 23:return zo(),null;case 24:return null;default:return null}}var yr=!1,ue=!1,fd=typeof WeakSet=="function"?WeakSet:Set,E=null;function Kt(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){W(e,t,r)}else n.current=null}function Ru(e,t,n){try{n()}catch(r){W(e,t,r)}}var Di=!1;function dd(e,t){if(hu=Ir,e=Hs(),uo(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,u=r.focusNode;r=r.focusOffset;try{n.nodeType,u.nodeType}catch{n=null;break e}var o=0,i=-1,s=-1,f=0,h=0,m=e,p=null;t:for(;;){for(var w;m!==n||l!==0&&m.nodeType!==3||(i=o+l),m!==u||r!==0&&m.nodeType!==3||(s=o+r),m.nodeType===3&&(o+=m.nodeValue.length),(w=m.firstChild)!==null;)p=m,m=w;for(;;){if(m===e)break t;if(p===n&&++f===l&&(i=o),p===u&&++h===r&&(s=o),(w=m.nextSibling)!==null)break;m=p,p=m.parentNode}m=w}n=i===-1||s===-1?null:{start:i,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(vu={focusedElem:e,selectionRange:n},Ir=!1,E=t;E!==null;)if(t=E,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,E=e;else for(;E!==null;){t=E;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,M=S.memoizedState,c=t.stateNode,a=c.getSnapshotBeforeUpdate(t.elementType===t.type?k:Te(t.type,k),M);c.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(g(163))}}catch(v){W(t,t.return,v)}if(e=t.sibling,e!==null){e.return=t.return,E=e;break}E=t.return}return S=Di,Di=!1,S}function Ln(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var u=l.destroy;l.destroy=void 0,u!==void 0&&Ru(t,n,u)}l=l.next}while(l!==r)}}function fl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Du(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function $a(e){var t=e.alternate;t!==null&&(e.alternate=null,$a(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Ae],delete t[Hn],delete t[wu],delete t[Yf],delete t[Gf])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Aa(e){return e.tag===5||e.tag===3||e.tag===4}function Oi(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Aa(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Ou(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Ar));else if(r!==4&&(e=e.child,e!==null))for(Ou(e,t,n),e=e.sibling;e!==null;)Ou(e,t,n),e=e.sibling}function Fu(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Fu(e,t,n),e=e.sibling;e!==null;)Fu(e,t,n),e=e.sibling}var ee=null,Re=!1;function be(e,t,n){for(n=n.child;n!==null;)Va(e,t,n),n=n.sibling}function Va(e,t,n){if(Ve&&typeof Ve.onCommitFiberUnmount=="function")try{Ve.onCommitFiberUnmount(rl,n)}catch{}switch(n.tag){case 5:ue||Kt(n,t);case 6:var r=ee,l=Re;ee=null,be(e,t,n),ee=r,Re=l,ee!==null&&(Re?(e=ee,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ee.removeChild(n.stateNode));break;case 18:ee!==null&&(Re?(e=ee,n=n.stateNode,e.nodeType===8?Il(e.parentNode,n):e.nodeType===1&&Il(e,n),Un(e)):Il(ee,n.stateNode));break;case 4:r=ee,l=Re,ee=n.stateNode.containerInfo,Re=!0,be(e,t,n),ee=r,Re=l;break;case 0:case 11:case 14:case 15:if(!ue&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var u=l,o=u.destroy;u=u.tag,o!==void 0&&(u&2||u&4)&&Ru(n,t,o),l=l.next}while(l!==r)}be(e,t,n);break;case 1:if(!ue&&(Kt(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(i){W(n,t,i)}be(e,t,n);break;case 21:be(e,t,n);break;case 22:n.mode&1?(ue=(r=ue)||n.memoizedState!==null,be(e,t,n),ue=r):be(e,t,n);break;default:be(e,t,n)}}function Fi(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new fd),t.forEach(function(r){var l=kd.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Le(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var u=e,o=t,i=o;e:for(;i!==null;){switch(i.tag){case 5:ee=i.stateNode,Re=!1;break e;case 3:ee=i.stateNode.containerInfo,Re=!0;break e;case 4:ee=i.stateNode.containerInfo,Re=!0;break e}i=i.return}if(ee===null)throw Error(g(160));Va(u,o,l),ee=null,Re=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(f){W(l,t,f)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Ba(t,e),t=t.sibling}function Ba(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Le(t,e),Ue(e),r&4){try{Ln(3,e,e.return),fl(3,e)}catch(k){W(e,e.return,k)}try{Ln(5,e,e.return)}catch(k){W(e,e.return,k)}}break;case 1:Le(t,e),Ue(e),r&512&&n!==null&&Kt(n,n.return);break;case 5:if(Le(t,e),Ue(e),r&512&&n!==null&&Kt(n,n.return),e.flags&32){var l=e.stateNode;try{On(l,"")}catch(k){W(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var u=e.memoizedProps,o=n!==null?n.memoizedProps:u,i=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{i==="input"&&u.type==="radio"&&u.name!=null&&cs(l,u),uu(i,o);var f=uu(i,u);for(o=0;o<s.length;o+=2){var h=s[o],m=s[o+1];h==="style"?hs(l,m):h==="dangerouslySetInnerHTML"?ps(l,m):h==="children"?On(l,m):Ku(l,h,m,f)}switch(i){case"input":eu(l,u);break;case"textarea":fs(l,u);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!u.multiple;var w=u.value;w!=null?Yt(l,!!u.multiple,w,!1):p!==!!u.multiple&&(u.defaultValue!=null?Yt(l,!!u.multiple,u.defaultValue,!0):Yt(l,!!u.multiple,u.multiple?[]:"",!1))}l[Hn]=u}catch(k){W(e,e.return,k)}}break;case 6:if(Le(t,e),Ue(e),r&4){if(e.stateNode===null)throw Error(g(162));l=e.stateNode,u=e.memoizedProps;try{l.nodeValue=u}catch(k){W(e,e.return,k)}}break;case 3:if(Le(t,e),Ue(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Un(t.containerInfo)}catch(k){W(e,e.return,k)}break;case 4:Le(t,e),Ue(e);break;case 13:Le(t,e),Ue(e),l=e.child,l.flags&8192&&(u=l.memoizedState!==null,l.stateNode.isHidden=u,!u||l.alternate!==null&&l.alternate.memoizedState!==null||(_o=K())),r&4&&Fi(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ue=(f=ue)||h,Le(t,e),ue=f):Le(t,e),Ue(e),r&8192){if(f=e.memoizedState!==null,(e.stateNode.isHidden=f)&&!h&&e.mode&1)for(E=e,h=e.child;h!==null;){for(m=E=h;E!==null;){switch(p=E,w=p.child,p.tag){case 0:case 11:case 14:case 15:Ln(4,p,p.return);break;case 1:Kt(p,p.return);var S=p.stateNode;if(typeof S.componentWillUnmount=="function"){r=p,n=p.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){W(r,n,k)}}break;case 5:Kt(p,p.return);break;case 22:if(p.memoizedState!==null){Ii(m);continue}}w!==null?(w.return=p,E=w):Ii(m)}h=h.sibling}e:for(h=null,m=e;;){if(m.tag===5){if(h===null){h=m;try{l=m.stateNode,f?(u=l.style,typeof u.setProperty=="function"?u.setProperty("display","none","important"):u.display="none"):(i=m.stateNode,s=m.memoizedProps.style,o=s!=null&&s.hasOwnProperty("display")?s.display:null,i.style.display=ms("display",o))}catch(k){W(e,e.return,k)}}}else if(m.tag===6){if(h===null)try{m.stateNode.nodeValue=f?"":m.memoizedProps}catch(k){W(e,e.return,k)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;h===m&&(h=null),m=m.return}h===m&&(h=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:Le(t,e),Ue(e),r&4&&Fi(e);break;case 21:break;default:Le(t,e),Ue(e)}}function Ue(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Aa(n)){var r=n;break e}n=n.return}throw Error(g(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(On(l,""),r.flags&=-33);var u=Oi(e);Fu(e,u,l);break;case 3:case 4:var o=r.stateNode.containerInfo,i=Oi(e);Ou(e,i,o);break;default:throw Error(g(161))}}catch(s){W(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function pd(e,t,n){E=e,Ha(e)}function Ha(e,t,n){for(var r=(e.mode&1)!==0;E!==null;){var l=E,u=l.child;if(l.tag===22&&r){var o=l.memoizedState!==null||yr;if(!o){var i=l.alternate,s=i!==null&&i.memoizedState!==null||ue;i=yr;var f=ue;if(yr=o,(ue=s)&&!f)for(E=l;E!==null;)o=E,s=o.child,o.tag===22&&o.memoizedState!==null?Ui(l):s!==null?(s.return=o,E=s):Ui(l);for(;u!==null;)E=u,Ha(u),u=u.sibling;E=l,yr=i,ue=f}Mi(e)}else l.subtreeFlags&8772&&u!==null?(u.return=l,E=u):Mi(e)}}function Mi(e){for(;E!==null;){var t=E;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ue||fl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ue)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Te(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var u=t.updateQueue;u!==null&&Si(t,u,r);break;case 3:var o=t.updateQueue;if(o!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Si(t,o,n)}break;case 5:var i=t.stateNode;if(n===null&&t.flags&4){n=i;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var f=t.alternate;if(f!==null){var h=f.memoizedState;if(h!==null){var m=h.dehydrated;m!==null&&Un(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(g(163))}ue||t.flags&512&&Du(t)}catch(p){W(t,t.return,p)}}if(t===e){E=null;break}if(n=t.sibling,n!==null){n.return=t.return,E=n;break}E=t.return}}function Ii(e){for(;E!==null;){var t=E;if(t===e){E=null;break}var n=t.sibling;if(n!==null){n.return=t.return,E=n;break}E=t.return}}function Ui(e){for(;E!==null;){var t=E;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{fl(4,t)}catch(s){W(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){W(t,l,s)}}var u=t.return;try{Du(t)}catch(s){W(t,u,s)}break;case 5:var o=t.return;try{Du(t)}catch(s){W(t,o,s)}}}catch(s){W(t,t.return,s)}if(t===e){E=null;break}var i=t.sibling;if(i!==null){i.return=t.return,E=i;break}E=t.return}}var md=Math.ceil,Jr=qe.ReactCurrentDispatcher,Co=qe.ReactCurrentOwner,Pe=qe.ReactCurrentBatchConfig,D=0,q=null,X=null,te=0,ge=0,Xt=yt(0),G=0,Gn=null,Tt=0,dl=0,No=0,Tn=null,pe=null,_o=0,on=1/0,He=null,qr=!1,Mu=null,ft=null,gr=!1,ut=null,br=0,Rn=0,Iu=null,jr=-1,Lr=0;function se(){return D&6?K():jr!==-1?jr:jr=K()}function dt(e){return e.mode&1?D&2&&te!==0?te&-te:Jf.transition!==null?(Lr===0&&(Lr=Ps()),Lr):(e=O,e!==0||(e=window.event,e=e===void 0?16:Os(e.type)),e):1}function Fe(e,t,n,r){if(50<Rn)throw Rn=0,Iu=null,Error(g(185));Jn(e,n,r),(!(D&2)||e!==q)&&(e===q&&(!(D&2)&&(dl|=n),G===4&&rt(e,te)),ye(e,r),n===1&&D===0&&!(t.mode&1)&&(on=K()+500,sl&&gt()))}function ye(e,t){var n=e.callbackNode;Zc(e,t);var r=Mr(e,e===q?te:0);if(r===0)n!==null&&Xo(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Xo(n),t===1)e.tag===0?Zf($i.bind(null,e)):bs($i.bind(null,e)),Kf(function(){!(D&6)&&gt()}),n=null;else{switch(zs(r)){case 1:n=Ju;break;case 4:n=Ns;break;case 16:n=Fr;break;case 536870912:n=_s;break;default:n=Fr}n=Ja(n,Wa.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Wa(e,t){if(jr=-1,Lr=0,D&6)throw Error(g(327));var n=e.callbackNode;if(bt()&&e.callbackNode!==n)return null;var r=Mr(e,e===q?te:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=el(e,r);else{t=r;var l=D;D|=2;var u=Ka();(q!==e||te!==t)&&(He=null,on=K()+500,_t(e,t));do try{yd();break}catch(i){Qa(e,i)}while(!0);co(),Jr.current=u,D=l,X!==null?t=0:(q=null,te=0,t=G)}if(t!==0){if(t===2&&(l=cu(e),l!==0&&(r=l,t=Uu(e,l))),t===1)throw n=Gn,_t(e,0),rt(e,r),ye(e,K()),n;if(t===6)rt(e,r);else{if(l=e.current.alternate,!(r&30)&&!hd(l)&&(t=el(e,r),t===2&&(u=cu(e),u!==0&&(r=u,t=Uu(e,u))),t===1))throw n=Gn,_t(e,0),rt(e,r),ye(e,K()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(g(345));case 2:xt(e,pe,He);break;case 3:if(rt(e,r),(r&130023424)===r&&(t=_o+500-K(),10<t)){if(Mr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){se(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=gu(xt.bind(null,e,pe,He),t);break}xt(e,pe,He);break;case 4:if(rt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var o=31-Oe(r);u=1<<o,o=t[o],o>l&&(l=o),r&=~u}if(r=l,r=K()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*md(r/1960))-r,10<r){e.timeoutHandle=gu(xt.bind(null,e,pe,He),r);break}xt(e,pe,He);break;case 5:xt(e,pe,He);break;default:throw Error(g(329))}}}return ye(e,K()),e.callbackNode===n?Wa.bind(null,e):null}function Uu(e,t){var n=Tn;return e.current.memoizedState.isDehydrated&&(_t(e,t).flags|=256),e=el(e,t),e!==2&&(t=pe,pe=n,t!==null&&$u(t)),e}function $u(e){pe===null?pe=e:pe.push.apply(pe,e)}function hd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],u=l.getSnapshot;l=l.value;try{if(!Me(u(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function rt(e,t){for(t&=~No,t&=~dl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Oe(t),r=1<<n;e[n]=-1,t&=~r}}function $i(e){if(D&6)throw Error(g(327));bt();var t=Mr(e,0);if(!(t&1))return ye(e,K()),null;var n=el(e,t);if(e.tag!==0&&n===2){var r=cu(e);r!==0&&(t=r,n=Uu(e,r))}if(n===1)throw n=Gn,_t(e,0),rt(e,t),ye(e,K()),n;if(n===6)throw Error(g(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,xt(e,pe,He),ye(e,K()),null}function Po(e,t){var n=D;D|=1;try{return e(t)}finally{D=n,D===0&&(on=K()+500,sl&&gt())}}function Rt(e){ut!==null&&ut.tag===0&&!(D&6)&&bt();var t=D;D|=1;var n=Pe.transition,r=O;try{if(Pe.transition=null,O=1,e)return e()}finally{O=r,Pe.transition=n,D=t,!(D&6)&&gt()}}function zo(){ge=Xt.current,U(Xt)}function _t(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Qf(n)),X!==null)for(n=X.return;n!==null;){var r=n;switch(io(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Vr();break;case 3:ln(),U(he),U(oe),yo();break;case 5:vo(r);break;case 4:ln();break;case 13:U(V);break;case 19:U(V);break;case 10:fo(r.type._context);break;case 22:case 23:zo()}n=n.return}if(q=e,X=e=pt(e.current,null),te=ge=t,G=0,Gn=null,No=dl=Tt=0,pe=Tn=null,Ct!==null){for(t=0;t<Ct.length;t++)if(n=Ct[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,u=n.pending;if(u!==null){var o=u.next;u.next=l,r.next=o}n.pending=r}Ct=null}return e}function Qa(e,t){do{var n=X;try{if(co(),_r.current=Zr,Gr){for(var r=B.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}Gr=!1}if(Lt=0,J=Y=B=null,jn=!1,Kn=0,Co.current=null,n===null||n.return===null){G=1,Gn=t,X=null;break}e:{var u=e,o=n.return,i=n,s=t;if(t=te,i.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var f=s,h=i,m=h.tag;if(!(h.mode&1)&&(m===0||m===11||m===15)){var p=h.alternate;p?(h.updateQueue=p.updateQueue,h.memoizedState=p.memoizedState,h.lanes=p.lanes):(h.updateQueue=null,h.memoizedState=null)}var w=_i(o);if(w!==null){w.flags&=-257,Pi(w,o,i,u,t),w.mode&1&&Ni(u,f,t),t=w,s=f;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){Ni(u,f,t),jo();break e}s=Error(g(426))}}else if($&&i.mode&1){var M=_i(o);if(M!==null){!(M.flags&65536)&&(M.flags|=256),Pi(M,o,i,u,t),so(un(s,i));break e}}u=s=un(s,i),G!==4&&(G=2),Tn===null?Tn=[u]:Tn.push(u),u=o;do{switch(u.tag){case 3:u.flags|=65536,t&=-t,u.lanes|=t;var c=za(u,s,t);wi(u,c);break e;case 1:i=s;var a=u.type,d=u.stateNode;if(!(u.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(ft===null||!ft.has(d)))){u.flags|=65536,t&=-t,u.lanes|=t;var v=ja(u,i,t);wi(u,v);break e}}u=u.return}while(u!==null)}Ya(n)}catch(x){t=x,X===n&&n!==null&&(X=n=n.return);continue}break}while(!0)}function Ka(){var e=Jr.current;return Jr.current=Zr,e===null?Zr:e}function jo(){(G===0||G===3||G===2)&&(G=4),q===null||!(Tt&268435455)&&!(dl&268435455)||rt(q,te)}function el(e,t){var n=D;D|=2;var r=Ka();(q!==e||te!==t)&&(He=null,_t(e,t));do try{vd();break}catch(l){Qa(e,l)}while(!0);if(co(),D=n,Jr.current=r,X!==null)throw Error(g(261));return q=null,te=0,G}function vd(){for(;X!==null;)Xa(X)}function yd(){for(;X!==null&&!Vc();)Xa(X)}function Xa(e){var t=Za(e.alternate,e,ge);e.memoizedProps=e.pendingProps,t===null?Ya(e):X=t,Co.current=null}function Ya(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=cd(n,t),n!==null){n.flags&=32767,X=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{G=6,X=null;return}}else if(n=ad(n,t,ge),n!==null){X=n;return}if(t=t.sibling,t!==null){X=t;return}X=t=e}while(t!==null);G===0&&(G=5)}function xt(e,t,n){var r=O,l=Pe.transition;try{Pe.transition=null,O=1,gd(e,t,n,r)}finally{Pe.transition=l,O=r}return null}function gd(e,t,n,r){do bt();while(ut!==null);if(D&6)throw Error(g(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(g(177));e.callbackNode=null,e.callbackPriority=0;var u=n.lanes|n.childLanes;if(Jc(e,u),e===q&&(X=q=null,te=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||gr||(gr=!0,Ja(Fr,function(){return bt(),null})),u=(n.flags&15990)!==0,n.subtreeFlags&15990||u){u=Pe.transition,Pe.transition=null;var o=O;O=1;var i=D;D|=4,Co.current=null,dd(e,n),Ba(n,e),Uf(vu),Ir=!!hu,vu=hu=null,e.current=n,pd(n),Bc(),D=i,O=o,Pe.transition=u}else e.current=n;if(gr&&(gr=!1,ut=e,br=l),u=e.pendingLanes,u===0&&(ft=null),Qc(n.stateNode),ye(e,K()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(qr)throw qr=!1,e=Mu,Mu=null,e;return br&1&&e.tag!==0&&bt(),u=e.pendingLanes,u&1?e===Iu?Rn++:(Rn=0,Iu=e):Rn=0,gt(),null}function bt(){if(ut!==null){var e=zs(br),t=Pe.transition,n=O;try{if(Pe.transition=null,O=16>e?16:e,ut===null)var r=!1;else{if(e=ut,ut=null,br=0,D&6)throw Error(g(331));var l=D;for(D|=4,E=e.current;E!==null;){var u=E,o=u.child;if(E.flags&16){var i=u.deletions;if(i!==null){for(var s=0;s<i.length;s++){var f=i[s];for(E=f;E!==null;){var h=E;switch(h.tag){case 0:case 11:case 15:Ln(8,h,u)}var m=h.child;if(m!==null)m.return=h,E=m;else for(;E!==null;){h=E;var p=h.sibling,w=h.return;if($a(h),h===f){E=null;break}if(p!==null){p.return=w,E=p;break}E=w}}}var S=u.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var M=k.sibling;k.sibling=null,k=M}while(k!==null)}}E=u}}if(u.subtreeFlags&2064&&o!==null)o.return=u,E=o;else e:for(;E!==null;){if(u=E,u.flags&2048)switch(u.tag){case 0:case 11:case 15:Ln(9,u,u.return)}var c=u.sibling;if(c!==null){c.return=u.return,E=c;break e}E=u.return}}var a=e.current;for(E=a;E!==null;){o=E;var d=o.child;if(o.subtreeFlags&2064&&d!==null)d.return=o,E=d;else e:for(o=a;E!==null;){if(i=E,i.flags&2048)try{switch(i.tag){case 0:case 11:case 15:fl(9,i)}}catch(x){W(i,i.return,x)}if(i===o){E=null;break e}var v=i.sibling;if(v!==null){v.return=i.return,E=v;break e}E=i.return}}if(D=l,gt(),Ve&&typeof Ve.onPostCommitFiberRoot=="function")try{Ve.onPostCommitFiberRoot(rl,e)}catch{}r=!0}return r}finally{O=n,Pe.transition=t}}return!1}function Ai(e,t,n){t=un(n,t),t=za(e,t,1),e=ct(e,t,1),t=se(),e!==null&&(Jn(e,1,t),ye(e,t))}function W(e,t,n){if(e.tag===3)Ai(e,e,n);else for(;t!==null;){if(t.tag===3){Ai(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(ft===null||!ft.has(r))){e=un(n,e),e=ja(t,e,1),t=ct(t,e,1),e=se(),t!==null&&(Jn(t,1,e),ye(t,e));break}}t=t.return}}function wd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=se(),e.pingedLanes|=e.suspendedLanes&n,q===e&&(te&n)===n&&(G===4||G===3&&(te&130023424)===te&&500>K()-_o?_t(e,0):No|=n),ye(e,t)}function Ga(e,t){t===0&&(e.mode&1?(t=sr,sr<<=1,!(sr&130023424)&&(sr=4194304)):t=1);var n=se();e=Ze(e,t),e!==null&&(Jn(e,t,n),ye(e,n))}function Sd(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Ga(e,n)}function kd(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(g(314))}r!==null&&r.delete(t),Ga(e,n)}var Za;Za=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||he.current)me=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return me=!1,sd(e,t,n);me=!!(e.flags&131072)}else me=!1,$&&t.flags&1048576&&ea(t,Wr,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;zr(e,t),e=t.pendingProps;var l=tn(t,oe.current);qt(t,n),l=wo(null,t,r,e,l,n);var u=So();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ve(r)?(u=!0,Br(t)):u=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,mo(t),l.updater=cl,t.stateNode=l,l._reactInternals=t,Nu(t,r,e,n),t=zu(null,t,r,!0,u,n)):(t.tag=0,$&&u&&oo(t),ie(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(zr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Ed(r),e=Te(r,e),l){case 0:t=Pu(null,t,r,e,n);break e;case 1:t=Li(null,t,r,e,n);break e;case 11:t=zi(null,t,r,e,n);break e;case 14:t=ji(null,t,r,Te(r.type,e),n);break e}throw Error(g(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Te(r,l),Pu(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Te(r,l),Li(e,t,r,l,n);case 3:e:{if(Da(t),e===null)throw Error(g(387));r=t.pendingProps,u=t.memoizedState,l=u.element,oa(e,t),Xr(t,r,null,n);var o=t.memoizedState;if(r=o.element,u.isDehydrated)if(u={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},t.updateQueue.baseState=u,t.memoizedState=u,t.flags&256){l=un(Error(g(423)),t),t=Ti(e,t,r,n,l);break e}else if(r!==l){l=un(Error(g(424)),t),t=Ti(e,t,r,n,l);break e}else for(we=at(t.stateNode.containerInfo.firstChild),Se=t,$=!0,De=null,n=la(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(nn(),r===l){t=Je(e,t,n);break e}ie(e,t,r,n)}t=t.child}return t;case 5:return ia(t),e===null&&xu(t),r=t.type,l=t.pendingProps,u=e!==null?e.memoizedProps:null,o=l.children,yu(r,l)?o=null:u!==null&&yu(r,u)&&(t.flags|=32),Ra(e,t),ie(e,t,o,n),t.child;case 6:return e===null&&xu(t),null;case 13:return Oa(e,t,n);case 4:return ho(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=rn(t,null,r,n):ie(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Te(r,l),zi(e,t,r,l,n);case 7:return ie(e,t,t.pendingProps,n),t.child;case 8:return ie(e,t,t.pendingProps.children,n),t.child;case 12:return ie(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,u=t.memoizedProps,o=l.value,F(Qr,r._currentValue),r._currentValue=o,u!==null)if(Me(u.value,o)){if(u.children===l.children&&!he.current){t=Je(e,t,n);break e}}else for(u=t.child,u!==null&&(u.return=t);u!==null;){var i=u.dependencies;if(i!==null){o=u.child;for(var s=i.firstContext;s!==null;){if(s.context===r){if(u.tag===1){s=Xe(-1,n&-n),s.tag=2;var f=u.updateQueue;if(f!==null){f=f.shared;var h=f.pending;h===null?s.next=s:(s.next=h.next,h.next=s),f.pending=s}}u.lanes|=n,s=u.alternate,s!==null&&(s.lanes|=n),Eu(u.return,n,t),i.lanes|=n;break}s=s.next}}else if(u.tag===10)o=u.type===t.type?null:u.child;else if(u.tag===18){if(o=u.return,o===null)throw Error(g(341));o.lanes|=n,i=o.alternate,i!==null&&(i.lanes|=n),Eu(o,n,t),o=u.sibling}else o=u.child;if(o!==null)o.return=u;else for(o=u;o!==null;){if(o===t){o=null;break}if(u=o.sibling,u!==null){u.return=o.return,o=u;break}o=o.return}u=o}ie(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,qt(t,n),l=ze(l),r=r(l),t.flags|=1,ie(e,t,r,n),t.child;case 14:return r=t.type,l=Te(r,t.pendingProps),l=Te(r.type,l),ji(e,t,r,l,n);case 15:return La(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Te(r,l),zr(e,t),t.tag=1,ve(r)?(e=!0,Br(t)):e=!1,qt(t,n),Pa(t,r,l),Nu(t,r,l,n),zu(null,t,r,!0,e,n);case 19:return Fa(e,t,n);case 22:return Ta(e,t,n)}throw Error(g(156,t.tag))};function Ja(e,t){return Cs(e,t)}function xd(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function _e(e,t,n,r){return new xd(e,t,n,r)}function Lo(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Ed(e){if(typeof e=="function")return Lo(e)?1:0;if(e!=null){if(e=e.$$typeof,e===Yu)return 11;if(e===Gu)return 14}return 2}function pt(e,t){var n=e.alternate;return n===null?(n=_e(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Tr(e,t,n,r,l,u){var o=2;if(r=e,typeof e=="function")Lo(e)&&(o=1);else if(typeof e=="string")o=5;else e:switch(e){case It:return Pt(n.children,l,u,t);case Xu:o=8,l|=8;break;case Gl:return e=_e(12,n,t,l|2),e.elementType=Gl,e.lanes=u,e;case Zl:return e=_e(13,n,t,l),e.elementType=Zl,e.lanes=u,e;case Jl:return e=_e(19,n,t,l),e.elementType=Jl,e.lanes=u,e;case is:return pl(n,l,u,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case us:o=10;break e;case os:o=9;break e;case Yu:o=11;break e;case Gu:o=14;break e;case et:o=16,r=null;break e}throw Error(g(130,e==null?e:typeof e,""))}return t=_e(o,n,t,l),t.elementType=e,t.type=r,t.lanes=u,t}function Pt(e,t,n,r){return e=_e(7,e,r,t),e.lanes=n,e}function pl(e,t,n,r){return e=_e(22,e,r,t),e.elementType=is,e.lanes=n,e.stateNode={isHidden:!1},e}function Ql(e,t,n){return e=_e(6,e,null,t),e.lanes=n,e}function Kl(e,t,n){return t=_e(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Cd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=_l(0),this.expirationTimes=_l(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=_l(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function To(e,t,n,r,l,u,o,i,s){return e=new Cd(e,t,n,i,s),t===1?(t=1,u===!0&&(t|=8)):t=0,u=_e(3,null,null,t),e.current=u,u.stateNode=e,u.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},mo(u),e}function Nd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Mt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function qa(e){if(!e)return ht;e=e._reactInternals;e:{if(Ot(e)!==e||e.tag!==1)throw Error(g(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ve(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(g(171))}if(e.tag===1){var n=e.type;if(ve(n))return qs(e,n,t)}return t}function ba(e,t,n,r,l,u,o,i,s){return e=To(n,r,!0,e,l,u,o,i,s),e.context=qa(null),n=e.current,r=se(),l=dt(n),u=Xe(r,l),u.callback=t??null,ct(n,u,l),e.current.lanes=l,Jn(e,l,r),ye(e,r),e}function ml(e,t,n,r){var l=t.current,u=se(),o=dt(l);return n=qa(n),t.context===null?t.context=n:t.pendingContext=n,t=Xe(u,o),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=ct(l,t,o),e!==null&&(Fe(e,l,o,u),Nr(e,l,o)),o}function tl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Vi(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ro(e,t){Vi(e,t),(e=e.alternate)&&Vi(e,t)}function _d(){return null}var ec=typeof reportError=="function"?reportError:function(e){console.error(e)};function Do(e){this._internalRoot=e}hl.prototype.render=Do.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(g(409));ml(e,t,null,null)};hl.prototype.unmount=Do.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Rt(function(){ml(null,e,null,null)}),t[Ge]=null}};function hl(e){this._internalRoot=e}hl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ts();e={blockedOn:null,target:e,priority:t};for(var n=0;n<nt.length&&t!==0&&t<nt[n].priority;n++);nt.splice(n,0,e),n===0&&Ds(e)}};function Oo(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function vl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Bi(){}function Pd(e,t,n,r,l){if(l){if(typeof r=="function"){var u=r;r=function(){var f=tl(o);u.call(f)}}var o=ba(t,r,e,0,null,!1,!1,"",Bi);return e._reactRootContainer=o,e[Ge]=o.current,Vn(e.nodeType===8?e.parentNode:e),Rt(),o}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var i=r;r=function(){var f=tl(s);i.call(f)}}var s=To(e,0,!1,null,null,!1,!1,"",Bi);return e._reactRootContainer=s,e[Ge]=s.current,Vn(e.nodeType===8?e.parentNode:e),Rt(function(){ml(t,s,n,r)}),s}function yl(e,t,n,r,l){var u=n._reactRootContainer;if(u){var o=u;if(typeof l=="function"){var i=l;l=function(){var s=tl(o);i.call(s)}}ml(t,o,e,l)}else o=Pd(n,t,e,l,r);return tl(o)}js=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=xn(t.pendingLanes);n!==0&&(qu(t,n|1),ye(t,K()),!(D&6)&&(on=K()+500,gt()))}break;case 13:Rt(function(){var r=Ze(e,1);if(r!==null){var l=se();Fe(r,e,1,l)}}),Ro(e,1)}};bu=function(e){if(e.tag===13){var t=Ze(e,134217728);if(t!==null){var n=se();Fe(t,e,134217728,n)}Ro(e,134217728)}};Ls=function(e){if(e.tag===13){var t=dt(e),n=Ze(e,t);if(n!==null){var r=se();Fe(n,e,t,r)}Ro(e,t)}};Ts=function(){return O};Rs=function(e,t){var n=O;try{return O=e,t()}finally{O=n}};iu=function(e,t,n){switch(t){case"input":if(eu(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=il(r);if(!l)throw Error(g(90));as(r),eu(r,l)}}}break;case"textarea":fs(e,n);break;case"select":t=n.value,t!=null&&Yt(e,!!n.multiple,t,!1)}};gs=Po;ws=Rt;var zd={usingClientEntryPoint:!1,Events:[bn,Vt,il,vs,ys,Po]},wn={findFiberByHostInstance:Et,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},jd={bundleType:wn.bundleType,version:wn.version,rendererPackageName:wn.rendererPackageName,rendererConfig:wn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:qe.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=xs(e),e===null?null:e.stateNode},findFiberByHostInstance:wn.findFiberByHostInstance||_d,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var wr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!wr.isDisabled&&wr.supportsFiber)try{rl=wr.inject(jd),Ve=wr}catch{}}xe.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=zd;xe.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Oo(t))throw Error(g(200));return Nd(e,t,null,n)};xe.createRoot=function(e,t){if(!Oo(e))throw Error(g(299));var n=!1,r="",l=ec;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=To(e,1,!1,null,null,n,!1,r,l),e[Ge]=t.current,Vn(e.nodeType===8?e.parentNode:e),new Do(t)};xe.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(g(188)):(e=Object.keys(e).join(","),Error(g(268,e)));return e=xs(t),e=e===null?null:e.stateNode,e};xe.flushSync=function(e){return Rt(e)};xe.hydrate=function(e,t,n){if(!vl(t))throw Error(g(200));return yl(null,e,t,!0,n)};xe.hydrateRoot=function(e,t,n){if(!Oo(e))throw Error(g(405));var r=n!=null&&n.hydratedSources||null,l=!1,u="",o=ec;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(u=n.identifierPrefix),n.onRecoverableError!==void 0&&(o=n.onRecoverableError)),t=ba(t,null,e,1,n??null,l,!1,u,o),e[Ge]=t.current,Vn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new hl(t)};xe.render=function(e,t,n){if(!vl(t))throw Error(g(200));return yl(null,e,t,!1,n)};xe.unmountComponentAtNode=function(e){if(!vl(e))throw Error(g(40));return e._reactRootContainer?(Rt(function(){yl(null,null,e,!1,function(){e._reactRootContainer=null,e[Ge]=null})}),!0):!1};xe.unstable_batchedUpdates=Po;xe.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!vl(n))throw Error(g(200));if(e==null||e._reactInternals===void 0)throw Error(g(38));return yl(e,t,n,!1,r)};xe.version="18.3.1-next-f1338f8080-20240426";function tc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(tc)}catch(e){console.error(e)}}tc(),ts.exports=xe;var Ld=ts.exports,Hi=Ld;Xl.createRoot=Hi.createRoot,Xl.hydrateRoot=Hi.hydrateRoot;function Td(){const[e,t]=de.useState(null),[n,r]=de.useState(!1),[l,u]=de.useState(0),[o,i]=de.useState(""),[s,f]=de.useState(null),[h,m]=de.useState(!1),[p,w]=de.useState([]),[S,k]=de.useState(!1),[M,c]=de.useState("checking"),a=de.useRef(null);de.useEffect(()=>{const z=async()=>{try{(await fetch("/health")).ok?c("online"):c("offline")}catch{c("offline")}};z();const b=setInterval(z,3e4);return()=>clearInterval(b)},[]);const d=z=>{z&&z.type==="application/pdf"?(t(z),i("")):i("Por favor, selecione apenas arquivos PDF.")},v=z=>{const b=z.target.files[0];d(b)},x=z=>{z.preventDefault(),m(!1);const b=z.dataTransfer.files[0];d(b)},N=z=>{z.preventDefault(),m(!0)},_=z=>{z.preventDefault(),m(!1)},P=async()=>{if(!e){i("Por favor, selecione um arquivo PDF.");return}r(!0),u(0),i("Iniciando conversão...");try{const z=new FormData;z.append("file",e);const fe=await(await fetch("/upload",{method:"POST",body:z})).json();if(fe.error)throw new Error(fe.error);f(fe.task_id),i("Conversão iniciada..."),A(fe.task_id)}catch(z){i(`Erro: ${z.message}`),r(!1)}},A=z=>{const b=setInterval(async()=>{try{const Ie=await(await fetch(`/api/status/${z}`)).json();if(Ie.error){clearInterval(b),i(`Erro: ${Ie.error}`),r(!1);return}if(u(Ie.progress),i(`Processando... ${Ie.progress}%`),Ie.status==="completed"){clearInterval(b),i("Conversão concluída!"),u(100);const gl={id:z,filename:e.name,timestamp:new Date().toLocaleString(),status:"completed"};w(fn=>[gl,...fn.slice(0,4)]),setTimeout(()=>{window.location.href=`/download/${z}`,T()},1e3)}else Ie.status==="error"&&(clearInterval(b),i(`Erro: ${Ie.error}`),r(!1))}catch{clearInterval(b),i("Erro de comunicação"),r(!1)}},1e3)},T=()=>{t(null),r(!1),u(0),i(""),f(null),a.current&&(a.current.value="")};return y.jsxs("div",{className:"app-container",children:[y.jsx("header",{className:"app-header",children:y.jsx("div",{className:"container",children:y.jsx("div",{className:"d-flex justify-content-center align-items-center",children:y.jsxs("div",{className:"logo",children:[y.jsx("i",{className:"fas fa-file-excel text-success me-2"}),y.jsx("span",{children:"PDF to XLSM"})]})})})}),o&&o.includes("Erro")&&y.jsx("div",{className:"error-notification",children:y.jsx("div",{className:"container",children:y.jsxs("div",{className:"d-flex justify-content-between align-items-center",children:[y.jsxs("span",{children:[y.jsx("i",{className:"fas fa-exclamation-triangle me-2"}),o]}),y.jsx("button",{className:"btn-close",onClick:()=>i(""),children:y.jsx("i",{className:"fas fa-times"})})]})})}),y.jsx("section",{className:"hero-section",children:y.jsxs("div",{className:"container",children:[y.jsxs("div",{className:"hero-content",children:[y.jsx("h1",{className:"hero-title",children:"Conversor PDF para XLSM"}),y.jsx("p",{className:"hero-description",children:"Converta arquivos PDF com tabelas financeiras para formato Excel (XLSM) com formatação profissional e estrutura otimizada."}),y.jsxs("div",{className:"conversion-indicator",children:[y.jsxs("div",{className:"format-tag",children:[y.jsx("i",{className:"fas fa-file-pdf me-2"}),"PDF"]}),y.jsx("div",{className:"arrow",children:y.jsx("i",{className:"fas fa-arrow-right"})}),y.jsxs("div",{className:"format-tag",children:[y.jsx("i",{className:"fas fa-file-excel me-2"}),"XLSM"]})]})]}),y.jsx("div",{className:"hero-icon",children:y.jsx("i",{className:"fas fa-file-excel"})})]})}),y.jsx("section",{className:"upload-section",children:y.jsx("div",{className:"container",children:y.jsxs("div",{className:"upload-card",children:[y.jsx("div",{className:"upload-header",children:y.jsxs("h3",{className:"upload-title",children:[y.jsx("i",{className:"fas fa-upload text-primary me-2"}),"Converter Arquivo"]})}),y.jsxs("div",{className:"upload-body",children:[y.jsxs("div",{className:`upload-area ${h?"dragover":""}`,onDrop:x,onDragOver:N,onDragLeave:_,onClick:()=>{var z;return(z=a.current)==null?void 0:z.click()},children:[y.jsx("i",{className:"fas fa-cloud-upload-alt fa-3x text-muted mb-3"}),y.jsx("p",{className:"upload-instruction",children:"Arraste e solte seu arquivo PDF aqui ou clique para selecionar"}),y.jsx("input",{ref:a,type:"file",accept:".pdf",onChange:v,style:{display:"none"}})]}),e&&y.jsx("div",{className:"mt-3",children:y.jsxs("p",{className:"text-success",children:[y.jsx("i",{className:"fas fa-check-circle me-2"}),"Arquivo selecionado: ",e.name]})}),o&&!o.includes("Erro")&&y.jsx("div",{className:"mt-3",children:y.jsx("p",{className:"text-info",children:o})}),n&&y.jsx("div",{className:"progress-container",children:y.jsx("div",{className:"progress",children:y.jsxs("div",{className:"progress-bar progress-bar-animated bg-primary",role:"progressbar",style:{width:`${l}%`},children:[l,"%"]})})}),y.jsx("div",{className:"text-center mt-4",children:y.jsx("button",{className:"btn btn-primary btn-lg",onClick:P,disabled:!e||n,children:n?y.jsxs(y.Fragment,{children:[y.jsx("i",{className:"fas fa-spinner fa-spin me-2"}),"Convertendo..."]}):y.jsxs(y.Fragment,{children:[y.jsx("i",{className:"fas fa-magic me-2"}),"Converter para XLSM"]})})}),y.jsx("div",{className:"mt-4 text-center",children:y.jsxs("small",{className:"text-muted",children:[y.jsx("i",{className:"fas fa-info-circle me-1"}),"Suporte apenas para arquivos PDF. Tamanho máximo: 10MB."]})})]})]})})}),p.length>0&&y.jsx("section",{className:"history-section",children:y.jsx("div",{className:"container",children:y.jsxs("div",{className:"history-card",children:[y.jsx("div",{className:"history-header",children:y.jsxs("h5",{className:"history-title",children:[y.jsx("i",{className:"fas fa-history text-primary me-2"}),"Histórico de Conversões"]})}),y.jsx("div",{className:"history-body",children:y.jsx("div",{className:"table-responsive",children:y.jsxs("table",{className:"table table-sm",children:[y.jsx("thead",{children:y.jsxs("tr",{children:[y.jsx("th",{children:"Arquivo"}),y.jsx("th",{children:"Data/Hora"}),y.jsx("th",{children:"Status"}),y.jsx("th",{children:"Ação"})]})}),y.jsx("tbody",{children:p.map(z=>y.jsxs("tr",{children:[y.jsxs("td",{children:[y.jsx("i",{className:"fas fa-file-pdf text-danger me-2"}),z.filename]}),y.jsx("td",{children:z.timestamp}),y.jsx("td",{children:y.jsxs("span",{className:"badge bg-success",children:[y.jsx("i",{className:"fas fa-check me-1"}),"Concluído"]})}),y.jsx("td",{children:y.jsxs("button",{className:"btn btn-sm btn-outline-primary",onClick:()=>{window.location.href=`/download/${z.id}`},children:[y.jsx("i",{className:"fas fa-download me-1"}),"Baixar"]})})]},z.id))})]})})})]})})}),y.jsx("footer",{className:"app-footer",children:y.jsx("div",{className:"container",children:y.jsxs("div",{className:"text-center",children:[y.jsxs("p",{className:"mb-2",children:[y.jsx("i",{className:"fas fa-code me-2"}),"Desenvolvido com React + Flask"]}),y.jsxs("p",{className:"mb-0",children:[y.jsx("i",{className:"fas fa-server me-2"}),"Processamento em tempo real •",y.jsx("i",{className:"fas fa-shield-alt ms-2 me-2"}),"Seguro e confiável"]})]})})})]})}Xl.createRoot(document.getElementById("root")).render(y.jsx(gc.StrictMode,{children:y.jsx(Td,{})}));
+`+u.stack}return{value:e,source:t,stack:l,digest:null}}function Hl(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function _u(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var ud=typeof WeakMap=="function"?WeakMap:Map;function za(e,t,n){n=Xe(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){qr||(qr=!0,Mu=r),_u(e,t)},n}function ja(e,t,n){n=Xe(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var l=t.value;n.payload=function(){return r(l)},n.callback=function(){_u(e,t)}}var u=e.stateNode;return u!==null&&typeof u.componentDidCatch=="function"&&(n.callback=function(){_u(e,t),typeof r!="function"&&(ft===null?ft=new Set([this]):ft.add(this));var o=t.stack;this.componentDidCatch(t.value,{componentStack:o!==null?o:""})}),n}function Ni(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new ud;var l=new Set;r.set(t,l)}else l=r.get(t),l===void 0&&(l=new Set,r.set(t,l));l.has(n)||(l.add(n),e=wd.bind(null,e,t,n),t.then(e,e))}function _i(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Pi(e,t,n,r,l){return e.mode&1?(e.flags|=65536,e.lanes=l,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=Xe(-1,1),t.tag=2,ct(n,t,1))),n.lanes|=1),e)}var od=qe.ReactCurrentOwner,me=!1;function ie(e,t,n,r){t.child=e===null?la(t,null,n,r):rn(t,e.child,n,r)}function zi(e,t,n,r,l){n=n.render;var u=t.ref;return qt(t,l),r=wo(e,t,n,r,u,l),n=So(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Je(e,t,l)):($&&n&&oo(t),t.flags|=1,ie(e,t,r,l),t.child)}function ji(e,t,n,r,l){if(e===null){var u=n.type;return typeof u=="function"&&!Lo(u)&&u.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=u,La(e,t,u,r,l)):(e=Tr(n.type,null,r,t,t.mode,l),e.ref=t.ref,e.return=t,t.child=e)}if(u=e.child,!(e.lanes&l)){var o=u.memoizedProps;if(n=n.compare,n=n!==null?n:An,n(o,r)&&e.ref===t.ref)return Je(e,t,l)}return t.flags|=1,e=pt(u,r),e.ref=t.ref,e.return=t,t.child=e}function La(e,t,n,r,l){if(e!==null){var u=e.memoizedProps;if(An(u,r)&&e.ref===t.ref)if(me=!1,t.pendingProps=r=u,(e.lanes&l)!==0)e.flags&131072&&(me=!0);else return t.lanes=e.lanes,Je(e,t,l)}return Pu(e,t,n,r,l)}function Ta(e,t,n){var r=t.pendingProps,l=r.children,u=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},F(Xt,ge),ge|=n;else{if(!(n&1073741824))return e=u!==null?u.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,F(Xt,ge),ge|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=u!==null?u.baseLanes:n,F(Xt,ge),ge|=r}else u!==null?(r=u.baseLanes|n,t.memoizedState=null):r=n,F(Xt,ge),ge|=r;return ie(e,t,l,n),t.child}function Ra(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Pu(e,t,n,r,l){var u=ve(n)?zt:oe.current;return u=tn(t,u),qt(t,l),n=wo(e,t,n,r,u,l),r=So(),e!==null&&!me?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l,Je(e,t,l)):($&&r&&oo(t),t.flags|=1,ie(e,t,n,l),t.child)}function Li(e,t,n,r,l){if(ve(n)){var u=!0;Br(t)}else u=!1;if(qt(t,l),t.stateNode===null)zr(e,t),Pa(t,n,r),Nu(t,n,r,l),r=!0;else if(e===null){var o=t.stateNode,i=t.memoizedProps;o.props=i;var s=o.context,f=n.contextType;typeof f=="object"&&f!==null?f=ze(f):(f=ve(n)?zt:oe.current,f=tn(t,f));var h=n.getDerivedStateFromProps,m=typeof h=="function"||typeof o.getSnapshotBeforeUpdate=="function";m||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(i!==r||s!==f)&&Ci(t,o,r,f),tt=!1;var p=t.memoizedState;o.state=p,Xr(t,r,o,l),s=t.memoizedState,i!==r||p!==s||he.current||tt?(typeof h=="function"&&(Cu(t,n,h,r),s=t.memoizedState),(i=tt||Ei(t,n,i,r,p,s,f))?(m||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(t.flags|=4194308)):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),o.props=r,o.state=s,o.context=f,r=i):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,oa(e,t),i=t.memoizedProps,f=t.type===t.elementType?i:Te(t.type,i),o.props=f,m=t.pendingProps,p=o.context,s=n.contextType,typeof s=="object"&&s!==null?s=ze(s):(s=ve(n)?zt:oe.current,s=tn(t,s));var w=n.getDerivedStateFromProps;(h=typeof w=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(i!==m||p!==s)&&Ci(t,o,r,s),tt=!1,p=t.memoizedState,o.state=p,Xr(t,r,o,l);var S=t.memoizedState;i!==m||p!==S||he.current||tt?(typeof w=="function"&&(Cu(t,n,w,r),S=t.memoizedState),(f=tt||Ei(t,n,f,r,p,S,s)||!1)?(h||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(r,S,s),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(r,S,s)),typeof o.componentDidUpdate=="function"&&(t.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof o.componentDidUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=S),o.props=r,o.state=S,o.context=s,r=f):(typeof o.componentDidUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||i===e.memoizedProps&&p===e.memoizedState||(t.flags|=1024),r=!1)}return zu(e,t,n,r,u,l)}function zu(e,t,n,r,l,u){Ra(e,t);var o=(t.flags&128)!==0;if(!r&&!o)return l&&hi(t,n,!1),Je(e,t,u);r=t.stateNode,od.current=t;var i=o&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&o?(t.child=rn(t,e.child,null,u),t.child=rn(t,null,i,u)):ie(e,t,i,u),t.memoizedState=r.state,l&&hi(t,n,!0),t.child}function Da(e){var t=e.stateNode;t.pendingContext?mi(e,t.pendingContext,t.pendingContext!==t.context):t.context&&mi(e,t.context,!1),ho(e,t.containerInfo)}function Ti(e,t,n,r,l){return nn(),so(l),t.flags|=256,ie(e,t,n,r),t.child}var ju={dehydrated:null,treeContext:null,retryLane:0};function Lu(e){return{baseLanes:e,cachePool:null,transitions:null}}function Oa(e,t,n){var r=t.pendingProps,l=V.current,u=!1,o=(t.flags&128)!==0,i;if((i=o)||(i=e!==null&&e.memoizedState===null?!1:(l&2)!==0),i?(u=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(l|=1),F(V,l&1),e===null)return xu(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(o=r.children,e=r.fallback,u?(r=t.mode,u=t.child,o={mode:"hidden",children:o},!(r&1)&&u!==null?(u.childLanes=0,u.pendingProps=o):u=pl(o,r,0,null),e=Pt(e,r,n,null),u.return=t,e.return=t,u.sibling=e,t.child=u,t.child.memoizedState=Lu(n),t.memoizedState=ju,e):Eo(t,o));if(l=e.memoizedState,l!==null&&(i=l.dehydrated,i!==null))return id(e,t,o,r,i,l,n);if(u){u=r.fallback,o=t.mode,l=e.child,i=l.sibling;var s={mode:"hidden",children:r.children};return!(o&1)&&t.child!==l?(r=t.child,r.childLanes=0,r.pendingProps=s,t.deletions=null):(r=pt(l,s),r.subtreeFlags=l.subtreeFlags&14680064),i!==null?u=pt(i,u):(u=Pt(u,o,n,null),u.flags|=2),u.return=t,r.return=t,r.sibling=u,t.child=r,r=u,u=t.child,o=e.child.memoizedState,o=o===null?Lu(n):{baseLanes:o.baseLanes|n,cachePool:null,transitions:o.transitions},u.memoizedState=o,u.childLanes=e.childLanes&~n,t.memoizedState=ju,r}return u=e.child,e=u.sibling,r=pt(u,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Eo(e,t){return t=pl({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function vr(e,t,n,r){return r!==null&&so(r),rn(t,e.child,null,n),e=Eo(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function id(e,t,n,r,l,u,o){if(n)return t.flags&256?(t.flags&=-257,r=Hl(Error(g(422))),vr(e,t,o,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(u=r.fallback,l=t.mode,r=pl({mode:"visible",children:r.children},l,0,null),u=Pt(u,l,o,null),u.flags|=2,r.return=t,u.return=t,r.sibling=u,t.child=r,t.mode&1&&rn(t,e.child,null,o),t.child.memoizedState=Lu(o),t.memoizedState=ju,u);if(!(t.mode&1))return vr(e,t,o,null);if(l.data==="$!"){if(r=l.nextSibling&&l.nextSibling.dataset,r)var i=r.dgst;return r=i,u=Error(g(419)),r=Hl(u,r,void 0),vr(e,t,o,r)}if(i=(o&e.childLanes)!==0,me||i){if(r=q,r!==null){switch(o&-o){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}l=l&(r.suspendedLanes|o)?0:l,l!==0&&l!==u.retryLane&&(u.retryLane=l,Ze(e,l),Fe(r,e,l,-1))}return jo(),r=Hl(Error(g(421))),vr(e,t,o,r)}return l.data==="$?"?(t.flags|=128,t.child=e.child,t=Sd.bind(null,e),l._reactRetry=t,null):(e=u.treeContext,we=at(l.nextSibling),Se=t,$=!0,De=null,e!==null&&(Ce[Ne++]=Qe,Ce[Ne++]=Ke,Ce[Ne++]=jt,Qe=e.id,Ke=e.overflow,jt=t),t=Eo(t,r.children),t.flags|=4096,t)}function Ri(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Eu(e.return,t,n)}function Wl(e,t,n,r,l){var u=e.memoizedState;u===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:l}:(u.isBackwards=t,u.rendering=null,u.renderingStartTime=0,u.last=r,u.tail=n,u.tailMode=l)}function Fa(e,t,n){var r=t.pendingProps,l=r.revealOrder,u=r.tail;if(ie(e,t,r.children,n),r=V.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Ri(e,n,t);else if(e.tag===19)Ri(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(F(V,r),!(t.mode&1))t.memoizedState=null;else switch(l){case"forwards":for(n=t.child,l=null;n!==null;)e=n.alternate,e!==null&&Yr(e)===null&&(l=n),n=n.sibling;n=l,n===null?(l=t.child,t.child=null):(l=n.sibling,n.sibling=null),Wl(t,!1,l,n,u);break;case"backwards":for(n=null,l=t.child,t.child=null;l!==null;){if(e=l.alternate,e!==null&&Yr(e)===null){t.child=l;break}e=l.sibling,l.sibling=n,n=l,l=e}Wl(t,!0,n,null,u);break;case"together":Wl(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function zr(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Je(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Tt|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(g(153));if(t.child!==null){for(e=t.child,n=pt(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=pt(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function sd(e,t,n){switch(t.tag){case 3:Da(t),nn();break;case 5:ia(t);break;case 1:ve(t.type)&&Br(t);break;case 4:ho(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,l=t.memoizedProps.value;F(Qr,r._currentValue),r._currentValue=l;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(F(V,V.current&1),t.flags|=128,null):n&t.child.childLanes?Oa(e,t,n):(F(V,V.current&1),e=Je(e,t,n),e!==null?e.sibling:null);F(V,V.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Fa(e,t,n);t.flags|=128}if(l=t.memoizedState,l!==null&&(l.rendering=null,l.tail=null,l.lastEffect=null),F(V,V.current),r)break;return null;case 22:case 23:return t.lanes=0,Ta(e,t,n)}return Je(e,t,n)}var Ma,Tu,Ia,Ua;Ma=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};Tu=function(){};Ia=function(e,t,n,r){var l=e.memoizedProps;if(l!==r){e=t.stateNode,Nt(Be.current);var u=null;switch(n){case"input":l=bl(e,l),r=bl(e,r),u=[];break;case"select":l=H({},l,{value:void 0}),r=H({},r,{value:void 0}),u=[];break;case"textarea":l=nu(e,l),r=nu(e,r),u=[];break;default:typeof l.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=Ar)}lu(n,r);var o;n=null;for(f in l)if(!r.hasOwnProperty(f)&&l.hasOwnProperty(f)&&l[f]!=null)if(f==="style"){var i=l[f];for(o in i)i.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else f!=="dangerouslySetInnerHTML"&&f!=="children"&&f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&f!=="autoFocus"&&(Dn.hasOwnProperty(f)?u||(u=[]):(u=u||[]).push(f,null));for(f in r){var s=r[f];if(i=l!=null?l[f]:void 0,r.hasOwnProperty(f)&&s!==i&&(s!=null||i!=null))if(f==="style")if(i){for(o in i)!i.hasOwnProperty(o)||s&&s.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in s)s.hasOwnProperty(o)&&i[o]!==s[o]&&(n||(n={}),n[o]=s[o])}else n||(u||(u=[]),u.push(f,n)),n=s;else f==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,i=i?i.__html:void 0,s!=null&&i!==s&&(u=u||[]).push(f,s)):f==="children"?typeof s!="string"&&typeof s!="number"||(u=u||[]).push(f,""+s):f!=="suppressContentEditableWarning"&&f!=="suppressHydrationWarning"&&(Dn.hasOwnProperty(f)?(s!=null&&f==="onScroll"&&I("scroll",e),u||i===s||(u=[])):(u=u||[]).push(f,s))}n&&(u=u||[]).push("style",n);var f=u;(t.updateQueue=f)&&(t.flags|=4)}};Ua=function(e,t,n,r){n!==r&&(t.flags|=4)};function gn(e,t){if(!$)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function le(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags&14680064,r|=l.flags&14680064,l.return=e,l=l.sibling;else for(l=e.child;l!==null;)n|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function ad(e,t,n){var r=t.pendingProps;switch(io(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return le(t),null;case 1:return ve(t.type)&&Vr(),le(t),null;case 3:return r=t.stateNode,ln(),U(he),U(oe),yo(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(mr(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,De!==null&&($u(De),De=null))),Tu(e,t),le(t),null;case 5:vo(t);var l=Nt(Qn.current);if(n=t.type,e!==null&&t.stateNode!=null)Ia(e,t,n,r,l),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(g(166));return le(t),null}if(e=Nt(Be.current),mr(t)){r=t.stateNode,n=t.type;var u=t.memoizedProps;switch(r[Ae]=t,r[Hn]=u,e=(t.mode&1)!==0,n){case"dialog":I("cancel",r),I("close",r);break;case"iframe":case"object":case"embed":I("load",r);break;case"video":case"audio":for(l=0;l<En.length;l++)I(En[l],r);break;case"source":I("error",r);break;case"img":case"image":case"link":I("error",r),I("load",r);break;case"details":I("toggle",r);break;case"input":Vo(r,u),I("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!u.multiple},I("invalid",r);break;case"textarea":Ho(r,u),I("invalid",r)}lu(n,u),l=null;for(var o in u)if(u.hasOwnProperty(o)){var i=u[o];o==="children"?typeof i=="string"?r.textContent!==i&&(u.suppressHydrationWarning!==!0&&pr(r.textContent,i,e),l=["children",i]):typeof i=="number"&&r.textContent!==""+i&&(u.suppressHydrationWarning!==!0&&pr(r.textContent,i,e),l=["children",""+i]):Dn.hasOwnProperty(o)&&i!=null&&o==="onScroll"&&I("scroll",r)}switch(n){case"input":ur(r),Bo(r,u,!0);break;case"textarea":ur(r),Wo(r);break;case"select":case"option":break;default:typeof u.onClick=="function"&&(r.onclick=Ar)}r=l,t.updateQueue=r,r!==null&&(t.flags|=4)}else{o=l.nodeType===9?l:l.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=ds(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=o.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=o.createElement(n,{is:r.is}):(e=o.createElement(n),n==="select"&&(o=e,r.multiple?o.multiple=!0:r.size&&(o.size=r.size))):e=o.createElementNS(e,n),e[Ae]=t,e[Hn]=r,Ma(e,t,!1,!1),t.stateNode=e;e:{switch(o=uu(n,r),n){case"dialog":I("cancel",e),I("close",e),l=r;break;case"iframe":case"object":case"embed":I("load",e),l=r;break;case"video":case"audio":for(l=0;l<En.length;l++)I(En[l],e);l=r;break;case"source":I("error",e),l=r;break;case"img":case"image":case"link":I("error",e),I("load",e),l=r;break;case"details":I("toggle",e),l=r;break;case"input":Vo(e,r),l=bl(e,r),I("invalid",e);break;case"option":l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=H({},r,{value:void 0}),I("invalid",e);break;case"textarea":Ho(e,r),l=nu(e,r),I("invalid",e);break;default:l=r}lu(n,l),i=l;for(u in i)if(i.hasOwnProperty(u)){var s=i[u];u==="style"?hs(e,s):u==="dangerouslySetInnerHTML"?(s=s?s.__html:void 0,s!=null&&ps(e,s)):u==="children"?typeof s=="string"?(n!=="textarea"||s!=="")&&On(e,s):typeof s=="number"&&On(e,""+s):u!=="suppressContentEditableWarning"&&u!=="suppressHydrationWarning"&&u!=="autoFocus"&&(Dn.hasOwnProperty(u)?s!=null&&u==="onScroll"&&I("scroll",e):s!=null&&Ku(e,u,s,o))}switch(n){case"input":ur(e),Bo(e,r,!1);break;case"textarea":ur(e),Wo(e);break;case"option":r.value!=null&&e.setAttribute("value",""+mt(r.value));break;case"select":e.multiple=!!r.multiple,u=r.value,u!=null?Yt(e,!!r.multiple,u,!1):r.defaultValue!=null&&Yt(e,!!r.multiple,r.defaultValue,!0);break;default:typeof l.onClick=="function"&&(e.onclick=Ar)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return le(t),null;case 6:if(e&&t.stateNode!=null)Ua(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(g(166));if(n=Nt(Qn.current),Nt(Be.current),mr(t)){if(r=t.stateNode,n=t.memoizedProps,r[Ae]=t,(u=r.nodeValue!==n)&&(e=Se,e!==null))switch(e.tag){case 3:pr(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&pr(r.nodeValue,n,(e.mode&1)!==0)}u&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[Ae]=t,t.stateNode=r}return le(t),null;case 13:if(U(V),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if($&&we!==null&&t.mode&1&&!(t.flags&128))na(),nn(),t.flags|=98560,u=!1;else if(u=mr(t),r!==null&&r.dehydrated!==null){if(e===null){if(!u)throw Error(g(318));if(u=t.memoizedState,u=u!==null?u.dehydrated:null,!u)throw Error(g(317));u[Ae]=t}else nn(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;le(t),u=!1}else De!==null&&($u(De),De=null),u=!0;if(!u)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||V.current&1?G===0&&(G=3):jo())),t.updateQueue!==null&&(t.flags|=4),le(t),null);case 4:return ln(),Tu(e,t),e===null&&Vn(t.stateNode.containerInfo),le(t),null;case 10:return fo(t.type._context),le(t),null;case 17:return ve(t.type)&&Vr(),le(t),null;case 19:if(U(V),u=t.memoizedState,u===null)return le(t),null;if(r=(t.flags&128)!==0,o=u.rendering,o===null)if(r)gn(u,!1);else{if(G!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(o=Yr(e),o!==null){for(t.flags|=128,gn(u,!1),r=o.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)u=n,e=r,u.flags&=14680066,o=u.alternate,o===null?(u.childLanes=0,u.lanes=e,u.child=null,u.subtreeFlags=0,u.memoizedProps=null,u.memoizedState=null,u.updateQueue=null,u.dependencies=null,u.stateNode=null):(u.childLanes=o.childLanes,u.lanes=o.lanes,u.child=o.child,u.subtreeFlags=0,u.deletions=null,u.memoizedProps=o.memoizedProps,u.memoizedState=o.memoizedState,u.updateQueue=o.updateQueue,u.type=o.type,e=o.dependencies,u.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return F(V,V.current&1|2),t.child}e=e.sibling}u.tail!==null&&K()>on&&(t.flags|=128,r=!0,gn(u,!1),t.lanes=4194304)}else{if(!r)if(e=Yr(o),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),gn(u,!0),u.tail===null&&u.tailMode==="hidden"&&!o.alternate&&!$)return le(t),null}else 2*K()-u.renderingStartTime>on&&n!==1073741824&&(t.flags|=128,r=!0,gn(u,!1),t.lanes=4194304);u.isBackwards?(o.sibling=t.child,t.child=o):(n=u.last,n!==null?n.sibling=o:t.child=o,u.last=o)}return u.tail!==null?(t=u.tail,u.rendering=t,u.tail=t.sibling,u.renderingStartTime=K(),t.sibling=null,n=V.current,F(V,r?n&1|2:n&1),t):(le(t),null);case 22:case 23:return zo(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?ge&1073741824&&(le(t),t.subtreeFlags&6&&(t.flags|=8192)):le(t),null;case 24:return null;case 25:return null}throw Error(g(156,t.tag))}function cd(e,t){switch(io(t),t.tag){case 1:return ve(t.type)&&Vr(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return ln(),U(he),U(oe),yo(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return vo(t),null;case 13:if(U(V),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(g(340));nn()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return U(V),null;case 4:return ln(),null;case 10:return fo(t.type._context),null;case 22:case 23:return zo(),null;case 24:return null;default:return null}}var yr=!1,ue=!1,fd=typeof WeakSet=="function"?WeakSet:Set,E=null;function Kt(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){W(e,t,r)}else n.current=null}function Ru(e,t,n){try{n()}catch(r){W(e,t,r)}}var Di=!1;function dd(e,t){if(hu=Ir,e=Hs(),uo(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var l=r.anchorOffset,u=r.focusNode;r=r.focusOffset;try{n.nodeType,u.nodeType}catch{n=null;break e}var o=0,i=-1,s=-1,f=0,h=0,m=e,p=null;t:for(;;){for(var w;m!==n||l!==0&&m.nodeType!==3||(i=o+l),m!==u||r!==0&&m.nodeType!==3||(s=o+r),m.nodeType===3&&(o+=m.nodeValue.length),(w=m.firstChild)!==null;)p=m,m=w;for(;;){if(m===e)break t;if(p===n&&++f===l&&(i=o),p===u&&++h===r&&(s=o),(w=m.nextSibling)!==null)break;m=p,p=m.parentNode}m=w}n=i===-1||s===-1?null:{start:i,end:s}}else n=null}n=n||{start:0,end:0}}else n=null;for(vu={focusedElem:e,selectionRange:n},Ir=!1,E=t;E!==null;)if(t=E,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,E=e;else for(;E!==null;){t=E;try{var S=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(S!==null){var k=S.memoizedProps,M=S.memoizedState,c=t.stateNode,a=c.getSnapshotBeforeUpdate(t.elementType===t.type?k:Te(t.type,k),M);c.__reactInternalSnapshotBeforeUpdate=a}break;case 3:var d=t.stateNode.containerInfo;d.nodeType===1?d.textContent="":d.nodeType===9&&d.documentElement&&d.removeChild(d.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(g(163))}}catch(v){W(t,t.return,v)}if(e=t.sibling,e!==null){e.return=t.return,E=e;break}E=t.return}return S=Di,Di=!1,S}function Ln(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var l=r=r.next;do{if((l.tag&e)===e){var u=l.destroy;l.destroy=void 0,u!==void 0&&Ru(t,n,u)}l=l.next}while(l!==r)}}function fl(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Du(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function $a(e){var t=e.alternate;t!==null&&(e.alternate=null,$a(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[Ae],delete t[Hn],delete t[wu],delete t[Yf],delete t[Gf])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Aa(e){return e.tag===5||e.tag===3||e.tag===4}function Oi(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Aa(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Ou(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Ar));else if(r!==4&&(e=e.child,e!==null))for(Ou(e,t,n),e=e.sibling;e!==null;)Ou(e,t,n),e=e.sibling}function Fu(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Fu(e,t,n),e=e.sibling;e!==null;)Fu(e,t,n),e=e.sibling}var ee=null,Re=!1;function be(e,t,n){for(n=n.child;n!==null;)Va(e,t,n),n=n.sibling}function Va(e,t,n){if(Ve&&typeof Ve.onCommitFiberUnmount=="function")try{Ve.onCommitFiberUnmount(rl,n)}catch{}switch(n.tag){case 5:ue||Kt(n,t);case 6:var r=ee,l=Re;ee=null,be(e,t,n),ee=r,Re=l,ee!==null&&(Re?(e=ee,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):ee.removeChild(n.stateNode));break;case 18:ee!==null&&(Re?(e=ee,n=n.stateNode,e.nodeType===8?Il(e.parentNode,n):e.nodeType===1&&Il(e,n),Un(e)):Il(ee,n.stateNode));break;case 4:r=ee,l=Re,ee=n.stateNode.containerInfo,Re=!0,be(e,t,n),ee=r,Re=l;break;case 0:case 11:case 14:case 15:if(!ue&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){l=r=r.next;do{var u=l,o=u.destroy;u=u.tag,o!==void 0&&(u&2||u&4)&&Ru(n,t,o),l=l.next}while(l!==r)}be(e,t,n);break;case 1:if(!ue&&(Kt(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(i){W(n,t,i)}be(e,t,n);break;case 21:be(e,t,n);break;case 22:n.mode&1?(ue=(r=ue)||n.memoizedState!==null,be(e,t,n),ue=r):be(e,t,n);break;default:be(e,t,n)}}function Fi(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new fd),t.forEach(function(r){var l=kd.bind(null,e,r);n.has(r)||(n.add(r),r.then(l,l))})}}function Le(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var l=n[r];try{var u=e,o=t,i=o;e:for(;i!==null;){switch(i.tag){case 5:ee=i.stateNode,Re=!1;break e;case 3:ee=i.stateNode.containerInfo,Re=!0;break e;case 4:ee=i.stateNode.containerInfo,Re=!0;break e}i=i.return}if(ee===null)throw Error(g(160));Va(u,o,l),ee=null,Re=!1;var s=l.alternate;s!==null&&(s.return=null),l.return=null}catch(f){W(l,t,f)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Ba(t,e),t=t.sibling}function Ba(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(Le(t,e),Ue(e),r&4){try{Ln(3,e,e.return),fl(3,e)}catch(k){W(e,e.return,k)}try{Ln(5,e,e.return)}catch(k){W(e,e.return,k)}}break;case 1:Le(t,e),Ue(e),r&512&&n!==null&&Kt(n,n.return);break;case 5:if(Le(t,e),Ue(e),r&512&&n!==null&&Kt(n,n.return),e.flags&32){var l=e.stateNode;try{On(l,"")}catch(k){W(e,e.return,k)}}if(r&4&&(l=e.stateNode,l!=null)){var u=e.memoizedProps,o=n!==null?n.memoizedProps:u,i=e.type,s=e.updateQueue;if(e.updateQueue=null,s!==null)try{i==="input"&&u.type==="radio"&&u.name!=null&&cs(l,u),uu(i,o);var f=uu(i,u);for(o=0;o<s.length;o+=2){var h=s[o],m=s[o+1];h==="style"?hs(l,m):h==="dangerouslySetInnerHTML"?ps(l,m):h==="children"?On(l,m):Ku(l,h,m,f)}switch(i){case"input":eu(l,u);break;case"textarea":fs(l,u);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!u.multiple;var w=u.value;w!=null?Yt(l,!!u.multiple,w,!1):p!==!!u.multiple&&(u.defaultValue!=null?Yt(l,!!u.multiple,u.defaultValue,!0):Yt(l,!!u.multiple,u.multiple?[]:"",!1))}l[Hn]=u}catch(k){W(e,e.return,k)}}break;case 6:if(Le(t,e),Ue(e),r&4){if(e.stateNode===null)throw Error(g(162));l=e.stateNode,u=e.memoizedProps;try{l.nodeValue=u}catch(k){W(e,e.return,k)}}break;case 3:if(Le(t,e),Ue(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Un(t.containerInfo)}catch(k){W(e,e.return,k)}break;case 4:Le(t,e),Ue(e);break;case 13:Le(t,e),Ue(e),l=e.child,l.flags&8192&&(u=l.memoizedState!==null,l.stateNode.isHidden=u,!u||l.alternate!==null&&l.alternate.memoizedState!==null||(_o=K())),r&4&&Fi(e);break;case 22:if(h=n!==null&&n.memoizedState!==null,e.mode&1?(ue=(f=ue)||h,Le(t,e),ue=f):Le(t,e),Ue(e),r&8192){if(f=e.memoizedState!==null,(e.stateNode.isHidden=f)&&!h&&e.mode&1)for(E=e,h=e.child;h!==null;){for(m=E=h;E!==null;){switch(p=E,w=p.child,p.tag){case 0:case 11:case 14:case 15:Ln(4,p,p.return);break;case 1:Kt(p,p.return);var S=p.stateNode;if(typeof S.componentWillUnmount=="function"){r=p,n=p.return;try{t=r,S.props=t.memoizedProps,S.state=t.memoizedState,S.componentWillUnmount()}catch(k){W(r,n,k)}}break;case 5:Kt(p,p.return);break;case 22:if(p.memoizedState!==null){Ii(m);continue}}w!==null?(w.return=p,E=w):Ii(m)}h=h.sibling}e:for(h=null,m=e;;){if(m.tag===5){if(h===null){h=m;try{l=m.stateNode,f?(u=l.style,typeof u.setProperty=="function"?u.setProperty("display","none","important"):u.display="none"):(i=m.stateNode,s=m.memoizedProps.style,o=s!=null&&s.hasOwnProperty("display")?s.display:null,i.style.display=ms("display",o))}catch(k){W(e,e.return,k)}}}else if(m.tag===6){if(h===null)try{m.stateNode.nodeValue=f?"":m.memoizedProps}catch(k){W(e,e.return,k)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;h===m&&(h=null),m=m.return}h===m&&(h=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:Le(t,e),Ue(e),r&4&&Fi(e);break;case 21:break;default:Le(t,e),Ue(e)}}function Ue(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Aa(n)){var r=n;break e}n=n.return}throw Error(g(160))}switch(r.tag){case 5:var l=r.stateNode;r.flags&32&&(On(l,""),r.flags&=-33);var u=Oi(e);Fu(e,u,l);break;case 3:case 4:var o=r.stateNode.containerInfo,i=Oi(e);Ou(e,i,o);break;default:throw Error(g(161))}}catch(s){W(e,e.return,s)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function pd(e,t,n){E=e,Ha(e)}function Ha(e,t,n){for(var r=(e.mode&1)!==0;E!==null;){var l=E,u=l.child;if(l.tag===22&&r){var o=l.memoizedState!==null||yr;if(!o){var i=l.alternate,s=i!==null&&i.memoizedState!==null||ue;i=yr;var f=ue;if(yr=o,(ue=s)&&!f)for(E=l;E!==null;)o=E,s=o.child,o.tag===22&&o.memoizedState!==null?Ui(l):s!==null?(s.return=o,E=s):Ui(l);for(;u!==null;)E=u,Ha(u),u=u.sibling;E=l,yr=i,ue=f}Mi(e)}else l.subtreeFlags&8772&&u!==null?(u.return=l,E=u):Mi(e)}}function Mi(e){for(;E!==null;){var t=E;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:ue||fl(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!ue)if(n===null)r.componentDidMount();else{var l=t.elementType===t.type?n.memoizedProps:Te(t.type,n.memoizedProps);r.componentDidUpdate(l,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var u=t.updateQueue;u!==null&&Si(t,u,r);break;case 3:var o=t.updateQueue;if(o!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Si(t,o,n)}break;case 5:var i=t.stateNode;if(n===null&&t.flags&4){n=i;var s=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&n.focus();break;case"img":s.src&&(n.src=s.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var f=t.alternate;if(f!==null){var h=f.memoizedState;if(h!==null){var m=h.dehydrated;m!==null&&Un(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(g(163))}ue||t.flags&512&&Du(t)}catch(p){W(t,t.return,p)}}if(t===e){E=null;break}if(n=t.sibling,n!==null){n.return=t.return,E=n;break}E=t.return}}function Ii(e){for(;E!==null;){var t=E;if(t===e){E=null;break}var n=t.sibling;if(n!==null){n.return=t.return,E=n;break}E=t.return}}function Ui(e){for(;E!==null;){var t=E;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{fl(4,t)}catch(s){W(t,n,s)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var l=t.return;try{r.componentDidMount()}catch(s){W(t,l,s)}}var u=t.return;try{Du(t)}catch(s){W(t,u,s)}break;case 5:var o=t.return;try{Du(t)}catch(s){W(t,o,s)}}}catch(s){W(t,t.return,s)}if(t===e){E=null;break}var i=t.sibling;if(i!==null){i.return=t.return,E=i;break}E=t.return}}var md=Math.ceil,Jr=qe.ReactCurrentDispatcher,Co=qe.ReactCurrentOwner,Pe=qe.ReactCurrentBatchConfig,D=0,q=null,X=null,te=0,ge=0,Xt=yt(0),G=0,Gn=null,Tt=0,dl=0,No=0,Tn=null,pe=null,_o=0,on=1/0,He=null,qr=!1,Mu=null,ft=null,gr=!1,ut=null,br=0,Rn=0,Iu=null,jr=-1,Lr=0;function se(){return D&6?K():jr!==-1?jr:jr=K()}function dt(e){return e.mode&1?D&2&&te!==0?te&-te:Jf.transition!==null?(Lr===0&&(Lr=Ps()),Lr):(e=O,e!==0||(e=window.event,e=e===void 0?16:Os(e.type)),e):1}function Fe(e,t,n,r){if(50<Rn)throw Rn=0,Iu=null,Error(g(185));Jn(e,n,r),(!(D&2)||e!==q)&&(e===q&&(!(D&2)&&(dl|=n),G===4&&rt(e,te)),ye(e,r),n===1&&D===0&&!(t.mode&1)&&(on=K()+500,sl&&gt()))}function ye(e,t){var n=e.callbackNode;Zc(e,t);var r=Mr(e,e===q?te:0);if(r===0)n!==null&&Xo(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&Xo(n),t===1)e.tag===0?Zf($i.bind(null,e)):bs($i.bind(null,e)),Kf(function(){!(D&6)&&gt()}),n=null;else{switch(zs(r)){case 1:n=Ju;break;case 4:n=Ns;break;case 16:n=Fr;break;case 536870912:n=_s;break;default:n=Fr}n=Ja(n,Wa.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function Wa(e,t){if(jr=-1,Lr=0,D&6)throw Error(g(327));var n=e.callbackNode;if(bt()&&e.callbackNode!==n)return null;var r=Mr(e,e===q?te:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=el(e,r);else{t=r;var l=D;D|=2;var u=Ka();(q!==e||te!==t)&&(He=null,on=K()+500,_t(e,t));do try{yd();break}catch(i){Qa(e,i)}while(!0);co(),Jr.current=u,D=l,X!==null?t=0:(q=null,te=0,t=G)}if(t!==0){if(t===2&&(l=cu(e),l!==0&&(r=l,t=Uu(e,l))),t===1)throw n=Gn,_t(e,0),rt(e,r),ye(e,K()),n;if(t===6)rt(e,r);else{if(l=e.current.alternate,!(r&30)&&!hd(l)&&(t=el(e,r),t===2&&(u=cu(e),u!==0&&(r=u,t=Uu(e,u))),t===1))throw n=Gn,_t(e,0),rt(e,r),ye(e,K()),n;switch(e.finishedWork=l,e.finishedLanes=r,t){case 0:case 1:throw Error(g(345));case 2:xt(e,pe,He);break;case 3:if(rt(e,r),(r&130023424)===r&&(t=_o+500-K(),10<t)){if(Mr(e,0)!==0)break;if(l=e.suspendedLanes,(l&r)!==r){se(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=gu(xt.bind(null,e,pe,He),t);break}xt(e,pe,He);break;case 4:if(rt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,l=-1;0<r;){var o=31-Oe(r);u=1<<o,o=t[o],o>l&&(l=o),r&=~u}if(r=l,r=K()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*md(r/1960))-r,10<r){e.timeoutHandle=gu(xt.bind(null,e,pe,He),r);break}xt(e,pe,He);break;case 5:xt(e,pe,He);break;default:throw Error(g(329))}}}return ye(e,K()),e.callbackNode===n?Wa.bind(null,e):null}function Uu(e,t){var n=Tn;return e.current.memoizedState.isDehydrated&&(_t(e,t).flags|=256),e=el(e,t),e!==2&&(t=pe,pe=n,t!==null&&$u(t)),e}function $u(e){pe===null?pe=e:pe.push.apply(pe,e)}function hd(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var l=n[r],u=l.getSnapshot;l=l.value;try{if(!Me(u(),l))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function rt(e,t){for(t&=~No,t&=~dl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Oe(t),r=1<<n;e[n]=-1,t&=~r}}function $i(e){if(D&6)throw Error(g(327));bt();var t=Mr(e,0);if(!(t&1))return ye(e,K()),null;var n=el(e,t);if(e.tag!==0&&n===2){var r=cu(e);r!==0&&(t=r,n=Uu(e,r))}if(n===1)throw n=Gn,_t(e,0),rt(e,t),ye(e,K()),n;if(n===6)throw Error(g(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,xt(e,pe,He),ye(e,K()),null}function Po(e,t){var n=D;D|=1;try{return e(t)}finally{D=n,D===0&&(on=K()+500,sl&&gt())}}function Rt(e){ut!==null&&ut.tag===0&&!(D&6)&&bt();var t=D;D|=1;var n=Pe.transition,r=O;try{if(Pe.transition=null,O=1,e)return e()}finally{O=r,Pe.transition=n,D=t,!(D&6)&&gt()}}function zo(){ge=Xt.current,U(Xt)}function _t(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Qf(n)),X!==null)for(n=X.return;n!==null;){var r=n;switch(io(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&Vr();break;case 3:ln(),U(he),U(oe),yo();break;case 5:vo(r);break;case 4:ln();break;case 13:U(V);break;case 19:U(V);break;case 10:fo(r.type._context);break;case 22:case 23:zo()}n=n.return}if(q=e,X=e=pt(e.current,null),te=ge=t,G=0,Gn=null,No=dl=Tt=0,pe=Tn=null,Ct!==null){for(t=0;t<Ct.length;t++)if(n=Ct[t],r=n.interleaved,r!==null){n.interleaved=null;var l=r.next,u=n.pending;if(u!==null){var o=u.next;u.next=l,r.next=o}n.pending=r}Ct=null}return e}function Qa(e,t){do{var n=X;try{if(co(),_r.current=Zr,Gr){for(var r=B.memoizedState;r!==null;){var l=r.queue;l!==null&&(l.pending=null),r=r.next}Gr=!1}if(Lt=0,J=Y=B=null,jn=!1,Kn=0,Co.current=null,n===null||n.return===null){G=1,Gn=t,X=null;break}e:{var u=e,o=n.return,i=n,s=t;if(t=te,i.flags|=32768,s!==null&&typeof s=="object"&&typeof s.then=="function"){var f=s,h=i,m=h.tag;if(!(h.mode&1)&&(m===0||m===11||m===15)){var p=h.alternate;p?(h.updateQueue=p.updateQueue,h.memoizedState=p.memoizedState,h.lanes=p.lanes):(h.updateQueue=null,h.memoizedState=null)}var w=_i(o);if(w!==null){w.flags&=-257,Pi(w,o,i,u,t),w.mode&1&&Ni(u,f,t),t=w,s=f;var S=t.updateQueue;if(S===null){var k=new Set;k.add(s),t.updateQueue=k}else S.add(s);break e}else{if(!(t&1)){Ni(u,f,t),jo();break e}s=Error(g(426))}}else if($&&i.mode&1){var M=_i(o);if(M!==null){!(M.flags&65536)&&(M.flags|=256),Pi(M,o,i,u,t),so(un(s,i));break e}}u=s=un(s,i),G!==4&&(G=2),Tn===null?Tn=[u]:Tn.push(u),u=o;do{switch(u.tag){case 3:u.flags|=65536,t&=-t,u.lanes|=t;var c=za(u,s,t);wi(u,c);break e;case 1:i=s;var a=u.type,d=u.stateNode;if(!(u.flags&128)&&(typeof a.getDerivedStateFromError=="function"||d!==null&&typeof d.componentDidCatch=="function"&&(ft===null||!ft.has(d)))){u.flags|=65536,t&=-t,u.lanes|=t;var v=ja(u,i,t);wi(u,v);break e}}u=u.return}while(u!==null)}Ya(n)}catch(x){t=x,X===n&&n!==null&&(X=n=n.return);continue}break}while(!0)}function Ka(){var e=Jr.current;return Jr.current=Zr,e===null?Zr:e}function jo(){(G===0||G===3||G===2)&&(G=4),q===null||!(Tt&268435455)&&!(dl&268435455)||rt(q,te)}function el(e,t){var n=D;D|=2;var r=Ka();(q!==e||te!==t)&&(He=null,_t(e,t));do try{vd();break}catch(l){Qa(e,l)}while(!0);if(co(),D=n,Jr.current=r,X!==null)throw Error(g(261));return q=null,te=0,G}function vd(){for(;X!==null;)Xa(X)}function yd(){for(;X!==null&&!Vc();)Xa(X)}function Xa(e){var t=Za(e.alternate,e,ge);e.memoizedProps=e.pendingProps,t===null?Ya(e):X=t,Co.current=null}function Ya(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=cd(n,t),n!==null){n.flags&=32767,X=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{G=6,X=null;return}}else if(n=ad(n,t,ge),n!==null){X=n;return}if(t=t.sibling,t!==null){X=t;return}X=t=e}while(t!==null);G===0&&(G=5)}function xt(e,t,n){var r=O,l=Pe.transition;try{Pe.transition=null,O=1,gd(e,t,n,r)}finally{Pe.transition=l,O=r}return null}function gd(e,t,n,r){do bt();while(ut!==null);if(D&6)throw Error(g(327));n=e.finishedWork;var l=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(g(177));e.callbackNode=null,e.callbackPriority=0;var u=n.lanes|n.childLanes;if(Jc(e,u),e===q&&(X=q=null,te=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||gr||(gr=!0,Ja(Fr,function(){return bt(),null})),u=(n.flags&15990)!==0,n.subtreeFlags&15990||u){u=Pe.transition,Pe.transition=null;var o=O;O=1;var i=D;D|=4,Co.current=null,dd(e,n),Ba(n,e),Uf(vu),Ir=!!hu,vu=hu=null,e.current=n,pd(n),Bc(),D=i,O=o,Pe.transition=u}else e.current=n;if(gr&&(gr=!1,ut=e,br=l),u=e.pendingLanes,u===0&&(ft=null),Qc(n.stateNode),ye(e,K()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)l=t[n],r(l.value,{componentStack:l.stack,digest:l.digest});if(qr)throw qr=!1,e=Mu,Mu=null,e;return br&1&&e.tag!==0&&bt(),u=e.pendingLanes,u&1?e===Iu?Rn++:(Rn=0,Iu=e):Rn=0,gt(),null}function bt(){if(ut!==null){var e=zs(br),t=Pe.transition,n=O;try{if(Pe.transition=null,O=16>e?16:e,ut===null)var r=!1;else{if(e=ut,ut=null,br=0,D&6)throw Error(g(331));var l=D;for(D|=4,E=e.current;E!==null;){var u=E,o=u.child;if(E.flags&16){var i=u.deletions;if(i!==null){for(var s=0;s<i.length;s++){var f=i[s];for(E=f;E!==null;){var h=E;switch(h.tag){case 0:case 11:case 15:Ln(8,h,u)}var m=h.child;if(m!==null)m.return=h,E=m;else for(;E!==null;){h=E;var p=h.sibling,w=h.return;if($a(h),h===f){E=null;break}if(p!==null){p.return=w,E=p;break}E=w}}}var S=u.alternate;if(S!==null){var k=S.child;if(k!==null){S.child=null;do{var M=k.sibling;k.sibling=null,k=M}while(k!==null)}}E=u}}if(u.subtreeFlags&2064&&o!==null)o.return=u,E=o;else e:for(;E!==null;){if(u=E,u.flags&2048)switch(u.tag){case 0:case 11:case 15:Ln(9,u,u.return)}var c=u.sibling;if(c!==null){c.return=u.return,E=c;break e}E=u.return}}var a=e.current;for(E=a;E!==null;){o=E;var d=o.child;if(o.subtreeFlags&2064&&d!==null)d.return=o,E=d;else e:for(o=a;E!==null;){if(i=E,i.flags&2048)try{switch(i.tag){case 0:case 11:case 15:fl(9,i)}}catch(x){W(i,i.return,x)}if(i===o){E=null;break e}var v=i.sibling;if(v!==null){v.return=i.return,E=v;break e}E=i.return}}if(D=l,gt(),Ve&&typeof Ve.onPostCommitFiberRoot=="function")try{Ve.onPostCommitFiberRoot(rl,e)}catch{}r=!0}return r}finally{O=n,Pe.transition=t}}return!1}function Ai(e,t,n){t=un(n,t),t=za(e,t,1),e=ct(e,t,1),t=se(),e!==null&&(Jn(e,1,t),ye(e,t))}function W(e,t,n){if(e.tag===3)Ai(e,e,n);else for(;t!==null;){if(t.tag===3){Ai(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(ft===null||!ft.has(r))){e=un(n,e),e=ja(t,e,1),t=ct(t,e,1),e=se(),t!==null&&(Jn(t,1,e),ye(t,e));break}}t=t.return}}function wd(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=se(),e.pingedLanes|=e.suspendedLanes&n,q===e&&(te&n)===n&&(G===4||G===3&&(te&130023424)===te&&500>K()-_o?_t(e,0):No|=n),ye(e,t)}function Ga(e,t){t===0&&(e.mode&1?(t=sr,sr<<=1,!(sr&130023424)&&(sr=4194304)):t=1);var n=se();e=Ze(e,t),e!==null&&(Jn(e,t,n),ye(e,n))}function Sd(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),Ga(e,n)}function kd(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;l!==null&&(n=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(g(314))}r!==null&&r.delete(t),Ga(e,n)}var Za;Za=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||he.current)me=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return me=!1,sd(e,t,n);me=!!(e.flags&131072)}else me=!1,$&&t.flags&1048576&&ea(t,Wr,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;zr(e,t),e=t.pendingProps;var l=tn(t,oe.current);qt(t,n),l=wo(null,t,r,e,l,n);var u=So();return t.flags|=1,typeof l=="object"&&l!==null&&typeof l.render=="function"&&l.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,ve(r)?(u=!0,Br(t)):u=!1,t.memoizedState=l.state!==null&&l.state!==void 0?l.state:null,mo(t),l.updater=cl,t.stateNode=l,l._reactInternals=t,Nu(t,r,e,n),t=zu(null,t,r,!0,u,n)):(t.tag=0,$&&u&&oo(t),ie(null,t,l,n),t=t.child),t;case 16:r=t.elementType;e:{switch(zr(e,t),e=t.pendingProps,l=r._init,r=l(r._payload),t.type=r,l=t.tag=Ed(r),e=Te(r,e),l){case 0:t=Pu(null,t,r,e,n);break e;case 1:t=Li(null,t,r,e,n);break e;case 11:t=zi(null,t,r,e,n);break e;case 14:t=ji(null,t,r,Te(r.type,e),n);break e}throw Error(g(306,r,""))}return t;case 0:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Te(r,l),Pu(e,t,r,l,n);case 1:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Te(r,l),Li(e,t,r,l,n);case 3:e:{if(Da(t),e===null)throw Error(g(387));r=t.pendingProps,u=t.memoizedState,l=u.element,oa(e,t),Xr(t,r,null,n);var o=t.memoizedState;if(r=o.element,u.isDehydrated)if(u={element:r,isDehydrated:!1,cache:o.cache,pendingSuspenseBoundaries:o.pendingSuspenseBoundaries,transitions:o.transitions},t.updateQueue.baseState=u,t.memoizedState=u,t.flags&256){l=un(Error(g(423)),t),t=Ti(e,t,r,n,l);break e}else if(r!==l){l=un(Error(g(424)),t),t=Ti(e,t,r,n,l);break e}else for(we=at(t.stateNode.containerInfo.firstChild),Se=t,$=!0,De=null,n=la(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(nn(),r===l){t=Je(e,t,n);break e}ie(e,t,r,n)}t=t.child}return t;case 5:return ia(t),e===null&&xu(t),r=t.type,l=t.pendingProps,u=e!==null?e.memoizedProps:null,o=l.children,yu(r,l)?o=null:u!==null&&yu(r,u)&&(t.flags|=32),Ra(e,t),ie(e,t,o,n),t.child;case 6:return e===null&&xu(t),null;case 13:return Oa(e,t,n);case 4:return ho(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=rn(t,null,r,n):ie(e,t,r,n),t.child;case 11:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Te(r,l),zi(e,t,r,l,n);case 7:return ie(e,t,t.pendingProps,n),t.child;case 8:return ie(e,t,t.pendingProps.children,n),t.child;case 12:return ie(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,l=t.pendingProps,u=t.memoizedProps,o=l.value,F(Qr,r._currentValue),r._currentValue=o,u!==null)if(Me(u.value,o)){if(u.children===l.children&&!he.current){t=Je(e,t,n);break e}}else for(u=t.child,u!==null&&(u.return=t);u!==null;){var i=u.dependencies;if(i!==null){o=u.child;for(var s=i.firstContext;s!==null;){if(s.context===r){if(u.tag===1){s=Xe(-1,n&-n),s.tag=2;var f=u.updateQueue;if(f!==null){f=f.shared;var h=f.pending;h===null?s.next=s:(s.next=h.next,h.next=s),f.pending=s}}u.lanes|=n,s=u.alternate,s!==null&&(s.lanes|=n),Eu(u.return,n,t),i.lanes|=n;break}s=s.next}}else if(u.tag===10)o=u.type===t.type?null:u.child;else if(u.tag===18){if(o=u.return,o===null)throw Error(g(341));o.lanes|=n,i=o.alternate,i!==null&&(i.lanes|=n),Eu(o,n,t),o=u.sibling}else o=u.child;if(o!==null)o.return=u;else for(o=u;o!==null;){if(o===t){o=null;break}if(u=o.sibling,u!==null){u.return=o.return,o=u;break}o=o.return}u=o}ie(e,t,l.children,n),t=t.child}return t;case 9:return l=t.type,r=t.pendingProps.children,qt(t,n),l=ze(l),r=r(l),t.flags|=1,ie(e,t,r,n),t.child;case 14:return r=t.type,l=Te(r,t.pendingProps),l=Te(r.type,l),ji(e,t,r,l,n);case 15:return La(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,l=t.pendingProps,l=t.elementType===r?l:Te(r,l),zr(e,t),t.tag=1,ve(r)?(e=!0,Br(t)):e=!1,qt(t,n),Pa(t,r,l),Nu(t,r,l,n),zu(null,t,r,!0,e,n);case 19:return Fa(e,t,n);case 22:return Ta(e,t,n)}throw Error(g(156,t.tag))};function Ja(e,t){return Cs(e,t)}function xd(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function _e(e,t,n,r){return new xd(e,t,n,r)}function Lo(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Ed(e){if(typeof e=="function")return Lo(e)?1:0;if(e!=null){if(e=e.$$typeof,e===Yu)return 11;if(e===Gu)return 14}return 2}function pt(e,t){var n=e.alternate;return n===null?(n=_e(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Tr(e,t,n,r,l,u){var o=2;if(r=e,typeof e=="function")Lo(e)&&(o=1);else if(typeof e=="string")o=5;else e:switch(e){case It:return Pt(n.children,l,u,t);case Xu:o=8,l|=8;break;case Gl:return e=_e(12,n,t,l|2),e.elementType=Gl,e.lanes=u,e;case Zl:return e=_e(13,n,t,l),e.elementType=Zl,e.lanes=u,e;case Jl:return e=_e(19,n,t,l),e.elementType=Jl,e.lanes=u,e;case is:return pl(n,l,u,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case us:o=10;break e;case os:o=9;break e;case Yu:o=11;break e;case Gu:o=14;break e;case et:o=16,r=null;break e}throw Error(g(130,e==null?e:typeof e,""))}return t=_e(o,n,t,l),t.elementType=e,t.type=r,t.lanes=u,t}function Pt(e,t,n,r){return e=_e(7,e,r,t),e.lanes=n,e}function pl(e,t,n,r){return e=_e(22,e,r,t),e.elementType=is,e.lanes=n,e.stateNode={isHidden:!1},e}function Ql(e,t,n){return e=_e(6,e,null,t),e.lanes=n,e}function Kl(e,t,n){return t=_e(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Cd(e,t,n,r,l){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=_l(0),this.expirationTimes=_l(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=_l(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function To(e,t,n,r,l,u,o,i,s){return e=new Cd(e,t,n,i,s),t===1?(t=1,u===!0&&(t|=8)):t=0,u=_e(3,null,null,t),e.current=u,u.stateNode=e,u.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},mo(u),e}function Nd(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Mt,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function qa(e){if(!e)return ht;e=e._reactInternals;e:{if(Ot(e)!==e||e.tag!==1)throw Error(g(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(ve(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(g(171))}if(e.tag===1){var n=e.type;if(ve(n))return qs(e,n,t)}return t}function ba(e,t,n,r,l,u,o,i,s){return e=To(n,r,!0,e,l,u,o,i,s),e.context=qa(null),n=e.current,r=se(),l=dt(n),u=Xe(r,l),u.callback=t??null,ct(n,u,l),e.current.lanes=l,Jn(e,l,r),ye(e,r),e}function ml(e,t,n,r){var l=t.current,u=se(),o=dt(l);return n=qa(n),t.context===null?t.context=n:t.pendingContext=n,t=Xe(u,o),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=ct(l,t,o),e!==null&&(Fe(e,l,o,u),Nr(e,l,o)),o}function tl(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function Vi(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ro(e,t){Vi(e,t),(e=e.alternate)&&Vi(e,t)}function _d(){return null}var ec=typeof reportError=="function"?reportError:function(e){console.error(e)};function Do(e){this._internalRoot=e}hl.prototype.render=Do.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(g(409));ml(e,t,null,null)};hl.prototype.unmount=Do.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Rt(function(){ml(null,e,null,null)}),t[Ge]=null}};function hl(e){this._internalRoot=e}hl.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ts();e={blockedOn:null,target:e,priority:t};for(var n=0;n<nt.length&&t!==0&&t<nt[n].priority;n++);nt.splice(n,0,e),n===0&&Ds(e)}};function Oo(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function vl(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function Bi(){}function Pd(e,t,n,r,l){if(l){if(typeof r=="function"){var u=r;r=function(){var f=tl(o);u.call(f)}}var o=ba(t,r,e,0,null,!1,!1,"",Bi);return e._reactRootContainer=o,e[Ge]=o.current,Vn(e.nodeType===8?e.parentNode:e),Rt(),o}for(;l=e.lastChild;)e.removeChild(l);if(typeof r=="function"){var i=r;r=function(){var f=tl(s);i.call(f)}}var s=To(e,0,!1,null,null,!1,!1,"",Bi);return e._reactRootContainer=s,e[Ge]=s.current,Vn(e.nodeType===8?e.parentNode:e),Rt(function(){ml(t,s,n,r)}),s}function yl(e,t,n,r,l){var u=n._reactRootContainer;if(u){var o=u;if(typeof l=="function"){var i=l;l=function(){var s=tl(o);i.call(s)}}ml(t,o,e,l)}else o=Pd(n,t,e,l,r);return tl(o)}js=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=xn(t.pendingLanes);n!==0&&(qu(t,n|1),ye(t,K()),!(D&6)&&(on=K()+500,gt()))}break;case 13:Rt(function(){var r=Ze(e,1);if(r!==null){var l=se();Fe(r,e,1,l)}}),Ro(e,1)}};bu=function(e){if(e.tag===13){var t=Ze(e,134217728);if(t!==null){var n=se();Fe(t,e,134217728,n)}Ro(e,134217728)}};Ls=function(e){if(e.tag===13){var t=dt(e),n=Ze(e,t);if(n!==null){var r=se();Fe(n,e,t,r)}Ro(e,t)}};Ts=function(){return O};Rs=function(e,t){var n=O;try{return O=e,t()}finally{O=n}};iu=function(e,t,n){switch(t){case"input":if(eu(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var l=il(r);if(!l)throw Error(g(90));as(r),eu(r,l)}}}break;case"textarea":fs(e,n);break;case"select":t=n.value,t!=null&&Yt(e,!!n.multiple,t,!1)}};gs=Po;ws=Rt;var zd={usingClientEntryPoint:!1,Events:[bn,Vt,il,vs,ys,Po]},wn={findFiberByHostInstance:Et,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},jd={bundleType:wn.bundleType,version:wn.version,rendererPackageName:wn.rendererPackageName,rendererConfig:wn.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:qe.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=xs(e),e===null?null:e.stateNode},findFiberByHostInstance:wn.findFiberByHostInstance||_d,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var wr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!wr.isDisabled&&wr.supportsFiber)try{rl=wr.inject(jd),Ve=wr}catch{}}xe.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=zd;xe.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Oo(t))throw Error(g(200));return Nd(e,t,null,n)};xe.createRoot=function(e,t){if(!Oo(e))throw Error(g(299));var n=!1,r="",l=ec;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(l=t.onRecoverableError)),t=To(e,1,!1,null,null,n,!1,r,l),e[Ge]=t.current,Vn(e.nodeType===8?e.parentNode:e),new Do(t)};xe.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(g(188)):(e=Object.keys(e).join(","),Error(g(268,e)));return e=xs(t),e=e===null?null:e.stateNode,e};xe.flushSync=function(e){return Rt(e)};xe.hydrate=function(e,t,n){if(!vl(t))throw Error(g(200));return yl(null,e,t,!0,n)};xe.hydrateRoot=function(e,t,n){if(!Oo(e))throw Error(g(405));var r=n!=null&&n.hydratedSources||null,l=!1,u="",o=ec;if(n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(u=n.identifierPrefix),n.onRecoverableError!==void 0&&(o=n.onRecoverableError)),t=ba(t,null,e,1,n??null,l,!1,u,o),e[Ge]=t.current,Vn(e),r)for(e=0;e<r.length;e++)n=r[e],l=n._getVersion,l=l(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,l]:t.mutableSourceEagerHydrationData.push(n,l);return new hl(t)};xe.render=function(e,t,n){if(!vl(t))throw Error(g(200));return yl(null,e,t,!1,n)};xe.unmountComponentAtNode=function(e){if(!vl(e))throw Error(g(40));return e._reactRootContainer?(Rt(function(){yl(null,null,e,!1,function(){e._reactRootContainer=null,e[Ge]=null})}),!0):!1};xe.unstable_batchedUpdates=Po;xe.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!vl(n))throw Error(g(200));if(e==null||e._reactInternals===void 0)throw Error(g(38));return yl(e,t,n,!1,r)};xe.version="18.3.1-next-f1338f8080-20240426";function tc(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(tc)}catch(e){console.error(e)}}tc(),ts.exports=xe;var Ld=ts.exports,Hi=Ld;Xl.createRoot=Hi.createRoot,Xl.hydrateRoot=Hi.hydrateRoot;function Td(){const[e,t]=de.useState(null),[n,r]=de.useState(!1),[l,u]=de.useState(0),[o,i]=de.useState(""),[s,f]=de.useState(null),[h,m]=de.useState(!1),[p,w]=de.useState([]),[S,k]=de.useState(!1),[M,c]=de.useState("checking"),a=de.useRef(null);de.useEffect(()=>{const z=async()=>{try{(await fetch("/health")).ok?c("online"):c("offline")}catch{c("offline")}};z();const b=setInterval(z,3e4);return()=>clearInterval(b)},[]);const d=z=>{z&&z.type==="application/pdf"?(t(z),i("")):i("Por favor, selecione apenas arquivos PDF.")},v=z=>{const b=z.target.files[0];d(b)},x=z=>{z.preventDefault(),m(!1);const b=z.dataTransfer.files[0];d(b)},N=z=>{z.preventDefault(),m(!0)},_=z=>{z.preventDefault(),m(!1)},P=async()=>{if(!e){i("Por favor, selecione um arquivo PDF.");return}r(!0),u(0),i("Iniciando conversão...");try{const z=new FormData;z.append("file",e);const fe=await(await fetch("/upload",{method:"POST",body:z})).json();if(fe.error)throw new Error(fe.error);f(fe.task_id),i("Conversão iniciada..."),A(fe.task_id)}catch(z){i(`Erro: ${z.message}`),r(!1)}},Rd=(z,b)=>{if(b.error)return i(`Erro: ${b.error}`),r(!1),!0;if(u(b.progress),b.status==="queued"&&b.queue_position?i(`Aguardando na fila... posição ${b.queue_position}`):i(`Processando... ${b.progress}%`),b.status==="completed"){i("Conversão concluída!"),u(100);const gl={id:z,filename:e.name,timestamp:new Date().toLocaleString(),status:"completed"};return w(fn=>[gl,...fn.slice(0,4)]),setTimeout(()=>{window.location.href=`/download/${z}`,T()},1e3),!0}return!1},A=z=>{if(!window.EventSource){Od(z);return}let b=!1;const Ie=new EventSource(`/api/status/${z}/stream`);Ie.onmessage=gl=>{Rd(z,JSON.parse(gl.data))&&(b=!0,Ie.close())},Ie.onerror=()=>{Ie.close(),b||Od(z)}},Od=async z=>{let b=0;for(;;)try{const Ie=await(await fetch(`/api/status/${z}?wait=25&since=${b}`)).json();if(b=Ie.version||b,Rd(z,Ie))return}catch{i("Erro de comunicação"),r(!1);return}},T=()=>{t(null),r(!1),u(0),i(""),f(null),a.current&&(a.current.value="")};return y.jsxs("div",{className:"app-container",children:[y.jsx("header",{className:"app-header",children:y.jsx("div",{className:"container",children:y.jsx("div",{className:"d-flex justify-content-center align-items-center",children:y.jsxs("div",{className:"logo",children:[y.jsx("i",{className:"fas fa-file-excel text-success me-2"}),y.jsx("span",{children:"PDF to XLSM"})]})})})}),o&&o.includes("Erro")&&y.jsx("div",{className:"error-notification",children:y.jsx("div",{className:"container",children:y.jsxs("div",{className:"d-flex justify-content-between align-items-center",children:[y.jsxs("span",{children:[y.jsx("i",{className:"fas fa-exclamation-triangle me-2"}),o]}),y.jsx("button",{className:"btn-close",onClick:()=>i(""),children:y.jsx("i",{className:"fas fa-times"})})]})})}),y.jsx("section",{className:"hero-section",children:y.jsxs("div",{className:"container",children:[y.jsxs("div",{className:"hero-content",children:[y.jsx("h1",{className:"hero-title",children:"Conversor PDF para XLSM"}),y.jsx("p",{className:"hero-description",children:"Converta arquivos PDF com tabelas financeiras para formato Excel (XLSM) com formatação profissional e estrutura otimizada."}),y.jsxs("div",{className:"conversion-indicator",children:[y.jsxs("div",{className:"format-tag",children:[y.jsx("i",{className:"fas fa-file-pdf me-2"}),"PDF"]}),y.jsx("div",{className:"arrow",children:y.jsx("i",{className:"fas fa-arrow-right"})}),y.jsxs("div",{className:"format-tag",children:[y.jsx("i",{className:"fas fa-file-excel me-2"}),"XLSM"]})]})]}),y.jsx("div",{className:"hero-icon",children:y.jsx("i",{className:"fas fa-file-excel"})})]})}),y.jsx("section",{className:"upload-section",children:y.jsx("div",{className:"container",children:y.jsxs("div",{className:"upload-card",children:[y.jsx("div",{className:"upload-header",children:y.jsxs("h3",{className:"upload-title",children:[y.jsx("i",{className:"fas fa-upload text-primary me-2"}),"Converter Arquivo"]})}),y.jsxs("div",{className:"upload-body",children:[y.jsxs("div",{className:`upload-area ${h?"dragover":""}`,onDrop:x,onDragOver:N,onDragLeave:_,onClick:()=>{var z;return(z=a.current)==null?void 0:z.click()},children:[y.jsx("i",{className:"fas fa-cloud-upload-alt fa-3x text-muted mb-3"}),y.jsx("p",{className:"upload-instruction",children:"Arraste e solte seu arquivo PDF aqui ou clique para selecionar"}),y.jsx("input",{ref:a,type:"file",accept:".pdf",onChange:v,style:{display:"none"}})]}),e&&y.jsx("div",{className:"mt-3",children:y.jsxs("p",{className:"text-success",children:[y.jsx("i",{className:"fas fa-check-circle me-2"}),"Arquivo selecionado: ",e.name]})}),o&&!o.includes("Erro")&&y.jsx("div",{className:"mt-3",children:y.jsx("p",{className:"text-info",children:o})}),n&&y.jsx("div",{className:"progress-container",children:y.jsx("div",{className:"progress",children:y.jsxs("div",{className:"progress-bar progress-bar-animated bg-primary",role:"progressbar",style:{width:`${l}%`},children:[l,"%"]})})}),y.jsx("div",{className:"text-center mt-4",children:y.jsx("button",{className:"btn btn-primary btn-lg",onClick:P,disabled:!e||n,children:n?y.jsxs(y.Fragment,{children:[y.jsx("i",{className:"fas fa-spinner fa-spin me-2"}),"Convertendo..."]}):y.jsxs(y.Fragment,{children:[y.jsx("i",{className:"fas fa-magic me-2"}),"Converter para XLSM"]})})}),y.jsx("div",{className:"mt-4 text-center",children:y.jsxs("small",{className:"text-muted",children:[y.jsx("i",{className:"fas fa-info-circle me-1"}),"Suporte apenas para arquivos PDF. Tamanho máximo: 10MB."]})})]})]})})}),p.length>0&&y.jsx("section",{className:"history-section",children:y.jsx("div",{className:"container",children:y.jsxs("div",{className:"history-card",children:[y.jsx("div",{className:"history-header",children:y.jsxs("h5",{className:"history-title",children:[y.jsx("i",{className:"fas fa-history text-primary me-2"}),"Histórico de Conversões"]})}),y.jsx("div",{className:"history-body",children:y.jsx("div",{className:"table-responsive",children:y.jsxs("table",{className:"table table-sm",children:[y.jsx("thead",{children:y.jsxs("tr",{children:[y.jsx("th",{children:"Arquivo"}),y.jsx("th",{children:"Data/Hora"}),y.jsx("th",{children:"Status"}),y.jsx("th",{children:"Ação"})]})}),y.jsx("tbody",{children:p.map(z=>y.jsxs("tr",{children:[y.jsxs("td",{children:[y.jsx("i",{className:"fas fa-file-pdf text-danger me-2"}),z.filename]}),y.jsx("td",{children:z.timestamp}),y.jsx("td",{children:y.jsxs("span",{className:"badge bg-success",children:[y.jsx("i",{className:"fas fa-check me-1"}),"Concluído"]})}),y.jsx("td",{children:y.jsxs("button",{className:"btn btn-sm btn-outline-primary",onClick:()=>{window.location.href=`/download/${z.id}`},children:[y.jsx("i",{className:"fas fa-download me-1"}),"Baixar"]})})]},z.id))})]})})})]})})}),y.jsx("footer",{className:"app-footer",children:y.jsx("div",{className:"container",children:y.jsxs("div",{className:"text-center",children:[y.jsxs("p",{className:"mb-2",children:[y.jsx("i",{className:"fas fa-code me-2"}),"Desenvolvido com React + Flask"]}),y.jsxs("p",{className:"mb-0",children:[y.jsx("i",{className:"fas fa-server me-2"}),"Processamento em tempo real •",y.jsx("i",{className:"fas fa-shield-alt ms-2 me-2"}),"Seguro e confiável"]})]})})})]})}Xl.createRoot(document.getElementById("root")).render(y.jsx(gc.StrictMode,{children:y.jsx(Td,{})}));
@@ -103,56 +103,91 @@ function App() {
     }
   }
 
-  const monitorProgress = (taskId) => {
-    const checkStatus = setInterval(async () => {
-      try {
+  // Atualiza a interface com um status recebido; retorna true quando a tarefa terminou
+  const handleStatusUpdate = (taskId, data) => {
+    if (data.error) {
+      setStatus(`Erro: ${data.error}`)
+      setIsUploading(false)
+      return true
+    }
+
+    setProgress(data.progress)
+    if (data.status === 'queued' && data.queue_position) {
+      setStatus(`Aguardando na fila... posição ${data.queue_position}`)
+    } else {
+      setStatus(`Processando... ${data.progress}%`)
+    }
+
+    if (data.status === 'completed') {
+      setStatus('Conversão concluída!')
+      setProgress(100)
+      
+      // Adicionar ao histórico
+      const newEntry = {
+        id: taskId,
+        filename: selectedFile.name,
+        timestamp: new Date().toLocaleString(),
+        status: 'completed'
+      }
+      setConversionHistory(prev => [newEntry, ...prev.slice(0, 4)]) // Manter apenas 5 entradas
+      
+      // Download automático
+      setTimeout(() => {
         // Em produção, usar URL relativa (mesmo domínio)
         // Em desenvolvimento, o proxy do Vite redireciona para localhost:5000
-        const response = await fetch(`/api/status/${taskId}`)
-        const data = await response.json()
+        window.location.href = `/download/${taskId}`
+        resetForm()
+      }, 1000)
+      return true
+    }
 
-        if (data.error) {
-          clearInterval(checkStatus)
-          setStatus(`Erro: ${data.error}`)
-          setIsUploading(false)
-          return
-        }
+    return false
+  }
 
-        setProgress(data.progress)
-        setStatus(`Processando... ${data.progress}%`)
+  // Eventos enviados pelo servidor (SSE); sem suporte ou se a conexão cair, usa long-poll
+  const monitorProgress = (taskId) => {
+    if (!window.EventSource) {
+      pollProgress(taskId)
+      return
+    }
 
-        if (data.status === 'completed') {
-          clearInterval(checkStatus)
-          setStatus('Conversão concluída!')
-          setProgress(100)
-          
-          // Adicionar ao histórico
-          const newEntry = {
-            id: taskId,
-            filename: selectedFile.name,
-            timestamp: new Date().toLocaleString(),
-            status: 'completed'
-          }
-          setConversionHistory(prev => [newEntry, ...prev.slice(0, 4)]) // Manter apenas 5 entradas
-          
-          // Download automático
-          setTimeout(() => {
-            // Em produção, usar URL relativa (mesmo domínio)
-            // Em desenvolvimento, o proxy do Vite redireciona para localhost:5000
-            window.location.href = `/download/${taskId}`
-            resetForm()
-          }, 1000)
-        } else if (data.status === 'error') {
-          clearInterval(checkStatus)
-          setStatus(`Erro: ${data.error}`)
-          setIsUploading(false)
+    let finished = false
+    const source = new EventSource(`/api/status/${taskId}/stream`)
+
+    source.onmessage = (event) => {
+      if (handleStatusUpdate(taskId, JSON.parse(event.data))) {
+        finished = true
+        source.close()
+      }
+    }
+
+    source.onerror = () => {
+      source.close()
+      if (!finished) {
+        pollProgress(taskId)
+      }
+    }
+  }
+
+  // Long-poll: o servidor segura a requisição até o status mudar (ou até 25s)
+  const pollProgress = async (taskId) => {
+    let version = 0
+
+    while (true) {
+      try {
+        const response = await fetch(`/api/status/${taskId}?wait=25&since=${version}`)
+        const data = await response.json()
+        version = data.version || version
+
+        if (handleStatusUpdate(taskId, data)) {
+          return
         }
       } catch (error) {
-        clearInterval(checkStatus)
         setStatus('Erro de comunicação')
         setIsUploading(false)
+        return
       }
-    }, 1000)
+    }
   }
 
   const resetForm = () => {
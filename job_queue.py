@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fila de conversões
+Pool fixo de threads consumindo uma fila FIFO limitada, no lugar de uma thread por upload
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """A fila de conversões atingiu o tamanho máximo"""
+
+    def __init__(self, retry_after):
+        super().__init__("Fila de conversões cheia")
+        self.retry_after = retry_after
+
+
+class ConversionQueue:
+    """
+    Executa as conversões em um número fixo de threads.
+    Tarefas excedentes aguardam em uma fila FIFO de tamanho limitado.
+    Conversões síncronas (fora da fila) reservam uma vaga com acquire_direct: no máximo
+    `workers` ao mesmo tempo, e só enquanto a fila não estiver cheia.
+    """
+
+    def __init__(self, workers=2, max_queue=20):
+        self.workers = max(1, int(workers))
+        self.max_queue = max(0, int(max_queue))
+
+        self._condition = threading.Condition()
+        self._pending = deque()
+        self._positions = {}
+        self._threads = []
+        self._active = 0
+        self._direct = 0
+
+        # Contadores sequenciais: posição na fila = sequência - iniciadas
+        self._submitted = 0
+        self._started = 0
+
+        # Média móvel da duração das tarefas (estimativa do Retry-After)
+        self._average_duration = None
+
+    def submit(self, task_id, func, *args):
+        """
+        Enfileira a tarefa e retorna a posição na fila (1 = próxima a executar).
+        Lança QueueFullError se a fila estiver cheia.
+        """
+        with self._condition:
+            self.check_capacity()
+
+            # Threads criadas sob demanda (seguro após o fork dos workers do gunicorn)
+            self._start_workers()
+
+            self._submitted += 1
+            self._positions[task_id] = self._submitted
+            self._pending.append((task_id, func, args))
+            self._condition.notify()
+
+            return self._submitted - self._started
+
+    def check_capacity(self):
+        """
+        Lança QueueFullError se a fila estiver cheia. Permite recusar uma tarefa antes de
+        preparar os dados dela (ex.: gravar o upload); submit confere de novo.
+        Workers livres contam como vagas: max_queue limita só as tarefas que ficariam
+        aguardando (0 = sem espera, aceita apenas com um worker livre).
+        """
+        with self._condition:
+            if len(self._pending) + self._active >= self.workers + self.max_queue:
+                raise QueueFullError(self.retry_after())
+
+    def acquire_direct(self):
+        """
+        Reserva uma vaga para uma conversão síncrona. Lança QueueFullError se a fila
+        estiver cheia ou se já houver `workers` conversões síncronas em execução.
+        Liberar com release_direct ao fim da conversão.
+        """
+        with self._condition:
+            self.check_capacity()
+            if self._direct >= self.workers:
+                raise QueueFullError(self.retry_after())
+            self._direct += 1
+
+    def release_direct(self):
+        """Libera a vaga reservada por acquire_direct"""
+        with self._condition:
+            self._direct = max(0, self._direct - 1)
+
+    def position(self, task_id):
+        """Posição da tarefa na fila ou None se ela não estiver aguardando"""
+        with self._condition:
+            sequence = self._positions.get(task_id)
+            if sequence is None:
+                return None
+            return sequence - self._started
+
+    def retry_after(self):
+        """Estimativa, em segundos, até uma vaga ser liberada na fila"""
+        average = self._average_duration or 5.0
+        return max(1, math.ceil(average / self.workers))
+
+    def stats(self):
+        """Tamanho da fila e tarefas em execução"""
+        with self._condition:
+            return {
+                'workers': self.workers,
+                'active': self._active,
+                'direct': self._direct,
+                'queued': len(self._pending),
+                'max_queue': self.max_queue,
+            }
+
+    def _start_workers(self):
+        """Inicia as threads do pool (chamar com o lock)"""
+        if self._threads:
+            return
+
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"conversion-worker-{index + 1}")
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+
+                task_id, func, args = self._pending.popleft()
+                self._positions.pop(task_id, None)
+                self._started += 1
+                self._active += 1
+
+            started_at = time.monotonic()
+            try:
+                func(task_id, *args)
+            except Exception as e:
+                logger.error(f"Erro não tratado na tarefa {task_id}: {str(e)}")
+            finally:
+                duration = time.monotonic() - started_at
+                with self._condition:
+                    self._active -= 1
+                    if self._average_duration is None:
+                        self._average_duration = duration
+                    else:
+                        self._average_duration = 0.8 * self._average_duration + 0.2 * duration
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Log em arquivo do conversor
+Configurado uma única vez por processo (instanciar vários conversores não duplica as
+linhas). Os registros vão para uma fila e uma thread (QueueListener) grava o arquivo,
+fora do caminho da conversão.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Diretório e nível do log do conversor
+LOG_DIR = os.environ.get('CONVERTER_LOG_DIR', 'logs')
+LOG_LEVEL = os.environ.get('CONVERTER_LOG_LEVEL', 'INFO').upper()
+
+_lock = threading.Lock()
+# Nome do logger -> {'pid', 'handler', 'listener'}
+_configured = {}
+
+
+def configure_file_logging(logger_name, filename='converter.log', log_dir=None, level=None,
+                           asynchronous=True):
+    """
+    Adiciona ao logger um handler para logs/<filename>, uma única vez por processo.
+    - asynchronous=True: QueueHandler + QueueListener (a gravação ocorre em outra thread)
+    - asynchronous=False: FileHandler direto (processos de pool, que encerram sem atexit)
+    Em um processo filho criado por fork o handler herdado é substituído, já que a
+    thread que esvaziava a fila existe só no processo pai.
+    """
+    logger = logging.getLogger(logger_name)
+    level = level or LOG_LEVEL
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+
+    with _lock:
+        state = _configured.get(logger_name)
+        if state and state['pid'] == os.getpid():
+            return state['handler']
+        if state:
+            logger.removeHandler(state['handler'])
+
+        log_dir = Path(log_dir or LOG_DIR)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        # O nível é controlado pelo logger (handlers sem nível próprio)
+        file_handler = logging.FileHandler(log_dir / filename, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        listener = None
+        if asynchronous:
+            log_queue = queue.SimpleQueue()
+            handler = QueueHandler(log_queue)
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            # Grava os registros pendentes ao encerrar o processo
+            atexit.register(listener.stop)
+        else:
+            handler = file_handler
+
+        # Um nível definido explicitamente no logger (ex.: benchmarks) é mantido
+        if logger.level == logging.NOTSET:
+            logger.setLevel(level)
+        logger.addHandler(handler)
+        _configured[logger_name] = {'pid': os.getpid(), 'handler': handler, 'listener': listener}
+        return handler
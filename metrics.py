@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Métricas no formato de texto do Prometheus
+Contadores, histogramas e gauges mínimos (sem dependências) e o conjunto de
+métricas das conversões exportado pelas aplicações em /metrics
+"""
+
+import math
+import threading
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Limites dos histogramas em segundos
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+PAGE_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+CONVERSION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+
+def format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for value in labels.values())
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + '}'
+
+
+class Counter:
+    """Contador acumulado, opcionalmente com rótulos"""
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, dict(key), value) for key, value in self._values.items()]
+
+
+class Histogram:
+    """Histograma com limites fixos (buckets cumulativos, soma e contagem)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, buckets):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    def samples(self):
+        result = []
+        with self._lock:
+            for key, (counts, total) in self._values.items():
+                labels = dict(key)
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    result.append((f'{self.name}_bucket', dict(labels, le=format_value(float(bound))),
+                                   cumulative))
+                result.append((f'{self.name}_sum', labels, total))
+                result.append((f'{self.name}_count', labels, cumulative))
+        return result
+
+
+class Gauge:
+    """Valor instantâneo lido de uma função no momento da exportação"""
+
+    kind = 'gauge'
+
+    def __init__(self, name, documentation, func):
+        self.name = name
+        self.documentation = documentation
+        self.func = func
+
+    def samples(self):
+        value = self.func()
+        # A função retorna um número ou uma lista de pares (rótulos, número)
+        if isinstance(value, (int, float)):
+            return [(self.name, {}, value)]
+        return [(self.name, labels, number) for labels, number in value]
+
+
+class MetricsRegistry:
+    """Conjunto de métricas exportadas em um único texto"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name, documentation):
+        return self._register(Counter(name, documentation))
+
+    def histogram(self, name, documentation, buckets):
+        return self._register(Histogram(name, documentation, buckets))
+
+    def gauge(self, name, documentation, func):
+        return self._register(Gauge(name, documentation, func))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Texto no formato de exposição do Prometheus"""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, labels, value in metric.samples():
+                lines.append(f'{name}{format_labels(labels)} {format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+class ConversionMetrics:
+    """
+    Métricas das conversões: tempos por etapa e por página, duração total,
+    páginas e linhas processadas e conversões por resultado.
+    Gauges de fila, tarefas ativas e armazenamento são registrados pela aplicação.
+    """
+
+    def __init__(self):
+        self.registry = MetricsRegistry()
+
+        self.conversions = self.registry.counter(
+            'pdf_conversions_total', 'Conversões finalizadas por resultado')
+        self.pages = self.registry.counter(
+            'pdf_pages_processed_total', 'Páginas de PDF processadas')
+        self.rows_extracted = self.registry.counter(
+            'pdf_rows_extracted_total', 'Linhas extraídas dos PDFs')
+        self.rows_valid = self.registry.counter(
+            'pdf_rows_valid_total', 'Linhas válidas escritas nos XLSM')
+        self.stage_seconds = self.registry.histogram(
+            'pdf_conversion_stage_seconds', 'Tempo de cada etapa da conversão', STAGE_BUCKETS)
+        self.page_seconds = self.registry.histogram(
+            'pdf_page_extraction_seconds', 'Tempo de extração de cada página', PAGE_BUCKETS)
+        self.duration = self.registry.histogram(
+            'pdf_conversion_duration_seconds', 'Duração total da conversão', CONVERSION_BUCKETS)
+
+    def gauge(self, name, documentation, func):
+        """Registra um gauge lido no momento da exportação"""
+        return self.registry.gauge(name, documentation, func)
+
+    def observe_conversion(self, stats, duration, status='completed'):
+        """Registra uma conversão a partir de PDFToXLSMConverter.conversion_stats()"""
+        self.conversions.inc(status=status)
+        self.duration.observe(duration, status=status)
+
+        if not stats:
+            return
+
+        self.pages.inc(stats['pages'])
+        self.rows_extracted.inc(stats['rows_extracted'])
+        self.rows_valid.inc(stats['rows_valid'])
+        for stage, seconds in stats['timings'].items():
+            if seconds:
+                self.stage_seconds.observe(seconds, stage=stage)
+        for seconds in stats['page_seconds']:
+            self.page_seconds.observe(seconds)
+
+    def render(self):
+        return self.registry.render()
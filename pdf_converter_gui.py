@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Interface gráfica (tkinter) do conversor PDF para XLSM
+Separada de pdf_to_xlsm_converter.py para que o servidor web nunca importe o tkinter
+"""
+
+import os
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from pathlib import Path
+from datetime import datetime
+
+from pdf_to_xlsm_converter import PDFToXLSMConverter
+
+
+class PDFConverterGUI:
+    def __init__(self):
+        self.converter = PDFToXLSMConverter(progress_callback=self.on_progress)
+        self.setup_gui()
+    
+    def setup_gui(self):
+        """
+        Configura a interface gráfica
+        """
+        self.root = tk.Tk()
+        self.root.title("Conversor PDF para XLSM")
+        self.root.geometry("600x400")
+        self.root.resizable(True, True)
+        
+        # Configurar estilo
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # Frame principal
+        main_frame = ttk.Frame(self.root, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configurar grid
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        
+        # Título
+        title_label = ttk.Label(main_frame, text="Conversor PDF para XLSM", 
+                               font=('Arial', 16, 'bold'))
+        title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
+        
+        # Seleção de arquivo PDF
+        ttk.Label(main_frame, text="Arquivo PDF:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.pdf_path_var = tk.StringVar()
+        pdf_entry = ttk.Entry(main_frame, textvariable=self.pdf_path_var, width=50)
+        pdf_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=5)
+        
+        pdf_button = ttk.Button(main_frame, text="Selecionar PDF", 
+                               command=self.select_pdf_file)
+        pdf_button.grid(row=1, column=2, padx=(5, 0), pady=5)
+        
+        # Seleção de arquivo de saída
+        ttk.Label(main_frame, text="Arquivo de saída:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.output_path_var = tk.StringVar()
+        output_entry = ttk.Entry(main_frame, textvariable=self.output_path_var, width=50)
+        output_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=5)
+        
+        output_button = ttk.Button(main_frame, text="Selecionar destino", 
+                                  command=self.select_output_file)
+        output_button.grid(row=2, column=2, padx=(5, 0), pady=5)
+        
+        # Botão de conversão
+        convert_button = ttk.Button(main_frame, text="Converter PDF para XLSM", 
+                                   command=self.convert_file, style='Accent.TButton')
+        convert_button.grid(row=3, column=0, columnspan=3, pady=20)
+        
+        # Barra de progresso
+        self.progress_var = tk.DoubleVar()
+        self.progress_bar = ttk.Progressbar(main_frame, variable=self.progress_var, 
+                                           maximum=100, length=400)
+        self.progress_bar.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
+        
+        # Área de log
+        ttk.Label(main_frame, text="Log de operações:").grid(row=5, column=0, sticky=tk.W, pady=(20, 5))
+        
+        # Frame para o log
+        log_frame = ttk.Frame(main_frame)
+        log_frame.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+        log_frame.columnconfigure(0, weight=1)
+        log_frame.rowconfigure(0, weight=1)
+        
+        # Text widget para log
+        self.log_text = tk.Text(log_frame, height=10, wrap=tk.WORD)
+        scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=scrollbar.set)
+        
+        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        
+        # Configurar peso das linhas
+        main_frame.rowconfigure(6, weight=1)
+        
+        # Informações sobre o conversor
+        info_text = """
+        Este conversor extrai tabelas de arquivos PDF com 3 colunas (Data, Movimentações, Valor)
+        e converte para formato XLSM com as colunas especificadas.
+        
+        Colunas de saída:
+        • Data → Data
+        • Movimentações → Complemento Histórico  
+        • Valor → Valor
+        • Colunas adicionais ficam vazias conforme especificado
+        """
+        
+        info_label = ttk.Label(main_frame, text=info_text, font=('Arial', 9), 
+                              foreground='gray', justify=tk.LEFT)
+        info_label.grid(row=7, column=0, columnspan=3, pady=(20, 0), sticky=tk.W)
+    
+    def log_message(self, message):
+        """
+        Adiciona mensagem ao log da interface
+        """
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        self.log_text.see(tk.END)
+        self.root.update_idletasks()
+    
+    def on_progress(self, event):
+        """
+        Atualiza a barra de progresso com os eventos do conversor
+        """
+        if event['stage'] == 'extract' and event.get('pages_total'):
+            self.progress_var.set(90 * event['pages_done'] / event['pages_total'])
+        elif event['stage'] == 'write':
+            self.progress_var.set(95)
+        self.root.update_idletasks()
+    
+    def select_pdf_file(self):
+        """
+        Seleciona arquivo PDF
+        """
+        file_path = filedialog.askopenfilename(
+            title="Selecionar arquivo PDF",
+            filetypes=[("Arquivos PDF", "*.pdf"), ("Todos os arquivos", "*.*")]
+        )
+        
+        if file_path:
+            self.pdf_path_var.set(file_path)
+            # Sugerir nome do arquivo de saída
+            pdf_path = Path(file_path)
+            output_path = pdf_path.parent / f"{pdf_path.stem}_convertido.xlsm"
+            self.output_path_var.set(str(output_path))
+            self.log_message(f"PDF selecionado: {file_path}")
+    
+    def select_output_file(self):
+        """
+        Seleciona arquivo de saída
+        """
+        file_path = filedialog.asksaveasfilename(
+            title="Salvar arquivo XLSM",
+            defaultextension=".xlsm",
+            filetypes=[("Arquivos Excel", "*.xlsm"), ("Todos os arquivos", "*.*")]
+        )
+        
+        if file_path:
+            self.output_path_var.set(file_path)
+            self.log_message(f"Arquivo de saída selecionado: {file_path}")
+    
+    def convert_file(self):
+        """
+        Executa a conversão do arquivo
+        """
+        pdf_path = self.pdf_path_var.get().strip()
+        output_path = self.output_path_var.get().strip()
+        
+        if not pdf_path:
+            messagebox.showerror("Erro", "Por favor, selecione um arquivo PDF")
+            return
+        
+        if not output_path:
+            messagebox.showerror("Erro", "Por favor, selecione um arquivo de saída")
+            return
+        
+        if not os.path.exists(pdf_path):
+            messagebox.showerror("Erro", "Arquivo PDF não encontrado")
+            return
+        
+        try:
+            self.log_message("Iniciando conversão...")
+            self.progress_var.set(0)
+            
+            # Executar conversão
+            success = self.converter.convert_pdf_to_xlsm(pdf_path, output_path)
+            
+            if success:
+                self.progress_var.set(100)
+                self.log_message("Conversão concluída com sucesso!")
+                messagebox.showinfo("Sucesso", f"Arquivo convertido com sucesso!\nSalvo em: {output_path}")
+            else:
+                self.log_message("Erro na conversão")
+                messagebox.showerror("Erro", "Falha na conversão do arquivo")
+                
+        except Exception as e:
+            self.log_message(f"Erro: {str(e)}")
+            messagebox.showerror("Erro", f"Erro durante a conversão:\n{str(e)}")
+            self.progress_var.set(0)
+    
+    def run(self):
+        """
+        Inicia a interface gráfica
+        """
+        self.root.mainloop()
+
+
+def main():
+    """
+    Inicia a interface gráfica
+    """
+    app = PDFConverterGUI()
+    app.run()
+
+
+if __name__ == "__main__":
+    main()
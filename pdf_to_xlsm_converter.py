@@ -5,228 +5,662 @@ Conversor de PDF para XLSM
 Converte arquivos PDF com tabelas financeiras para formato Excel (XLSM)
 """
 
+import argparse
+import glob
+import io
 import os
 import sys
-import pandas as pd
-import pdfplumber
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+import time
 from pathlib import Path
 import re
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import chain, islice
 import logging
+from importlib.util import find_spec
+
+from bank_formats import detect_format, has_format_dates, sample_format, text_format
+from log_config import configure_file_logging
+from row_formats import (CHUNK_WRITERS, OUTPUT_FORMATS, STREAMING_FORMATS, check_output_format,
+                         format_for_path, write_parquet)
+
+# pdfplumber, pandas e openpyxl são importados apenas quando uma conversão é
+# executada, e a interface gráfica (tkinter) fica em pdf_converter_gui.py:
+# importar este módulo (servidor web, /health) não carrega nenhum deles.
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Versão do conversor (faz parte da chave do cache de resultados)
+CONVERTER_VERSION = '1.1.0'
+
+# Colunas do arquivo XLSM de saída
+XLSM_COLUMNS = [
+    'Data',
+    'Cód. Conta Debito',
+    'Cód. Conta Credito',
+    'Valor',
+    'Cód. Histórico',
+    'Complemento Histórico',
+    'Inicia Lote',
+    'Código Matriz/Filial',
+    'Centro de Custo Débito',
+    'Centro de Custo Crédito'
+]
+
+# Larguras das colunas do arquivo de referência
+REFERENCE_COLUMN_WIDTHS = {
+    'A': 10.7109375,   # Data
+    'B': 17.28515625,  # Cód. Conta Debito
+    'C': 17.85546875,  # Cód. Conta Credito
+    'D': 10.28515625,  # Valor
+    'E': 13.42578125,  # Cód. Histórico
+    'F': 80.7109375,   # Complemento Histórico
+    'G': 17.140625,    # Inicia Lote
+    'H': 18.5703125,   # Código Matriz/Filial
+    'I': 22.0,         # Centro de Custo Débito
+    'J': 22.5703125,   # Centro de Custo Crédito
+    'K': 3.28515625,   # (vazio)
+    'L': 95.7109375    # Instruções
+}
+
+# Padrões de data aceitos, combinados em uma única expressão:
+# DD/MM/YYYY, DD-MM-YYYY, YYYY-MM-DD, DD.MM.YYYY, DD/MM/YY, DD-MM-YY
+DATE_PATTERN = re.compile(
+    r'\d{1,2}/\d{1,2}/(?:\d{4}|\d{2})'
+    r'|\d{1,2}-\d{1,2}-(?:\d{4}|\d{2})'
+    r'|\d{4}-\d{1,2}-\d{1,2}'
+    r'|\d{1,2}\.\d{1,2}\.\d{4}'
+)
+
+# Padrões de valor aceitos, combinados em uma única expressão:
+# 1.000,00 / 1.000 / 100,00 / 100.00 / 100 / 1,000.00
+VALUE_PATTERN = re.compile(
+    r'-?(?:\d{1,3}(?:\.\d{3})*(?:,\d{2})?'
+    r'|\d+(?:[,.]\d{2})?'
+    r'|\d{1,3}(?:,\d{3})*\.\d{2})'
+)
+
+# Caracteres removidos do valor antes da validação
+VALUE_NOISE = re.compile(r'[^\d,.-]')
+
+# Quantidade de linhas validadas por lote
+VALIDATION_BATCH_SIZE = 500
+
+# Item da seleção de páginas: 'N', 'N-M' ou 'N-'; referências 'z' (última) e 'rN' (N-ésima a partir do fim)
+PAGE_RANGE_PATTERN = re.compile(r'(\d+|z|r\d+)(?:(-)(\d+|z|r\d+)?)?')
+
+
+def parse_page_ref(token):
+    """Referência de página: número (1-based) ou negativa a partir do fim (-1 = última)"""
+    if isinstance(token, int):
+        if token == 0:
+            raise ValueError("Página inválida: 0 (as páginas começam em 1)")
+        return token
+    if token == 'z':
+        return -1
+    number = int(token.lstrip('r'))
+    if number < 1:
+        raise ValueError(f"Página inválida: {token} (as páginas começam em 1)")
+    return -number if token.startswith('r') else number
+
+
+def parse_page_ranges(spec):
+    """
+    Interpreta a seleção de páginas, separada por vírgulas (1-based, fim inclusivo):
+    - '5': página 5; '2-4': páginas 2 a 4; '10-': da página 10 até o fim
+    - 'z': última página; 'rN': N-ésima página a partir do fim ('r3-z': as três últimas)
+    Também aceita um iterável de números de página ou de faixas (início, fim).
+    Retorna uma tupla de faixas (início, fim), com as referências ao fim negativas
+    (-1 = última), resolvidas por select_pages quando o total de páginas é conhecido.
+    """
+    if spec is None:
+        return None
+    
+    if not isinstance(spec, str):
+        items = ((item, item) if isinstance(item, int) else item for item in spec)
+        return tuple((parse_page_ref(start), parse_page_ref(end)) for start, end in items)
+    
+    ranges = []
+    for item in spec.replace(' ', '').lower().split(','):
+        match = PAGE_RANGE_PATTERN.fullmatch(item)
+        if match is None:
+            raise ValueError(f"Seleção de páginas inválida: '{item}'. Use, por exemplo, '1-3,8', '10-' ou 'r3-z'")
+        start, dash, end = match.groups()
+        start = parse_page_ref(start)
+        end = parse_page_ref(end) if end else (-1 if dash else start)
+        ranges.append((start, end))
+    return tuple(ranges)
+
+
+def select_pages(page_ranges, total_pages):
+    """
+    Números das páginas selecionadas (ordem do documento, sem repetições).
+    Faixas fora do documento (ou invertidas) são ignoradas; lança ValueError se nenhuma
+    página sobrar.
+    """
+    if page_ranges is None:
+        return list(range(1, total_pages + 1))
+    
+    selected = set()
+    for start, end in page_ranges:
+        start, end = (ref if ref > 0 else total_pages + 1 + ref for ref in (start, end))
+        selected.update(range(max(start, 1), min(end, total_pages) + 1))
+    
+    if not selected:
+        raise ValueError(f"Nenhuma página selecionada em um PDF de {total_pages} páginas")
+    return sorted(selected)
+
+
+def validate_max_rows(max_rows):
+    """Limite de linhas da conversão: None (sem limite) ou inteiro positivo"""
+    if max_rows is None:
+        return None
+    try:
+        max_rows = int(max_rows)
+    except (TypeError, ValueError):
+        raise ValueError(f"Limite de linhas inválido: {max_rows!r} (use um inteiro positivo)")
+    if max_rows < 1:
+        raise ValueError(f"Limite de linhas inválido: {max_rows} (use um inteiro positivo)")
+    return max_rows
+
+
+class InvalidPDFError(ValueError):
+    """O arquivo não pôde ser lido como PDF (inválido ou corrompido)"""
+
+
+def pdf_parse_errors():
+    """Exceções do pdfplumber/pdfminer para PDF inválido ou corrompido (importadas sob demanda)"""
+    from pdfminer.psparser import PSException
+    try:
+        from pdfplumber.utils.exceptions import PdfminerException
+    except ImportError:
+        # pdfplumber < 0.11 repassa as exceções do pdfminer
+        return (PSException,)
+    return (PSException, PdfminerException)
+
+
+class Transaction:
+    """
+    Transação já validada (data, descrição, valor), que não precisa ser verificada de novo.
+    Registro compacto com __slots__; desempacota e indexa como a linha [data, descrição, valor].
+    """
+    __slots__ = ('date', 'description', 'value')
+    
+    def __init__(self, date, description, value):
+        self.date = date
+        self.description = description
+        self.value = value
+    
+    def __iter__(self):
+        return iter((self.date, self.description, self.value))
+    
+    def __getitem__(self, index):
+        return (self.date, self.description, self.value)[index]
+    
+    def __len__(self):
+        return 3
+    
+    def __eq__(self, other):
+        return tuple(self) == tuple(other) if isinstance(other, (Transaction, list, tuple)) else NotImplemented
+    
+    def __repr__(self):
+        return f"Transaction({self.date!r}, {self.description!r}, {self.value!r})"
+    
+    def __reduce__(self):
+        # Serialização compacta para os processos de extração
+        return Transaction, (self.date, self.description, self.value)
+
+
+def xlsm_row(date, description, value):
+    """Linha no layout de 10 colunas do XLSM"""
+    return (
+        date,                    # Data
+        '',                      # Cód. Conta Debito (vazio)
+        '',                      # Cód. Conta Credito (vazio)
+        value,                   # Valor
+        '',                      # Cód. Histórico (vazio)
+        description,             # Complemento Histórico
+        '',                      # Inicia Lote (vazio)
+        '',                      # Código Matriz/Filial (vazio)
+        '',                      # Centro de Custo Débito (vazio)
+        ''                       # Centro de Custo Crédito (vazio)
+    )
+
+
+class TransactionTable:
+    """
+    Transações válidas em colunas (datas, descrições, valores), sem pandas.
+    Iterar gera as linhas no layout de 10 colunas do XLSM; to_dataframe() cria o
+    DataFrame apenas para quem pedir explicitamente (requer pandas).
+    """
+    __slots__ = ('dates', 'descriptions', 'values')
+    
+    columns = XLSM_COLUMNS
+    
+    def __init__(self, transactions=()):
+        self.dates = []
+        self.descriptions = []
+        self.values = []
+        self.extend(transactions)
+    
+    def append(self, transaction):
+        date, description, value = transaction
+        self.dates.append(date)
+        self.descriptions.append(description)
+        self.values.append(value)
+    
+    def extend(self, transactions):
+        for transaction in transactions:
+            self.append(transaction)
+    
+    def __len__(self):
+        return len(self.dates)
+    
+    def __iter__(self):
+        for date, description, value in zip(self.dates, self.descriptions, self.values):
+            yield xlsm_row(date, description, value)
+    
+    def transactions(self):
+        """Gera as transações (data, descrição, valor)"""
+        for date, description, value in zip(self.dates, self.descriptions, self.values):
+            yield Transaction(date, description, value)
+    
+    def to_dataframe(self):
+        """DataFrame do pandas com as colunas do XLSM"""
+        import pandas as pd
+        
+        return pd.DataFrame(list(self), columns=XLSM_COLUMNS)
+
+
+# Estilos nomeados registrados no workbook de saída
+HEADER_STYLE = 'cabecalho_xlsm'
+DATA_STYLE = 'dados_xlsm'
+
+# Motores de escrita do XLSM: openpyxl (write-only) ou XML direto (xlsx_writer)
+OUTPUT_ENGINES = ('openpyxl', 'xml')
+
+# Dependências necessárias para converter (o DataFrame do pandas é opcional)
+CONVERSION_DEPENDENCIES = ('pdfplumber', 'openpyxl')
+
+# Páginas amostradas (início, meio e fim) para decidir o formato do documento
+FORMAT_SAMPLE_PAGES = 3
+
+# Diagnóstico por linha extraída (nível DEBUG): registra uma a cada N linhas
+# (0 desliga, 1 registra todas)
+ROW_LOG_EVERY = int(os.environ.get('CONVERTER_ROW_LOG_EVERY', 0))
+
+# Etapas com tempo registrado em cada conversão (segundos)
+TIMED_STAGES = ('open', 'detect', 'extract', 'validate', 'table', 'write')
+
 class PDFToXLSMConverter:
-    def __init__(self):
+    def __init__(self, workers=1, engine='openpyxl', progress_callback=None, row_log_every=None):
+        # Número de processos usados na extração (1 = sequencial)
+        self.workers = max(1, int(workers or 1))
+        
+        if engine not in OUTPUT_ENGINES:
+            raise ValueError(f"Motor de escrita inválido: {engine}. Use um de: {', '.join(OUTPUT_ENGINES)}")
+        self.engine = engine
+        
+        # Recebe um dicionário por evento: {'stage': 'open' | 'extract' | 'write' | 'done', ...}
+        self.progress_callback = progress_callback
+        
+        # Amostragem do diagnóstico por linha (só com o logger em DEBUG)
+        self.row_log_every = ROW_LOG_EVERY if row_log_every is None else max(0, int(row_log_every))
+        self.row_log_counter = 0
+        self.rows_written = 0
+        
+        self.reset_stats()
         self.setup_logging()
     
     def setup_logging(self):
-        """Configura o sistema de logging"""
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+        """
+        Configura o log em logs/converter.log (uma única vez por processo, gravado por
+        uma thread separada)
+        """
+        configure_file_logging(__name__)
+    
+    def row_log_interval(self):
+        """Intervalo do diagnóstico por linha; 0 quando desligado ou sem nível DEBUG"""
+        if self.row_log_every and logger.isEnabledFor(logging.DEBUG):
+            return self.row_log_every
+        return 0
+    
+    def reset_stats(self):
+        """Zera os tempos por etapa e os contadores da conversão"""
+        self.pages_total = 0
+        self.pages_selected = 0
+        self.pages_processed = 0
+        self.rows_extracted = 0
+        self.rows_valid = 0
+        self.row_limit_reached = False
+        self.document_format = None
+        # Linhas já extraídas da página/faixa atual que ainda não foram consumidas
+        self.pending_rows = deque()
+        self.timings = dict.fromkeys(TIMED_STAGES, 0.0)
+        self.page_seconds = []
+    
+    def conversion_stats(self):
+        """
+        Tempos por etapa (segundos), tempo de extração de cada página e contadores
+        da última conversão
+        """
+        return {
+            'pages': self.pages_processed,
+            'pages_total': self.pages_total,
+            'format': self.document_format,
+            'rows_extracted': self.rows_extracted,
+            'rows_valid': self.rows_valid,
+            'row_limit_reached': self.row_limit_reached,
+            'timings': dict(self.timings),
+            'page_seconds': list(self.page_seconds),
+        }
+    
+    def report_progress(self, stage, **info):
+        """
+        Envia um evento de progresso ao callback configurado.
+        Falhas no callback não interrompem a conversão.
+        """
+        if self.progress_callback is None:
+            return
         
-        file_handler = logging.FileHandler(log_dir / "converter.log", encoding='utf-8')
-        file_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        try:
+            self.progress_callback(dict(info, stage=stage))
+        except Exception as e:
+            logger.warning(f"Erro no callback de progresso: {str(e)}")
     
-    def extract_tables_from_pdf(self, pdf_path):
+    def extract_tables_from_pdf(self, pdf_path, pages=None):
         """
-        Extrai todas as tabelas de um arquivo PDF
+        Extrai todas as tabelas de um arquivo PDF (ou das páginas selecionadas).
+        Aceita caminho, bytes, BytesIO/arquivo aberto, mmap ou FileStorage do Flask.
         """
-        all_tables = []
+        all_tables = list(self.iter_rows_from_pdf(pdf_path, pages))
+        logger.info(f"Total de linhas extraídas: {len(all_tables)}")
+        return all_tables
+    
+    def iter_rows_from_pdf(self, pdf_path, pages=None):
+        """
+        Gera as linhas extraídas do PDF página a página, sem acumular o documento.
+        pages: seleção de páginas (ver parse_page_ranges); None processa o documento inteiro.
+        Interromper o consumo (close) encerra a extração das páginas restantes.
+        """
+        import pdfplumber
+        
+        self.reset_stats()
+        page_ranges = parse_page_ranges(pages)
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                logger.info(f"Processando PDF com {len(pdf.pages)} páginas")
+            started = time.perf_counter()
+            with pdfplumber.open(as_pdf_input(pdf_path)) as pdf:
+                self.pages_total = len(pdf.pages)
+                page_numbers = select_pages(page_ranges, self.pages_total)
+                total_pages = self.pages_selected = len(page_numbers)
+                selected = [pdf.pages[number - 1] for number in page_numbers]
+                self.timings['open'] = time.perf_counter() - started
+                if total_pages < self.pages_total:
+                    logger.info(f"Processando {total_pages} de {self.pages_total} páginas do PDF")
+                else:
+                    logger.info(f"Processando PDF com {total_pages} páginas")
+                self.report_progress('open', pages_total=total_pages)
                 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    logger.info(f"Processando página {page_num}")
-                    
-                    # Tentar extrair tabelas da página
-                    tables = page.extract_tables()
-                    
-                    if tables:
-                        for table in tables:
-                            if table and len(table) > 1:  # Verifica se a tabela tem dados
-                                # Filtrar apenas linhas com 3 colunas (Data, Movimentações, Valor)
-                                filtered_table = []
-                                for row in table:
-                                    if row and len(row) >= 3:
-                                        # Limpar dados da linha
-                                        cleaned_row = [cell.strip() if cell else "" for cell in row[:3]]
-                                        # Verificar se a linha tem dados válidos
-                                        if any(cleaned_row):
-                                            filtered_table.append(cleaned_row)
-                                
-                                if filtered_table:
-                                    all_tables.extend(filtered_table)
-                                    logger.info(f"Página {page_num}: {len(filtered_table)} linhas extraídas")
-                    
-                    # Se não encontrou tabelas, tentar extrair texto e procurar padrões
-                    if not tables or not any(tables):
-                        logger.info(f"Página {page_num}: Tentando extrair texto para encontrar padrões")
-                        text = page.extract_text()
-                        if text:
-                            lines = text.split('\n')
-                            # Detectar tipo de arquivo pelo padrão de data
-                            is_mercadopago = self.detect_file_type(text)
-                            logger.info(f"Página {page_num}: Detectado formato {'MercadoPago' if is_mercadopago else 'Asaas'}")
-                            
-                            if is_mercadopago:
-                                logger.info(f"Página {page_num}: Extraindo padrões MercadoPago")
-                                self.extract_mercadopago_patterns(lines, page_num, all_tables)
-                            else:
-                                logger.info(f"Página {page_num}: Extraindo padrões Asaas")
-                                self.extract_asaas_patterns(lines, page_num, all_tables)
+                started = time.perf_counter()
+                document_format = self.document_format = self.detect_document_format(selected)
+                self.timings['detect'] = time.perf_counter() - started
+                
+                if self.workers > 1 and total_pages > 1:
+                    page_chunks = self.iter_page_ranges_parallel(as_worker_input(pdf_path), page_numbers,
+                                                                 document_format)
+                else:
+                    page_chunks = self.iter_page_rows(selected, document_format)
                 
-                logger.info(f"Total de linhas extraídas: {len(all_tables)}")
-                return all_tables
+                try:
+                    while True:
+                        # Tempo esperando as páginas (não inclui o consumo das linhas geradas)
+                        started = time.perf_counter()
+                        chunk = next(page_chunks, None)
+                        self.timings['extract'] += time.perf_counter() - started
+                        if chunk is None:
+                            break
+                        
+                        page_count, rows = chunk
+                        self.pages_processed += page_count
+                        self.rows_extracted += len(rows)
+                        self.report_progress('extract', pages_done=self.pages_processed,
+                                             pages_total=total_pages, rows=self.rows_extracted)
+                        self.pending_rows = deque(rows)
+                        while self.pending_rows:
+                            yield self.pending_rows.popleft()
+                finally:
+                    # Consumo interrompido (ex.: limite de linhas): páginas pendentes são descartadas
+                    page_chunks.close()
                 
         except Exception as e:
             logger.error(f"Erro ao extrair tabelas do PDF: {str(e)}")
+            if isinstance(e, pdf_parse_errors()):
+                raise InvalidPDFError(f"PDF inválido ou corrompido: {str(e)}") from e
             raise
     
-    def detect_file_type(self, text):
-        """Detecta se é arquivo MercadoPago ou Asaas baseado no padrão de data"""
-        # MercadoPago usa DD-MM-YYYY, Asaas usa DD/MM/YYYY
-        mercadopago_count = len(re.findall(r'\d{2}-\d{2}-\d{4}', text))
-        asaas_count = len(re.findall(r'\d{2}/\d{2}/\d{4}', text))
-        
-        return mercadopago_count > asaas_count
-    
-    def extract_mercadopago_patterns(self, lines, page_num, all_tables):
-        """Extrai padrões específicos do MercadoPago"""
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
-            
-            # Pular cabeçalhos
-            if line in ['Data Descrição ID da operação Valor Saldo', 'Data', 'Descrição', 'Valor']:
-                i += 1
-                continue
-            
-            # Padrão MercadoPago: DD-MM-YYYY descrição ID_operacao R$ valor R$ saldo
-            mercadopago_pattern = r'^(\d{2}-\d{2}-\d{4})\s+(.+?)\s+(\d+)\s+(R\$\s*[+-]?\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s+(R\$\s*[+-]?\d{1,3}(?:\.\d{3})*(?:,\d{2})?)$'
-            match = re.match(mercadopago_pattern, line)
-            
-            if match:
-                date, description, operation_id, value, balance = match.groups()
-                clean_value = re.sub(r'R\$\s*', '', value).strip()
-                
-                if self.is_valid_date(date) and self.is_valid_value(clean_value):
-                    all_tables.append([date, description, clean_value])
-                    logger.info(f"Página {page_num}: MercadoPago extraído: {date} | {description[:30]}... | {clean_value}")
-            else:
-                # Padrão alternativo: DD-MM-YYYY ID_operacao R$ valor R$ saldo (descrição na linha anterior)
-                alt_pattern = r'^(\d{2}-\d{2}-\d{4})\s+(\d+)\s+(R\$\s*[+-]?\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s+(R\$\s*[+-]?\d{1,3}(?:\.\d{3})*(?:,\d{2})?)$'
-                alt_match = re.match(alt_pattern, line)
-                
-                if alt_match and i > 0:
-                    date, operation_id, value, balance = alt_match.groups()
-                    description = lines[i-1].strip()  # Descrição na linha anterior
-                    clean_value = re.sub(r'R\$\s*', '', value).strip()
-                    
-                    if self.is_valid_date(date) and self.is_valid_value(clean_value) and description:
-                        all_tables.append([date, description, clean_value])
-                        logger.info(f"Página {page_num}: MercadoPago (alt) extraído: {date} | {description[:30]}... | {clean_value}")
-            
-            i += 1
-    
-    def extract_asaas_patterns(self, lines, page_num, all_tables):
-        """Extrai padrões específicos do Asaas"""
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
-
-            # Pular cabeçalhos
-            if line in ['Data Movimentações Valor', 'Data', 'Movimentações', 'Valor']:
-                i += 1
-                continue
-
-            # Padrão para linha completa: DD/MM/YYYY descrição R$ valor
-            date_pattern = r'^(\d{1,2}/\d{1,2}/\d{4})\s+(.+?)\s+(R\$\s*[+-]?\d{1,3}(?:\.\d{3})*(?:,\d{2})?)$'
-            match = re.match(date_pattern, line)
-
-            if match:
-                date, description, value = match.groups()
-                # Limpar o valor (remover R$ e espaços)
-                clean_value = re.sub(r'R\$\s*', '', value).strip()
-                if clean_value and self.is_valid_date(date) and self.is_valid_value(clean_value):
-                    all_tables.append([date, description, clean_value])
-                    logger.info(f"Página {page_num}: Linha extraída: {date} | {description[:30]}... | {clean_value}")
-            else:
-                # Verificar se é uma linha quebrada (descrição na linha atual, valor na próxima)
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    
-                    # Padrão: linha atual tem data e descrição, próxima linha tem valor
-                    date_desc_pattern = r'^(\d{1,2}/\d{1,2}/\d{4})\s+(.+)$'
-                    value_pattern = r'^R\$\s*([+-]?\d{1,3}(?:\.\d{3})*(?:,\d{2})?)$'
-                    
-                    date_desc_match = re.match(date_desc_pattern, line)
-                    value_match = re.match(value_pattern, next_line)
+    def detect_document_format(self, pages):
+        """
+        Decide o formato do documento uma única vez a partir de uma amostra de páginas.
+        Retorna o nome de um formato em texto de bank_formats ('mercadopago', 'asaas', ...),
+        'combinado' (regras de todos os formatos) quando a amostra não aponta um formato claro,
+        ou None quando a amostra tem tabelas ou nenhuma data (cada página é verificada como antes).
+        """
+        count = min(FORMAT_SAMPLE_PAGES, len(pages))
+        if not count:
+            return None
+        
+        sample = sorted({round(i * (len(pages) - 1) / max(count - 1, 1)) for i in range(count)})
+        texts = []
+        for index in sample:
+            # O cache das páginas amostradas é reaproveitado na extração
+            page = pages[index]
+            if any(page.extract_tables()):
+                logger.info(f"Página {page.page_number} da amostra tem tabelas: formato verificado por página")
+                return None
+            texts.append(page.extract_text() or '')
+        
+        text = '\n'.join(texts)
+        if not has_format_dates(text):
+            return None
+        
+        document_format = sample_format(text).name
+        logger.info(f"Formato do documento: {document_format} (texto, {len(sample)} páginas amostradas)")
+        return document_format
+    
+    def iter_page_rows(self, pages, document_format=None):
+        """
+        Gera (páginas processadas, linhas da página) para cada página, liberando o cache
+        da página em seguida
+        """
+        for page in pages:
+            started = time.perf_counter()
+            page_rows = []
+            self.extract_rows_from_page(page, page.page_number, page_rows, document_format)
+            page.close()
+            self.page_seconds.append(time.perf_counter() - started)
+            yield 1, page_rows
+    
+    def iter_page_ranges_parallel(self, pdf_path, page_numbers, document_format=None):
+        """
+        Extrai faixas de páginas em um pool de processos e gera (páginas da faixa, linhas)
+        na ordem das páginas. pdf_path deve ser serializável entre processos (caminho ou bytes).
+        """
+        # Modo paralelo: faixas de páginas processadas em um pool de processos
+        page_ranges = self.split_page_ranges(page_numbers)
+        logger.info(f"Extração paralela: {len(page_ranges)} faixas em {self.workers} processos")
+        
+        # PDF em memória: enviado uma vez a cada processo (inicialização), não a cada faixa
+        pdf_data = None
+        if isinstance(pdf_path, (bytes, bytearray)):
+            pdf_data, pdf_path = pdf_path, None
+        
+        executor = ProcessPoolExecutor(max_workers=min(self.workers, len(page_ranges)),
+                                       initializer=_init_extraction_worker,
+                                       initargs=(self.engine, self.row_log_every, pdf_data))
+        # Janela limitada de faixas em andamento para manter a memória constante
+        pending = deque()
+        
+        def next_chunk():
+            page_count, future = pending.popleft()
+            rows, page_seconds = future.result()
+            self.page_seconds.extend(page_seconds)
+            return page_count, rows
+        
+        try:
+            for chunk in page_ranges:
+                pending.append((len(chunk), executor.submit(_extract_pages, pdf_path, chunk,
+                                                            document_format)))
+                if len(pending) >= self.workers * 2:
+                    yield next_chunk()
+            while pending:
+                yield next_chunk()
+        finally:
+            # Extração interrompida (ex.: limite de linhas): as faixas pendentes são
+            # canceladas e a conversão não espera as que já estão em andamento
+            executor.shutdown(wait=not pending, cancel_futures=True)
+    
+    def split_page_ranges(self, page_numbers):
+        """
+        Divide as páginas selecionadas (números 1-based, em ordem) em faixas consecutivas
+        """
+        total_pages = len(page_numbers)
+        # Mais faixas que processos para equilibrar páginas mais lentas
+        chunk_count = min(total_pages, self.workers * 4)
+        chunk_size = -(-total_pages // chunk_count)
+        
+        return [page_numbers[start:start + chunk_size] for start in range(0, total_pages, chunk_size)]
+    
+    def extract_rows_from_page(self, page, page_num, all_tables, document_format=None):
+        """
+        Extrai as linhas de uma página (tabelas ou padrões de texto).
+        document_format: formato em texto já decidido para o documento (nome em
+        bank_formats.BANK_FORMATS ou o combinado), que dispensa a detecção de tabelas e de
+        formato em cada página.
+        """
+        logger.debug(f"Processando página {page_num}")
+        bank_format = text_format(document_format)
+        
+        # Tentar extrair tabelas da página (dispensado em extratos de texto de formato conhecido)
+        tables = [] if bank_format else page.extract_tables()
+        
+        if tables:
+            for table in tables:
+                if table and len(table) > 1:  # Verifica se a tabela tem dados
+                    # Filtrar apenas linhas com 3 colunas (Data, Movimentações, Valor)
+                    filtered_table = []
+                    for row in table:
+                        if row and len(row) >= 3:
+                            # Limpar dados da linha
+                            cleaned_row = [cell.strip() if cell else "" for cell in row[:3]]
+                            # Verificar se a linha tem dados válidos
+                            if any(cleaned_row):
+                                filtered_table.append(cleaned_row)
                     
-                    if date_desc_match and value_match:
-                        date, description = date_desc_match.groups()
-                        clean_value = value_match.group(1)
-                        
-                        if self.is_valid_date(date) and self.is_valid_value(clean_value):
-                            all_tables.append([date, description, clean_value])
-                            logger.info(f"Página {page_num}: Linha quebrada extraída: {date} | {description[:30]}... | {clean_value}")
-                            i += 1  # Pular a próxima linha (valor)
-                    else:
-                        # Verificar se é uma linha quebrada (descrição sem data, data na próxima linha)
-                        if i + 1 < len(lines):
-                            next_line = lines[i + 1].strip()
-                            
-                            # Padrão: linha atual tem descrição, próxima linha tem data e valor
-                            desc_pattern = r'^(.+)$'
-                            date_value_pattern = r'^(\d{1,2}/\d{1,2}/\d{4})\s+R\$\s*([+-]?\d{1,3}(?:\.\d{3})*(?:,\d{2})?)$'
-                            
-                            desc_match = re.match(desc_pattern, line)
-                            date_value_match = re.match(date_value_pattern, next_line)
-                            
-                            if desc_match and date_value_match and not re.match(r'^\d{1,2}/\d{1,2}/\d{4}', line):
-                                description = desc_match.group(1)
-                                date, clean_value = date_value_match.groups()
-                                
-                                if self.is_valid_date(date) and self.is_valid_value(clean_value):
-                                    all_tables.append([date, description, clean_value])
-                                    logger.info(f"Página {page_num}: Linha quebrada (desc+data) extraída: {date} | {description[:30]}... | {clean_value}")
-                                    i += 1  # Pular a próxima linha (data+valor)
-            
-            i += 1
+                    if filtered_table:
+                        all_tables.extend(filtered_table)
+                        logger.debug(f"Página {page_num}: {len(filtered_table)} linhas extraídas")
+        
+        # Se não encontrou tabelas, tentar extrair texto e procurar padrões
+        if not tables or not any(tables):
+            logger.debug(f"Página {page_num}: Tentando extrair texto para encontrar padrões")
+            text = page.extract_text()
+            if text:
+                lines = text.split('\n')
+                if bank_format is None:
+                    # Detectar o formato pelo padrão de data
+                    bank_format = detect_format(text)
+                    logger.debug(f"Página {page_num}: Detectado formato {bank_format.label}")
+                
+                logger.debug(f"Página {page_num}: Extraindo padrões {bank_format.label}")
+                self.extract_format_patterns(bank_format, lines, page_num, all_tables)
+    
+    def extract_format_patterns(self, bank_format, lines, page_num, all_tables):
+        """Extrai as transações das linhas de texto com as regras do formato"""
+        every = self.row_log_interval()
+        for rule, date, description, value in bank_format.parse_lines(lines, self.is_valid_transaction):
+            all_tables.append(Transaction(date, description, value))
+            if every:
+                self.row_log_counter += 1
+            if every and self.row_log_counter % every == 0:
+                logger.debug(f"Página {page_num}: {bank_format.label} ({rule.name}): "
+                             f"{date} | {description[:30]}... | {value}")
+    
+    def is_valid_transaction(self, date, value):
+        """Mesma validação de is_valid_date e is_valid_value, sem as chamadas intermediárias"""
+        return (DATE_PATTERN.fullmatch(date.strip()) is not None
+                and VALUE_PATTERN.fullmatch(VALUE_NOISE.sub('', value.strip())) is not None)
     
     def clean_and_validate_data(self, tables):
         """
         Limpa e valida os dados extraídos
         """
-        cleaned_data = []
+        cleaned_data = list(self.iter_valid_rows(tables))
         
-        for row in tables:
-            if len(row) >= 3:
+        logger.info(f"Dados válidos após limpeza: {len(cleaned_data)}")
+        return cleaned_data
+    
+    def iter_valid_rows(self, rows, max_rows=None):
+        """
+        Filtra as linhas extraídas sob demanda, em lotes, mantendo apenas data e valor válidos.
+        Com max_rows, para ao atingir o limite e encerra a extração das páginas restantes.
+        """
+        self.rows_valid = 0
+        rows = iter(rows)
+        
+        try:
+            while max_rows is None or self.rows_valid < max_rows:
+                # Perto do limite o lote diminui: nenhuma página além da necessária é extraída
+                batch_size = VALIDATION_BATCH_SIZE
+                if max_rows is not None:
+                    batch_size = min(batch_size, max_rows - self.rows_valid)
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                
+                started = time.perf_counter()
+                valid_rows = self.filter_valid_rows(batch)
+                self.timings['validate'] += time.perf_counter() - started
+                self.rows_valid += len(valid_rows)
+                yield from valid_rows
+            else:
+                # Limite atingido: o resultado só foi cortado se existir mais uma linha válida
+                # (um documento com exatamente max_rows linhas não é marcado). Só as linhas já
+                # extraídas da página/faixa atual são verificadas; se não houver nenhuma válida
+                # e ainda restarem páginas, o limite é marcado sem extraí-las
+                if self.filter_valid_rows(list(self.pending_rows)) or self.pages_processed < self.pages_selected:
+                    self.row_limit_reached = True
+                    logger.info(f"Limite de {max_rows} linhas atingido: extração encerrada")
+        finally:
+            close = getattr(rows, 'close', None)
+            if close is not None:
+                close()
+    
+    def filter_valid_rows(self, rows):
+        """
+        Valida um lote de linhas de uma vez com os padrões pré-compilados.
+        Linhas já validadas na extração (Transaction) não são verificadas de novo.
+        """
+        date_match = DATE_PATTERN.fullmatch
+        value_match = VALUE_PATTERN.fullmatch
+        strip_value = VALUE_NOISE.sub
+        
+        valid_rows = []
+        for row in rows:
+            if type(row) is Transaction:
+                valid_rows.append(row)
+            elif len(row) >= 3:
                 data, movimentacoes, valor = row[0], row[1], row[2]
                 
-                # Validar e limpar data
-                if self.is_valid_date(data):
-                    # Validar e limpar valor
-                    if self.is_valid_value(valor):
-                        cleaned_data.append([data, movimentacoes, valor])
+                # Validar data e valor
+                if (data and valor and date_match(data.strip())
+                        and value_match(strip_value('', valor.strip()))):
+                    valid_rows.append(Transaction(data, movimentacoes, valor))
         
-        logger.info(f"Dados válidos após limpeza: {len(cleaned_data)}")
-        return cleaned_data
+        return valid_rows
     
     def is_valid_date(self, date_str):
         """
@@ -235,21 +669,7 @@ class PDFToXLSMConverter:
         if not date_str:
             return False
         
-        # Padrões de data aceitos
-        date_patterns = [
-            r'^\d{1,2}/\d{1,2}/\d{4}$',  # DD/MM/YYYY
-            r'^\d{1,2}-\d{1,2}-\d{4}$',  # DD-MM-YYYY
-            r'^\d{4}-\d{1,2}-\d{1,2}$',  # YYYY-MM-DD
-            r'^\d{1,2}\.\d{1,2}\.\d{4}$',  # DD.MM.YYYY
-            r'^\d{1,2}/\d{1,2}/\d{2}$',   # DD/MM/YY
-            r'^\d{1,2}-\d{1,2}-\d{2}$',   # DD-MM-YY
-        ]
-        
-        for pattern in date_patterns:
-            if re.match(pattern, date_str.strip()):
-                return True
-        
-        return False
+        return DATE_PATTERN.fullmatch(date_str.strip()) is not None
     
     def is_valid_value(self, value_str):
         """
@@ -259,198 +679,267 @@ class PDFToXLSMConverter:
             return False
         
         # Remove espaços e caracteres especiais
-        cleaned_value = re.sub(r'[^\d,.-]', '', value_str.strip())
-        
-        # Padrões de valor aceitos
-        value_patterns = [
-            r'^-?\d{1,3}(\.\d{3})*,\d{2}$',  # R$ 1.000,00
-            r'^-?\d+,\d{2}$',                 # 100,00
-            r'^-?\d+\.\d{2}$',                # 100.00
-            r'^-?\d+$',                       # 100
-            r'^-?\d{1,3}(,\d{3})*\.\d{2}$',  # 1,000.00
-            r'^-?\d{1,3}(\.\d{3})*$',        # 1.000
-        ]
-        
-        for pattern in value_patterns:
-            if re.match(pattern, cleaned_value):
-                return True
+        cleaned_value = VALUE_NOISE.sub('', value_str.strip())
         
-        return False
+        return VALUE_PATTERN.fullmatch(cleaned_value) is not None
     
-    def convert_to_xlsm_format(self, cleaned_data):
-        """
-        Converte os dados para o formato XLSM com as colunas especificadas
-        """
-        # Definir as colunas conforme especificado
-        columns = [
-            'Data',
-            'Cód. Conta Debito',
-            'Cód. Conta Credito', 
-            'Valor',
-            'Cód. Histórico',
-            'Complemento Histórico',
-            'Inicia Lote',
-            'Código Matriz/Filial',
-            'Centro de Custo Débito',
-            'Centro de Custo Crédito'
-        ]
-        
-        # Criar DataFrame com as colunas vazias
-        df_data = []
-        
-        for row in cleaned_data:
-            data, movimentacoes, valor = row
-            
-            # Criar linha com as colunas especificadas
-            new_row = [
-                data,                    # Data
-                '',                      # Cód. Conta Debito (vazio)
-                '',                      # Cód. Conta Credito (vazio)
-                valor,                   # Valor
-                '',                      # Cód. Histórico (vazio)
-                movimentacoes,           # Complemento Histórico
-                '',                      # Inicia Lote (vazio)
-                '',                      # Código Matriz/Filial (vazio)
-                '',                      # Centro de Custo Débito (vazio)
-                ''                       # Centro de Custo Crédito (vazio)
-            ]
-            df_data.append(new_row)
-        
-        df = pd.DataFrame(df_data, columns=columns)
-        logger.info(f"DataFrame criado com {len(df)} linhas e {len(columns)} colunas")
-        
-        return df
+    def convert_to_xlsm_format(self, cleaned_data, as_dataframe=False):
+        """
+        Converte os dados para o formato XLSM com as colunas especificadas.
+        Retorna uma TransactionTable (colunas compactas, sem pandas); com
+        as_dataframe=True retorna um DataFrame do pandas.
+        """
+        started = time.perf_counter()
+        table = TransactionTable(cleaned_data)
+        result = table.to_dataframe() if as_dataframe else table
+        self.timings['table'] += time.perf_counter() - started
+        logger.info(f"Tabela criada com {len(table)} linhas e {len(XLSM_COLUMNS)} colunas")
+        
+        return result
+    
+    def iter_xlsm_rows(self, cleaned_rows):
+        """
+        Gera as linhas no layout de 10 colunas do XLSM a partir das linhas válidas
+        """
+        for data, movimentacoes, valor in cleaned_rows:
+            yield xlsm_row(data, movimentacoes, valor)
+    
+    def stream_conversion_rows(self, pdf_path, pages=None, max_rows=None):
+        """
+        Pipeline em streaming: páginas -> linhas válidas -> linhas no layout XLSM.
+        - pages: seleção de páginas (ver parse_page_ranges)
+        - max_rows: limite de linhas válidas; a extração para assim que ele é atingido
+        Falha antes de qualquer escrita se o PDF não tiver dados válidos.
+        """
+        max_rows = validate_max_rows(max_rows)
+        valid_rows = self.iter_valid_rows(self.iter_rows_from_pdf(pdf_path, pages), max_rows)
+        
+        first_row = next(valid_rows, None)
+        if first_row is None:
+            if not self.rows_extracted:
+                raise ValueError("Nenhuma tabela válida encontrada no PDF")
+            raise ValueError("Nenhum dado válido encontrado após limpeza")
+        
+        return self.iter_xlsm_rows(chain([first_row], valid_rows))
+    
+    def iter_output_rows(self, df):
+        """
+        Retorna as linhas de um DataFrame ou de um iterável de linhas já no layout XLSM
+        """
+        # Sem o pandas carregado o objeto não pode ser um DataFrame
+        pd = sys.modules.get('pandas')
+        if pd is not None and isinstance(df, pd.DataFrame):
+            return df.itertuples(index=False, name=None)
+        
+        if df is None or isinstance(df, (str, bytes)) or not hasattr(df, '__iter__'):
+            logger.error(f"Erro: df não é um DataFrame nem um iterável de linhas, é {type(df)}")
+            raise ValueError(f"Parâmetro df deve ser um DataFrame ou um iterável de linhas, recebido: {type(df)}")
+        
+        return iter(df)
     
     def save_to_xlsm(self, df, output_path):
         """
-        Salva o DataFrame como arquivo XLSM com formatação idêntica ao arquivo de referência
+        Salva o DataFrame (ou as linhas geradas pelo pipeline) como arquivo XLSM
+        com formatação idêntica ao arquivo de referência
         """
         try:
-            # Verificar se df é um DataFrame
-            if not isinstance(df, pd.DataFrame):
-                logger.error(f"Erro: df não é um DataFrame, é {type(df)}")
-                raise ValueError(f"Parâmetro df deve ser um DataFrame, recebido: {type(df)}")
+            rows = self.iter_output_rows(df)
             
-            logger.info(f"Salvando DataFrame com {len(df)} linhas e {len(df.columns)} colunas")
             # Criar diretório se não existir
             output_dir = Path(output_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Larguras das colunas do arquivo de referência
-            reference_column_widths = {
-                'A': 10.7109375,   # Data
-                'B': 17.28515625,  # Cód. Conta Debito
-                'C': 17.85546875,  # Cód. Conta Credito
-                'D': 10.28515625,  # Valor
-                'E': 13.42578125,  # Cód. Histórico
-                'F': 80.7109375,   # Complemento Histórico
-                'G': 17.140625,    # Inicia Lote
-                'H': 18.5703125,   # Código Matriz/Filial
-                'I': 22.0,         # Centro de Custo Débito
-                'J': 22.5703125,   # Centro de Custo Crédito
-                'K': 3.28515625,   # (vazio)
-                'L': 95.7109375    # Instruções
-            }
-            
-            # Salvar como XLSM
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # Criar planilha vazia primeiro
-                worksheet = writer.book.create_sheet('Dados')
-                
-                # Adicionar linhas vazias no início (como no arquivo de referência)
-                for row in range(1, 5):
-                    for col in range(1, 13):
-                        worksheet.cell(row=row, column=col, value="")
-                
-                # Adicionar cabeçalhos na linha 5
-                headers = ['Data', 'Cód. Conta Debito', 'Cód. Conta Credito', 'Valor', 
-                          'Cód. Histórico', 'Complemento Histórico', 'Inicia Lote', 
-                          'Código Matriz/Filial', 'Centro de Custo Débito', 'Centro de Custo Crédito', '', '']
-                
-                for col, header in enumerate(headers, 1):
-                    worksheet.cell(row=5, column=col, value=header)
-                
-                # Adicionar dados a partir da linha 6
-                for row_idx, row_data in enumerate(df.values, 6):
-                    for col_idx, value in enumerate(row_data, 1):
-                        worksheet.cell(row=row_idx, column=col_idx, value=value)
-                
-                # Aplicar larguras das colunas do arquivo de referência
-                for col_letter, width in reference_column_widths.items():
-                    worksheet.column_dimensions[col_letter].width = width
-                
-                # Aplicar formatação das células
-                from openpyxl.styles import Font, Alignment, Border, Side
-                
-                # Formatação para cabeçalhos (linha 5)
-                header_font = Font(name='Calibri', size=11, bold=True)
-                header_alignment = Alignment(horizontal='center', vertical='center')
-                
-                for col in range(1, 11):  # Apenas as 10 primeiras colunas
-                    cell = worksheet.cell(row=5, column=col)
-                    cell.font = header_font
-                    cell.alignment = header_alignment
-                
-                # Formatação para dados
-                data_font = Font(name='Calibri', size=11)
-                data_alignment = Alignment(horizontal='left', vertical='center')
-                
-                for row in range(6, worksheet.max_row + 1):
-                    for col in range(1, 11):  # Apenas as 10 primeiras colunas
-                        cell = worksheet.cell(row=row, column=col)
-                        cell.font = data_font
-                        cell.alignment = data_alignment
-                
-                # Aplicar bordas
-                thin_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                
-                for row in range(5, worksheet.max_row + 1):
-                    for col in range(1, 11):
-                        worksheet.cell(row=row, column=col).border = thin_border
-                
-                # Definir altura da linha dos cabeçalhos
-                worksheet.row_dimensions[5].height = 31.5
-                
-                # Remover a planilha padrão se existir
-                if 'Sheet' in writer.book.sheetnames:
-                    del writer.book['Sheet']
+            row_count = self.write_xlsm(rows, output_path)
             
-            logger.info(f"Arquivo XLSM salvo em: {output_path}")
+            logger.info(f"Arquivo XLSM salvo em: {output_path} ({row_count} linhas)")
             return True
             
         except Exception as e:
             logger.error(f"Erro ao salvar arquivo XLSM: {str(e)}")
             raise
     
-    def convert_pdf_to_xlsm(self, pdf_path, output_path):
+    def write_xlsm(self, rows, output):
+        """
+        Escreve as linhas no layout do arquivo de referência em um caminho ou buffer.
+        Retorna o número de linhas de dados escritas.
         """
-        Função principal para converter PDF para XLSM
+        return self.write_xlsm_sheets([('Dados', rows)], output)
+    
+    def write_xlsm_sheets(self, sheets, output):
+        """
+        Escreve um workbook com uma planilha no layout de referência para cada (título, linhas).
+        Retorna o total de linhas de dados escritas.
+        """
+        with self.timed_write():
+            if self.engine == 'xml':
+                row_count = self.write_xlsm_direct(sheets, output)
+            else:
+                from openpyxl import Workbook
+                
+                # Workbook write-only: cada linha é serializada uma única vez, já formatada
+                workbook = Workbook(write_only=True)
+                self.register_xlsm_styles(workbook)
+                
+                row_count = sum(self.write_xlsm_sheet(workbook, title, rows) for title, rows in sheets)
+                self.report_progress('write', rows=row_count)
+                workbook.save(output)
+        
+        self.report_progress('done', rows=row_count)
+        return row_count
+    
+    @contextmanager
+    def timed_write(self):
+        """
+        Soma o tempo do bloco à etapa de escrita. As linhas podem vir do pipeline em
+        streaming: o tempo de extração e validação gasto dentro do bloco é descontado.
+        """
+        started = time.perf_counter()
+        upstream = self.timings['open'] + self.timings['extract'] + self.timings['validate']
+        try:
+            yield
+        finally:
+            upstream = self.timings['open'] + self.timings['extract'] + self.timings['validate'] - upstream
+            self.timings['write'] += time.perf_counter() - started - upstream
+    
+    def iter_output_chunks(self, rows, output_format):
+        """
+        Gera os blocos de bytes de um formato em streaming (CSV ou JSON Lines) a partir
+        das linhas no layout XLSM, consumindo-as sob demanda
+        """
+        self.rows_written = 0
+        
+        def counted(rows):
+            for row in rows:
+                self.rows_written += 1
+                yield row
+        
+        chunks = CHUNK_WRITERS[output_format](counted(self.iter_output_rows(rows)), XLSM_COLUMNS)
+        self.report_progress('write', rows=self.rows_valid)
+        
+        while True:
+            # Só o tempo gerando o bloco: o envio/gravação de cada bloco fica de fora
+            with self.timed_write():
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+        
+        self.report_progress('done', rows=self.rows_written)
+    
+    def write_output(self, rows, output, output_format='xlsm'):
+        """
+        Escreve as linhas no formato pedido (xlsm, csv, jsonl ou parquet) em um caminho
+        ou buffer. Retorna o número de linhas de dados escritas.
+        """
+        if output_format == 'xlsm':
+            return self.write_xlsm(rows, output)
+        
+        check_output_format(output_format)
+        if output_format == 'parquet':
+            with self.timed_write():
+                row_count = write_parquet(self.iter_output_rows(rows), XLSM_COLUMNS, output)
+            self.report_progress('done', rows=row_count)
+            return row_count
+        
+        if isinstance(output, (str, Path)):
+            with open(output, 'wb') as output_file:
+                return self.write_output(rows, output_file, output_format)
+        
+        for chunk in self.iter_output_chunks(rows, output_format):
+            output.write(chunk)
+        return self.rows_written
+    
+    def write_xlsm_direct(self, sheets, output):
+        """
+        Escreve o XLSM gerando o XML das planilhas direto no zip, sem objetos do openpyxl.
+        Retorna o total de linhas de dados escritas.
+        """
+        from xlsx_writer import XLSXStreamWriter
+        
+        with XLSXStreamWriter(output, XLSM_COLUMNS, REFERENCE_COLUMN_WIDTHS,
+                              header_style_name=HEADER_STYLE, data_style_name=DATA_STYLE) as writer:
+            row_count = sum(writer.add_sheet(title, rows) for title, rows in sheets)
+            self.report_progress('write', rows=row_count)
+        
+        return row_count
+    
+    def register_xlsm_styles(self, workbook):
+        """
+        Registra no workbook os estilos nomeados do cabeçalho e dos dados
+        """
+        from openpyxl.styles import NamedStyle, Font, Alignment, Border, Side
+        
+        thin_border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+        
+        # Formatação para cabeçalhos (linha 5)
+        workbook.add_named_style(NamedStyle(
+            name=HEADER_STYLE,
+            font=Font(name='Calibri', size=11, bold=True),
+            alignment=Alignment(horizontal='center', vertical='center'),
+            border=thin_border
+        ))
+        
+        # Formatação para dados
+        workbook.add_named_style(NamedStyle(
+            name=DATA_STYLE,
+            font=Font(name='Calibri', size=11),
+            alignment=Alignment(horizontal='left', vertical='center'),
+            border=thin_border
+        ))
+    
+    def write_xlsm_sheet(self, workbook, title, rows):
+        """
+        Cria uma planilha write-only no layout de referência e escreve as linhas.
+        Retorna o número de linhas de dados escritas.
+        """
+        from openpyxl.cell import WriteOnlyCell
+        
+        worksheet = workbook.create_sheet(title)
+        
+        # Larguras e altura do cabeçalho precisam ser definidas antes das linhas
+        for col_letter, width in REFERENCE_COLUMN_WIDTHS.items():
+            worksheet.column_dimensions[col_letter].width = width
+        worksheet.row_dimensions[5].height = 31.5
+        
+        def styled_cell(value, style):
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.style = style
+            return cell
+        
+        # Adicionar linhas vazias no início (como no arquivo de referência)
+        for _ in range(4):
+            worksheet.append([''] * 12)
+        
+        # Adicionar cabeçalhos na linha 5 (apenas as 10 primeiras colunas formatadas)
+        worksheet.append([styled_cell(header, HEADER_STYLE) for header in XLSM_COLUMNS] + ['', ''])
+        
+        # Adicionar dados a partir da linha 6, consumindo as linhas sob demanda
+        row_count = 0
+        for row_data in rows:
+            worksheet.append([styled_cell(value, DATA_STYLE) for value in row_data])
+            row_count += 1
+        
+        return row_count
+    
+    def convert_pdf_to_xlsm(self, pdf_path, output_path, pages=None, max_rows=None):
+        """
+        Função principal para converter PDF para XLSM.
+        pages seleciona as páginas (ex.: '1-3,8' ou 'r3-z') e max_rows limita as linhas
+        convertidas, encerrando a extração ao atingir o limite.
         """
         try:
             logger.info(f"Iniciando conversão: {pdf_path} -> {output_path}")
             
-            # 1. Extrair tabelas do PDF
-            tables = self.extract_tables_from_pdf(pdf_path)
-            
-            if not tables:
-                raise ValueError("Nenhuma tabela válida encontrada no PDF")
-            
-            # 2. Limpar e validar dados
-            cleaned_data = self.clean_and_validate_data(tables)
+            # 1-3. Extrair, validar e converter as linhas sob demanda
+            rows = self.stream_conversion_rows(pdf_path, pages, max_rows)
             
-            if not cleaned_data:
-                raise ValueError("Nenhum dado válido encontrado após limpeza")
-            
-            # 3. Converter para formato XLSM
-            df = self.convert_to_xlsm_format(cleaned_data)
-            
-            # 4. Salvar arquivo XLSM
-            self.save_to_xlsm(df, output_path)
+            # 4. Salvar arquivo XLSM consumindo o pipeline
+            self.save_to_xlsm(rows, output_path)
             
             logger.info("Conversão concluída com sucesso!")
             return True
@@ -459,357 +948,318 @@ class PDFToXLSMConverter:
             logger.error(f"Erro na conversão: {str(e)}")
             raise
 
-    def convert_pdf_to_xlsm_in_memory(self, pdf_file):
+    def convert_pdf_to_xlsm_in_memory(self, pdf_file, pages=None, max_rows=None):
         """
-        Converte PDF para XLSM em memória e retorna os dados do arquivo
+        Converte PDF para XLSM em memória e retorna os dados do arquivo.
+        O PDF é lido direto do buffer (bytes, BytesIO, mmap ou FileStorage), sem arquivo temporário.
+        pages e max_rows funcionam como em convert_pdf_to_xlsm.
         """
-        import io
-        import tempfile
-        
         try:
             logger.info("Iniciando conversão em memória")
             logger.info(f"Tipo do arquivo: {type(pdf_file)}")
-            logger.info(f"Arquivo tem método read: {hasattr(pdf_file, 'read')}")
             
-            # Salvar arquivo temporário para processamento
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                # Se for um BytesIO, escrever os dados diretamente
-                if hasattr(pdf_file, 'read'):
-                    logger.info("Processando como BytesIO")
-                    pdf_file.seek(0)  # Voltar ao início
-                    file_data = pdf_file.read()  # Ler uma vez só
-                    logger.info(f"Dados lidos: {len(file_data)} bytes")
-                    temp_file.write(file_data)
-                else:
-                    logger.info("Processando como Flask FileStorage")
-                    # Se for um objeto Flask FileStorage
-                    pdf_file.save(temp_file.name)
-                temp_path = temp_file.name
-                logger.info(f"Arquivo temporário criado: {temp_path}")
+            # 1-3. Extrair, validar e converter as linhas sob demanda
+            rows = self.stream_conversion_rows(pdf_file, pages, max_rows)
             
-            try:
-                # 1. Extrair tabelas do PDF
-                tables = self.extract_tables_from_pdf(temp_path)
-                
-                if not tables:
-                    raise ValueError("Nenhuma tabela válida encontrada no PDF")
-                
-                # 2. Limpar e validar dados
-                cleaned_data = self.clean_and_validate_data(tables)
-                
-                if not cleaned_data:
-                    raise ValueError("Nenhum dado válido encontrado após limpeza")
-                
-                # 3. Converter para formato XLSM
-                df = self.convert_to_xlsm_format(cleaned_data)
-                
-                # 4. Criar XLSM em memória
-                xlsm_data = self.create_xlsm_in_memory(df)
-                
-                logger.info("Conversão em memória concluída com sucesso!")
-                return xlsm_data
-                
-            finally:
-                # Limpar arquivo temporário
-                os.unlink(temp_path)
+            # 4. Criar XLSM em memória consumindo o pipeline
+            xlsm_data = self.create_xlsm_in_memory(rows)
+            
+            logger.info("Conversão em memória concluída com sucesso!")
+            return xlsm_data
                 
         except Exception as e:
             logger.error(f"Erro na conversão em memória: {str(e)}")
             raise
 
-    def create_xlsm_in_memory(self, df):
+    def convert_pdf(self, pdf_path, output_path, output_format=None, pages=None, max_rows=None):
         """
-        Cria arquivo XLSM em memória e retorna os dados
+        Converte o PDF para o formato pedido (xlsm, csv, jsonl ou parquet); sem formato,
+        ele é escolhido pela extensão do arquivo de saída.
         """
-        import io
+        output_format = output_format or format_for_path(output_path)
+        if output_format == 'xlsm':
+            return self.convert_pdf_to_xlsm(pdf_path, output_path, pages, max_rows)
         
         try:
-            # Verificar se df é um DataFrame
-            if not isinstance(df, pd.DataFrame):
-                logger.error(f"Erro: df não é um DataFrame, é {type(df)}")
-                raise ValueError(f"Parâmetro df deve ser um DataFrame, recebido: {type(df)}")
+            check_output_format(output_format)
+            logger.info(f"Iniciando conversão ({output_format}): {pdf_path} -> {output_path}")
             
-            logger.info(f"Criando XLSM em memória com {len(df)} linhas e {len(df.columns)} colunas")
+            rows = self.stream_conversion_rows(pdf_path, pages, max_rows)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            row_count = self.write_output(rows, output_path, output_format)
             
-            # Criar buffer em memória
-            output = io.BytesIO()
-            
-            # Larguras das colunas do arquivo de referência
-            reference_column_widths = {
-                'A': 10.7109375,   # Data
-                'B': 17.28515625,  # Cód. Conta Debito
-                'C': 17.85546875,  # Cód. Conta Credito
-                'D': 10.28515625,  # Valor
-                'E': 13.42578125,  # Cód. Histórico
-                'F': 80.7109375,   # Complemento Histórico
-                'G': 17.140625,    # Inicia Lote
-                'H': 18.5703125,   # Código Matriz/Filial
-                'I': 22.0,         # Centro de Custo Débito
-                'J': 22.5703125,   # Centro de Custo Crédito
-                'K': 3.28515625,   # (vazio)
-                'L': 95.7109375    # Instruções
-            }
-            
-            # Salvar como XLSM em memória
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                # Criar planilha vazia primeiro
-                worksheet = writer.book.create_sheet('Dados')
-                
-                # Adicionar linhas vazias no início (como no arquivo de referência)
-                for row in range(1, 5):
-                    for col in range(1, 13):
-                        worksheet.cell(row=row, column=col, value="")
-                
-                # Adicionar cabeçalhos na linha 5
-                headers = ['Data', 'Cód. Conta Debito', 'Cód. Conta Credito', 'Valor', 
-                          'Cód. Histórico', 'Complemento Histórico', 'Inicia Lote', 
-                          'Código Matriz/Filial', 'Centro de Custo Débito', 'Centro de Custo Crédito', '', '']
-                
-                for col, header in enumerate(headers, 1):
-                    worksheet.cell(row=5, column=col, value=header)
-                
-                # Adicionar dados a partir da linha 6
-                for row_idx, row_data in enumerate(df.values, 6):
-                    for col_idx, value in enumerate(row_data, 1):
-                        worksheet.cell(row=row_idx, column=col_idx, value=value)
-                
-                # Aplicar larguras das colunas do arquivo de referência
-                for col_letter, width in reference_column_widths.items():
-                    worksheet.column_dimensions[col_letter].width = width
-                
-                # Aplicar formatação das células
-                from openpyxl.styles import Font, Alignment, Border, Side
-                
-                # Formatação para cabeçalhos (linha 5)
-                header_font = Font(name='Calibri', size=11, bold=True)
-                header_alignment = Alignment(horizontal='center', vertical='center')
-                
-                for col in range(1, 11):  # Apenas as 10 primeiras colunas
-                    cell = worksheet.cell(row=5, column=col)
-                    cell.font = header_font
-                    cell.alignment = header_alignment
-                
-                # Formatação para dados
-                data_font = Font(name='Calibri', size=11)
-                data_alignment = Alignment(horizontal='left', vertical='center')
-                
-                for row in range(6, worksheet.max_row + 1):
-                    for col in range(1, 11):  # Apenas as 10 primeiras colunas
-                        cell = worksheet.cell(row=row, column=col)
-                        cell.font = data_font
-                        cell.alignment = data_alignment
-                
-                # Aplicar bordas
-                thin_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                
-                for row in range(5, worksheet.max_row + 1):
-                    for col in range(1, 11):
-                        worksheet.cell(row=row, column=col).border = thin_border
-                
-                # Definir altura da linha dos cabeçalhos
-                worksheet.row_dimensions[5].height = 31.5
-                
-                # Remover a planilha padrão se existir
-                if 'Sheet' in writer.book.sheetnames:
-                    del writer.book['Sheet']
-            
-            # Retornar dados do buffer
-            output.seek(0)
-            return output.getvalue()
+            logger.info(f"Arquivo {output_format} salvo em: {output_path} ({row_count} linhas)")
+            return True
             
         except Exception as e:
-            logger.error(f"Erro ao criar XLSM em memória: {str(e)}")
+            logger.error(f"Erro na conversão: {str(e)}")
             raise
-
-
-class PDFConverterGUI:
-    def __init__(self):
-        self.converter = PDFToXLSMConverter()
-        self.setup_gui()
-    
-    def setup_gui(self):
-        """
-        Configura a interface gráfica
-        """
-        self.root = tk.Tk()
-        self.root.title("Conversor PDF para XLSM")
-        self.root.geometry("600x400")
-        self.root.resizable(True, True)
-        
-        # Configurar estilo
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Frame principal
-        main_frame = ttk.Frame(self.root, padding="20")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Configurar grid
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        
-        # Título
-        title_label = ttk.Label(main_frame, text="Conversor PDF para XLSM", 
-                               font=('Arial', 16, 'bold'))
-        title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
-        
-        # Seleção de arquivo PDF
-        ttk.Label(main_frame, text="Arquivo PDF:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.pdf_path_var = tk.StringVar()
-        pdf_entry = ttk.Entry(main_frame, textvariable=self.pdf_path_var, width=50)
-        pdf_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=5)
-        
-        pdf_button = ttk.Button(main_frame, text="Selecionar PDF", 
-                               command=self.select_pdf_file)
-        pdf_button.grid(row=1, column=2, padx=(5, 0), pady=5)
-        
-        # Seleção de arquivo de saída
-        ttk.Label(main_frame, text="Arquivo de saída:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.output_path_var = tk.StringVar()
-        output_entry = ttk.Entry(main_frame, textvariable=self.output_path_var, width=50)
-        output_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=5)
-        
-        output_button = ttk.Button(main_frame, text="Selecionar destino", 
-                                  command=self.select_output_file)
-        output_button.grid(row=2, column=2, padx=(5, 0), pady=5)
-        
-        # Botão de conversão
-        convert_button = ttk.Button(main_frame, text="Converter PDF para XLSM", 
-                                   command=self.convert_file, style='Accent.TButton')
-        convert_button.grid(row=3, column=0, columnspan=3, pady=20)
-        
-        # Barra de progresso
-        self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(main_frame, variable=self.progress_var, 
-                                           maximum=100, length=400)
-        self.progress_bar.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
-        
-        # Área de log
-        ttk.Label(main_frame, text="Log de operações:").grid(row=5, column=0, sticky=tk.W, pady=(20, 5))
-        
-        # Frame para o log
-        log_frame = ttk.Frame(main_frame)
-        log_frame.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
-        log_frame.columnconfigure(0, weight=1)
-        log_frame.rowconfigure(0, weight=1)
-        
-        # Text widget para log
-        self.log_text = tk.Text(log_frame, height=10, wrap=tk.WORD)
-        scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
-        self.log_text.configure(yscrollcommand=scrollbar.set)
-        
-        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        
-        # Configurar peso das linhas
-        main_frame.rowconfigure(6, weight=1)
-        
-        # Informações sobre o conversor
-        info_text = """
-        Este conversor extrai tabelas de arquivos PDF com 3 colunas (Data, Movimentações, Valor)
-        e converte para formato XLSM com as colunas especificadas.
-        
-        Colunas de saída:
-        • Data → Data
-        • Movimentações → Complemento Histórico  
-        • Valor → Valor
-        • Colunas adicionais ficam vazias conforme especificado
-        """
-        
-        info_label = ttk.Label(main_frame, text=info_text, font=('Arial', 9), 
-                              foreground='gray', justify=tk.LEFT)
-        info_label.grid(row=7, column=0, columnspan=3, pady=(20, 0), sticky=tk.W)
     
-    def log_message(self, message):
+    def convert_pdf_in_memory(self, pdf_file, output_format='xlsm', pages=None, max_rows=None):
         """
-        Adiciona mensagem ao log da interface
+        Converte o PDF em memória para o formato pedido e retorna os bytes do resultado
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
-    
-    def select_pdf_file(self):
-        """
-        Seleciona arquivo PDF
-        """
-        file_path = filedialog.askopenfilename(
-            title="Selecionar arquivo PDF",
-            filetypes=[("Arquivos PDF", "*.pdf"), ("Todos os arquivos", "*.*")]
-        )
+        if output_format == 'xlsm':
+            return self.convert_pdf_to_xlsm_in_memory(pdf_file, pages, max_rows)
         
-        if file_path:
-            self.pdf_path_var.set(file_path)
-            # Sugerir nome do arquivo de saída
-            pdf_path = Path(file_path)
-            output_path = pdf_path.parent / f"{pdf_path.stem}_convertido.xlsm"
-            self.output_path_var.set(str(output_path))
-            self.log_message(f"PDF selecionado: {file_path}")
+        try:
+            check_output_format(output_format)
+            logger.info(f"Iniciando conversão em memória ({output_format})")
+            
+            rows = self.stream_conversion_rows(pdf_file, pages, max_rows)
+            output = io.BytesIO()
+            row_count = self.write_output(rows, output, output_format)
+            
+            logger.info(f"{output_format} criado em memória com {row_count} linhas")
+            return output.getvalue()
+            
+        except Exception as e:
+            logger.error(f"Erro na conversão em memória: {str(e)}")
+            raise
     
-    def select_output_file(self):
+    def stream_pdf_conversion(self, pdf_file, output_format='csv', pages=None, max_rows=None):
         """
-        Seleciona arquivo de saída
+        Converte o PDF para CSV ou JSON Lines gerando blocos de bytes enquanto as páginas
+        são extraídas. Erros de validação (PDF sem dados válidos) são lançados aqui, antes
+        do primeiro bloco.
         """
-        file_path = filedialog.asksaveasfilename(
-            title="Salvar arquivo XLSM",
-            defaultextension=".xlsm",
-            filetypes=[("Arquivos Excel", "*.xlsm"), ("Todos os arquivos", "*.*")]
-        )
+        if output_format not in STREAMING_FORMATS:
+            raise ValueError(f"Formato sem streaming: {output_format}. Use um de: {', '.join(STREAMING_FORMATS)}")
         
-        if file_path:
-            self.output_path_var.set(file_path)
-            self.log_message(f"Arquivo de saída selecionado: {file_path}")
+        logger.info(f"Iniciando conversão em streaming ({output_format})")
+        rows = self.stream_conversion_rows(pdf_file, pages, max_rows)
+        return self.iter_output_chunks(rows, output_format)
     
-    def convert_file(self):
+    def create_xlsm_in_memory(self, df):
         """
-        Executa a conversão do arquivo
+        Cria arquivo XLSM em memória a partir de um DataFrame ou das linhas do pipeline
+        e retorna os dados
         """
-        pdf_path = self.pdf_path_var.get().strip()
-        output_path = self.output_path_var.get().strip()
-        
-        if not pdf_path:
-            messagebox.showerror("Erro", "Por favor, selecione um arquivo PDF")
-            return
-        
-        if not output_path:
-            messagebox.showerror("Erro", "Por favor, selecione um arquivo de saída")
-            return
-        
-        if not os.path.exists(pdf_path):
-            messagebox.showerror("Erro", "Arquivo PDF não encontrado")
-            return
-        
         try:
-            self.log_message("Iniciando conversão...")
-            self.progress_var.set(0)
+            rows = self.iter_output_rows(df)
             
-            # Executar conversão
-            success = self.converter.convert_pdf_to_xlsm(pdf_path, output_path)
+            # Criar buffer em memória
+            output = io.BytesIO()
+            
+            row_count = self.write_xlsm(rows, output)
+            logger.info(f"XLSM criado em memória com {row_count} linhas e {len(XLSM_COLUMNS)} colunas")
+            
+            # Retornar dados do buffer
+            return output.getvalue()
             
-            if success:
-                self.progress_var.set(100)
-                self.log_message("Conversão concluída com sucesso!")
-                messagebox.showinfo("Sucesso", f"Arquivo convertido com sucesso!\nSalvo em: {output_path}")
-            else:
-                self.log_message("Erro na conversão")
-                messagebox.showerror("Erro", "Falha na conversão do arquivo")
-                
         except Exception as e:
-            self.log_message(f"Erro: {str(e)}")
-            messagebox.showerror("Erro", f"Erro durante a conversão:\n{str(e)}")
-            self.progress_var.set(0)
+            logger.error(f"Erro ao criar XLSM em memória: {str(e)}")
+            raise
+
+def missing_dependencies():
+    """Dependências de conversão não instaladas (verificado sem importá-las)"""
+    return [name for name in CONVERSION_DEPENDENCIES if find_spec(name) is None]
+
+
+def as_pdf_input(pdf_source):
+    """
+    Normaliza a origem do PDF para o pdfplumber: caminhos são abertos pelo próprio
+    pdfplumber, bytes viram BytesIO e buffers (BytesIO, arquivo aberto, mmap,
+    FileStorage) são usados diretamente, sem cópia
+    """
+    if isinstance(pdf_source, (str, Path)):
+        return pdf_source
     
-    def run(self):
-        """
-        Inicia a interface gráfica
-        """
-        self.root.mainloop()
+    if isinstance(pdf_source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(pdf_source)
+    
+    # FileStorage do Flask: usar o stream interno
+    if hasattr(pdf_source, 'stream') and hasattr(pdf_source, 'save'):
+        pdf_source = pdf_source.stream
+    
+    if not hasattr(pdf_source, 'read') or not hasattr(pdf_source, 'seek'):
+        raise ValueError(f"Origem de PDF não suportada: {type(pdf_source)}")
+    
+    pdf_source.seek(0)  # Voltar ao início
+    return pdf_source
+
+
+def as_worker_input(pdf_source):
+    """
+    Converte a origem do PDF em algo que possa ser enviado aos processos do pool
+    (caminho ou bytes)
+    """
+    pdf_source = as_pdf_input(pdf_source)
+    
+    if isinstance(pdf_source, (str, Path)):
+        return pdf_source
+    
+    if isinstance(pdf_source, io.BytesIO):
+        return pdf_source.getvalue()
+    
+    pdf_source.seek(0)
+    return pdf_source.read()
+
+
+# Conversor e PDF em memória (se houver) usados pelos processos do pool de extração
+_worker_converter = None
+_worker_pdf_data = None
+
+
+def _init_extraction_worker(engine='openpyxl', row_log_every=None, pdf_data=None):
+    """
+    Inicializa o conversor de cada processo do pool de extração (ou do lote da linha de comando).
+    pdf_data: bytes do PDF em memória, recebidos uma única vez por processo
+    """
+    global _worker_converter, _worker_pdf_data
+    # Processos do pool encerram sem atexit: gravação direta no arquivo, sem fila
+    configure_file_logging(__name__, asynchronous=False)
+    _worker_converter = PDFToXLSMConverter(engine=engine, row_log_every=row_log_every)
+    _worker_pdf_data = pdf_data
+
+
+def _extract_pages(pdf_path, page_numbers, document_format=None):
+    """
+    Extrai as linhas de uma faixa de páginas (executado em processo separado).
+    pdf_path None usa o PDF em memória recebido na inicialização do processo.
+    Retorna (linhas, tempo de extração de cada página).
+    """
+    import pdfplumber
+    
+    rows = []
+    page_seconds = []
+    pdf_source = _worker_pdf_data if pdf_path is None else pdf_path
+    with pdfplumber.open(as_pdf_input(pdf_source), pages=page_numbers) as pdf:
+        for page in pdf.pages:
+            started = time.perf_counter()
+            _worker_converter.extract_rows_from_page(page, page.page_number, rows, document_format)
+            page_seconds.append(time.perf_counter() - started)
+    return rows, page_seconds
+
+
+def collect_pdf_paths(patterns):
+    """
+    Expande arquivos, diretórios (PDFs do diretório) e padrões glob na lista de PDFs,
+    sem repetições e na ordem informada
+    """
+    found = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(item for item in path.iterdir()
+                             if item.is_file() and item.suffix.lower() == '.pdf')
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = sorted(Path(item) for item in glob.glob(pattern, recursive=True)
+                             if Path(item).is_file() and Path(item).suffix.lower() == '.pdf')
+        
+        if not matches:
+            logger.warning(f"Nenhum PDF encontrado em: {pattern}")
+        for match in matches:
+            found.setdefault(match.resolve(), match)
+    
+    return list(found.values())
+
+
+def is_up_to_date(pdf_path, output_path):
+    """Verifica se a saída existe e é mais nova que o PDF"""
+    try:
+        return Path(output_path).stat().st_mtime >= Path(pdf_path).stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def convert_file(converter, pdf_path, output_path, pages=None, max_rows=None, output_format='xlsm'):
+    """
+    Converte um arquivo do lote e retorna o resumo {'pdf', 'output', 'pages', 'rows', 'seconds', 'error'}.
+    A saída é gravada em um arquivo temporário e renomeada, para que uma falha
+    não deixe um arquivo parcial considerado atualizado na próxima execução.
+    """
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(f".{output_path.stem}.parcial{output_path.suffix}")
+    result = {'pdf': str(pdf_path), 'output': str(output_path), 'pages': 0, 'rows': 0, 'error': None}
+    started = time.perf_counter()
+    
+    try:
+        converter.convert_pdf(pdf_path, temp_path, output_format, pages, max_rows)
+        os.replace(temp_path, output_path)
+        result['rows'] = converter.rows_valid
+    except Exception as e:
+        temp_path.unlink(missing_ok=True)
+        result['error'] = str(e)
+    
+    result['pages'] = getattr(converter, 'pages_processed', 0)
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def _convert_file_worker(pdf_path, output_path, pages=None, max_rows=None, output_format='xlsm'):
+    """Converte um arquivo do lote (executado em processo separado)"""
+    return convert_file(_worker_converter, pdf_path, output_path, pages, max_rows, output_format)
+
+
+def run_batch(patterns, output_dir, jobs=1, workers=1, engine='openpyxl', force=False, row_log_every=None,
+              pages=None, max_rows=None, output_format='xlsm'):
+    """
+    Modo lote da linha de comando: converte os PDFs encontrados em `patterns` para
+    `output_dir/<nome>.xlsm` (ou a extensão de output_format) em um pool de `jobs` processos,
+    pulando saídas atualizadas e continuando após falhas. pages e max_rows valem para todos os arquivos.
+    Imprime o resumo de vazão e retorna o número de erros.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    tasks, skipped, failures = [], 0, []
+    outputs = set()
+    for pdf_path in collect_pdf_paths(patterns):
+        output_path = output_dir / f"{pdf_path.stem}{OUTPUT_FORMATS[output_format][0]}"
+        if output_path in outputs:
+            failures.append({'pdf': str(pdf_path), 'error': f"saída repetida: {output_path}"})
+            continue
+        outputs.add(output_path)
+        
+        if not force and is_up_to_date(pdf_path, output_path):
+            skipped += 1
+            continue
+        tasks.append((pdf_path, output_path))
+    
+    print(f"{len(tasks)} arquivos para converter, {skipped} já atualizados")
+    
+    def report(index, result):
+        if result['error']:
+            failures.append(result)
+            print(f"[{index}/{len(tasks)}] ERRO {result['pdf']}: {result['error']}")
+        else:
+            print(f"[{index}/{len(tasks)}] {result['pdf']} -> {result['output']}: "
+                  f"{result['pages']} páginas, {result['rows']} linhas ({result['seconds']:.2f}s)")
+    
+    results = []
+    started = time.perf_counter()
+    jobs = max(1, min(jobs, len(tasks) or 1))
+    
+    if jobs == 1:
+        # Um único conversor: o custo de inicialização é pago uma vez para todo o lote
+        converter = PDFToXLSMConverter(workers=workers, engine=engine, row_log_every=row_log_every)
+        for index, (pdf_path, output_path) in enumerate(tasks, 1):
+            results.append(convert_file(converter, pdf_path, output_path, pages, max_rows, output_format))
+            report(index, results[-1])
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_extraction_worker,
+                                 initargs=(engine, row_log_every)) as executor:
+            futures = [executor.submit(_convert_file_worker, pdf_path, output_path, pages, max_rows, output_format)
+                       for pdf_path, output_path in tasks]
+            for index, future in enumerate(as_completed(futures), 1):
+                results.append(future.result())
+                report(index, results[-1])
+    
+    elapsed = time.perf_counter() - started
+    converted = [result for result in results if not result['error']]
+    pages = sum(result['pages'] for result in converted)
+    rows = sum(result['rows'] for result in converted)
+    
+    print(f"\nResumo: {len(converted)} convertidos, {skipped} já atualizados, {len(failures)} com erro "
+          f"em {elapsed:.2f}s ({jobs} processos)")
+    if elapsed > 0:
+        print(f"Vazão: {pages / elapsed:.1f} páginas/s, {rows / elapsed:.1f} linhas/s "
+              f"({pages} páginas, {rows} linhas)")
+    
+    return len(failures)
 
 
 def main():
@@ -820,15 +1270,72 @@ def main():
         # Verificar se está sendo executado como script
         if len(sys.argv) > 1:
             # Modo linha de comando
-            if len(sys.argv) != 3:
-                print("Uso: python pdf_to_xlsm_converter.py <arquivo_pdf> <arquivo_saida.xlsm>")
-                sys.exit(1)
+            parser = argparse.ArgumentParser(
+                prog="pdf_to_xlsm_converter.py",
+                description="Converte arquivos PDF com tabelas financeiras para XLSM",
+                epilog="Modo lote: pdf_to_xlsm_converter.py --output-dir saida/ extratos/ 'outros/*.pdf' --jobs 4"
+            )
+            parser.add_argument("paths", nargs='+', metavar="caminho",
+                                help="arquivo_pdf arquivo_saida (.xlsm, .csv, .jsonl ou .parquet; '-' envia CSV/JSON Lines "
+                                     "para a saída padrão); com --output-dir: PDFs, diretórios ou padrões glob")
+            parser.add_argument("-o", "--output-dir",
+                                help="Modo lote: diretório onde os XLSM serão gravados")
+            parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                                help="Modo lote: número de arquivos convertidos em paralelo (padrão: núcleos da CPU)")
+            parser.add_argument("--force", action="store_true",
+                                help="Modo lote: converter mesmo quando a saída é mais nova que o PDF")
+            parser.add_argument("--workers", type=int, default=1,
+                                help="Número de processos para extrair as páginas em paralelo (padrão: 1)")
+            parser.add_argument("--engine", choices=OUTPUT_ENGINES, default='openpyxl',
+                                help="Motor de escrita do XLSM (padrão: openpyxl)")
+            parser.add_argument("--format", dest="output_format", choices=list(OUTPUT_FORMATS),
+                                help="Formato de saída (padrão: pela extensão do arquivo de saída; xlsm no modo lote)")
+            parser.add_argument("--pages",
+                                help="Páginas convertidas, ex.: '1-3,8', '10-' ou 'r3-z' (as três últimas)")
+            parser.add_argument("--max-rows", type=int,
+                                help="Limite de linhas convertidas; a extração para ao atingi-lo")
+            parser.add_argument("--log-level", choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'), type=str.upper,
+                                help="Nível do log do conversor (padrão: CONVERTER_LOG_LEVEL ou INFO)")
+            parser.add_argument("--row-log-every", type=int,
+                                help="Com --log-level DEBUG: registra uma a cada N linhas extraídas (padrão: 0, desligado)")
+            args = parser.parse_args()
+            
+            if args.log_level:
+                logger.setLevel(args.log_level)
+            
+            try:
+                args.pages = parse_page_ranges(args.pages)
+                args.max_rows = validate_max_rows(args.max_rows)
+                if args.output_format:
+                    check_output_format(args.output_format)
+            except ValueError as e:
+                parser.error(str(e))
+            
+            if args.output_dir:
+                failures = run_batch(args.paths, args.output_dir, jobs=args.jobs, workers=args.workers,
+                                     engine=args.engine, force=args.force, row_log_every=args.row_log_every,
+                                     pages=args.pages, max_rows=args.max_rows,
+                                     output_format=args.output_format or 'xlsm')
+                sys.exit(1 if failures else 0)
+            
+            if len(args.paths) != 2:
+                parser.error("informe arquivo_pdf e arquivo_saida.xlsm (ou use --output-dir para o modo lote)")
+            pdf_path, output_path = args.paths
+            
+            converter = PDFToXLSMConverter(workers=args.workers, engine=args.engine,
+                                           row_log_every=args.row_log_every)
             
-            pdf_path = sys.argv[1]
-            output_path = sys.argv[2]
+            if output_path == '-':
+                # Saída padrão: blocos escritos à medida que as páginas são extraídas
+                output_format = args.output_format or 'csv'
+                if output_format not in STREAMING_FORMATS:
+                    parser.error(f"a saída padrão aceita apenas {', '.join(STREAMING_FORMATS)}")
+                for chunk in converter.stream_pdf_conversion(pdf_path, output_format, args.pages, args.max_rows):
+                    sys.stdout.buffer.write(chunk)
+                    sys.stdout.buffer.flush()
+                sys.exit(0)
             
-            converter = PDFToXLSMConverter()
-            success = converter.convert_pdf_to_xlsm(pdf_path, output_path)
+            success = converter.convert_pdf(pdf_path, output_path, args.output_format, args.pages, args.max_rows)
             
             if success:
                 print(f"Conversão concluída com sucesso! Arquivo salvo em: {output_path}")
@@ -837,6 +1344,7 @@ def main():
                 sys.exit(1)
         else:
             # Modo interface gráfica
+            from pdf_converter_gui import PDFConverterGUI
             app = PDFConverterGUI()
             app.run()
             
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Armazenamento de status e resultados das conversões
+Dicionário com expiração por entrada (TTL), orçamento total de bytes com despejo LRU
+e limpeza periódica em segundo plano
+Cada escrita incrementa a versão da entrada e acorda quem aguarda mudanças (SSE/long-poll)
+Valores binários acima de um limite são gravados em disco e mantidos apenas como caminho
+O backend é escolhido em create_result_store: 'memory' (ResultStore, por processo) ou
+'sqlite' (SQLiteResultStore, compartilhado entre os workers do gunicorn no mesmo host)
+"""
+
+import io
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class SpilledResult:
+    """Resultado gravado em disco pelo ResultStore; em memória ficam só o caminho e o tamanho"""
+
+    __slots__ = ('path', 'size')
+
+    def __init__(self, path, size):
+        self.path = path
+        self.size = size
+
+    def read(self):
+        """Lê o conteúdo completo do arquivo"""
+        return Path(self.path).read_bytes()
+
+
+def result_source(value):
+    """Origem para send_file: caminho do arquivo gravado em disco ou buffer do valor em memória"""
+    if isinstance(value, SpilledResult):
+        return value.path
+    return io.BytesIO(value)
+
+
+def default_size(value):
+    """Tamanho contabilizado de um valor: bytes reais para dados binários, estimativa para o resto"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class BaseResultStore:
+    """
+    Interface dos armazenamentos de status e resultados (mapeamento task_id -> valor).
+    Um backend implementa:
+    - __setitem__: grava o valor, incrementa a versão da entrada e acorda quem aguarda
+    - __getitem__: retorna o valor ou lança KeyError (ausente ou expirado)
+    - __delitem__, __len__, version(key), wait(key, since, timeout), sweep() e stats()
+    get, pop e __contains__ são derivados desses métodos. Os valores são dicionários
+    serializáveis em JSON (status) ou dados binários/SpilledResult (arquivos convertidos).
+    Recebe as opções comuns:
+    - ttl: segundos até a entrada expirar (None = sem expiração)
+    - max_bytes: orçamento total; as entradas menos usadas são despejadas primeiro (None = sem limite)
+    - evict_after_download: indica às aplicações que removam a entrada após o download completo
+    - sweep_interval: intervalo da limpeza em segundo plano das entradas expiradas
+    - spill_dir/spill_threshold: dados binários maiores que o limite vão para arquivos no
+      diretório e são armazenados como SpilledResult (None = tudo no armazenamento).
+      Um SpilledResult de outro diretório (ex.: cache em disco) recebe um hard link no
+      diretório, sem copiar os dados: o arquivo original continua sendo de quem o criou
+    """
+
+    def __init__(self, ttl=3600, max_bytes=None, evict_after_download=False, sweep_interval=60,
+                 spill_dir=None, spill_threshold=None):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.evict_after_download = evict_after_download
+        self.sweep_interval = sweep_interval
+        self.spill_dir = Path(os.path.abspath(spill_dir)) if spill_dir else None
+        self.spill_threshold = spill_threshold
+
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        self._sweeper = None
+        self._sweeper_lock = threading.Lock()
+
+        # Contadores do processo atual
+        self.evictions = 0
+        self.expirations = 0
+
+    def __setitem__(self, key, value):
+        raise NotImplementedError
+
+    def __getitem__(self, key):
+        raise NotImplementedError
+
+    def __delitem__(self, key):
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def __contains__(self, key):
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, default=None):
+        value = self.get(key, default)
+        try:
+            del self[key]
+        except KeyError:
+            pass
+        return value
+
+    def version(self, key):
+        """Número de escritas da entrada (0 se ela não existir)"""
+        raise NotImplementedError
+
+    def wait(self, key, since=0, timeout=30):
+        """
+        Bloqueia até a entrada ter versão maior que `since`, ser removida ou o tempo acabar.
+        Retorna (versão, valor); o valor é None se a entrada não existir.
+        """
+        raise NotImplementedError
+
+    def sweep(self):
+        """Remove as entradas expiradas. Retorna quantas foram removidas."""
+        raise NotImplementedError
+
+    def stats(self):
+        """
+        Quantidade de entradas e bytes mantidos: entries, bytes, max_bytes, ttl, evictions,
+        expirations, spilled_entries e spilled_bytes
+        """
+        raise NotImplementedError
+
+    def _should_spill(self, value):
+        if isinstance(value, SpilledResult):
+            return self.spill_dir is None or Path(value.path).parent != self.spill_dir
+        return (self.spill_dir is not None and self.spill_threshold is not None
+                and isinstance(value, (bytes, bytearray, memoryview))
+                and len(value) > self.spill_threshold)
+
+    def _spill(self, value):
+        """Grava o valor em um arquivo novo do diretório; em caso de erro mantém o valor"""
+        if isinstance(value, SpilledResult):
+            return self._link(value)
+
+        try:
+            fd, path = tempfile.mkstemp(suffix='.bin', dir=self.spill_dir)
+            with os.fdopen(fd, 'wb') as spill_file:
+                spill_file.write(value)
+        except OSError as e:
+            logger.warning(f"Erro ao gravar resultado em disco, mantendo em memória: {str(e)}")
+            return value
+
+        return SpilledResult(path, len(value))
+
+    def _link(self, value):
+        """Arquivo próprio no diretório para um SpilledResult de fora dele"""
+        if self.spill_dir is None:
+            return value.read()
+
+        path = str(self.spill_dir / f"{uuid.uuid4().hex}.bin")
+        try:
+            os.link(value.path, path)
+        except OSError:
+            # Outro sistema de arquivos (ou sem suporte a hard links): cópia em blocos
+            shutil.copyfile(value.path, path)
+        return SpilledResult(path, value.size)
+
+    def _unlink(self, path):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # No Windows um download em andamento impede a remoção; a limpeza tenta de novo
+            logger.warning(f"Erro ao remover resultado em disco {path}: {str(e)}")
+
+    def _sweep_spill_dir(self, referenced):
+        """Remove arquivos do diretório sem entrada e mais antigos que o TTL (ex.: outro processo)"""
+        if not self.spill_dir or not self.ttl:
+            return
+
+        limit = time.time() - self.ttl
+        for path in self.spill_dir.glob('*.bin'):
+            if str(path) in referenced:
+                continue
+            try:
+                if path.stat().st_mtime < limit:
+                    self._unlink(path)
+            except FileNotFoundError:
+                continue
+
+    def _start_sweeper(self):
+        """Inicia a thread de limpeza na primeira escrita (seguro após o fork do gunicorn)"""
+        if self._sweeper is not None or not self.ttl or not self.sweep_interval:
+            return
+
+        with self._sweeper_lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(target=self._sweep_loop, name='result-store-sweeper')
+            self._sweeper.daemon = True
+            self._sweeper.start()
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Erro na limpeza de resultados: {str(e)}")
+
+
+class ResultStore(BaseResultStore):
+    """
+    Armazenamento em memória, por processo (backend 'memory'), usado no lugar dos
+    dicionários globais das aplicações. Além das opções de BaseResultStore:
+    - sizeof: tamanho contabilizado de cada valor no orçamento
+    """
+
+    def __init__(self, ttl=3600, max_bytes=None, evict_after_download=False, sweep_interval=60,
+                 sizeof=default_size, spill_dir=None, spill_threshold=None):
+        super().__init__(ttl=ttl, max_bytes=max_bytes, evict_after_download=evict_after_download,
+                         sweep_interval=sweep_interval, spill_dir=spill_dir, spill_threshold=spill_threshold)
+        self.sizeof = sizeof
+
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._bytes = 0
+        self._spilled_bytes = 0
+
+    def __setitem__(self, key, value):
+        if self._should_spill(value):
+            value = self._spill(value)
+
+        size = self.sizeof(value)
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+
+        with self._lock:
+            version = self._versions.get(key, 0) + 1
+            self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self._versions[key] = version
+            self._bytes += size
+            if isinstance(value, SpilledResult):
+                self._spilled_bytes += value.size
+            self._enforce_budget(keep=key)
+            self._changed.notify_all()
+
+        self._start_sweeper()
+
+    def __getitem__(self, key):
+        with self._lock:
+            value, _, expires_at = self._entries[key]
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                raise KeyError(key)
+
+            self._entries.move_to_end(key)
+            return value
+
+    def __delitem__(self, key):
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._remove(key)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            value = self.get(key, default)
+            self._remove(key)
+            return value
+
+    def version(self, key):
+        with self._lock:
+            return self._versions.get(key, 0)
+
+    def wait(self, key, since=0, timeout=30):
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while key in self._entries and self._versions.get(key, 0) <= since:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+
+            return self._versions.get(key, 0), self.get(key)
+
+    def sweep(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (_, _, expires_at) in self._entries.items()
+                       if expires_at is not None and expires_at <= now]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            referenced = {entry[0].path for entry in self._entries.values()
+                          if isinstance(entry[0], SpilledResult)}
+
+        self._sweep_spill_dir(referenced)
+
+        if expired:
+            logger.info(f"Limpeza de resultados: {len(expired)} entradas expiradas removidas")
+        return len(expired)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'spilled_entries': sum(1 for entry in self._entries.values()
+                                       if isinstance(entry[0], SpilledResult)),
+                'spilled_bytes': self._spilled_bytes,
+            }
+
+    def _remove(self, key):
+        """Remove a entrada e atualiza o total de bytes (chamar com o lock)"""
+        entry = self._entries.pop(key, None)
+        self._versions.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+            if isinstance(entry[0], SpilledResult):
+                self._spilled_bytes -= entry[0].size
+                self._unlink(entry[0].path)
+            self._changed.notify_all()
+
+    def _enforce_budget(self, keep):
+        """Despeja as entradas menos usadas até caber no orçamento (chamar com o lock)"""
+        if self.max_bytes is None:
+            return
+
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            if key == keep:
+                self._entries.move_to_end(key)
+                continue
+            self._remove(key)
+            self.evictions += 1
+            logger.info(f"Resultado {key} removido para respeitar o limite de memória")
+
+
+def _memory_backend(name, location=None, **options):
+    return ResultStore(**options)
+
+
+def _sqlite_backend(name, location=None, **options):
+    # Importado sob demanda (o módulo depende desta interface)
+    from sqlite_result_store import SQLiteResultStore
+    return SQLiteResultStore(location, table=name, **options)
+
+
+# Backends registrados: nome -> fábrica(name, location, **opções)
+RESULT_BACKENDS = {
+    'memory': _memory_backend,
+    'sqlite': _sqlite_backend,
+}
+
+
+def register_result_backend(name, factory):
+    """
+    Registra (ou substitui) um backend. A fábrica recebe o nome do armazenamento
+    (ex.: 'status', 'data'), o local configurado (arquivo, URL...) e as opções de
+    BaseResultStore, e retorna um objeto com essa interface (ex.: um armazenamento em
+    rede compartilhado entre hosts).
+    """
+    RESULT_BACKENDS[name] = factory
+    return factory
+
+
+def create_result_store(backend, name, location=None, **options):
+    """
+    Cria o armazenamento `name` no backend configurado:
+    - memory: em memória, por processo (um único worker)
+    - sqlite: no arquivo `location`, compartilhado pelos processos do mesmo host
+    """
+    try:
+        factory = RESULT_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Backend de resultados desconhecido: {backend}. Use um de: {', '.join(RESULT_BACKENDS)}")
+    return factory(name, location, **options)
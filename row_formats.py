@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Formatos de saída sem planilha: CSV, JSON Lines e Parquet
+Recebem as linhas no layout de 10 colunas do XLSM. CSV e JSON Lines são gerados em
+blocos de bytes à medida que as linhas chegam (streaming, sem esperar o fim da
+extração); Parquet é escrito de uma vez, em colunas, e requer o pyarrow.
+"""
+
+import csv
+import io
+import json
+from importlib.util import find_spec
+from pathlib import Path
+
+# Formato -> (extensão, tipo MIME)
+OUTPUT_FORMATS = {
+    'xlsm': ('.xlsm', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': ('.csv', 'text/csv; charset=utf-8'),
+    'jsonl': ('.jsonl', 'application/x-ndjson'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+}
+
+# Formatos enviados em blocos enquanto as páginas são extraídas
+STREAMING_FORMATS = ('csv', 'jsonl')
+
+# Dependências opcionais de cada formato
+FORMAT_DEPENDENCIES = {'parquet': 'pyarrow'}
+
+# Linhas por bloco nos formatos em streaming
+CHUNK_ROWS = 200
+
+
+def format_available(output_format):
+    """O formato é conhecido e suas dependências estão instaladas (sem importá-las)?"""
+    if output_format not in OUTPUT_FORMATS:
+        return False
+    dependency = FORMAT_DEPENDENCIES.get(output_format)
+    return dependency is None or find_spec(dependency) is not None
+
+
+def check_output_format(output_format):
+    """Lança ValueError se o formato for desconhecido ou não estiver disponível"""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Formato de saída inválido: {output_format}. Use um de: {', '.join(OUTPUT_FORMATS)}")
+    if not format_available(output_format):
+        raise ValueError(f"Formato {output_format} indisponível: instale {FORMAT_DEPENDENCIES[output_format]}")
+    return output_format
+
+
+def format_for_path(path, default='xlsm'):
+    """Formato correspondente à extensão do arquivo de saída"""
+    suffix = Path(str(path)).suffix.lower()
+    for output_format, (extension, _) in OUTPUT_FORMATS.items():
+        if suffix == extension:
+            return output_format
+    return default
+
+
+def iter_csv_chunks(rows, columns, chunk_rows=CHUNK_ROWS):
+    """Gera o CSV (UTF-8, cabeçalho na primeira linha) em blocos de bytes"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(columns)
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    yield buffer.getvalue().encode('utf-8')
+
+
+def iter_jsonl_chunks(rows, columns, chunk_rows=CHUNK_ROWS):
+    """Gera um objeto JSON por linha ({coluna: valor}) em blocos de bytes"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+        if len(lines) >= chunk_rows:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+            lines = []
+
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+# Formato em streaming -> gerador de blocos
+CHUNK_WRITERS = {
+    'csv': iter_csv_chunks,
+    'jsonl': iter_jsonl_chunks,
+}
+
+
+def write_parquet(rows, columns, output):
+    """
+    Escreve as linhas em Parquet (caminho ou buffer), com uma coluna de texto por coluna
+    do layout. Retorna o número de linhas escritas.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    values = [[] for _ in columns]
+    for row in rows:
+        for column, value in zip(values, row):
+            column.append(value)
+
+    table = pa.table({name: pa.array(column, type=pa.string()) for name, column in zip(columns, values)})
+    pq.write_table(table, output)
+    return table.num_rows
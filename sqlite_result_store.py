@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Armazenamento de status e resultados em SQLite (backend 'sqlite')
+Compartilhado pelos processos do mesmo host: com vários workers do gunicorn, o status
+e o download de uma tarefa funcionam em qualquer worker, não só no que recebeu o upload.
+Cada armazenamento é uma tabela do arquivo; os resultados grandes continuam em arquivos
+no diretório de spill (que também precisa ser compartilhado) e a tabela guarda o caminho.
+Quem aguarda mudanças (SSE/long-poll) é acordado na hora por escritas do mesmo processo
+e consulta o banco a cada poll_interval para ver as dos outros.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from result_store import BaseResultStore, SpilledResult
+
+logger = logging.getLogger(__name__)
+
+# Tipos de valor gravados na coluna kind
+JSON_VALUE = 'json'      # dicionários de status
+BYTES_VALUE = 'bytes'    # dados binários
+FILE_VALUE = 'file'      # SpilledResult (caminho e tamanho em JSON)
+
+TABLE_NAME = re.compile(r'[A-Za-z_]\w*')
+
+
+def encode_value(value):
+    """Valor -> (tipo, conteúdo gravado, bytes no disco de spill)"""
+    if isinstance(value, SpilledResult):
+        return FILE_VALUE, json.dumps({'path': value.path, 'size': value.size}).encode('utf-8'), value.size
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return BYTES_VALUE, bytes(value), 0
+    return JSON_VALUE, json.dumps(value, ensure_ascii=False).encode('utf-8'), 0
+
+
+def decode_value(kind, data):
+    if kind == BYTES_VALUE:
+        return data
+    if kind == FILE_VALUE:
+        spilled = json.loads(data)
+        return SpilledResult(spilled['path'], spilled['size'])
+    return json.loads(data)
+
+
+def spilled_path(kind, data):
+    """Caminho do arquivo de spill de uma linha (None para valores na tabela)"""
+    return json.loads(data)['path'] if kind == FILE_VALUE else None
+
+
+class SQLiteResultStore(BaseResultStore):
+    """
+    Armazenamento em uma tabela SQLite (modo WAL), com as opções de BaseResultStore.
+    - path: arquivo do banco, compartilhado pelos processos
+    - table: tabela deste armazenamento (ex.: 'status', 'data')
+    - poll_interval: intervalo, em segundos, da consulta ao banco em wait()
+    - touch_interval: intervalo mínimo, em segundos, entre as atualizações da ordem de uso
+      (accessed_at) de uma entrada pelas leituras
+    Os valores de status precisam ser serializáveis em JSON. A expiração usa o relógio
+    do sistema (comum aos processos); os contadores de despejo e expiração são do processo.
+    """
+
+    def __init__(self, path, table='results', ttl=3600, max_bytes=None, evict_after_download=False,
+                 sweep_interval=60, spill_dir=None, spill_threshold=None, poll_interval=0.25,
+                 touch_interval=30):
+        if not path:
+            raise ValueError("Informe o arquivo do banco SQLite")
+        if not TABLE_NAME.fullmatch(table):
+            raise ValueError(f"Nome de tabela inválido: {table}")
+
+        super().__init__(ttl=ttl, max_bytes=max_bytes, evict_after_download=evict_after_download,
+                         sweep_interval=sweep_interval, spill_dir=spill_dir, spill_threshold=spill_threshold)
+        self.path = os.path.abspath(path)
+        self.table = table
+        self.poll_interval = poll_interval
+        self.touch_interval = touch_interval
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        # Uma conexão por thread (e por processo, já que o gunicorn cria os workers por fork)
+        self._local = threading.local()
+        # Acorda as esperas deste processo a cada escrita, sem aguardar a próxima consulta
+        self._changed = threading.Condition()
+
+        with self._transaction() as connection:
+            connection.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    spilled INTEGER NOT NULL DEFAULT 0,
+                    version INTEGER NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )""")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_expires ON {table} (expires_at)")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)")
+
+    def __setitem__(self, key, value):
+        if self._should_spill(value):
+            value = self._spill(value)
+
+        kind, data, spilled = encode_value(value)
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else None
+
+        with self._transaction() as connection:
+            row = connection.execute(f"SELECT kind, value, version FROM {self.table} WHERE key = ?",
+                                     (key,)).fetchone()
+            version = row[2] + 1 if row else 1
+            connection.execute(f"""
+                INSERT OR REPLACE INTO {self.table}
+                    (key, kind, value, size, spilled, version, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (key, kind, data, len(data), spilled, version, expires_at, now))
+            removed = [spilled_path(*row[:2])] if row else []
+            removed += self._enforce_budget(connection, keep=key)
+
+        self._unlink_files(path for path in removed if path and path != getattr(value, 'path', None))
+        self._notify()
+        self._start_sweeper()
+
+    def __getitem__(self, key):
+        row = self._connection().execute(
+            f"SELECT kind, value, expires_at, accessed_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+
+        kind, data, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at is not None and expires_at <= now:
+            if self._delete(key, expired=True):
+                self.expirations += 1
+            raise KeyError(key)
+
+        # Ordem de uso para o despejo (só quando há orçamento): no máximo uma escrita por
+        # entrada a cada touch_interval, para as leituras repetidas não disputarem o banco
+        if self.max_bytes is not None and now - accessed_at >= self.touch_interval:
+            self._connection().execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+        return decode_value(kind, data)
+
+    def __delitem__(self, key):
+        if not self._delete(key):
+            raise KeyError(key)
+
+    def __len__(self):
+        return self._connection().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def pop(self, key, default=None):
+        with self._transaction() as connection:
+            row = connection.execute(f"SELECT kind, value, expires_at FROM {self.table} WHERE key = ?",
+                                     (key,)).fetchone()
+            if row is not None:
+                connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+        if row is None:
+            return default
+
+        kind, data, expires_at = row
+        # O arquivo de spill é removido como no armazenamento em memória (um envio já
+        # aberto continua lendo o arquivo)
+        self._unlink_files([spilled_path(kind, data)])
+        self._notify()
+        if expires_at is not None and expires_at <= time.time():
+            self.expirations += 1
+            return default
+        return decode_value(kind, data)
+
+    def version(self, key):
+        row = self._connection().execute(f"SELECT version FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def wait(self, key, since=0, timeout=30):
+        deadline = time.monotonic() + timeout
+        while True:
+            version = self.version(key)
+            value = self.get(key)
+            if value is None:
+                return 0, None
+            if version > since:
+                return version, value
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return version, value
+            with self._changed:
+                self._changed.wait(min(remaining, self.poll_interval))
+
+    def sweep(self):
+        with self._transaction() as connection:
+            expired = connection.execute(
+                f"SELECT kind, value FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)).fetchall()
+            connection.execute(f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                               (time.time(),))
+            referenced = {spilled_path(kind, data) for kind, data in connection.execute(
+                f"SELECT kind, value FROM {self.table} WHERE kind = ?", (FILE_VALUE,))}
+
+        self._unlink_files(spilled_path(kind, data) for kind, data in expired)
+        self.expirations += len(expired)
+        self._sweep_spill_dir(referenced)
+
+        if expired:
+            self._notify()
+            logger.info(f"Limpeza de resultados ({self.table}): {len(expired)} entradas expiradas removidas")
+        return len(expired)
+
+    def stats(self):
+        entries, size, spilled_entries, spilled_bytes = self._connection().execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(spilled > 0), 0), "
+            f"COALESCE(SUM(spilled), 0) FROM {self.table}").fetchone()
+        return {
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'ttl': self.ttl,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'spilled_entries': spilled_entries,
+            'spilled_bytes': spilled_bytes,
+        }
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            # Autocommit: as escritas abrem a transação explicitamente em _transaction
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    @contextmanager
+    def _transaction(self):
+        """Transação de escrita (BEGIN IMMEDIATE: os outros processos aguardam até o timeout)"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _delete(self, key, expired=False):
+        """Remove a entrada (só se estiver expirada, com expired=True). Retorna se removeu."""
+        condition = " AND expires_at IS NOT NULL AND expires_at <= ?" if expired else ""
+        params = (key, time.time()) if expired else (key,)
+        with self._transaction() as connection:
+            row = connection.execute(f"SELECT kind, value FROM {self.table} WHERE key = ?{condition}",
+                                     params).fetchone()
+            if row is not None:
+                connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+        if row is None:
+            return False
+        self._unlink_files([spilled_path(*row)])
+        self._notify()
+        return True
+
+    def _enforce_budget(self, connection, keep):
+        """
+        Despeja as entradas menos usadas até caber no orçamento (dentro da transação).
+        Retorna os arquivos de spill a remover depois do commit.
+        """
+        if self.max_bytes is None:
+            return []
+
+        total = connection.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        if total <= self.max_bytes:
+            return []
+
+        removed = []
+        candidates = connection.execute(
+            f"SELECT key, kind, CASE WHEN kind = ? THEN value ELSE x'' END, size FROM {self.table} "
+            f"WHERE key != ? ORDER BY accessed_at", (FILE_VALUE, keep)).fetchall()
+        for key, kind, data, size in candidates:
+            if total <= self.max_bytes:
+                break
+            connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            removed.append(spilled_path(kind, data))
+            total -= size
+            self.evictions += 1
+            logger.info(f"Resultado {key} removido para respeitar o limite de armazenamento")
+        return removed
+
+    def _unlink_files(self, paths):
+        for path in paths:
+            if path:
+                self._unlink(path)
+
+    def _notify(self):
+        with self._changed:
+            self._changed.notify_all()
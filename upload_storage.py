@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDFs enviados gravados em disco
+O upload é copiado em blocos para um arquivo temporário enquanto o hash é calculado,
+sem ler o corpo inteiro para a memória; o conversor recebe o caminho do arquivo.
+O arquivo pertence à tarefa e é removido quando a conversão termina.
+"""
+
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from conversion_cache import pdf_hasher
+
+logger = logging.getLogger(__name__)
+
+# Tamanho dos blocos lidos do upload (a memória por requisição fica limitada a um bloco)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class StoredUpload:
+    """PDF enviado gravado em disco: caminho, tamanho em bytes e hash SHA-256 (hex)"""
+
+    __slots__ = ('path', 'size', 'digest')
+
+    def __init__(self, path, size, digest):
+        self.path = path
+        self.size = size
+        self.digest = digest
+
+    def remove(self):
+        """Remove o arquivo (pode ser chamado mais de uma vez)"""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Erro ao remover upload {self.path}: {str(e)}")
+
+    def __repr__(self):
+        return f"StoredUpload({self.path!r}, {self.size}, {self.digest[:12]!r})"
+
+
+def store_upload(source, upload_dir=None, max_bytes=None, chunk_size=UPLOAD_CHUNK_SIZE):
+    """
+    Copia o upload (FileStorage do Flask ou arquivo aberto) em blocos para um arquivo novo
+    em upload_dir, calculando o hash no caminho. Lança ValueError se passar de max_bytes.
+    Retorna um StoredUpload; quem recebe é responsável por chamar remove().
+    """
+    stream = getattr(source, 'stream', source)
+    if hasattr(stream, 'seek'):
+        stream.seek(0)
+
+    if upload_dir is not None:
+        os.makedirs(upload_dir, exist_ok=True)
+
+    hasher = pdf_hasher()
+    size = 0
+    fd, path = tempfile.mkstemp(prefix='upload_', suffix='.pdf', dir=upload_dir)
+    try:
+        with os.fdopen(fd, 'wb') as output:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise ValueError(f"Arquivo maior que o limite de {max_bytes // (1024 * 1024)} MB")
+                hasher.update(chunk)
+                output.write(chunk)
+    except BaseException:
+        StoredUpload(path, size, '').remove()
+        raise
+
+    return StoredUpload(path, size, hasher.hexdigest())
+
+
+def remove_stale_uploads(upload_dir, max_age):
+    """
+    Remove uploads mais antigos que max_age segundos (tarefas interrompidas, ex.: um worker
+    encerrado no meio da conversão). Retorna a quantidade de arquivos removidos.
+    """
+    upload_dir = Path(upload_dir)
+    if not upload_dir.is_dir():
+        return 0
+
+    limit = time.time() - max_age
+    removed = 0
+    for path in upload_dir.glob('upload_*.pdf'):
+        try:
+            if path.stat().st_mtime < limit:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(f"Erro ao remover upload antigo {path}: {str(e)}")
+
+    if removed:
+        logger.info(f"{removed} uploads antigos removidos de {upload_dir}")
+    return removed
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Escritor XLSX direto
+Gera o XML das planilhas diretamente em um zip, sem criar objetos do openpyxl,
+para o layout fixo do conversor (4 linhas vazias, cabeçalho e dados)
+"""
+
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+# Índices dos formatos em cellXfs do styles.xml pré-montado
+STYLE_DEFAULT = 0
+STYLE_HEADER = 1
+STYLE_DATA = 2
+
+# Caracteres de controle que não são permitidos em XML
+_ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+_STYLES_XML = (
+    _XML_HEADER +
+    f'<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font>'
+    '</fonts>'
+    '<fills count="2">'
+    '<fill><patternFill/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+    '</borders>'
+    '<cellStyleXfs count="3">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="1" applyFont="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="left" vertical="center"/></xf>'
+    '</cellStyleXfs>'
+    '<cellXfs count="3">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" pivotButton="0" quotePrefix="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="1" xfId="1" applyFont="1" applyBorder="1" applyAlignment="1" pivotButton="0" quotePrefix="0">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="1" xfId="2" applyBorder="1" applyAlignment="1" pivotButton="0" quotePrefix="0">'
+    '<alignment horizontal="left" vertical="center"/></xf>'
+    '</cellXfs>'
+    '<cellStyles count="3">'
+    '<cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    '<cellStyle name="{header}" xfId="1"/>'
+    '<cellStyle name="{data}" xfId="2"/>'
+    '</cellStyles>'
+    '<tableStyles count="0" defaultTableStyle="TableStyleMedium9" defaultPivotStyle="PivotStyleLight16"/>'
+    '</styleSheet>'
+)
+
+
+def quote_attr(value):
+    """Escapa um texto para uso em atributo XML"""
+    return escape(value, {'"': '&quot;'})
+
+
+def column_letter(index):
+    """Converte o índice da coluna (1-based) na letra do Excel"""
+    letters = ''
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class XLSXStreamWriter:
+    """
+    Escreve um arquivo XLSX em streaming no layout de referência do conversor.
+    As linhas de dados são serializadas direto no zip, uma única vez.
+    """
+
+    # Quantidade de linhas acumuladas antes de cada escrita no zip
+    BATCH_SIZE = 1000
+
+    def __init__(self, output, headers, column_widths, header_row=5, header_height=31.5,
+                 header_style_name='cabecalho', data_style_name='dados'):
+        self.headers = list(headers)
+        self.column_widths = column_widths
+        self.header_row = header_row
+        self.header_height = header_height
+        self.styles_xml = (_STYLES_XML.replace('{header}', quote_attr(header_style_name))
+                           .replace('{data}', quote_attr(data_style_name)))
+
+        # Total de colunas do layout (inclui colunas extras sem cabeçalho, ex.: K e L)
+        self.total_columns = max(len(self.headers), len(column_widths))
+        self.letters = [column_letter(col) for col in range(1, self.total_columns + 1)]
+
+        self.shared_strings = {}
+        self.shared_string_refs = 0
+        self.sheet_titles = []
+
+        self.zip_file = zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.zip_file.close()
+
+    def string_index(self, value):
+        """Retorna o índice do texto na tabela de strings compartilhadas"""
+        self.shared_string_refs += 1
+        index = self.shared_strings.get(value)
+        if index is None:
+            index = self.shared_strings[value] = len(self.shared_strings)
+        return index
+
+    def cell_xml(self, ref, value, style):
+        """Serializa uma célula"""
+        style_attr = f' s="{style}"' if style else ''
+
+        if value is None or value == '':
+            return f'<c r="{ref}"{style_attr}/>'
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return f'<c r="{ref}"{style_attr} t="n"><v>{value}</v></c>'
+
+        return f'<c r="{ref}"{style_attr} t="s"><v>{self.string_index(str(value))}</v></c>'
+
+    def row_xml(self, row_idx, values, style):
+        """Serializa uma linha completa"""
+        letters = self.letters
+        cells = ''.join(self.cell_xml(f'{letters[col]}{row_idx}', value, style)
+                        for col, value in enumerate(values))
+        return f'<row r="{row_idx}">{cells}</row>'
+
+    def add_sheet(self, title, rows):
+        """
+        Escreve uma planilha com as linhas informadas.
+        Retorna o número de linhas de dados escritas.
+        """
+        self.sheet_titles.append(title)
+        sheet_path = f'xl/worksheets/sheet{len(self.sheet_titles)}.xml'
+
+        cols_xml = ''.join(
+            f'<col min="{col}" max="{col}" width="{self.column_widths[letter]}" customWidth="1"/>'
+            for col, letter in enumerate(self.letters, 1) if letter in self.column_widths
+        )
+
+        row_count = 0
+        with self.zip_file.open(sheet_path, 'w') as sheet:
+            sheet.write((
+                _XML_HEADER +
+                f'<worksheet xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+                '<sheetPr><outlinePr summaryBelow="1" summaryRight="1"/><pageSetUpPr/></sheetPr>'
+                '<sheetViews><sheetView workbookViewId="0"><selection activeCell="A1" sqref="A1"/></sheetView></sheetViews>'
+                '<sheetFormatPr baseColWidth="8" defaultRowHeight="15"/>'
+                f'<cols>{cols_xml}</cols>'
+                '<sheetData>'
+            ).encode('utf-8'))
+
+            # Linhas vazias antes do cabeçalho (como no arquivo de referência)
+            blank_row = [''] * self.total_columns
+            parts = [self.row_xml(row_idx, blank_row, STYLE_DEFAULT)
+                     for row_idx in range(1, self.header_row)]
+
+            # Cabeçalho formatado apenas nas colunas com título
+            header_attrs = f' ht="{self.header_height}" customHeight="1"'
+            header_cells = ''.join(
+                self.cell_xml(f'{self.letters[col]}{self.header_row}', value,
+                              STYLE_HEADER if col < len(self.headers) else STYLE_DEFAULT)
+                for col, value in enumerate(self.headers + [''] * (self.total_columns - len(self.headers)))
+            )
+            parts.append(f'<row r="{self.header_row}"{header_attrs}>{header_cells}</row>')
+
+            # Dados a partir da linha seguinte ao cabeçalho, em lotes
+            for row_idx, row_data in enumerate(rows, self.header_row + 1):
+                parts.append(self.row_xml(row_idx, row_data, STYLE_DATA))
+                row_count += 1
+                if len(parts) >= self.BATCH_SIZE:
+                    sheet.write(''.join(parts).encode('utf-8'))
+                    parts = []
+
+            parts.append('</sheetData>')
+            parts.append('<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>')
+            parts.append('</worksheet>')
+            sheet.write(''.join(parts).encode('utf-8'))
+
+        return row_count
+
+    def close(self):
+        """Escreve as partes fixas do pacote e fecha o zip"""
+        zip_file = self.zip_file
+        sheet_count = len(self.sheet_titles)
+
+        sheet_overrides = ''.join(
+            f'<Override PartName="/xl/worksheets/sheet{idx}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for idx in range(1, sheet_count + 1)
+        )
+        zip_file.writestr('[Content_Types].xml', (
+            _XML_HEADER +
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            f'{sheet_overrides}'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            '<Override PartName="/docProps/core.xml" '
+            'ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+            '<Override PartName="/docProps/app.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>'
+            '</Types>'
+        ))
+
+        zip_file.writestr('_rels/.rels', (
+            _XML_HEADER +
+            f'<Relationships xmlns="{_PKG_REL_NS}">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="xl/workbook.xml"/>'
+            '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" '
+            'Target="docProps/core.xml"/>'
+            '<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties" '
+            'Target="docProps/app.xml"/>'
+            '</Relationships>'
+        ))
+
+        zip_file.writestr('docProps/app.xml', (
+            _XML_HEADER +
+            '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+            '<Application>Microsoft Excel</Application></Properties>'
+        ))
+
+        zip_file.writestr('docProps/core.xml', (
+            _XML_HEADER +
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:creator>Conversor PDF para XLSM</dc:creator></cp:coreProperties>'
+        ))
+
+        sheets_xml = ''.join(
+            f'<sheet name="{quote_attr(title)}" sheetId="{idx}" r:id="rId{idx}"/>'
+            for idx, title in enumerate(self.sheet_titles, 1)
+        )
+        zip_file.writestr('xl/workbook.xml', (
+            _XML_HEADER +
+            f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+            '<bookViews><workbookView activeTab="0"/></bookViews>'
+            f'<sheets>{sheets_xml}</sheets>'
+            '</workbook>'
+        ))
+
+        sheet_rels = ''.join(
+            f'<Relationship Id="rId{idx}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{idx}.xml"/>'
+            for idx in range(1, sheet_count + 1)
+        )
+        zip_file.writestr('xl/_rels/workbook.xml.rels', (
+            _XML_HEADER +
+            f'<Relationships xmlns="{_PKG_REL_NS}">'
+            f'{sheet_rels}'
+            f'<Relationship Id="rId{sheet_count + 1}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+            f'<Relationship Id="rId{sheet_count + 2}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+            'Target="sharedStrings.xml"/>'
+            '</Relationships>'
+        ))
+
+        zip_file.writestr('xl/styles.xml', self.styles_xml)
+
+        # Tabela de strings compartilhadas (na ordem dos índices atribuídos)
+        with zip_file.open('xl/sharedStrings.xml', 'w') as shared:
+            shared.write((
+                _XML_HEADER +
+                f'<sst xmlns="{_MAIN_NS}" count="{self.shared_string_refs}" '
+                f'uniqueCount="{len(self.shared_strings)}">'
+            ).encode('utf-8'))
+
+            parts = []
+            for text in self.shared_strings:
+                text = _ILLEGAL_XML_CHARS.sub('', text)
+                preserve = ' xml:space="preserve"' if text != text.strip() else ''
+                parts.append(f'<si><t{preserve}>{escape(text)}</t></si>')
+                if len(parts) >= self.BATCH_SIZE:
+                    shared.write(''.join(parts).encode('utf-8'))
+                    parts = []
+
+            parts.append('</sst>')
+            shared.write(''.join(parts).encode('utf-8'))
+
+        zip_file.close()